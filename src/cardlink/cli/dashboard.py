@@ -10,6 +10,7 @@ Example:
 
 import asyncio
 import sys
+from pathlib import Path
 from typing import Optional
 
 import click
@@ -59,8 +60,17 @@ def cli(ctx: click.Context, verbose: bool) -> None:
     is_flag=True,
     help="Open browser automatically",
 )
+@click.option(
+    "--db",
+    "db_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help="SQLite file to persist sessions and APDUs (enables history search)",
+)
 @click.pass_context
-def start(ctx: click.Context, host: str, port: int, open_browser: bool) -> None:
+def start(
+    ctx: click.Context, host: str, port: int, open_browser: bool, db_path: Optional[Path]
+) -> None:
     """Start the dashboard server.
 
     Starts the web dashboard for monitoring APDU traffic and
@@ -79,6 +89,9 @@ def start(ctx: click.Context, host: str, port: int, open_browser: bool) -> None:
         # Open browser automatically
         gp-dashboard start --open
 
+        # Keep sessions and APDUs across restarts
+        gp-dashboard start --db dashboard.db
+
     Common Issues:
         - Port blocked on Windows: Try --port 8081 or --port 8082
         - Access from other machines: Use --host 0.0.0.0
@@ -86,12 +99,14 @@ def start(ctx: click.Context, host: str, port: int, open_browser: bool) -> None:
     try:
         from cardlink.dashboard import DashboardServer, DashboardConfig
 
-        config = DashboardConfig(host=host, port=port)
+        config = DashboardConfig(host=host, port=port, persistence_path=db_path)
         server = DashboardServer(config)
 
         url = f"http://{host}:{port}"
         console.print(f"\n[bold green]Starting GP OTA Dashboard[/bold green]")
         console.print(f"[cyan]URL:[/cyan] {url}")
+        if db_path:
+            console.print(f"[cyan]Database:[/cyan] {db_path}")
         console.print("\nPress Ctrl+C to stop\n")
 
         if open_browser:
@@ -8,6 +8,7 @@ Example:
     $ gp-db status
     $ gp-db export --format yaml --output backup.yaml
     $ gp-db import backup.yaml
+    $ gp-db logs --session <id> --limit 100
 """
 
 import sys
@@ -374,6 +375,155 @@ def cleanup(ctx: click.Context, days: int, confirm: bool) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--status",
+    "-s",
+    type=click.Choice(["pending", "active", "completed", "failed", "timeout"]),
+    help="Only show sessions with this status",
+)
+@click.option("--limit", "-n", default=50, show_default=True, help="Sessions per page")
+@click.option("--cursor", "-c", help="Cursor printed by the previous page")
+@click.option(
+    "--count",
+    type=click.Choice(["exact", "estimate"]),
+    help="Also show the total number of sessions",
+)
+@click.pass_context
+def sessions(
+    ctx: click.Context,
+    status: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+    count: Optional[str],
+) -> None:
+    """List OTA sessions, newest first.
+
+    Pages with a cursor, so deep pages are as fast as the first one.
+    """
+    try:
+        from cardlink.database import DatabaseConfig, DatabaseManager, SessionStatus, UnitOfWork
+
+        # Get config
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        filters = {}
+        if status:
+            filters["status"] = SessionStatus(status)
+
+        with UnitOfWork(manager) as uow:
+            page = uow.sessions.paginate_keyset(
+                cursor,
+                per_page=limit,
+                order_by="created_at",
+                descending=True,
+                total=count,
+                **filters,
+            )
+
+            table = Table(title="OTA Sessions")
+            table.add_column("ID", style="cyan")
+            table.add_column("Created", style="white")
+            table.add_column("Status", style="green")
+            table.add_column("Card", style="white")
+            table.add_column("Duration (ms)", justify="right")
+            for session in page.items:
+                table.add_row(
+                    session.id,
+                    session.created_at.strftime("%Y-%m-%d %H:%M:%S"),
+                    session.status.value,
+                    session.card_iccid or "",
+                    str(session.duration_ms) if session.duration_ms is not None else "",
+                )
+            console.print(table)
+            _print_page_footer(page)
+
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
+@cli.command()
+@click.option("--session", "-s", "session_id", help="Only show logs for this session")
+@click.option("--limit", "-n", default=100, show_default=True, help="Log entries per page")
+@click.option("--cursor", "-c", help="Cursor printed by the previous page")
+@click.option(
+    "--count",
+    type=click.Choice(["exact", "estimate"]),
+    help="Also show the total number of log entries",
+)
+@click.pass_context
+def logs(
+    ctx: click.Context,
+    session_id: Optional[str],
+    limit: int,
+    cursor: Optional[str],
+    count: Optional[str],
+) -> None:
+    """List communication log entries in time order.
+
+    Pages with a cursor, so deep pages are as fast as the first one.
+    """
+    try:
+        from cardlink.database import DatabaseConfig, DatabaseManager, UnitOfWork
+
+        # Get config
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        filters = {"session_id": session_id} if session_id else {}
+
+        with UnitOfWork(manager) as uow:
+            page = uow.logs.paginate_keyset(
+                cursor,
+                per_page=limit,
+                order_by="timestamp",
+                total=count,
+                **filters,
+            )
+
+            table = Table(title="Communication Logs")
+            table.add_column("Time", style="white")
+            table.add_column("Session", style="cyan")
+            table.add_column("Dir", style="white")
+            table.add_column("Data", style="white", overflow="fold")
+            table.add_column("SW", style="green")
+            for log in page.items:
+                table.add_row(
+                    log.timestamp.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3],
+                    log.session_id[:8],
+                    ">>" if log.is_command else "<<",
+                    log.raw_data,
+                    log.status_word or "",
+                )
+            console.print(table)
+            _print_page_footer(page)
+
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
+def _print_page_footer(page) -> None:
+    """Print the total (if counted) and the cursor for the next page."""
+    if page.total is not None:
+        prefix = "~" if page.estimated else ""
+        console.print(f"Total: {prefix}{page.total}")
+    if page.next_cursor:
+        console.print(f"Next page: --cursor {page.next_cursor}")
+
+
 @cli.command()
 @click.pass_context
 def stats(ctx: click.Context) -> None:
@@ -438,6 +588,219 @@ def stats(ctx: click.Context) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    "--lookback",
+    default=24,
+    show_default=True,
+    help="Hours before the last run to recompute (late session updates)",
+)
+@click.option(
+    "--rebuild-days",
+    type=int,
+    help="Rebuild everything from N days ago instead",
+)
+@click.pass_context
+def rollup(ctx: click.Context, lookback: int, rebuild_days: Optional[int]) -> None:
+    """Update hourly and daily rollup tables.
+
+    Run periodically (e.g. from cron) to keep historic reports current.
+    """
+    try:
+        from datetime import datetime, timedelta
+
+        from cardlink.database import DatabaseConfig, DatabaseManager, UnitOfWork
+
+        # Get config
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        with UnitOfWork(manager) as uow:
+            if rebuild_days is not None:
+                now = datetime.utcnow()
+                rows = uow.rollups.rebuild(now - timedelta(days=rebuild_days), now)
+                console.print(f"Rebuilt last {rebuild_days} days: {rows} rollup rows")
+            else:
+                result = uow.rollups.compact(lookback=timedelta(hours=lookback))
+                if result.start is None:
+                    console.print("Nothing to roll up")
+                else:
+                    console.print(
+                        f"Rolled up {result.start:%Y-%m-%d %H:%M} to "
+                        f"{result.end:%Y-%m-%d %H:%M}: {result.rows} rollup rows"
+                    )
+            uow.commit()
+
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
+@cli.group()
+def retention() -> None:
+    """Manage communication log retention."""
+
+
+@retention.command("show")
+@click.pass_context
+def retention_show(ctx: click.Context) -> None:
+    """Show the retention policy and comm_logs partitions."""
+    try:
+        from datetime import datetime
+
+        from cardlink.database import DatabaseConfig, DatabaseManager, RetentionManager
+
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        retention_manager = RetentionManager(manager)
+        policy = retention_manager.policy
+        days = f"{policy.comm_logs_days} days" if policy.comm_logs_days else "forever"
+        console.print(f"Keep comm_logs: {days}")
+        console.print(f"Partition size: {policy.partition}")
+        archive = f"{policy.archive_dir}" if policy.archive else "disabled"
+        console.print(f"Archive: {archive}")
+
+        cutoff = policy.cutoff(datetime.utcnow())
+        table = Table(title="comm_logs Partitions")
+        table.add_column("Partition", style="cyan")
+        table.add_column("From")
+        table.add_column("To")
+        table.add_column("Rows", justify="right")
+        table.add_column("Expired")
+        for partition in retention_manager.list_partitions():
+            expired = cutoff is not None and partition.end <= cutoff
+            estimate = partition.native and not partition.pending
+            rows = f"~{partition.rows}" if estimate else str(partition.rows)
+            name = f"{partition.name} (in default)" if partition.pending else partition.name
+            table.add_row(
+                name,
+                f"{partition.start:%Y-%m-%d}",
+                f"{partition.end:%Y-%m-%d}",
+                rows,
+                "[red]yes[/red]" if expired else "",
+            )
+        console.print(table)
+
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
+@retention.command("set")
+@click.option("--days", type=int, help="Days to keep comm_logs (0 keeps them forever)")
+@click.option(
+    "--partition",
+    type=click.Choice(["day", "month"]),
+    help="Partition size when comm_logs is not natively partitioned",
+)
+@click.option("--archive/--no-archive", default=None, help="Archive partitions before dropping")
+@click.option("--archive-dir", help="Directory for NDJSON archives")
+@click.pass_context
+def retention_set(
+    ctx: click.Context,
+    days: Optional[int],
+    partition: Optional[str],
+    archive: Optional[bool],
+    archive_dir: Optional[str],
+) -> None:
+    """Update the retention policy."""
+    try:
+        from dataclasses import replace
+
+        from cardlink.database import (
+            DatabaseConfig,
+            DatabaseManager,
+            RetentionPolicy,
+            UnitOfWork,
+        )
+
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        changes = {
+            "comm_logs_days": days,
+            "partition": partition,
+            "archive": archive,
+            "archive_dir": archive_dir,
+        }
+        with UnitOfWork(manager) as uow:
+            policy = RetentionPolicy.from_settings(uow.settings)
+            policy = replace(policy, **{k: v for k, v in changes.items() if v is not None})
+            policy.save(uow.settings)
+            uow.commit()
+
+        console.print(f"[green]Retention policy updated: {policy}[/green]")
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
+@retention.command("apply")
+@click.option("--dry-run", is_flag=True, help="Only show expired partitions")
+@click.option("--vacuum", is_flag=True, help="Reclaim free space afterwards (SQLite)")
+@click.option("--confirm", "-y", is_flag=True, help="Skip confirmation prompt")
+@click.pass_context
+def retention_apply(ctx: click.Context, dry_run: bool, vacuum: bool, confirm: bool) -> None:
+    """Archive and drop expired comm_logs partitions.
+
+    Run periodically (e.g. from cron) after setting a policy with
+    ``retention set --days N``.
+    """
+    try:
+        from cardlink.database import DatabaseConfig, DatabaseManager, RetentionManager
+
+        url = ctx.obj.get("database_url")
+        config = DatabaseConfig(url=url) if url else DatabaseConfig()
+
+        manager = DatabaseManager(config)
+        manager.initialize()
+
+        retention_manager = RetentionManager(manager)
+        expired = retention_manager.expired_partitions()
+        for partition in expired:
+            console.print(f"Expired: {partition.name} ({partition.rows} rows)")
+
+        if not dry_run and expired and not confirm:
+            if not click.confirm(f"Drop {len(expired)} partition(s)?"):
+                console.print("Cancelled.")
+                manager.close()
+                return
+
+        result = retention_manager.apply(dry_run=dry_run, vacuum=vacuum)
+        if dry_run:
+            console.print(f"Would drop {len(result.dropped)} partition(s), {result.rows} rows")
+        else:
+            for path in result.archives:
+                console.print(f"Archived to {path}")
+            for name in result.created:
+                console.print(f"Created partition {name}")
+            console.print(
+                f"[green]Dropped {len(result.dropped)} partition(s), {result.rows} rows[/green]"
+            )
+
+        manager.close()
+
+    except Exception as e:
+        console.print(f"[bold red]Error:[/bold red] {e}")
+        sys.exit(1)
+
+
 @cli.command()
 @click.option(
     "--revision",
@@ -8,7 +8,8 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from dataclasses import replace
+from typing import Optional, Tuple
 
 import click
 import yaml
@@ -126,6 +127,23 @@ def cli(ctx: click.Context, verbose: bool) -> None:
     default=0.0,
     help="Session timeout in persistent mode (seconds, 0=no timeout)",
 )
+@click.option(
+    "--network-profile",
+    "network_profiles",
+    multiple=True,
+    help="Bearer profile (2g, 3g, lte-m, nb-iot); repeat to spread parallel cards across profiles",
+)
+@click.option(
+    "--population",
+    type=click.Path(exists=True, path_type=Path),
+    default=None,
+    help="Card population file (CSV or binary); each session uses the next card",
+)
+@click.option(
+    "--results",
+    default=None,
+    help="Stream results to ndjson:PATH, sqlite:PATH or unix:PATH (kind inferred from extension)",
+)
 @click.pass_context
 def run(
     ctx: click.Context,
@@ -144,10 +162,15 @@ def run(
     persistent: bool,
     poll_interval: int,
     session_timeout: float,
+    network_profiles: Tuple[str, ...],
+    population: Optional[Path],
+    results: Optional[str],
 ) -> None:
     """Run mobile simulator session(s).
 
     Connects to the PSK-TLS server and runs APDU exchange sessions.
+    With --results, every exchange and session result is streamed to
+    the given destination as it completes instead of being kept in memory.
     """
     try:
         from cardlink.simulator import (
@@ -155,7 +178,12 @@ def run(
             BehaviorMode,
             ConnectionMode,
             MobileSimulator,
+            PopulationError,
+            ResultSinkError,
             SimulatorConfig,
+            SimulatorStats,
+            create_sink,
+            open_population,
         )
     except ImportError as e:
         console.print(f"[red]Error:[/red] Missing dependencies: {e}")
@@ -202,9 +230,19 @@ def run(
             behavior=behavior,
         )
 
+    # Network profiles are assigned to cards round-robin
+    card_configs = [sim_config]
+    if network_profiles:
+        card_configs = [
+            replace(sim_config, behavior=replace(sim_config.behavior, network_profile=name))
+            for name in network_profiles
+        ]
+        sim_config = card_configs[0]
+
     # Validate config
     try:
-        sim_config.validate()
+        for card_config in card_configs:
+            card_config.validate()
     except ValueError as e:
         console.print(f"[red]Configuration error:[/red] {e}")
         sys.exit(1)
@@ -213,6 +251,10 @@ def run(
     console.print(f"Server: {sim_config.server_address}")
     console.print(f"PSK Identity: {sim_config.psk_identity}")
     console.print(f"Mode: {sim_config.behavior.mode.value}")
+    if network_profiles:
+        console.print(f"Network: {', '.join(network_profiles)}")
+    elif sim_config.behavior.network_profile:
+        console.print(f"Network: {sim_config.behavior.network_profile}")
     if sim_config.behavior.connection_mode == ConnectionMode.PERSISTENT:
         console.print(f"[cyan]Persistent mode:[/cyan] poll every {sim_config.behavior.poll_interval_ms}ms")
         if sim_config.behavior.session_timeout_seconds > 0:
@@ -226,11 +268,50 @@ def run(
         console.print("[red bold]WARNING: NULL ciphers enabled - traffic will be UNENCRYPTED![/red bold]")
         console.print("[red]Only use in isolated test environments![/red]")
 
+    # Open card population (cards are materialized only when they become active)
+    cards = None
+    if population:
+        try:
+            cards = open_population(population)
+        except (PopulationError, OSError) as e:
+            console.print(f"[red]Error:[/red] Cannot open population: {e}")
+            sys.exit(1)
+        if not len(cards):
+            console.print(f"[red]Error:[/red] Population is empty: {population}")
+            sys.exit(1)
+        console.print(f"Population: {population} ({len(cards)} cards)")
+
+    # Open result sink
+    result_sink = None
+    if results:
+        try:
+            result_sink = create_sink(results)
+        except (ResultSinkError, OSError) as e:
+            console.print(f"[red]Error:[/red] Cannot open results destination: {e}")
+            sys.exit(1)
+        console.print(f"Results: {results}")
+
+    # Exchanges are only kept in memory when nothing else consumes them
+    retain_exchanges = result_sink is None or bool(ctx.obj.get("verbose"))
+
+    def new_simulator(card: int = 0) -> MobileSimulator:
+        card_config = card_configs[card % len(card_configs)]
+        if cards is not None:
+            card_config = cards[card % len(cards)].to_config(card_config)
+        return MobileSimulator(
+            card_config,
+            result_sink=result_sink,
+            retain_exchanges=retain_exchanges,
+        )
+
     console.print()
 
     # Run sessions
     async def run_sessions():
-        simulator = MobileSimulator(sim_config)
+        # Without a population every sequential session reuses one simulator
+        simulator = new_simulator() if cards is None else None
+        totals = SimulatorStats()
+        next_card = 0
         session_count = 0
         success_count = 0
 
@@ -238,12 +319,17 @@ def run(
             while True:
                 if parallel and count > 1:
                     # Run multiple sessions in parallel
-                    tasks = []
+                    sims = []
                     for i in range(count):
-                        sim = MobileSimulator(sim_config)
-                        tasks.append(sim.run_complete_session())
+                        sims.append(new_simulator(next_card))
+                        next_card += 1
 
-                    results = await asyncio.gather(*tasks, return_exceptions=True)
+                    results = await asyncio.gather(
+                        *(sim.run_complete_session() for sim in sims),
+                        return_exceptions=True,
+                    )
+                    for sim in sims:
+                        totals.merge(sim.statistics)
 
                     for i, result in enumerate(results):
                         session_count += 1
@@ -268,7 +354,13 @@ def run(
                         session_count += 1
                         console.print(f"[bold]Session {session_count}[/bold]")
 
-                        result = await simulator.run_complete_session()
+                        if simulator is None:
+                            card_simulator = new_simulator(next_card)
+                            next_card += 1
+                            result = await card_simulator.run_complete_session()
+                            totals.merge(card_simulator.statistics)
+                        else:
+                            result = await simulator.run_complete_session()
 
                         if result.success:
                             success_count += 1
@@ -308,13 +400,34 @@ def run(
         console.print(f"  Successful: {success_count}")
         console.print(f"  Failed: {session_count - success_count}")
 
-        stats = simulator.get_statistics()
+        if simulator is not None:
+            totals.merge(simulator.statistics)
+        stats = totals
         console.print(f"  Total APDUs sent: {stats.total_apdus_sent}")
         console.print(f"  Total APDUs received: {stats.total_apdus_received}")
         if stats.avg_apdu_response_time_ms > 0:
             console.print(f"  Avg APDU time: {stats.avg_apdu_response_time_ms:.1f}ms")
+        if stats.full_handshakes or stats.resumed_handshakes:
+            console.print(
+                f"  TLS handshakes: {stats.full_handshakes} full, "
+                f"{stats.resumed_handshakes} resumed"
+            )
 
-    asyncio.run(run_sessions())
+    try:
+        asyncio.run(run_sessions())
+    finally:
+        if cards is not None:
+            cards.close()
+        if result_sink is not None:
+            result_sink.close()
+            console.print(
+                f"  Results written: {result_sink.records_written}"
+                + (
+                    f" ([yellow]{result_sink.records_dropped} dropped[/yellow])"
+                    if result_sink.records_dropped
+                    else ""
+                )
+            )
 
 
 @cli.command()
@@ -473,6 +586,27 @@ def test_connection(server: str, psk_identity: str, psk_key: str) -> None:
     asyncio.run(test())
 
 
+@cli.command()
+@click.argument("source", type=click.Path(exists=True, path_type=Path))
+@click.argument("output", type=click.Path(path_type=Path))
+def population_convert(source: Path, output: Path) -> None:
+    """Convert a CSV card population to the binary format.
+
+    The binary format has fixed-size records, so the simulator can
+    jump to any card without scanning the file.
+    """
+    from cardlink.simulator import PopulationError, open_population, write_population
+
+    try:
+        with open_population(source) as cards:
+            written = write_population(output, cards)
+    except (PopulationError, OSError) as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+
+    console.print(f"[green]Wrote {written} cards to {output}[/green]")
+
+
 @cli.command()
 def status() -> None:
     """Show simulator status and statistics."""
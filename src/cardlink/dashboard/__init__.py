@@ -8,6 +8,7 @@ Features:
 - Session management and monitoring
 - Command builder for manual APDU commands
 - Alert configuration for specific APDU patterns
+- Server-wide throughput, error rate and latency charts
 - Dark/light theme support
 
 Quick Start:
@@ -30,6 +31,8 @@ Example with custom configuration:
 
 __version__ = "0.1.0"
 
+from cardlink.dashboard.history import APDUHistory
+from cardlink.dashboard.metrics import TimeSeriesAggregator
 from cardlink.dashboard.server import (
     DashboardServer,
     DashboardConfig,
@@ -46,5 +49,7 @@ __all__ = [
     "DashboardState",
     "Session",
     "APDUEntry",
+    "APDUHistory",
+    "TimeSeriesAggregator",
     "start_dashboard",
 ]
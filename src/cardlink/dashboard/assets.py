@@ -0,0 +1,250 @@
+"""In-memory cache of the dashboard's static assets.
+
+Assets are loaded once (at startup via :meth:`StaticAssetCache.preload`
+or on first request) together with an ETag and, for compressible types,
+a gzip variant. Each lookup stats the file and reloads it if its mtime or
+size changed, so edits to the static directory are picked up without a
+restart. Files larger than ``max_file_size`` are not cached; they are
+described by an mtime-based ETag and streamed from disk.
+
+Example:
+    >>> cache = StaticAssetCache(STATIC_DIR)
+    >>> cache.preload()
+    >>> asset = cache.lookup("/js/app.js")
+    >>> body = asset.gzip if accepts_gzip and asset.gzip else asset.content
+"""
+
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+# Content types worth compressing (besides text/*)
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/javascript",
+        "application/json",
+        "application/xml",
+        "image/svg+xml",
+        "application/vnd.ms-fontobject",
+        "font/ttf",
+    }
+)
+
+# Files with a content hash in their name (app.3f9a1c2e.js, app-3f9a1c2e.css)
+# never change and can be cached by browsers indefinitely.
+_HASHED_NAME_RE = re.compile(r"[.-][0-9a-fA-F]{8,}\.[^.]+$")
+
+CACHE_CONTROL_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_CONTROL_REVALIDATE = "no-cache"
+
+
+@dataclass
+class StaticAsset:
+    """Static file with its cached representations.
+
+    Attributes:
+        path: Absolute file path.
+        content_type: MIME type.
+        size: Uncompressed size in bytes.
+        mtime_ns: Modification time when loaded.
+        etag: Entity tag (quoted).
+        cache_control: Cache-Control header value.
+        content: File content, or None if the file is served from disk.
+        gzip: Gzip-compressed content, or None if not worthwhile.
+    """
+
+    path: Path
+    content_type: str
+    size: int
+    mtime_ns: int
+    etag: str
+    cache_control: str
+    content: Optional[bytes] = None
+    gzip: Optional[bytes] = None
+
+    @property
+    def gzip_etag(self) -> str:
+        """Get entity tag of the gzip representation."""
+        return self.etag[:-1] + '-gz"'
+
+    def matches(self, if_none_match: str) -> bool:
+        """Check an If-None-Match header against this asset (weak comparison)."""
+        if if_none_match.strip() == "*":
+            return True
+        tags = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        if _opaque_tag(self.etag) in tags:
+            return True
+        return self.gzip is not None and _opaque_tag(self.gzip_etag) in tags
+
+
+def _opaque_tag(etag: str) -> str:
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Check if an Accept-Encoding header allows gzip."""
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class StaticAssetCache:
+    """Cache of static files under a root directory.
+
+    Attributes:
+        root: Static files directory.
+        max_file_size: Largest file kept in memory.
+        compress_min_size: Smallest file for which a gzip variant is built.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        mime_types: Optional[Mapping[str, str]] = None,
+        max_file_size: int = 1024 * 1024,
+        compress_min_size: int = 1024,
+    ):
+        """Initialize cache.
+
+        Args:
+            root: Static files directory.
+            mime_types: Suffix to MIME type overrides.
+            max_file_size: Largest file kept in memory.
+            compress_min_size: Smallest file for which a gzip variant is built.
+        """
+        self.root = Path(root).resolve()
+        self.mime_types = dict(mime_types or {})
+        self.max_file_size = max_file_size
+        self.compress_min_size = compress_min_size
+        self._assets: Dict[Path, StaticAsset] = {}
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    def preload(self) -> int:
+        """Load every file under the root directory.
+
+        Returns:
+            Number of files loaded.
+        """
+        if not self.root.is_dir():
+            return 0
+        count = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                if self._load(Path(dirpath) / filename) is not None:
+                    count += 1
+        return count
+
+    def resolve(self, url_path: str) -> Path:
+        """Map a URL path to a file path under the root.
+
+        Raises:
+            PermissionError: If the path escapes the root directory.
+        """
+        if url_path in ("", "/"):
+            url_path = "/index.html"
+        file_path = (self.root / url_path.lstrip("/")).resolve()
+        if file_path != self.root and self.root not in file_path.parents:
+            raise PermissionError(url_path)
+        return file_path
+
+    def lookup(self, url_path: str) -> Optional[StaticAsset]:
+        """Get the asset for a URL path, reloading it if the file changed.
+
+        Args:
+            url_path: Request path (``/`` maps to ``/index.html``).
+
+        Returns:
+            StaticAsset, or None if no such file exists.
+
+        Raises:
+            PermissionError: If the path escapes the root directory.
+        """
+        file_path = self.resolve(url_path)
+        try:
+            stat = file_path.stat()
+        except OSError:
+            self._assets.pop(file_path, None)
+            return None
+
+        asset = self._assets.get(file_path)
+        if asset is not None and (asset.mtime_ns, asset.size) == (stat.st_mtime_ns, stat.st_size):
+            return asset
+        return self._load(file_path, stat)
+
+    def _content_type(self, path: Path) -> str:
+        content_type = self.mime_types.get(path.suffix.lower())
+        if content_type is None:
+            content_type, _ = mimetypes.guess_type(str(path))
+        return content_type or "application/octet-stream"
+
+    def _load(self, path: Path, stat: Optional[os.stat_result] = None) -> Optional[StaticAsset]:
+        try:
+            stat = stat or path.stat()
+        except OSError:
+            return None
+        if not path.is_file():
+            return None
+
+        content_type = self._content_type(path)
+        if _HASHED_NAME_RE.search(path.name):
+            cache_control = CACHE_CONTROL_IMMUTABLE
+        else:
+            cache_control = CACHE_CONTROL_REVALIDATE
+
+        if stat.st_size > self.max_file_size:
+            asset = StaticAsset(
+                path=path,
+                content_type=content_type,
+                size=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                etag=f'W/"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+                cache_control=cache_control,
+            )
+            self._assets[path] = asset
+            return asset
+
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+
+        compressed = None
+        if len(content) >= self.compress_min_size and self._compressible(content_type):
+            compressed = gzip.compress(content, compresslevel=9, mtime=0)
+            if len(compressed) >= len(content):
+                compressed = None
+
+        asset = StaticAsset(
+            path=path,
+            content_type=content_type,
+            size=len(content),
+            mtime_ns=stat.st_mtime_ns,
+            etag='"' + hashlib.blake2b(content, digest_size=10).hexdigest() + '"',
+            cache_control=cache_control,
+            content=content,
+            gzip=compressed,
+        )
+        self._assets[path] = asset
+        return asset
+
+    @staticmethod
+    def _compressible(content_type: str) -> bool:
+        return content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES
@@ -0,0 +1,150 @@
+"""Thread-to-event-loop bridge for admin server events.
+
+The admin server emits events from its own threads. Scheduling one
+coroutine per event with ``asyncio.run_coroutine_threadsafe`` creates a
+future and a loop callback for every APDU; at high rates that floods the
+loop. The bridge instead appends events to a thread-safe buffer and wakes
+the loop at most once until the buffer has been drained, and a single
+task hands the buffered events to an async handler in batches.
+
+Example:
+    >>> bridge = EventBridge(handle_batch, max_batch=500)
+    >>> bridge.start(asyncio.get_running_loop())
+    >>> emitter.subscribe("apdu_sent", lambda e: bridge.post("apdu_sent", e))
+    >>> ...
+    >>> await bridge.stop()
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (event name, event data)
+BridgedEvent = Tuple[str, Any]
+
+
+class EventBridge:
+    """Batching bridge from foreign threads to an asyncio handler.
+
+    Attributes:
+        max_batch: Maximum events passed to the handler at once.
+        max_pending: Buffered events beyond which new events are dropped.
+        events_posted: Events accepted by post().
+        events_dropped: Events rejected because the buffer was full.
+        batches: Handler invocations.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[BridgedEvent]], Awaitable[None]],
+        max_batch: int = 500,
+        max_pending: int = 100000,
+    ):
+        """Initialize bridge.
+
+        Args:
+            handler: Coroutine function receiving a list of (name, event).
+            max_batch: Maximum events passed to the handler at once.
+            max_pending: Maximum buffered events.
+        """
+        self._handler = handler
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.events_posted = 0
+        self.events_dropped = 0
+        self.batches = 0
+        self._pending: Deque[BridgedEvent] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wakeup_scheduled = False
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        """Check if the drain task is running."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> int:
+        """Get number of buffered events."""
+        return len(self._pending)
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """Start draining on the given (or running) event loop.
+
+        Must be called from the loop's thread.
+        """
+        if self.running:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task = self._loop.create_task(self._drain_loop())
+
+    def post(self, name: str, event: Any) -> bool:
+        """Buffer an event. Safe to call from any thread.
+
+        Args:
+            name: Event name.
+            event: Event data.
+
+        Returns:
+            True if the event was buffered.
+        """
+        loop = self._loop
+        if loop is None or self._stopping or loop.is_closed():
+            return False
+        if len(self._pending) >= self.max_pending:
+            self.events_dropped += 1
+            return False
+
+        self._pending.append((name, event))
+        self.events_posted += 1
+        if not self._wakeup_scheduled:
+            self._wakeup_scheduled = True
+            try:
+                loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # Loop closed between the check above and scheduling
+                return False
+        return True
+
+    async def _drain_loop(self) -> None:
+        wakeup = self._wakeup
+        while True:
+            await wakeup.wait()
+            wakeup.clear()
+            # Events posted from here on schedule a new wakeup
+            self._wakeup_scheduled = False
+            await self._drain()
+            if self._stopping:
+                return
+
+    async def _drain(self) -> None:
+        pending = self._pending
+        while pending:
+            count = min(len(pending), self.max_batch)
+            batch = [pending.popleft() for _ in range(count)]
+            self.batches += 1
+            try:
+                await self._handler(batch)
+            except Exception as e:
+                logger.error("Error handling %d bridged events: %s", len(batch), e)
+            # Let other tasks (HTTP, WebSocket) run between batches
+            await asyncio.sleep(0)
+
+    async def stop(self) -> None:
+        """Stop accepting events and deliver the ones already buffered."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
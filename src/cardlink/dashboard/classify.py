@@ -0,0 +1,160 @@
+"""Table-driven APDU classification for dashboard ingestion.
+
+Every APDU added to the dashboard is labelled with its instruction name
+and type (RAM, RFM, standard) and the remote APDU format it was sent in.
+These depend only on a few header bytes, so the labels are precomputed
+into two 256-entry tables indexed by INS, one for interindustry class
+bytes and one for proprietary (GlobalPlatform) class bytes. Classifying
+an APDU is then two table lookups on the raw bytes.
+
+Classification rules:
+
+- Proprietary CLA (bit 8 set, except the GSM class A0): GlobalPlatform
+  card content management commands (INSTALL, LOAD, DELETE, ...) are
+  Remote Application Management (RAM) commands.
+- Interindustry CLA: file management commands that change the file
+  system (UPDATE BINARY, UPDATE RECORD, CREATE FILE, ...) are Remote
+  File Management (RFM) commands per ETSI TS 102.226; selection and
+  read commands are standard commands.
+- A command starting with a Command Scripting template (tag AA, or AE
+  for indefinite length) uses the expanded remote APDU format and is
+  classified by its first C-APDU; any other command uses the compact
+  format. Responses starting with a Response Scripting template (tag AB
+  or AF) use the expanded format.
+
+Example:
+    >>> info = classify_apdu(bytes.fromhex("80E60C00"), "command")
+    >>> info.ins_name, info.apdu_type, info.remote_apdu_format
+    ('INSTALL', 'ram', 'compact')
+"""
+
+from dataclasses import dataclass, replace
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class APDUInfo:
+    """Classification of one APDU.
+
+    Attributes:
+        ins: Instruction byte (None for responses and short data).
+        ins_name: Instruction name, or ``INS_xx`` if unknown.
+        apdu_type: 'ram', 'rfm', 'standard' or 'unknown'.
+        remote_apdu_format: 'compact', 'expanded' or None.
+    """
+
+    ins: Optional[int] = None
+    ins_name: Optional[str] = None
+    apdu_type: Optional[str] = None
+    remote_apdu_format: Optional[str] = None
+
+
+# Instruction names and types shared by both class byte families
+_COMMON: Dict[int, Tuple[str, str]] = {
+    0xA4: ("SELECT", "standard"),
+    0xB0: ("READ BINARY", "standard"),
+    0xB2: ("READ RECORD", "standard"),
+    0xC0: ("GET RESPONSE", "standard"),
+    0xCA: ("GET DATA", "standard"),
+    0xD6: ("UPDATE BINARY", "standard"),
+    0xDC: ("UPDATE RECORD", "standard"),
+    0xE2: ("STORE DATA", "ram"),
+    0xE4: ("DELETE", "ram"),
+    0xE6: ("INSTALL", "ram"),
+    0xE8: ("LOAD", "ram"),
+    0xF2: ("GET STATUS", "ram"),
+    0xF0: ("SET STATUS", "ram"),
+    0x50: ("INITIALIZE UPDATE", "unknown"),
+    0x82: ("EXTERNAL AUTHENTICATE", "unknown"),
+    0x84: ("GET CHALLENGE", "unknown"),
+    0xD8: ("PUT KEY", "ram"),
+}
+
+# File management commands under an interindustry class (ETSI TS 102.221/102.226)
+_INTERINDUSTRY: Dict[int, Tuple[str, str]] = {
+    0x04: ("DEACTIVATE FILE", "rfm"),
+    0x32: ("INCREASE", "rfm"),
+    0x44: ("ACTIVATE FILE", "rfm"),
+    0xA2: ("SEARCH RECORD", "rfm"),
+    0xD4: ("RESIZE FILE", "rfm"),
+    0xD6: ("UPDATE BINARY", "rfm"),
+    0xDC: ("UPDATE RECORD", "rfm"),
+    0xE0: ("CREATE FILE", "rfm"),
+    0xE4: ("DELETE FILE", "rfm"),
+}
+
+
+def _build_table(*overlays: Dict[int, Tuple[str, str]]) -> Tuple[APDUInfo, ...]:
+    entries = {ins: (f"INS_{ins:02X}", "unknown") for ins in range(256)}
+    for overlay in overlays:
+        entries.update(overlay)
+    return tuple(APDUInfo(ins, *entries[ins], "compact") for ins in range(256))
+
+
+# Compact format command classification, indexed by the INS byte
+INTERINDUSTRY_TABLE = _build_table(_COMMON, _INTERINDUSTRY)
+PROPRIETARY_TABLE = _build_table(_COMMON)
+
+# CLA -> table, indexed by the CLA byte
+_TABLE_BY_CLA = tuple(
+    PROPRIETARY_TABLE if cla & 0x80 and cla != 0xA0 else INTERINDUSTRY_TABLE
+    for cla in range(256)
+)
+
+_COMMAND_SCRIPT_TAGS = frozenset({0xAA, 0xAE})
+_RESPONSE_SCRIPT_TAGS = frozenset({0xAB, 0xAF})
+_C_APDU_TAG = 0x22
+
+_RESPONSE = APDUInfo()
+_EXPANDED = APDUInfo(remote_apdu_format="expanded")
+
+
+def _first_c_apdu(script: bytes) -> Optional[bytes]:
+    """Get the first C-APDU of an expanded format command script."""
+    # Skip the template tag and its length (definite or indefinite)
+    offset = 1
+    if script[0] == 0xAA:
+        if len(script) < 2:
+            return None
+        first = script[1]
+        offset += 1 + (first & 0x7F if first & 0x80 else 0)
+    else:
+        offset += 1  # AE 80
+    while offset + 1 < len(script):
+        tag = script[offset]
+        length = script[offset + 1]
+        offset += 2
+        if length & 0x80:
+            size = length & 0x7F
+            length = int.from_bytes(script[offset:offset + size], "big")
+            offset += size
+        if tag == _C_APDU_TAG:
+            return script[offset:offset + length]
+        offset += length
+    return None
+
+
+def classify_apdu(apdu: bytes, direction: str) -> APDUInfo:
+    """Classify an APDU from its raw bytes.
+
+    Args:
+        apdu: APDU (or remote command script) bytes.
+        direction: 'command' or 'response'.
+
+    Returns:
+        APDUInfo (instruction fields are None for responses).
+    """
+    if direction != "command":
+        if apdu and apdu[0] in _RESPONSE_SCRIPT_TAGS:
+            return _EXPANDED
+        return _RESPONSE
+    if len(apdu) < 4:
+        return _RESPONSE
+
+    if apdu[0] not in _COMMAND_SCRIPT_TAGS:
+        return _TABLE_BY_CLA[apdu[0]][apdu[1]]
+
+    c_apdu = _first_c_apdu(apdu)
+    if c_apdu is None or len(c_apdu) < 4:
+        return _EXPANDED
+    return replace(_TABLE_BY_CLA[c_apdu[0]][c_apdu[1]], remote_apdu_format="expanded")
@@ -0,0 +1,156 @@
+"""Coalescing of high-rate WebSocket events.
+
+Streams such as APDU traffic produce one event per exchange. Sending each
+as its own WebSocket message makes the browser parse and render tiny
+frames at the APDU rate. The coalescer buffers these events and flushes
+them on a short interval, or as soon as a channel reaches its batch size:
+
+- Batched events (``add``) are sent as one ``<type>.batch`` message with
+  ``{"items": [...]}`` (a single buffered event is sent unchanged).
+- Debounced events (``update``) keep only the latest value per key, e.g.
+  one ``session.updated`` per session with its current counters.
+
+Example:
+    >>> coalescer = EventCoalescer(send_event, interval=0.05)
+    >>> coalescer.start()
+    >>> await coalescer.add("apdu", apdu.to_dict())
+    >>> await coalescer.update("session.updated", session.id, session.to_dict)
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BATCH_SUFFIX = ".batch"
+
+
+class EventCoalescer:
+    """Buffers events per type and flushes them in batches.
+
+    Until :meth:`start` is called (or when ``interval`` is 0), events are
+    sent immediately.
+
+    Attributes:
+        interval: Seconds between flushes.
+        max_batch: Buffered events of one type that trigger an early flush.
+        messages_sent: Messages passed to the send callback.
+        events_coalesced: Events buffered instead of sent individually.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], Awaitable[None]],
+        interval: float = 0.05,
+        max_batch: int = 200,
+    ):
+        """Initialize coalescer.
+
+        Args:
+            send: Coroutine function sending one message (event type, payload).
+            interval: Seconds between flushes.
+            max_batch: Buffered events of one type that trigger an early flush.
+        """
+        self._send = send
+        self.interval = interval
+        self.max_batch = max_batch
+        self.messages_sent = 0
+        self.events_coalesced = 0
+        self._batches: Dict[str, List[Any]] = {}
+        self._latest: Dict[str, Dict[Any, Any]] = {}
+        self._has_events = asyncio.Event()
+        self._full = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        """Check if events are being coalesced."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> bool:
+        """Check if any events are waiting to be flushed."""
+        return bool(self._batches or self._latest)
+
+    def start(self) -> None:
+        """Start the flush task (no-op when interval is 0)."""
+        if self.interval > 0 and not self.running:
+            self._task = asyncio.create_task(self._flush_loop())
+
+    async def stop(self) -> None:
+        """Stop the flush task and send pending events."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def add(self, event_type: str, data: Any) -> None:
+        """Buffer an event to be sent as part of a batch.
+
+        Args:
+            event_type: Event type (batches are sent as ``<type>.batch``).
+            data: Event payload.
+        """
+        if not self.running:
+            await self._emit(event_type, data)
+            return
+        batch = self._batches.setdefault(event_type, [])
+        batch.append(data)
+        self.events_coalesced += 1
+        self._has_events.set()
+        if len(batch) >= self.max_batch:
+            self._full.set()
+
+    async def update(self, event_type: str, key: Any, data: Any) -> None:
+        """Buffer an event, replacing any pending event with the same key.
+
+        Args:
+            event_type: Event type.
+            key: Debounce key (e.g. session ID).
+            data: Event payload, or a zero-argument callable evaluated at
+                flush time to send the latest state.
+        """
+        if not self.running:
+            await self._emit(event_type, data() if callable(data) else data)
+            return
+        self._latest.setdefault(event_type, {})[key] = data
+        self.events_coalesced += 1
+        self._has_events.set()
+
+    async def flush(self) -> None:
+        """Send all pending events now."""
+        batches, self._batches = self._batches, {}
+        latest, self._latest = self._latest, {}
+        self._has_events.clear()
+        self._full.clear()
+
+        for event_type, items in batches.items():
+            if len(items) == 1:
+                await self._emit(event_type, items[0])
+            else:
+                await self._emit(event_type + BATCH_SUFFIX, {"items": items})
+        for event_type, values in latest.items():
+            for data in values.values():
+                await self._emit(event_type, data() if callable(data) else data)
+
+    async def _emit(self, event_type: str, data: Any) -> None:
+        self.messages_sent += 1
+        await self._send(event_type, data)
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await self._has_events.wait()
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.interval)
+                except asyncio.TimeoutError:
+                    pass
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error("Error flushing coalesced events: %s", e)
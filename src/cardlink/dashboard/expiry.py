@@ -0,0 +1,114 @@
+"""Deadline scheduling for idle dashboard sessions.
+
+Sessions expire after a fixed idle timeout. Instead of periodically
+scanning every session, each session has a deadline kept in a min-heap,
+so the expiry task sleeps exactly until the earliest deadline and only
+looks at sessions whose deadline has passed.
+
+Activity only records the new deadline in a dict. Each session has at
+most one heap entry: when an entry comes due but the session has been
+active since, it is pushed back with its current deadline instead of
+expiring. Touching a session is therefore O(1), and the heap never holds
+more entries than there are sessions (plus removed ones not yet due).
+
+Example:
+    >>> expiry = ExpiryScheduler(timeout=300)
+    >>> expiry.touch(session.id)
+    >>> ...
+    >>> delay = expiry.time_until_next()
+    >>> await asyncio.sleep(expiry.timeout if delay is None else delay)
+    >>> for session_id in expiry.pop_expired():
+    ...     close(session_id)
+"""
+
+import heapq
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+
+class ExpiryScheduler:
+    """Min-heap of idle deadlines with lazy rescheduling.
+
+    Attributes:
+        timeout: Idle seconds after which a key expires.
+    """
+
+    def __init__(self, timeout: float, clock: Callable[[], float] = time.monotonic):
+        """Initialize scheduler.
+
+        Args:
+            timeout: Idle seconds after which a key expires.
+            clock: Monotonic clock in seconds.
+        """
+        if timeout <= 0:
+            raise ValueError("timeout must be positive")
+        self.timeout = timeout
+        self._clock = clock
+        self._deadlines: Dict[Hashable, float] = {}
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._scheduled: Set[Hashable] = set()
+        self._counter = 0  # Tie-breaker so keys are never compared
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def touch(self, key: Hashable) -> None:
+        """Record activity, moving the key's deadline to now + timeout.
+
+        With a fixed timeout a new deadline is never earlier than any
+        deadline already scheduled, so a task sleeping until
+        :meth:`time_until_next` (or ``timeout`` when empty) never needs
+        to be woken early.
+        """
+        deadline = self._clock() + self.timeout
+        self._deadlines[key] = deadline
+        if key not in self._scheduled:
+            self._push(deadline, key)
+
+    def remove(self, key: Hashable) -> None:
+        """Stop tracking a key (its heap entry is discarded when due)."""
+        self._deadlines.pop(key, None)
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        """Get a key's current deadline (clock time), or None."""
+        return self._deadlines.get(key)
+
+    def time_until_next(self) -> Optional[float]:
+        """Get seconds until the earliest heap entry is due (None if empty).
+
+        The entry may turn out to be stale (key active since or removed),
+        in which case :meth:`pop_expired` reschedules or drops it.
+        """
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._clock())
+
+    def pop_expired(self) -> List[Hashable]:
+        """Remove and return every key whose deadline has passed.
+
+        Returns:
+            Expired keys, earliest deadline first.
+        """
+        now = self._clock()
+        heap = self._heap
+        expired = []
+        while heap and heap[0][0] <= now:
+            _, _, key = heapq.heappop(heap)
+            self._scheduled.discard(key)
+            deadline = self._deadlines.get(key)
+            if deadline is None:
+                continue  # Removed
+            if deadline > now:
+                self._push(deadline, key)  # Active since it was scheduled
+                continue
+            del self._deadlines[key]
+            expired.append(key)
+        return expired
+
+    def _push(self, deadline: float, key: Hashable) -> None:
+        self._counter += 1
+        heapq.heappush(self._heap, (deadline, self._counter, key))
+        self._scheduled.add(key)
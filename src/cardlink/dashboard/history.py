@@ -0,0 +1,135 @@
+"""Bounded APDU history for dashboard sessions.
+
+Each session keeps its APDU log in a fixed-capacity ring buffer. Entries
+are numbered with a per-session sequence number that keeps increasing
+when old entries are evicted or the history is cleared, so clients can
+poll for new entries with a cursor (``after=<last seq seen>``).
+
+Example:
+    >>> history = APDUHistory(capacity=3)
+    >>> for entry in entries:
+    ...     history.append(entry)
+    >>> page = history.after(cursor, limit=100)
+"""
+
+from typing import Any, Iterator, List
+
+
+class APDUHistory:
+    """Fixed-capacity ring buffer of APDU entries.
+
+    Appending assigns ``entry.seq``. When the buffer is full the oldest
+    entry is overwritten and counted in ``dropped``.
+
+    Attributes:
+        capacity: Maximum number of retained entries.
+        dropped: Entries evicted since the history was created.
+    """
+
+    def __init__(self, capacity: int = 10000):
+        """Initialize history.
+
+        Args:
+            capacity: Maximum number of retained entries.
+
+        Raises:
+            ValueError: If capacity is not positive.
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.dropped = 0
+        self._items: List[Any] = []
+        self._start = 0  # Position of the oldest entry once the buffer is full
+        self._next_seq = 1
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    @property
+    def first_seq(self) -> int:
+        """Get sequence number of the oldest retained entry."""
+        return self._next_seq - len(self._items)
+
+    @property
+    def last_seq(self) -> int:
+        """Get sequence number of the newest entry (0 if none were added)."""
+        return self._next_seq - 1
+
+    def append(self, entry: Any) -> int:
+        """Add an entry, evicting the oldest if full.
+
+        Args:
+            entry: Entry with a writable ``seq`` attribute.
+
+        Returns:
+            Sequence number assigned to the entry.
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        entry.seq = seq
+
+        items = self._items
+        if len(items) < self.capacity:
+            items.append(entry)
+        else:
+            items[self._start] = entry
+            self._start = (self._start + 1) % self.capacity
+            self.dropped += 1
+        return seq
+
+    def restore(self, entry: Any) -> None:
+        """Add an entry that already has a sequence number (e.g. loaded from disk).
+
+        Raises:
+            ValueError: If ``entry.seq`` is not after the newest entry.
+        """
+        if entry.seq < self._next_seq:
+            raise ValueError(f"Sequence {entry.seq} is not after {self.last_seq}")
+        self._next_seq = entry.seq
+        self.append(entry)
+
+    def _slice(self, offset: int, count: int) -> List[Any]:
+        """Get ``count`` entries starting ``offset`` entries after the oldest."""
+        items = self._items
+        begin = (self._start + offset) % len(items)
+        end = begin + count
+        if end <= len(items):
+            return items[begin:end]
+        return items[begin:] + items[: end - len(items)]
+
+    def after(self, seq: int, limit: int) -> List[Any]:
+        """Get entries with a sequence number greater than ``seq``.
+
+        Args:
+            seq: Cursor (last sequence number already seen, 0 for the start).
+            limit: Maximum number of entries to return.
+
+        Returns:
+            Up to ``limit`` entries in sequence order. If ``seq`` is older
+            than the oldest retained entry, the result starts at the oldest.
+        """
+        first = max(seq + 1, self.first_seq)
+        count = min(limit, self._next_seq - first)
+        if count <= 0:
+            return []
+        return self._slice(first - self.first_seq, count)
+
+    def tail(self, limit: int) -> List[Any]:
+        """Get the newest ``limit`` entries in sequence order."""
+        count = min(limit, len(self._items))
+        if count <= 0:
+            return []
+        return self._slice(len(self._items) - count, count)
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._items:
+            yield from self._slice(0, len(self._items))
+
+    def clear(self) -> None:
+        """Remove all entries. Sequence numbers keep increasing."""
+        self._items = []
+        self._start = 0
@@ -0,0 +1,237 @@
+"""Rolling time-series aggregation of dashboard traffic.
+
+Server-wide counters (APDUs, handshakes, error status words) and
+command/response latency are accumulated into fixed-size ring buffers at
+several resolutions, by default 1 s buckets for 10 minutes and 1 min
+buckets for 24 hours. Memory use is fixed by the number of buckets, not
+by traffic: recording an event only adds to the current bucket of each
+resolution.
+
+Queries pick the finest resolution that covers the requested range and
+merge adjacent buckets so that at most ``points`` values are returned.
+
+Example:
+    >>> metrics = TimeSeriesAggregator()
+    >>> metrics.record_apdu("session-1", "command")
+    >>> metrics.record_apdu("session-1", "response", sw="6985")
+    >>> metrics.query(["apdus", "errors", "latency_avg"], duration=600, points=120)
+"""
+
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Counted events, reported as per-second rates
+COUNTERS = ("apdus", "commands", "responses", "errors", "handshakes", "handshake_failures")
+
+# Command-to-response latency, reported in milliseconds
+LATENCY_SERIES = ("latency_avg", "latency_max")
+
+SERIES = COUNTERS + LATENCY_SERIES
+
+# SW1 values of successful or informational responses (everything else
+# counts as an error): 90 normal, 91 proactive command pending, 61/9F
+# response bytes available, 62/63 warnings.
+_OK_SW1 = frozenset({"90", "91", "61", "9F", "62", "63"})
+
+
+def is_error_sw(sw: Optional[str]) -> bool:
+    """Check if a status word (hex string) reports an error."""
+    if not sw or len(sw) < 2:
+        return False
+    return sw[:2].upper() not in _OK_SW1
+
+
+@dataclass(frozen=True)
+class Resolution:
+    """Bucket size and retention of one ring buffer.
+
+    Attributes:
+        step: Bucket size in seconds.
+        buckets: Number of buckets kept.
+    """
+
+    step: int
+    buckets: int
+
+    @property
+    def retention(self) -> int:
+        """Get the time span covered in seconds."""
+        return self.step * self.buckets
+
+
+DEFAULT_RESOLUTIONS = (Resolution(1, 600), Resolution(60, 1440))
+
+
+class _Ring:
+    """Fixed-size ring of buckets for one resolution."""
+
+    def __init__(self, resolution: Resolution):
+        self.resolution = resolution
+        size = resolution.buckets
+        # Absolute bucket number held by each slot (-1 = empty)
+        self.bucket_ids = array("q", [-1]) * size
+        self.counters = {name: array("d", [0.0]) * size for name in COUNTERS}
+        self.latency_sum = array("d", [0.0]) * size
+        self.latency_count = array("d", [0.0]) * size
+        self.latency_max = array("d", [0.0]) * size
+
+    def _slot(self, timestamp: float) -> int:
+        bucket = int(timestamp // self.resolution.step)
+        slot = bucket % self.resolution.buckets
+        if self.bucket_ids[slot] != bucket:
+            self.bucket_ids[slot] = bucket
+            for values in self.counters.values():
+                values[slot] = 0.0
+            self.latency_sum[slot] = 0.0
+            self.latency_count[slot] = 0.0
+            self.latency_max[slot] = 0.0
+        return slot
+
+    def add(self, timestamp: float, counters: Iterable[str], latency: Optional[float]) -> None:
+        slot = self._slot(timestamp)
+        for name in counters:
+            self.counters[name][slot] += 1
+        if latency is not None:
+            self.latency_sum[slot] += latency
+            self.latency_count[slot] += 1
+            if latency > self.latency_max[slot]:
+                self.latency_max[slot] = latency
+
+    def read(self, series: str, first: int, count: int, group: int) -> List[Optional[float]]:
+        """Read ``count`` buckets from bucket number ``first``, merged by ``group``."""
+        size = self.resolution.buckets
+        step = self.resolution.step
+        values: List[Optional[float]] = []
+        for start in range(first, first + count, group):
+            total = 0.0
+            samples = 0.0
+            peak = 0.0
+            for bucket in range(start, min(start + group, first + count)):
+                slot = bucket % size
+                if self.bucket_ids[slot] != bucket:
+                    continue
+                if series in self.counters:
+                    total += self.counters[series][slot]
+                else:
+                    total += self.latency_sum[slot]
+                    samples += self.latency_count[slot]
+                    peak = max(peak, self.latency_max[slot])
+            if series in self.counters:
+                values.append(total / (group * step))
+            elif not samples:
+                values.append(None)
+            elif series == "latency_avg":
+                values.append(total / samples * 1000)
+            else:
+                values.append(peak * 1000)
+        return values
+
+
+class TimeSeriesAggregator:
+    """Multi-resolution rolling aggregator for dashboard metrics.
+
+    Attributes:
+        resolutions: Ring buffer resolutions, finest first.
+    """
+
+    def __init__(
+        self,
+        resolutions: Sequence[Resolution] = DEFAULT_RESOLUTIONS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize aggregator.
+
+        Args:
+            resolutions: Bucket sizes and retention, finest first.
+            clock: Function returning the current time in seconds.
+        """
+        self.resolutions = tuple(sorted(resolutions, key=lambda r: r.step))
+        self._rings = [_Ring(resolution) for resolution in self.resolutions]
+        self._clock = clock
+        # session_id -> time of the command awaiting its response
+        self._pending_commands: Dict[str, float] = {}
+
+    def record(self, *counters: str, latency: Optional[float] = None) -> None:
+        """Count events in the current bucket.
+
+        Args:
+            *counters: Counter names (see ``COUNTERS``), each incremented by 1.
+            latency: Optional latency sample in seconds.
+        """
+        now = self._clock()
+        for ring in self._rings:
+            ring.add(now, counters, latency)
+
+    def record_apdu(self, session_id: str, direction: str, sw: Optional[str] = None) -> None:
+        """Record an APDU, pairing responses with their command for latency.
+
+        Args:
+            session_id: Session the APDU belongs to.
+            direction: 'command' or 'response'.
+            sw: Status word of a response.
+        """
+        if direction == "command":
+            self._pending_commands[session_id] = self._clock()
+            self.record("apdus", "commands")
+            return
+
+        sent = self._pending_commands.pop(session_id, None)
+        latency = self._clock() - sent if sent is not None else None
+        if is_error_sw(sw):
+            self.record("apdus", "responses", "errors", latency=latency)
+        else:
+            self.record("apdus", "responses", latency=latency)
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop the pending command of a closed session."""
+        self._pending_commands.pop(session_id, None)
+
+    def query(
+        self,
+        series: Sequence[str],
+        duration: float = 600,
+        points: int = 120,
+    ) -> Dict[str, Any]:
+        """Get downsampled series for the last ``duration`` seconds.
+
+        Args:
+            series: Series names (see ``SERIES``).
+            duration: Time range in seconds (capped at the longest retention).
+            points: Maximum values per series.
+
+        Returns:
+            Dict with ``start`` (epoch seconds of the first point), ``step``
+            (seconds per point) and ``series`` (name -> list of values;
+            rates per second, latencies in ms or None without samples).
+
+        Raises:
+            ValueError: If a series name is unknown or points < 1.
+        """
+        unknown = [name for name in series if name not in SERIES]
+        if unknown:
+            raise ValueError(f"Unknown series: {', '.join(unknown)}")
+        if points < 1:
+            raise ValueError("points must be at least 1")
+
+        ring, first, count = self._select(duration)
+        group = -(-count // points)  # ceil
+        step = ring.resolution.step
+        return {
+            "start": first * step,
+            "step": group * step,
+            "series": {name: ring.read(name, first, count, group) for name in series},
+        }
+
+    def _select(self, duration: float) -> Tuple[_Ring, int, int]:
+        """Pick the finest ring covering ``duration`` and its bucket range."""
+        ring = self._rings[-1]
+        for candidate in self._rings:
+            if candidate.resolution.retention >= duration:
+                ring = candidate
+                break
+        step = ring.resolution.step
+        count = max(1, min(ring.resolution.buckets, -(-int(duration) // step)))
+        last = int(self._clock() // step)
+        return ring, last - count + 1, count
@@ -0,0 +1,482 @@
+"""Optional SQLite persistence and search for dashboard state.
+
+When enabled (``DashboardConfig.persistence_path``), DashboardState
+mirrors every session and APDU into a local SQLite database. The
+in-memory state stays the hot cache: on startup sessions and the newest
+APDUs of each session are restored from the database, and the full
+history remains queryable without being held in RAM.
+
+Writes are batched: sessions and APDUs are queued and written with one
+transaction per flush (every ``flush_interval`` seconds or ``batch_size``
+queued APDUs). A session changed many times between flushes is written
+once, with its latest state.
+
+APDUs and sessions are indexed with SQLite FTS5 for search:
+
+- APDU text: direction, hex data, status word, instruction name and
+  ``INS<xx>`` code, APDU type.
+- Session text: name, identifiers (PSK identity, ICCID, EID, IMEI, SEID),
+  client IP, cipher suite and metadata values.
+
+Example:
+    >>> store = DashboardStore("dashboard.db")
+    >>> store.open()
+    >>> hits = await store.search_apdus("INSTALL", then="6985")
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+from dataclasses import fields
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class PersistenceError(Exception):
+    """Error raised when the dashboard database cannot be used."""
+
+    pass
+
+
+def _to_row(obj: Any) -> Dict[str, Any]:
+    """Flatten a dataclass into column values (datetimes as ISO strings)."""
+    row = {}
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, dict):
+            value = json.dumps(value, default=str)
+        row[f.name] = value
+    return row
+
+
+def fts_query(text: str) -> str:
+    """Convert user search text into a safe FTS5 query.
+
+    Each whitespace-separated term must match a whole token; a trailing
+    ``*`` makes it a prefix match. All terms must match.
+
+    Example:
+        >>> fts_query("INSTALL 80E6*")
+        '"INSTALL" "80E6"*'
+    """
+    terms = []
+    for term in text.split():
+        prefix = term.endswith("*")
+        term = term.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"*' if prefix else f'"{term}"')
+    return " ".join(terms)
+
+
+class DashboardStore:
+    """SQLite store for dashboard sessions and APDUs.
+
+    Attributes:
+        path: Database file path.
+        batch_size: Queued APDUs that trigger a flush.
+        flush_interval: Seconds between background flushes.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS sessions ("
+        " id TEXT PRIMARY KEY,"
+        " name TEXT,"
+        " status TEXT,"
+        " created_at TEXT,"
+        " updated_at TEXT,"
+        " psk_identity TEXT,"
+        " iccid TEXT,"
+        " data TEXT NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS apdus ("
+        " rowid INTEGER PRIMARY KEY,"
+        " id TEXT NOT NULL,"
+        " session_id TEXT NOT NULL,"
+        " seq INTEGER NOT NULL,"
+        " timestamp TEXT,"
+        " direction TEXT,"
+        " data TEXT,"
+        " sw TEXT,"
+        " response_data TEXT,"
+        " metadata TEXT,"
+        " ins INTEGER,"
+        " ins_name TEXT,"
+        " apdu_type TEXT,"
+        " remote_apdu_format TEXT,"
+        " script_chaining TEXT)",
+        "CREATE INDEX IF NOT EXISTS idx_apdus_session_seq ON apdus (session_id, seq)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS apdu_fts USING fts5(text)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS session_fts USING fts5("
+        "session_id UNINDEXED, text)",
+    )
+
+    _APDU_COLUMNS = (
+        "id",
+        "session_id",
+        "seq",
+        "timestamp",
+        "direction",
+        "data",
+        "sw",
+        "response_data",
+        "metadata",
+        "ins",
+        "ins_name",
+        "apdu_type",
+        "remote_apdu_format",
+        "script_chaining",
+    )
+
+    # Session fields stored in their own columns (everything is also in ``data``)
+    _SESSION_COLUMNS = (
+        "id",
+        "name",
+        "status",
+        "created_at",
+        "updated_at",
+        "psk_identity",
+        "iccid",
+    )
+
+    # Session attributes included in the session search index
+    _SESSION_SEARCH_FIELDS = (
+        "name",
+        "psk_identity",
+        "iccid",
+        "eid",
+        "imei",
+        "seid",
+        "client_ip",
+        "cipher_suite",
+        "tls_version",
+        "protocol_mode",
+        "status",
+    )
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ):
+        """Initialize store.
+
+        Args:
+            path: Database file path.
+            batch_size: Queued APDUs that trigger a flush.
+            flush_interval: Seconds between background flushes.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dirty_sessions: Dict[str, Any] = {}
+        self._pending_apdus: List[Any] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._batch_ready = asyncio.Event()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def open(self) -> None:
+        """Open (and create if needed) the database.
+
+        Raises:
+            PersistenceError: If the database cannot be opened or SQLite
+                lacks FTS5 support.
+        """
+        if self._conn is not None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in self.SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            if "fts5" in str(e).lower():
+                raise PersistenceError("SQLite FTS5 support is required for persistence") from e
+            raise PersistenceError(f"Cannot open dashboard database {self.path}: {e}") from e
+        except (sqlite3.Error, OSError) as e:
+            raise PersistenceError(f"Cannot open dashboard database {self.path}: {e}") from e
+        self._conn = conn
+
+    def start(self) -> None:
+        """Start the background flush task."""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def close(self) -> None:
+        """Flush pending writes and close the database."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            try:
+                await self._flush_task
+            except asyncio.CancelledError:
+                pass
+            self._flush_task = None
+        if self._conn is not None:
+            await self.flush()
+            self._conn.close()
+            self._conn = None
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.flush()
+            except PersistenceError as e:
+                logger.error("%s", e)
+
+    # =========================================================================
+    # Writes
+    # =========================================================================
+
+    def save_session(self, session: Any) -> None:
+        """Queue a session to be written with its state at the next flush."""
+        self._dirty_sessions[session.id] = session
+
+    def add_apdu(self, entry: Any) -> None:
+        """Queue an APDU entry for writing."""
+        self._pending_apdus.append(entry)
+        if len(self._pending_apdus) >= self.batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> None:
+        """Write queued sessions and APDUs in one transaction.
+
+        Raises:
+            PersistenceError: If the write fails (queued records are lost).
+        """
+        if self._conn is None:
+            return
+        async with self._lock:
+            self._batch_ready.clear()
+            sessions = [_to_row(s) for s in self._dirty_sessions.values()]
+            apdus = [_to_row(a) for a in self._pending_apdus]
+            self._dirty_sessions = {}
+            self._pending_apdus = []
+            if not sessions and not apdus:
+                return
+            try:
+                await asyncio.to_thread(self._write, sessions, apdus)
+            except sqlite3.Error as e:
+                raise PersistenceError(
+                    f"Failed to write {len(sessions)} sessions and {len(apdus)} APDUs: {e}"
+                ) from e
+
+    def _write(self, sessions: List[Dict[str, Any]], apdus: List[Dict[str, Any]]) -> None:
+        conn = self._conn
+        with conn:
+            if sessions:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO sessions ({', '.join(self._SESSION_COLUMNS)}, data)"
+                    f" VALUES ({', '.join('?' * (len(self._SESSION_COLUMNS) + 1))})",
+                    [
+                        tuple(row[c] for c in self._SESSION_COLUMNS) + (json.dumps(row),)
+                        for row in sessions
+                    ],
+                )
+                conn.executemany(
+                    "DELETE FROM session_fts WHERE session_id = ?",
+                    [(row["id"],) for row in sessions],
+                )
+                conn.executemany(
+                    "INSERT INTO session_fts (session_id, text) VALUES (?, ?)",
+                    [(row["id"], self._session_text(row)) for row in sessions],
+                )
+            for row in apdus:
+                cursor = conn.execute(
+                    f"INSERT INTO apdus ({', '.join(self._APDU_COLUMNS)})"
+                    f" VALUES ({', '.join('?' * len(self._APDU_COLUMNS))})",
+                    tuple(row[c] for c in self._APDU_COLUMNS),
+                )
+                conn.execute(
+                    "INSERT INTO apdu_fts (rowid, text) VALUES (?, ?)",
+                    (cursor.lastrowid, self._apdu_text(row)),
+                )
+
+    @staticmethod
+    def _apdu_text(row: Dict[str, Any]) -> str:
+        parts = [row["direction"], row["data"], row["sw"], row["ins_name"], row["apdu_type"]]
+        if row["ins"] is not None:
+            parts.append(f"INS{row['ins']:02X}")
+        return " ".join(str(p) for p in parts if p)
+
+    def _session_text(self, row: Dict[str, Any]) -> str:
+        parts = [row.get(name) for name in self._SESSION_SEARCH_FIELDS]
+        metadata = json.loads(row.get("metadata") or "{}")
+        parts.extend(v for v in metadata.values() if isinstance(v, (str, int, float)))
+        return " ".join(str(p) for p in parts if p)
+
+    async def delete_session(self, session_id: str) -> None:
+        """Delete a session and its APDUs."""
+        await self._delete([session_id], delete_session=True)
+
+    async def delete_sessions(self, session_ids: List[str]) -> None:
+        """Delete several sessions and their APDUs in one transaction."""
+        await self._delete(session_ids, delete_session=True)
+
+    async def clear_apdus(self, session_id: str) -> None:
+        """Delete a session's APDUs."""
+        await self._delete([session_id], delete_session=False)
+
+    async def _delete(self, session_ids: List[str], delete_session: bool) -> None:
+        if self._conn is None or not session_ids:
+            return
+        # Write anything queued first so the delete also covers it
+        await self.flush()
+        async with self._lock:
+            await asyncio.to_thread(self._delete_rows, session_ids, delete_session)
+
+    def _delete_rows(self, session_ids: List[str], delete_session: bool) -> None:
+        params = [(session_id,) for session_id in session_ids]
+        with self._conn as conn:
+            conn.executemany(
+                "DELETE FROM apdu_fts WHERE rowid IN"
+                " (SELECT rowid FROM apdus WHERE session_id = ?)",
+                params,
+            )
+            conn.executemany("DELETE FROM apdus WHERE session_id = ?", params)
+            if delete_session:
+                conn.executemany("DELETE FROM session_fts WHERE session_id = ?", params)
+                conn.executemany("DELETE FROM sessions WHERE id = ?", params)
+
+    # =========================================================================
+    # Reads
+    # =========================================================================
+
+    async def _query(self, sql: str, params: tuple = ()) -> List[sqlite3.Row]:
+        if self._conn is None:
+            raise PersistenceError("Dashboard database is not open")
+
+        def run() -> List[sqlite3.Row]:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            return cursor.execute(sql, params).fetchall()
+
+        async with self._lock:
+            return await asyncio.to_thread(run)
+
+    async def load_sessions(self) -> List[Dict[str, Any]]:
+        """Load every stored session as a dict of Session fields."""
+        rows = await self._query("SELECT data FROM sessions ORDER BY created_at")
+        sessions = []
+        for row in rows:
+            data = json.loads(row["data"])
+            for name in ("created_at", "updated_at"):
+                data[name] = datetime.fromisoformat(data[name])
+            data["metadata"] = json.loads(data.get("metadata") or "{}")
+            sessions.append(data)
+        return sessions
+
+    async def load_apdus(self, session_id: str, limit: int) -> List[Dict[str, Any]]:
+        """Load the newest ``limit`` APDUs of a session, oldest first."""
+        rows = await self._query(
+            f"SELECT {', '.join(self._APDU_COLUMNS)} FROM apdus"
+            " WHERE session_id = ? ORDER BY seq DESC LIMIT ?",
+            (session_id, limit),
+        )
+        return [self._apdu_fields(row) for row in reversed(rows)]
+
+    @staticmethod
+    def _apdu_fields(row: sqlite3.Row) -> Dict[str, Any]:
+        data = dict(row)
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        data["metadata"] = json.loads(data["metadata"] or "{}")
+        return data
+
+    async def search_apdus(
+        self,
+        query: str,
+        then: Optional[str] = None,
+        within: int = 1,
+        session_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Search stored APDUs.
+
+        Args:
+            query: Search terms (see :func:`fts_query`).
+            then: Optional terms that must match a later APDU of the same
+                session, at most ``within`` entries after the first match
+                (e.g. query ``INSTALL`` then ``6985``).
+            within: Maximum sequence distance for ``then``.
+            session_id: Restrict to one session.
+            limit: Maximum results.
+
+        Returns:
+            Matching APDUs as dicts of APDUEntry fields, newest first. With
+            ``then``, each result also has a ``followed_by`` entry.
+
+        Raises:
+            PersistenceError: If the database is not open.
+        """
+        await self.flush()
+        match = fts_query(query)
+        if not match:
+            return []
+        columns = ", ".join(f"a.{c}" for c in self._APDU_COLUMNS)
+        session_filter = " AND a.session_id = ?" if session_id else ""
+        session_params = (session_id,) if session_id else ()
+
+        if not then:
+            rows = await self._query(
+                f"SELECT {columns} FROM apdu_fts f JOIN apdus a ON a.rowid = f.rowid"
+                f" WHERE apdu_fts MATCH ?{session_filter}"
+                " ORDER BY a.rowid DESC LIMIT ?",
+                (match, *session_params, limit),
+            )
+            return [self._apdu_fields(row) for row in rows]
+
+        then_match = fts_query(then)
+        if not then_match:
+            return []
+        then_columns = ", ".join(f"b.{c} AS then_{c}" for c in self._APDU_COLUMNS)
+        rows = await self._query(
+            f"SELECT {columns}, {then_columns}"
+            " FROM apdus a JOIN apdus b"
+            "  ON b.session_id = a.session_id AND b.seq > a.seq AND b.seq <= a.seq + ?"
+            " WHERE a.rowid IN (SELECT rowid FROM apdu_fts WHERE apdu_fts MATCH ?)"
+            "  AND b.rowid IN (SELECT rowid FROM apdu_fts WHERE apdu_fts MATCH ?)"
+            f"{session_filter}"
+            " ORDER BY a.rowid DESC LIMIT ?",
+            (within, match, then_match, *session_params, limit),
+        )
+        results = []
+        for row in rows:
+            data = dict(row)
+            first = {c: data[c] for c in self._APDU_COLUMNS}
+            second = {c: data[f"then_{c}"] for c in self._APDU_COLUMNS}
+            result = self._apdu_fields(first)
+            result["followed_by"] = self._apdu_fields(second)
+            results.append(result)
+        return results
+
+    async def search_sessions(self, query: str, limit: int = 100) -> List[str]:
+        """Search stored sessions by name, identifiers and metadata.
+
+        Returns:
+            Matching session IDs, best match first.
+        """
+        await self.flush()
+        match = fts_query(query)
+        if not match:
+            return []
+        rows = await self._query(
+            "SELECT session_id FROM session_fts WHERE session_fts MATCH ? ORDER BY rank LIMIT ?",
+            (match, limit),
+        )
+        return [row["session_id"] for row in rows]
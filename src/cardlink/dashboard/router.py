@@ -0,0 +1,131 @@
+"""HTTP request routing for the dashboard server.
+
+This module provides a small precompiled router that maps an HTTP method
+and path to a handler. Static paths are resolved with a single dict
+lookup; parameterized paths are compiled to regular expressions once,
+when the route is added.
+
+Path patterns:
+    ``/api/sessions``                      exact match
+    ``/api/sessions/{session_id}``         one path segment as a parameter
+    ``/api/scripts/{rest:path}``           remainder of the path (may contain ``/``)
+
+Example:
+    >>> router = Router()
+    >>> router.add("GET", "/api/sessions/{session_id}", get_session)
+    >>> match = router.match("GET", "/api/sessions/abc")
+    >>> match.handler, match.params
+    (<function get_session ...>, {'session_id': 'abc'})
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Pattern, Tuple
+from urllib.parse import unquote
+
+# Method wildcard matching every HTTP method
+ANY_METHOD = "*"
+
+_PARAM_RE = re.compile(r"\{(\w+)(?::(path))?\}")
+
+
+@dataclass
+class RouteMatch:
+    """Result of matching a request path.
+
+    Attributes:
+        handler: Handler for the request method, or None if the path exists
+            but does not accept the method (405).
+        params: Path parameters extracted from the URL.
+        allowed_methods: Methods accepted by the matched path.
+    """
+
+    handler: Optional[Callable[..., Any]]
+    params: Dict[str, str] = field(default_factory=dict)
+    allowed_methods: FrozenSet[str] = frozenset()
+
+
+def _normalize(path: str) -> str:
+    """Strip trailing slash (except for the root path)."""
+    if len(path) > 1 and path.endswith("/"):
+        return path.rstrip("/") or "/"
+    return path
+
+
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a path pattern to an anchored regular expression."""
+    regex = []
+    pos = 0
+    for m in _PARAM_RE.finditer(pattern):
+        regex.append(re.escape(pattern[pos : m.start()]))
+        name, kind = m.group(1), m.group(2)
+        regex.append(f"(?P<{name}>.+)" if kind == "path" else f"(?P<{name}>[^/]+)")
+        pos = m.end()
+    regex.append(re.escape(pattern[pos:]))
+    return re.compile("^" + "".join(regex) + "$")
+
+
+class Router:
+    """Method and path router with parameter extraction.
+
+    Routes are matched in two stages: an exact lookup in the table of
+    static paths, then the parameterized patterns in registration order.
+    """
+
+    def __init__(self) -> None:
+        self._static: Dict[str, Dict[str, Callable[..., Any]]] = {}
+        self._dynamic: List[Tuple[Pattern[str], Dict[str, Callable[..., Any]]]] = []
+        self._dynamic_index: Dict[str, Dict[str, Callable[..., Any]]] = {}
+
+    def add(self, method: str, pattern: str, handler: Callable[..., Any]) -> None:
+        """Register a handler.
+
+        Args:
+            method: HTTP method, or ``"*"`` for any method.
+            pattern: Path pattern (see module docstring).
+            handler: Handler callable.
+        """
+        method = method.upper()
+        pattern = _normalize(pattern)
+
+        if not _PARAM_RE.search(pattern):
+            self._static.setdefault(pattern, {})[method] = handler
+            return
+
+        handlers = self._dynamic_index.get(pattern)
+        if handlers is None:
+            handlers = self._dynamic_index[pattern] = {}
+            self._dynamic.append((_compile_pattern(pattern), handlers))
+        handlers[method] = handler
+
+    def match(self, method: str, path: str) -> Optional[RouteMatch]:
+        """Find the handler for a request.
+
+        Args:
+            method: HTTP method.
+            path: Request path without query string.
+
+        Returns:
+            RouteMatch, or None if no route matches the path (404).
+        """
+        path = _normalize(path)
+        params: Dict[str, str] = {}
+
+        handlers = self._static.get(path)
+        if handlers is None:
+            for regex, candidate in self._dynamic:
+                m = regex.match(path)
+                if m:
+                    handlers = candidate
+                    params = {k: unquote(v) for k, v in m.groupdict().items()}
+                    break
+            else:
+                return None
+
+        handler = handlers.get(method.upper()) or handlers.get(ANY_METHOD)
+        return RouteMatch(handler=handler, params=params, allowed_methods=frozenset(handlers))
+
+    def __len__(self) -> int:
+        return sum(len(h) for h in self._static.values()) + sum(
+            len(h) for _, h in self._dynamic
+        )
@@ -14,15 +14,41 @@ Example:
 """
 
 import asyncio
+import inspect
 import json
 import logging
-import mimetypes
 import os
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl
+
+from cardlink.dashboard.assets import StaticAssetCache, accepts_gzip
+from cardlink.dashboard.bridge import BridgedEvent, EventBridge
+from cardlink.dashboard.classify import classify_apdu
+from cardlink.dashboard.coalescer import EventCoalescer
+from cardlink.dashboard.expiry import ExpiryScheduler
+from cardlink.dashboard.history import APDUHistory
+from cardlink.dashboard.metrics import SERIES, TimeSeriesAggregator
+from cardlink.dashboard.persistence import DashboardStore, PersistenceError
+from cardlink.dashboard.router import ANY_METHOD, Router
+from cardlink.dashboard.websocket import (
+    CLOSE_NORMAL,
+    OP_CLOSE,
+    OP_PING,
+    OP_PONG,
+    OP_TEXT,
+    PerMessageDeflate,
+    WebSocketError,
+    WebSocketReader,
+    accept_key,
+    encode_close,
+    encode_frame,
+    encode_message,
+)
 
 # Import protocol layer for APDU parsing and analysis
 try:
@@ -107,6 +133,18 @@ logger = logging.getLogger(__name__)
 # Get the static files directory
 STATIC_DIR = Path(__file__).parent / "static"
 
+# Query parameters accepted by GET /api/sessions -> session attribute
+SESSION_QUERY_FILTERS = {
+    "pskIdentity": "psk_identity",
+    "iccid": "iccid",
+    "eid": "eid",
+    "imei": "imei",
+    "seid": "seid",
+    "clientIp": "client_ip",
+    "status": "status",
+    "protocolMode": "protocol_mode",
+}
+
 
 @dataclass
 class DashboardConfig:
@@ -119,6 +157,62 @@ class DashboardConfig:
     debug: bool = False
     session_timeout_seconds: float = 0.0  # 0 = disabled, auto-close sessions after timeout
     scripts_dir: Optional[Path] = None  # Directory to load APDU scripts from
+    keepalive_timeout: float = 15.0  # Idle seconds before a persistent connection is closed
+    max_keepalive_requests: int = 1000  # Requests served per connection before closing
+    max_header_size: int = 16 * 1024  # Total request header bytes
+    max_body_size: int = 4 * 1024 * 1024  # Request body bytes
+    ws_send_queue_size: int = 256  # Frames queued per WebSocket client
+    ws_drop_when_full: bool = False  # Drop frames for slow clients instead of disconnecting
+    ws_compression: bool = True  # Negotiate permessage-deflate with clients that offer it
+    ws_max_message_size: int = 1024 * 1024  # Largest incoming WebSocket message
+    apdu_history_size: int = 10000  # APDUs retained per session (oldest are evicted)
+    apdu_page_size: int = 500  # Default and maximum ?limit for paginated APDU requests
+    admin_event_batch_size: int = 500  # Admin server events applied per batch
+    admin_event_buffer_size: int = 100000  # Buffered admin server events before dropping
+    ws_flush_interval: float = 0.05  # Seconds APDU events are coalesced (0 = send each)
+    ws_batch_size: int = 200  # Coalesced APDU events that trigger an early flush
+    static_cache_max_file_size: int = 1024 * 1024  # Larger static files are sent from disk
+    persistence_path: Optional[Path] = None  # SQLite file for sessions/APDUs (None = memory only)
+    persistence_flush_interval: float = 1.0  # Seconds between batched database writes
+
+
+class RequestError(Exception):
+    """HTTP request rejected before routing."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class HTTPRequest:
+    """Parsed HTTP request."""
+
+    method: str
+    path: str
+    query: str = ""
+    version: str = "HTTP/1.1"
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Optional[str] = None
+
+    @property
+    def keep_alive(self) -> bool:
+        """Whether the client wants the connection kept open."""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return "keep-alive" in connection
+        return "close" not in connection
+
+    @property
+    def is_websocket_upgrade(self) -> bool:
+        """Whether this is a WebSocket upgrade request."""
+        return self.headers.get("upgrade", "").lower() == "websocket"
+
+    @property
+    def query_params(self) -> Dict[str, str]:
+        """Query string parameters (last value wins)."""
+        return dict(parse_qsl(self.query)) if self.query else {}
 
 
 @dataclass
@@ -131,6 +225,7 @@ class Session:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     apdu_count: int = 0
+    apdus_dropped: int = 0  # Evicted from the bounded APDU history
     metadata: Dict[str, Any] = field(default_factory=dict)
     psk_identity: Optional[str] = None
     client_ip: Optional[str] = None
@@ -149,6 +244,8 @@ class Session:
     ram_command_count: int = 0
     rfm_command_count: int = 0
     script_count: int = 0
+    # State version (DashboardState.version at the last change)
+    version: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -172,6 +269,7 @@ class Session:
             "createdAt": self.created_at.isoformat(),
             "updatedAt": self.updated_at.isoformat(),
             "apduCount": self.apdu_count,
+            "apdusDropped": self.apdus_dropped,
             "metadata": metadata,
             "pskIdentity": self.psk_identity,
             "clientIp": self.client_ip,
@@ -189,6 +287,7 @@ class Session:
             "ramCommandCount": self.ram_command_count,
             "rfmCommandCount": self.rfm_command_count,
             "scriptCount": self.script_count,
+            "version": self.version,
         }
 
 
@@ -210,11 +309,13 @@ class APDUEntry:
     apdu_type: Optional[str] = None  # 'ram', 'rfm', 'standard', 'unknown'
     remote_apdu_format: Optional[str] = None  # 'compact', 'expanded', None
     script_chaining: Optional[str] = None  # 'first', 'subsequent', 'last', 'only'
+    seq: int = 0  # Position in the session's APDU history (assigned on insert)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
             "id": self.id,
+            "seq": self.seq,
             "sessionId": self.session_id,
             "timestamp": int(self.timestamp.timestamp() * 1000),
             "direction": self.direction,
@@ -231,80 +332,182 @@ class APDUEntry:
         }
 
 
-# APDU parsing helper functions
-def _parse_apdu_info(apdu_hex: str, direction: str) -> Dict[str, Any]:
-    """Parse APDU and extract protocol information.
+@dataclass
+class SessionChanges:
+    """Session changes since a state version.
+
+    Attributes:
+        version: Current state version (pass as ``since`` next time).
+        sessions: Sessions created or changed since the given version.
+        deleted: IDs of sessions deleted since the given version.
+        reset: True if ``sessions`` is the full list and replaces the
+            client's copy (first sync, or history no longer available).
+    """
 
-    Args:
-        apdu_hex: APDU data as hex string.
-        direction: 'command' or 'response'.
+    version: int
+    sessions: List[Session]
+    deleted: List[str]
+    reset: bool = False
 
-    Returns:
-        Dictionary with parsed info: ins, ins_name, apdu_type.
-    """
-    result = {
-        "ins": None,
-        "ins_name": None,
-        "apdu_type": None,
-        "remote_apdu_format": None,
-    }
 
-    if direction != "command" or len(apdu_hex) < 8:
-        return result
+class DashboardState:
+    """In-memory state storage for dashboard.
 
-    try:
-        apdu_bytes = bytes.fromhex(apdu_hex)
-        if len(apdu_bytes) < 4:
-            return result
-
-        ins = apdu_bytes[1]
-        result["ins"] = ins
-
-        # INS name mapping
-        ins_names = {
-            0xA4: "SELECT",
-            0xB0: "READ BINARY",
-            0xB2: "READ RECORD",
-            0xC0: "GET RESPONSE",
-            0xCA: "GET DATA",
-            0xD6: "UPDATE BINARY",
-            0xDC: "UPDATE RECORD",
-            0xE2: "STORE DATA",
-            0xE4: "DELETE",
-            0xE6: "INSTALL",
-            0xE8: "LOAD",
-            0xF2: "GET STATUS",
-            0xF0: "SET STATUS",
-            0x50: "INITIALIZE UPDATE",
-            0x82: "EXTERNAL AUTHENTICATE",
-            0x84: "GET CHALLENGE",
-            0xD8: "PUT KEY",
-        }
-        result["ins_name"] = ins_names.get(ins, f"INS_{ins:02X}")
-
-        # Determine APDU type (RAM, RFM, standard)
-        ram_commands = {0xE4, 0xE6, 0xE8, 0xF2, 0xF0, 0xD8, 0xE2}
-        if ins in ram_commands:
-            result["apdu_type"] = "ram"
-        elif ins in {0xA4, 0xB0, 0xB2, 0xC0, 0xCA, 0xD6, 0xDC}:
-            result["apdu_type"] = "standard"
-        else:
-            result["apdu_type"] = "unknown"
+    Sessions are indexed by the identifiers in ``INDEXED_FIELDS`` so that
+    lookups (e.g. mapping an admin server APDU event to its session by
+    PSK identity) do not scan every session.
 
-    except (ValueError, IndexError):
-        pass
+    With a DashboardStore attached (see :meth:`attach_store`), every
+    change is also written to SQLite and the full APDU history can be
+    searched beyond what the in-memory ring buffers retain.
 
-    return result
+    Every change to a session bumps the monotonic ``version`` and stamps
+    it on the session, so clients can fetch only what changed (see
+    :meth:`get_changes`) and serialized sessions can be cached until
+    their version changes (see :meth:`session_dict`).
+    """
 
+    # Session attributes with a hash index (value -> session IDs in creation order)
+    INDEXED_FIELDS = ("psk_identity", "iccid", "eid", "imei", "client_ip")
 
-class DashboardState:
-    """In-memory state storage for dashboard."""
+    # Deleted session IDs remembered for delta sync; older clients get a reset
+    MAX_TOMBSTONES = 1000
+
+    def __init__(self, apdu_history_size: int = 10000, session_timeout: float = 0.0):
+        """Initialize state.
 
-    def __init__(self):
+        Args:
+            apdu_history_size: APDUs retained per session.
+            session_timeout: Idle seconds after which sessions expire
+                (0 = never). Expired sessions are collected with
+                :meth:`expire_sessions`.
+        """
         self.sessions: Dict[str, Session] = {}
-        self.apdus: Dict[str, List[APDUEntry]] = {}  # session_id -> apdus
+        self.apdus: Dict[str, APDUHistory] = {}  # session_id -> apdus
+        self.apdu_history_size = apdu_history_size
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {
+            name: {} for name in self.INDEXED_FIELDS
+        }
+        self._store: Optional[DashboardStore] = None
+        self.version = 0
+        self._changelog: OrderedDict[str, int] = OrderedDict()  # session_id -> version
+        self._tombstones: OrderedDict[str, int] = OrderedDict()  # session_id -> version
+        self._tombstone_floor = 0  # Version of the newest forgotten tombstone
+        self._dict_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+        self.expiry = ExpiryScheduler(session_timeout) if session_timeout > 0 else None
         self._lock = asyncio.Lock()
 
+    @property
+    def store(self) -> Optional[DashboardStore]:
+        """Get the attached persistent store, if any."""
+        return self._store
+
+    async def attach_store(self, store: DashboardStore) -> int:
+        """Attach a persistent store and restore its sessions.
+
+        Sessions already in memory are kept (and written to the store);
+        each restored session gets its newest APDUs back in its history.
+
+        Args:
+            store: Open DashboardStore.
+
+        Returns:
+            Number of sessions restored.
+        """
+        async with self._lock:
+            self._store = store
+            restored = 0
+            for data in await store.load_sessions():
+                if data["id"] in self.sessions:
+                    continue
+                known = {k: v for k, v in data.items() if k in Session.__dataclass_fields__}
+                session = Session(**known)
+                history = APDUHistory(self.apdu_history_size)
+                for apdu in await store.load_apdus(session.id, self.apdu_history_size):
+                    history.restore(APDUEntry(**apdu))
+                # Keep counting evictions from the persisted total
+                history.dropped = session.apdus_dropped
+                self.sessions[session.id] = session
+                self.apdus[session.id] = history
+                self._index_session(session)
+                if self.expiry is not None:
+                    self.expiry.touch(session.id)
+                restored += 1
+
+            # Continue numbering after the restored versions
+            ordered = sorted(self.sessions.values(), key=lambda session: session.version)
+            self._changelog = OrderedDict((session.id, session.version) for session in ordered)
+            if ordered:
+                self.version = max(self.version, ordered[-1].version)
+            for session in self.sessions.values():
+                store.save_session(session)
+            return restored
+
+    def _touch(self, session: Session) -> None:
+        """Record a change to a session (call with the lock held)."""
+        self.version += 1
+        session.version = self.version
+        self._changelog[session.id] = self.version
+        self._changelog.move_to_end(session.id)
+        if self.expiry is not None:
+            self.expiry.touch(session.id)
+        if self._store is not None:
+            self._store.save_session(session)
+
+    def session_dict(self, session: Session) -> Dict[str, Any]:
+        """Get a session in API format, reusing the cached dict if unchanged.
+
+        The returned dict is shared and must not be modified.
+        """
+        cached = self._dict_cache.get(session.id)
+        if cached is not None and cached[0] == session.version:
+            return cached[1]
+        data = session.to_dict()
+        self._dict_cache[session.id] = (session.version, data)
+        return data
+
+    async def get_changes(self, since: int) -> SessionChanges:
+        """Get sessions changed and deleted after a state version.
+
+        Args:
+            since: Version from a previous call (0 for a full sync).
+
+        Returns:
+            SessionChanges with sessions in the order they changed.
+        """
+        version = self.version
+        if since <= 0 or since > version or since < self._tombstone_floor:
+            return SessionChanges(version, list(self.sessions.values()), [], reset=True)
+
+        changed = []
+        for session_id in reversed(self._changelog):
+            if self._changelog[session_id] <= since:
+                break
+            changed.append(self.sessions[session_id])
+        deleted = []
+        for session_id in reversed(self._tombstones):
+            if self._tombstones[session_id] <= since:
+                break
+            deleted.append(session_id)
+        changed.reverse()
+        deleted.reverse()
+        return SessionChanges(version, changed, deleted)
+
+    def _index_session(self, session: Session) -> None:
+        for name, index in self._indexes.items():
+            value = getattr(session, name)
+            if value is not None:
+                index.setdefault(value, {})[session.id] = None
+
+    def _unindex_session(self, session: Session) -> None:
+        for name, index in self._indexes.items():
+            value = getattr(session, name)
+            ids = index.get(value)
+            if ids is not None:
+                ids.pop(session.id, None)
+                if not ids:
+                    del index[value]
+
     async def create_session(
         self,
         name: str,
@@ -371,7 +574,9 @@ class DashboardState:
                 metadata=metadata,
             )
             self.sessions[session.id] = session
-            self.apdus[session.id] = []
+            self.apdus[session.id] = APDUHistory(self.apdu_history_size)
+            self._index_session(session)
+            self._touch(session)
             return session
 
     async def get_session(self, session_id: str) -> Optional[Session]:
@@ -382,12 +587,61 @@ class DashboardState:
         """Get a session by PSK identity.
 
         This is used to map APDU events (which use PSK identity as session_id)
-        to dashboard sessions (which use a random UUID as session ID).
+        to dashboard sessions (which use a random UUID as session ID). If
+        several sessions share the identity, the oldest one is returned.
         """
-        for session in self.sessions.values():
-            if session.psk_identity == psk_identity:
-                return session
-        return None
+        ids = self._indexes["psk_identity"].get(psk_identity)
+        if not ids:
+            return None
+        if len(ids) == 1:
+            return self.sessions.get(next(iter(ids)))
+        return min((self.sessions[sid] for sid in ids), key=lambda session: session.created_at)
+
+    async def find_sessions(self, **criteria: Any) -> List[Session]:
+        """Find sessions whose attributes equal all given values.
+
+        Indexed attributes (see ``INDEXED_FIELDS``) are resolved through
+        their index; remaining criteria are checked on the candidates.
+
+        Args:
+            **criteria: Session attribute names and required values.
+
+        Returns:
+            Matching sessions in creation order.
+
+        Raises:
+            ValueError: If a criterion is not a session attribute.
+
+        Example:
+            >>> await state.find_sessions(iccid="8901234567890123456", status="active")
+        """
+        unknown = [name for name in criteria if name not in Session.__dataclass_fields__]
+        if unknown:
+            raise ValueError(f"Unknown session attribute: {', '.join(unknown)}")
+
+        indexed = []
+        filters = []
+        for name, value in criteria.items():
+            if name in self._indexes and value is not None:
+                ids = self._indexes[name].get(value)
+                if not ids:
+                    return []
+                indexed.append(ids)
+            filters.append((name, value))
+
+        candidates = min(indexed, key=len) if indexed else None
+        if candidates is None:
+            sessions = self.sessions.values()
+        else:
+            sessions = [self.sessions[sid] for sid in candidates if sid in self.sessions]
+        result = [
+            session
+            for session in sessions
+            if all(getattr(session, name) == value for name, value in filters)
+        ]
+        if candidates is not None:
+            result.sort(key=lambda session: session.created_at)
+        return result
 
     async def get_sessions(self) -> List[Session]:
         """Get all sessions."""
@@ -400,21 +654,62 @@ class DashboardState:
             if not session:
                 return None
 
+            reindex = any(key in self._indexes for key in updates)
+            if reindex:
+                self._unindex_session(session)
             for key, value in updates.items():
                 if hasattr(session, key):
                     setattr(session, key, value)
+            if reindex:
+                self._index_session(session)
 
             session.updated_at = datetime.now()
+            self._touch(session)
             return session
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete a session."""
+        return bool(await self.delete_sessions([session_id]))
+
+    async def delete_sessions(self, session_ids: List[str]) -> List[Session]:
+        """Delete several sessions at once.
+
+        Args:
+            session_ids: IDs of sessions to delete (unknown IDs are ignored).
+
+        Returns:
+            Deleted sessions.
+        """
         async with self._lock:
-            if session_id in self.sessions:
-                del self.sessions[session_id]
+            deleted = []
+            for session_id in session_ids:
+                session = self.sessions.pop(session_id, None)
+                if session is None:
+                    continue
+                self._unindex_session(session)
                 self.apdus.pop(session_id, None)
-                return True
-            return False
+                self._changelog.pop(session_id, None)
+                self._dict_cache.pop(session_id, None)
+                if self.expiry is not None:
+                    self.expiry.remove(session_id)
+                self.version += 1
+                self._tombstones[session_id] = self.version
+                if len(self._tombstones) > self.MAX_TOMBSTONES:
+                    _, self._tombstone_floor = self._tombstones.popitem(last=False)
+                deleted.append(session)
+            if deleted and self._store is not None:
+                await self._store.delete_sessions([session.id for session in deleted])
+            return deleted
+
+    async def expire_sessions(self) -> List[Session]:
+        """Delete sessions idle for longer than the session timeout.
+
+        Returns:
+            Expired sessions (empty if the timeout is disabled).
+        """
+        if self.expiry is None:
+            return []
+        return await self.delete_sessions(self.expiry.pop_expired())
 
     async def add_apdu(
         self,
@@ -423,16 +718,34 @@ class DashboardState:
         data: str,
         sw: Optional[str] = None,
         response_data: Optional[str] = None,
+        raw: Optional[bytes] = None,
         **metadata,
     ) -> Optional[APDUEntry]:
-        """Add an APDU entry with protocol analysis."""
+        """Add an APDU entry with protocol analysis.
+
+        Args:
+            session_id: Session ID.
+            direction: 'command' or 'response'.
+            data: APDU data (hex string).
+            sw: Status word for responses.
+            response_data: Response data for responses.
+            raw: APDU bytes, if the caller has them (saves decoding ``data``).
+            **metadata: Additional metadata.
+
+        Returns:
+            Created APDU entry or None if session not found.
+        """
+        if raw is None:
+            try:
+                raw = bytes.fromhex(data)
+            except ValueError:
+                raw = b""
+        apdu_info = classify_apdu(raw, direction)
+
         async with self._lock:
             if session_id not in self.sessions:
                 return None
 
-            # Parse APDU for protocol information
-            apdu_info = _parse_apdu_info(data, direction)
-
             entry = APDUEntry(
                 id=str(uuid.uuid4()),
                 session_id=session_id,
@@ -443,71 +756,228 @@ class DashboardState:
                 response_data=response_data,
                 metadata=metadata,
                 # Protocol analysis fields
-                ins=apdu_info.get("ins"),
-                ins_name=apdu_info.get("ins_name"),
-                apdu_type=apdu_info.get("apdu_type"),
-                remote_apdu_format=apdu_info.get("remote_apdu_format"),
+                ins=apdu_info.ins,
+                ins_name=apdu_info.ins_name,
+                apdu_type=apdu_info.apdu_type,
+                remote_apdu_format=apdu_info.remote_apdu_format,
             )
 
-            if session_id not in self.apdus:
-                self.apdus[session_id] = []
-
-            self.apdus[session_id].append(entry)
+            history = self.apdus.get(session_id)
+            if history is None:
+                history = self.apdus[session_id] = APDUHistory(self.apdu_history_size)
+            history.append(entry)
 
             # Update session counters
             session = self.sessions[session_id]
-            session.apdu_count = len(self.apdus[session_id])
+            session.apdu_count += 1
+            session.apdus_dropped = history.dropped
             session.updated_at = datetime.now()
 
             # Update protocol-specific counters
-            if apdu_info.get("apdu_type") == "ram":
+            if apdu_info.apdu_type == "ram":
                 session.ram_command_count += 1
-            elif apdu_info.get("apdu_type") == "rfm":
+            elif apdu_info.apdu_type == "rfm":
                 session.rfm_command_count += 1
 
+            if self._store is not None:
+                self._store.add_apdu(entry)
+            self._touch(session)
             return entry
 
     async def get_apdus(self, session_id: str) -> List[APDUEntry]:
-        """Get APDUs for a session."""
-        return self.apdus.get(session_id, [])
+        """Get retained APDUs for a session."""
+        history = self.apdus.get(session_id)
+        return list(history) if history is not None else []
+
+    async def get_apdu_history(self, session_id: str) -> Optional[APDUHistory]:
+        """Get the APDU history buffer of a session (None if not found)."""
+        return self.apdus.get(session_id)
+
+    async def search_apdus(self, query: str, **options: Any) -> List[Dict[str, Any]]:
+        """Search the persisted APDU history.
+
+        Args:
+            query: Search terms.
+            **options: ``then``, ``within``, ``session_id`` and ``limit``
+                (see DashboardStore.search_apdus).
+
+        Returns:
+            Matching APDUs as dicts in API format, newest first.
+
+        Raises:
+            PersistenceError: If no store is attached.
+        """
+        if self._store is None:
+            raise PersistenceError("Persistence is not enabled")
+        results = []
+        for row in await self._store.search_apdus(query, **options):
+            followed_by = row.pop("followed_by", None)
+            result = APDUEntry(**row).to_dict()
+            if followed_by is not None:
+                result["followedBy"] = APDUEntry(**followed_by).to_dict()
+            results.append(result)
+        return results
+
+    async def search_sessions(self, query: str, limit: int = 100) -> List[Session]:
+        """Search sessions by name, identifiers and metadata.
+
+        Raises:
+            PersistenceError: If no store is attached.
+        """
+        if self._store is None:
+            raise PersistenceError("Persistence is not enabled")
+        ids = await self._store.search_sessions(query, limit)
+        return [self.sessions[sid] for sid in ids if sid in self.sessions]
 
     async def clear_apdus(self, session_id: str) -> bool:
         """Clear APDUs for a session."""
         async with self._lock:
-            if session_id in self.apdus:
-                self.apdus[session_id] = []
-                self.sessions[session_id].apdu_count = 0
+            history = self.apdus.get(session_id)
+            if history is not None:
+                history.clear()
+                session = self.sessions[session_id]
+                session.apdu_count = 0
+                if self._store is not None:
+                    await self._store.clear_apdus(session_id)
+                self._touch(session)
                 return True
             return False
 
 
 class WebSocketClient:
-    """WebSocket client connection."""
+    """WebSocket client connection.
 
-    def __init__(self, writer: asyncio.StreamWriter):
+    Outgoing frames go through a bounded queue drained by a per-client
+    writer task, so a slow client never blocks delivery to others. When
+    the queue is full the client is either disconnected or the frame is
+    dropped, depending on ``drop_when_full``.
+    """
+
+    def __init__(
+        self,
+        writer: asyncio.StreamWriter,
+        queue_size: int = 256,
+        drop_when_full: bool = False,
+        deflate: Optional[PerMessageDeflate] = None,
+    ):
         self.writer = writer
+        self.deflate = deflate
         self.id = str(uuid.uuid4())
         self.subscriptions: Set[str] = set()
+        self.drop_when_full = drop_when_full
+        self.frames_sent = 0
+        self.frames_dropped = 0
+        self.closed = False
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._writer_task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the writer task."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._write_loop())
+
+    def wants(self, event_type: str) -> bool:
+        """Check if the client is subscribed to an event.
+
+        Clients without subscriptions receive every event. A subscription
+        matches the exact event type or its channel prefix (``session``
+        matches ``session.created``).
+        """
+        subscriptions = self.subscriptions
+        if not subscriptions or "*" in subscriptions or event_type in subscriptions:
+            return True
+        return event_type.split(".", 1)[0] in subscriptions
+
+    def enqueue(self, frame: bytes) -> bool:
+        """Queue an encoded frame for sending.
+
+        Args:
+            frame: Complete WebSocket frame.
+
+        Returns:
+            True if the frame was queued.
+        """
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(frame)
+            return True
+        except asyncio.QueueFull:
+            if self.drop_when_full:
+                self.frames_dropped += 1
+                return False
+            logger.warning(
+                "WebSocket client %s is not keeping up (%d frames queued), disconnecting",
+                self.id, self._queue.qsize()
+            )
+            self.close()
+            return False
 
     async def send(self, message: Dict[str, Any]) -> None:
         """Send a message to the client."""
-        try:
-            data = json.dumps(message).encode()
-            # Simple WebSocket frame (text frame)
-            if len(data) <= 125:
-                frame = bytes([0x81, len(data)]) + data
-            elif len(data) <= 65535:
-                frame = bytes([0x81, 126]) + len(data).to_bytes(2, "big") + data
-            else:
-                frame = bytes([0x81, 127]) + len(data).to_bytes(8, "big") + data
+        self.enqueue(encode_message(json.dumps(message).encode(), deflate=self.deflate))
+
+    async def shutdown(
+        self, code: int = CLOSE_NORMAL, reason: str = "", timeout: float = 1.0
+    ) -> None:
+        """Send a close frame after queued frames, then close the connection.
 
-            self.writer.write(frame)
-            await self.writer.drain()
+        Args:
+            code: Close status code.
+            reason: Close reason.
+            timeout: Seconds to wait for queued frames to be written.
+        """
+        if self.closed:
+            return
+        if self._writer_task is not None and self.enqueue(encode_close(code, reason)):
+            try:
+                self._queue.put_nowait(None)
+                await asyncio.wait_for(asyncio.shield(self._writer_task), timeout)
+            except (asyncio.QueueFull, asyncio.TimeoutError):
+                pass
+        self.close()
+
+    async def _write_loop(self) -> None:
+        """Drain the send queue, batching queued frames into one write.
+
+        A ``None`` entry ends the loop once the frames before it are written.
+        """
+        queue = self._queue
+        try:
+            while True:
+                frames = [await queue.get()]
+                while not queue.empty():
+                    frames.append(queue.get_nowait())
+                done = None in frames
+                if done:
+                    frames = frames[: frames.index(None)]
+                self.writer.write(b"".join(frames))
+                await self.writer.drain()
+                self.frames_sent += len(frames)
+                if done:
+                    return
+        except asyncio.CancelledError:
+            pass
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
             # Connection was closed by client - this is expected behavior
             logger.debug("Connection closed for client %s: %s", self.id, e)
+            self.close()
         except Exception as e:
             logger.debug("Failed to send to client %s: %s", self.id, e)
+            self.close()
+
+    def close(self) -> None:
+        """Stop sending and abort the connection."""
+        if self.closed:
+            return
+        self.closed = True
+        if self._writer_task is not None and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+        transport = getattr(self.writer, "transport", None)
+        if transport is not None:
+            transport.abort()
+        else:
+            self.writer.close()
 
 
 class DashboardServer:
@@ -525,10 +995,14 @@ class DashboardServer:
             config: Server configuration.
         """
         self.config = config or DashboardConfig()
-        self.state = DashboardState()
+        self.state = DashboardState(
+            apdu_history_size=self.config.apdu_history_size,
+            session_timeout=self.config.session_timeout_seconds,
+        )
         self._server: Optional[asyncio.AbstractServer] = None
         self._clients: Dict[str, WebSocketClient] = {}
         self._apdu_callbacks: List[Callable] = []
+        self._router = self._build_router()
 
         # Network simulator integration
         self._simulator: Optional[SimulatorManager] = None
@@ -541,6 +1015,29 @@ class DashboardServer:
 
         # Event loop reference for cross-thread event handling
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._admin_events = EventBridge(
+            self._handle_admin_events,
+            max_batch=self.config.admin_event_batch_size,
+            max_pending=self.config.admin_event_buffer_size,
+        )
+        self._assets = StaticAssetCache(
+            self.config.static_dir,
+            mime_types=self.MIME_TYPES,
+            max_file_size=self.config.static_cache_max_file_size,
+        )
+        self._events = EventCoalescer(
+            self._send_event,
+            interval=self.config.ws_flush_interval,
+            max_batch=self.config.ws_batch_size,
+        )
+        self.metrics = TimeSeriesAggregator()
+        self._admin_event_handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            'handshake_completed': self._handle_server_session_created,
+            'handshake_failed': self._handle_server_handshake_failed,
+            'apdu_received': self._handle_server_apdu_received,
+            'apdu_sent': self._handle_server_apdu_sent,
+            'session_updated': self._handle_server_session_updated,
+        }
 
         # Session timeout task
         self._session_timeout_task: Optional[asyncio.Task] = None
@@ -621,57 +1118,38 @@ class DashboardServer:
             return
 
         emitter = self._admin_server._event_emitter
+        bridge = self._admin_events
+
+        def make_callback(event_name: str) -> Callable[[Dict[str, Any]], None]:
+            # Called from the AdminServer thread: only buffer the event here,
+            # the bridge applies it on the dashboard loop.
+            def callback(event: Dict[str, Any]) -> None:
+                if not bridge.post(event_name, event):
+                    logger.debug(
+                        "Dashboard dropped %s event (bridge running=%s, pending=%d)",
+                        event_name, bridge.running, bridge.pending
+                    )
+            return callback
+
+        callbacks = []
+        for event_name in self._admin_event_handlers:
+            callback = make_callback(event_name)
+            emitter.subscribe(event_name, callback)
+            callbacks.append(callback)
+        self._admin_server_event_handler = tuple(callbacks)
+        logger.info(
+            "Subscribed to AdminServer events: %s", ", ".join(self._admin_event_handlers)
+        )
 
-        def on_handshake_completed(event):
-            # Use thread-safe scheduling since this may be called from AdminServer thread
-            if self._loop and self._loop.is_running():
-                logger.info("Scheduling handshake_completed event for dashboard: %s", event.get('psk_identity', 'unknown'))
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_server_session_created(event),
-                    self._loop
-                )
-            else:
-                logger.warning("Dashboard event loop not available for session event (loop=%s, running=%s)",
-                              self._loop is not None, self._loop.is_running() if self._loop else False)
-
-        def on_apdu_received(event):
-            # Use thread-safe scheduling since this may be called from AdminServer thread
-            if self._loop and self._loop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_server_apdu_received(event),
-                    self._loop
-                )
-            else:
-                logger.debug("Dashboard event loop not available for APDU received event")
-
-        def on_apdu_sent(event):
-            # Use thread-safe scheduling since this may be called from AdminServer thread
-            if self._loop and self._loop.is_running():
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_server_apdu_sent(event),
-                    self._loop
-                )
-            else:
-                logger.debug("Dashboard event loop not available for APDU sent event")
-
-        def on_session_updated(event):
-            # Use thread-safe scheduling since this may be called from AdminServer thread
-            if self._loop and self._loop.is_running():
-                logger.debug("Scheduling session_updated event for dashboard: %s", event.get('psk_identity', 'unknown'))
-                asyncio.run_coroutine_threadsafe(
-                    self._handle_server_session_updated(event),
-                    self._loop
+    async def _handle_admin_events(self, batch: List[BridgedEvent]) -> None:
+        """Apply a batch of AdminServer events in the order they were emitted."""
+        for event_name, event in batch:
+            if event_name == 'handshake_completed':
+                logger.info(
+                    "Handling handshake_completed event for dashboard: %s",
+                    event.get('psk_identity', 'unknown')
                 )
-            else:
-                logger.debug("Dashboard event loop not available for session_updated event")
-
-        # Subscribe to correct server event names
-        emitter.subscribe('handshake_completed', on_handshake_completed)
-        emitter.subscribe('apdu_received', on_apdu_received)
-        emitter.subscribe('apdu_sent', on_apdu_sent)
-        emitter.subscribe('session_updated', on_session_updated)
-        self._admin_server_event_handler = (on_handshake_completed, on_apdu_received, on_apdu_sent, on_session_updated)
-        logger.info("Subscribed to AdminServer events: handshake_completed, apdu_received, apdu_sent, session_updated")
+            await self._admin_event_handlers[event_name](event)
 
     @property
     def admin_server(self) -> Optional[Any]:
@@ -700,6 +1178,7 @@ class DashboardServer:
         In persistent mode, the simulator reconnects multiple times. We check
         for existing sessions by PSK identity to avoid creating duplicates.
         """
+        self.metrics.record("handshakes")
         try:
             psk_identity = event.get('psk_identity', '')
             client_address = event.get('client_address', '')
@@ -750,6 +1229,10 @@ class DashboardServer:
         except Exception as e:
             logger.error("Error handling session created event: %s", e)
 
+    async def _handle_server_handshake_failed(self, event: Dict[str, Any]) -> None:
+        """Handle handshake_failed event from AdminServer (counted in metrics only)."""
+        self.metrics.record("handshake_failures")
+
     async def _handle_server_apdu_received(self, event: Dict[str, Any]) -> None:
         """Handle apdu_received event from AdminServer (R-APDU from card)."""
         try:
@@ -772,12 +1255,13 @@ class DashboardServer:
                 response_data = apdu_hex[:-4] if len(apdu_hex) > 4 else ''
 
             # Store APDU for later retrieval (use actual session ID)
-            await self.state.add_apdu(
+            entry = await self.state.add_apdu(
                 session_id=session.id,
                 direction='response',
                 data=apdu_hex,
                 sw=sw,
                 response_data=response_data,
+                raw=apdu if isinstance(apdu, bytes) else None,
             )
 
             # Extract HTTP info from event if available
@@ -785,7 +1269,8 @@ class DashboardServer:
 
             # Notify WebSocket clients
             apdu_data = {
-                'id': str(uuid.uuid4()),
+                'id': entry.id if entry else str(uuid.uuid4()),
+                'seq': entry.seq if entry else None,
                 'direction': 'response',
                 'sessionId': session.id,
                 'data': apdu_hex,
@@ -796,7 +1281,7 @@ class DashboardServer:
             if http_info:
                 apdu_data['http'] = http_info
 
-            await self._broadcast('apdu', apdu_data)
+            await self._publish_apdu(session, apdu_data)
         except Exception as e:
             logger.error("Error handling APDU received event: %s", e)
 
@@ -815,10 +1300,11 @@ class DashboardServer:
                 return
 
             # Store APDU for later retrieval (use actual session ID)
-            await self.state.add_apdu(
+            entry = await self.state.add_apdu(
                 session_id=session.id,
                 direction='command',
                 data=apdu_hex,
+                raw=apdu if isinstance(apdu, bytes) else None,
             )
 
             # Extract HTTP info from event if available
@@ -826,7 +1312,8 @@ class DashboardServer:
 
             # Notify WebSocket clients
             apdu_data = {
-                'id': str(uuid.uuid4()),
+                'id': entry.id if entry else str(uuid.uuid4()),
+                'seq': entry.seq if entry else None,
                 'direction': 'command',
                 'sessionId': session.id,
                 'data': apdu_hex,
@@ -835,7 +1322,7 @@ class DashboardServer:
             if http_info:
                 apdu_data['http'] = http_info
 
-            await self._broadcast('apdu', apdu_data)
+            await self._publish_apdu(session, apdu_data)
         except Exception as e:
             logger.error("Error handling APDU sent event: %s", e)
 
@@ -904,7 +1391,26 @@ class DashboardServer:
         # Store event loop reference for cross-thread event handling
         self._loop = asyncio.get_event_loop()
 
+        # Restore persisted state before accepting events or connections
+        if self.config.persistence_path is not None:
+            store = DashboardStore(
+                self.config.persistence_path,
+                flush_interval=self.config.persistence_flush_interval,
+            )
+            store.open()
+            restored = await self.state.attach_store(store)
+            store.start()
+            logger.info(
+                "Dashboard persistence enabled: %s (%d sessions restored)",
+                self.config.persistence_path, restored
+            )
+
+        loaded = self._assets.preload()
+        logger.debug("Cached %d static assets from %s", loaded, self.config.static_dir)
+
         # Subscribe to AdminServer events now that the loop is ready
+        self._events.start()
+        self._admin_events.start(self._loop)
         self._subscribe_to_admin_events()
 
         # Start session timeout checker if enabled
@@ -954,54 +1460,53 @@ class DashboardServer:
                 pass
             self._session_timeout_task = None
 
+        await self._admin_events.stop()
+        await self._events.stop()
+        if self.state.store is not None:
+            await self.state.store.close()
+
         if self._server:
             self._server.close()
             await self._server.wait_closed()
             logger.info("Dashboard server stopped")
 
     async def _run_session_timeout_checker(self) -> None:
-        """Background task to check and close timed-out sessions.
+        """Background task to close timed-out sessions.
 
-        Runs periodically to check all sessions and close those that
-        haven't had activity within the configured timeout period.
+        Sleeps until the earliest session deadline (see ExpiryScheduler),
+        then closes every session that has been idle for the configured
+        timeout in one batch and notifies clients with one message.
         """
-        timeout = self.config.session_timeout_seconds
-        # Check every 10% of the timeout, but at least every 5 seconds
-        check_interval = max(5.0, timeout * 0.1)
-
-        logger.debug(
-            "Session timeout checker started (timeout=%.0fs, interval=%.0fs)",
-            timeout, check_interval
-        )
+        expiry = self.state.expiry
+        logger.debug("Session timeout checker started (timeout=%.0fs)", expiry.timeout)
 
         try:
             while True:
-                await asyncio.sleep(check_interval)
-
-                now = datetime.now()
-                sessions_to_close = []
-
-                # Find sessions that have timed out
-                for session_id, session in list(self.state.sessions.items()):
-                    elapsed = (now - session.updated_at).total_seconds()
-                    if elapsed > timeout:
-                        sessions_to_close.append((session_id, session, elapsed))
-
-                # Close timed-out sessions
-                for session_id, session, elapsed in sessions_to_close:
-                    logger.info(
-                        "Closing session %s (PSK: %s) due to timeout (%.0fs idle)",
-                        session_id, session.psk_identity or "unknown", elapsed
+                # New deadlines are at least one timeout away, so sleeping
+                # a full timeout when nothing is scheduled misses nothing
+                delay = expiry.time_until_next()
+                await asyncio.sleep(expiry.timeout if delay is None else delay)
+
+                expired = await self.state.expire_sessions()
+                if not expired:
+                    continue
+
+                for session in expired:
+                    self.metrics.forget_session(session.id)
+                    logger.debug(
+                        "Session %s (PSK: %s) timed out",
+                        session.id, session.psk_identity or "unknown"
                     )
+                logger.info(
+                    "Closed %d session(s) idle for %.0fs", len(expired), expiry.timeout
+                )
 
-                    # Delete session from state
-                    await self.state.delete_session(session_id)
-
-                    # Notify WebSocket clients
-                    await self._broadcast('session.deleted', {
-                        'id': session_id,
-                        'reason': 'timeout',
-                    })
+                # Notify WebSocket clients
+                items = [{'id': session.id, 'reason': 'timeout'} for session in expired]
+                if len(items) == 1:
+                    await self._broadcast('session.deleted', items[0])
+                else:
+                    await self._broadcast('session.deleted.batch', {'items': items})
 
         except asyncio.CancelledError:
             logger.debug("Session timeout checker stopped")
@@ -1010,46 +1515,45 @@ class DashboardServer:
     async def _handle_connection(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
     ) -> None:
-        """Handle incoming connection."""
-        try:
-            # Read request line
-            request_line = await reader.readline()
-            if not request_line:
-                return
-
-            request_line = request_line.decode().strip()
-            parts = request_line.split()
-            if len(parts) < 2:
-                return
+        """Handle incoming connection.
 
-            method = parts[0]
-            path = parts[1]
-
-            # Read headers
-            headers = {}
+        Serves requests sequentially on the connection while the client
+        keeps it alive (HTTP/1.1 persistent connections). Pipelined
+        requests are safe because each body is read with its exact
+        Content-Length, leaving the next request in the stream buffer.
+        """
+        try:
+            requests_served = 0
             while True:
-                line = await reader.readline()
-                if line == b"\r\n" or not line:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader),
+                        timeout=self.config.keepalive_timeout,
+                    )
+                except asyncio.TimeoutError:
+                    break
+                except RequestError as e:
+                    await self._send_error(writer, e.status, e.message)
                     break
-                line = line.decode().strip()
-                if ": " in line:
-                    key, value = line.split(": ", 1)
-                    headers[key.lower()] = value
-
-            # Check for WebSocket upgrade
-            if headers.get("upgrade", "").lower() == "websocket":
-                await self._handle_websocket(reader, writer, headers)
-                return
 
-            # Read body if present
-            body = None
-            content_length = int(headers.get("content-length", 0))
-            if content_length > 0:
-                body = await reader.read(content_length)
-                body = body.decode()
+                if request is None:
+                    break
 
-            # Route request
-            await self._route_request(method, path, headers, body, writer)
+                # Check for WebSocket upgrade
+                if request.is_websocket_upgrade:
+                    await self._handle_websocket(reader, writer, request.headers)
+                    return
+
+                requests_served += 1
+                keep_alive = (
+                    request.keep_alive
+                    and requests_served < self.config.max_keepalive_requests
+                )
+
+                # Route request
+                await self._route_request(request, writer, keep_alive)
+                if not keep_alive:
+                    break
 
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
             # Connection was closed by client - this is expected behavior
@@ -1064,315 +1568,479 @@ class DashboardServer:
                 # Ignore errors when closing already-closed connection
                 pass
 
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[HTTPRequest]:
+        """Read one HTTP request from the stream.
+
+        Args:
+            reader: Connection stream reader.
+
+        Returns:
+            Parsed request, or None if the client closed the connection.
+
+        Raises:
+            RequestError: If the request is malformed or exceeds size limits.
+        """
+        try:
+            line = await reader.readline()
+            # Ignore empty lines preceding a request (RFC 7230 section 3.5)
+            while line in (b"\r\n", b"\n"):
+                line = await reader.readline()
+        except ValueError:
+            raise RequestError(414, "Request line too long")
+        if not line:
+            return None
+
+        parts = line.decode("latin-1").split()
+        if len(parts) != 3 or not parts[2].startswith("HTTP/"):
+            raise RequestError(400, "Malformed request line")
+        method, target, version = parts
+
+        headers: Dict[str, str] = {}
+        header_size = 0
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                raise RequestError(431, "Request header too large")
+            if not line:
+                return None
+            if line in (b"\r\n", b"\n"):
+                break
+
+            header_size += len(line)
+            if header_size > self.config.max_header_size:
+                raise RequestError(431, "Request header too large")
+
+            name, sep, value = line.decode("latin-1").partition(":")
+            if not sep:
+                raise RequestError(400, "Malformed header")
+            key = name.strip().lower()
+            value = value.strip()
+            headers[key] = f"{headers[key]}, {value}" if key in headers else value
+
+        if "transfer-encoding" in headers:
+            raise RequestError(501, "Chunked request bodies are not supported")
+
+        # Read body if present
+        body = None
+        try:
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length")
+        if content_length < 0:
+            raise RequestError(400, "Invalid Content-Length")
+        if content_length > self.config.max_body_size:
+            raise RequestError(413, "Request body too large")
+        if content_length > 0:
+            try:
+                body = (await reader.readexactly(content_length)).decode(
+                    "utf-8", errors="replace"
+                )
+            except asyncio.IncompleteReadError:
+                return None
+
+        path, _, query = target.partition("?")
+        return HTTPRequest(
+            method=method.upper(),
+            path=path,
+            query=query,
+            version=version,
+            headers=headers,
+            body=body,
+        )
+
     async def _route_request(
         self,
-        method: str,
-        path: str,
-        headers: Dict[str, str],
-        body: Optional[str],
+        request: HTTPRequest,
         writer: asyncio.StreamWriter,
+        keep_alive: bool = False,
     ) -> None:
         """Route HTTP request."""
-        # Remove query string
-        if "?" in path:
-            path = path.split("?")[0]
-
         # API routes
-        if path.startswith("/api/"):
-            await self._handle_api(method, path, headers, body, writer)
+        if request.path.startswith("/api/"):
+            await self._handle_api(request, writer, keep_alive)
             return
 
         # Static files
-        await self._serve_static(path, writer)
+        await self._serve_static(request, writer, keep_alive)
 
-    async def _handle_api(
-        self,
-        method: str,
-        path: str,
-        headers: Dict[str, str],
-        body: Optional[str],
-        writer: asyncio.StreamWriter,
-    ) -> None:
-        """Handle API requests."""
-        try:
-            # Parse body
-            data = json.loads(body) if body else {}
-        except json.JSONDecodeError:
-            data = {}
-
-        response = None
-        status = 200
+    def _build_router(self) -> Router:
+        """Build the API route table."""
+        router = Router()
 
         # Sessions
-        if path == "/api/sessions":
-            if method == "GET":
-                sessions = await self.state.get_sessions()
-                response = [s.to_dict() for s in sessions]
-            elif method == "POST":
-                # Extract psk_identity and client_ip from request
-                psk_identity = data.get("pskIdentity") or data.get("psk_identity")
-                client_ip = data.get("clientIp") or data.get("client_ip")
-                metadata = data.get("metadata", {})
-
-                # Also check metadata for these fields
-                if not psk_identity:
-                    psk_identity = metadata.get("psk_identity") or metadata.get("pskIdentity")
-                if not client_ip:
-                    client_ip = metadata.get("client_ip") or metadata.get("clientIp")
-
-                session = await self.state.create_session(
-                    name=data.get("name", f"Session {datetime.now().strftime('%H:%M:%S')}"),
-                    psk_identity=psk_identity,
-                    client_ip=client_ip,
-                    **metadata,
-                )
-                response = session.to_dict()
-                await self._broadcast("session.created", response)
-                status = 201
+        router.add("GET", "/api/sessions", self._api_list_sessions)
+        router.add("POST", "/api/sessions", self._api_create_session)
+        router.add("GET", "/api/sessions/{session_id}", self._api_get_session)
+        router.add("PATCH", "/api/sessions/{session_id}", self._api_update_session)
+        router.add("DELETE", "/api/sessions/{session_id}", self._api_delete_session)
 
-        elif path.startswith("/api/sessions/") and "/apdus" not in path:
-            session_id = path.split("/")[-1]
+        # APDUs
+        router.add("GET", "/api/sessions/{session_id}/apdus", self._api_list_apdus)
+        router.add("POST", "/api/sessions/{session_id}/apdus", self._api_add_apdu)
+        router.add("DELETE", "/api/sessions/{session_id}/apdus", self._api_clear_apdus)
 
-            if method == "GET":
-                session = await self.state.get_session(session_id)
-                if session:
-                    response = session.to_dict()
-                else:
-                    status = 404
-                    response = {"error": "Session not found"}
-
-            elif method == "PATCH":
-                session = await self.state.update_session(session_id, **data)
-                if session:
-                    response = session.to_dict()
-                    await self._broadcast("session.updated", response)
-                else:
-                    status = 404
-                    response = {"error": "Session not found"}
+        # Search (requires persistence)
+        router.add("GET", "/api/search/apdus", self._api_search_apdus)
+        router.add("GET", "/api/search/sessions", self._api_search_sessions)
 
-            elif method == "DELETE":
-                if await self.state.delete_session(session_id):
-                    response = {"success": True}
-                    await self._broadcast("session.deleted", {"id": session_id})
-                else:
-                    status = 404
-                    response = {"error": "Session not found"}
+        # Status and metrics
+        router.add("GET", "/api/status", self._api_status)
+        router.add("GET", "/api/metrics/timeseries", self._api_timeseries)
 
-        # APDUs
-        elif "/apdus" in path:
-            parts = path.split("/")
-            session_idx = parts.index("sessions") + 1
-            session_id = parts[session_idx] if session_idx < len(parts) else None
-
-            if method == "GET" and session_id:
-                apdus = await self.state.get_apdus(session_id)
-                response = [a.to_dict() for a in apdus]
-
-            elif method == "POST" and session_id:
-                apdu_hex = data.get("data", "")
-                is_manual = data.get("manual", False)  # Flag for manually sent APDUs
-                payload_format = data.get("payloadFormat", "auto")  # Payload format per ETSI TS 102.226
-
-                # Queue the command for execution via AdminServer if connected
-                if self._admin_server and apdu_hex:
-                    handler = getattr(self._admin_server, '_handler', None)
-                    if handler:
-                        try:
-                            # Convert hex string to bytes and queue
-                            apdu_bytes = bytes.fromhex(apdu_hex.replace(" ", ""))
-                            # Store manual flag in session for tracking
-                            if is_manual:
-                                if not hasattr(handler, '_manual_apdus'):
-                                    handler._manual_apdus = {}
-                                if session_id not in handler._manual_apdus:
-                                    handler._manual_apdus[session_id] = set()
-                                handler._manual_apdus[session_id].add(apdu_hex.upper().replace(" ", ""))
-                            handler.queue_commands(session_id, [apdu_bytes])
-                            logger.debug("Queued %sAPDU command for session %s: %s (format: %s)",
-                                        "manual " if is_manual else "", session_id, apdu_hex, payload_format)
-                            response = {"queued": True, "apdu": apdu_hex, "manual": is_manual, "payloadFormat": payload_format}
-                            status = 202  # Accepted
-                        except ValueError as e:
-                            status = 400
-                            response = {"error": f"Invalid APDU hex: {e}"}
-                    else:
-                        # AdminServer handler not ready - just log for now
-                        apdu = await self.state.add_apdu(
-                            session_id=session_id,
-                            direction=data.get("direction", "command"),
-                            data=apdu_hex,
-                            sw=data.get("sw"),
-                            response_data=data.get("responseData"),
-                            manual=is_manual,
-                            payload_format=payload_format,
-                        )
-                        if apdu:
-                            response = apdu.to_dict()
-                            await self._broadcast("apdu", response)
-                            status = 201
-                        else:
-                            status = 404
-                            response = {"error": "Session not found"}
-                else:
-                    # No AdminServer - just log the APDU
-                    apdu = await self.state.add_apdu(
-                        session_id=session_id,
-                        direction=data.get("direction", "command"),
-                        data=apdu_hex,
-                        sw=data.get("sw"),
-                        response_data=data.get("responseData"),
-                        manual=is_manual,
-                        payload_format=payload_format,
-                    )
-                    if apdu:
-                        response = apdu.to_dict()
-                        await self._broadcast("apdu", response)
-                        status = 201
-                    else:
-                        status = 404
-                        response = {"error": "Session not found"}
-
-            elif method == "DELETE" and session_id:
-                if await self.state.clear_apdus(session_id):
-                    response = {"success": True}
-                else:
-                    status = 404
-                    response = {"error": "Session not found"}
-
-        # Status
-        elif path == "/api/status":
-            response = {
-                "status": "running",
-                "sessions": len(self.state.sessions),
-                "clients": len(self._clients),
-                "simulator_available": NETSIM_AVAILABLE,
-                "simulator_connected": self._simulator is not None and self._simulator.is_connected,
-                "server_available": ADMIN_SERVER_AVAILABLE,
-                "server_connected": self.is_server_connected,
-                "protocol_available": PROTOCOL_AVAILABLE,
-                "scripts_available": SCRIPTS_API_AVAILABLE and self._scripts_api is not None,
-            }
-
-        # =====================================================================
         # APDU Scripts and Templates API
-        # =====================================================================
+        for prefix in ("/api/scripts", "/api/templates"):
+            router.add(ANY_METHOD, prefix, self._api_scripts)
+            router.add(ANY_METHOD, prefix + "/{rest:path}", self._api_scripts)
 
-        elif path.startswith("/api/scripts") or path.startswith("/api/templates"):
-            if self._scripts_api is None:
-                status = 503
-                response = {"error": "Scripts API not available"}
-            else:
-                # Parse query params from URL (if any)
-                query_params = {}
-                response, status = self._scripts_api.handle_request(
-                    method, path, query_params, body
-                )
-
-        # =====================================================================
         # Protocol Information API (GP SCP81 / ETSI TS 102.226)
-        # =====================================================================
+        router.add("GET", "/api/protocol/info", lambda r, p, d: self._get_protocol_info())
+        router.add("GET", "/api/protocol/ciphers", lambda r, p, d: self._get_supported_ciphers())
+        router.add("GET", "/api/protocol/stats", lambda r, p, d: self._get_protocol_stats())
 
-        elif path == "/api/protocol/info":
-            if method == "GET":
-                response = await self._get_protocol_info()
+        # GP SCP81 Configuration API
+        router.add("GET", "/api/scp81/config", lambda r, p, d: self._get_scp81_config())
+        router.add("PUT", "/api/scp81/config", lambda r, p, d: self._update_scp81_config(d))
+        router.add("GET", "/api/scp81/keys", lambda r, p, d: self._get_scp81_keys())
+        router.add("POST", "/api/scp81/keys", lambda r, p, d: self._add_scp81_key(d))
+        router.add(
+            "DELETE",
+            "/api/scp81/keys/{key_id}",
+            lambda r, p, d: self._delete_scp81_key(p["key_id"]),
+        )
+        router.add("GET", "/api/scp81/trigger", lambda r, p, d: self._get_trigger_params())
+        router.add("PUT", "/api/scp81/trigger", lambda r, p, d: self._update_trigger_params(d))
 
-        elif path == "/api/protocol/ciphers":
-            if method == "GET":
-                response = await self._get_supported_ciphers()
+        # Network Simulator API
+        router.add("GET", "/api/simulator/status", lambda r, p, d: self._get_simulator_status())
+        router.add("POST", "/api/simulator/connect", lambda r, p, d: self._connect_simulator(d))
+        router.add(
+            "POST", "/api/simulator/disconnect", lambda r, p, d: self._disconnect_simulator()
+        )
+        router.add("GET", "/api/simulator/ues", lambda r, p, d: self._get_simulator_ues())
+        router.add(
+            "GET", "/api/simulator/sessions", lambda r, p, d: self._get_simulator_sessions()
+        )
+        router.add("GET", "/api/simulator/events", self._api_simulator_events)
+        router.add(
+            "POST", "/api/simulator/cell/start", lambda r, p, d: self._start_simulator_cell(d)
+        )
+        router.add("POST", "/api/simulator/cell/stop", lambda r, p, d: self._stop_simulator_cell())
+        router.add(
+            "POST", "/api/simulator/sms/send", lambda r, p, d: self._send_simulator_sms(d)
+        )
 
-        elif path == "/api/protocol/stats":
-            if method == "GET":
-                response = await self._get_protocol_stats()
+        # TLS PSK Server API
+        router.add("GET", "/api/server/status", lambda r, p, d: self._get_server_status())
+        router.add("GET", "/api/server/sessions", lambda r, p, d: self._get_server_sessions())
+        router.add("GET", "/api/server/config", lambda r, p, d: self._get_server_config())
 
-        # =====================================================================
-        # GP SCP81 Configuration API
-        # =====================================================================
-
-        elif path == "/api/scp81/config":
-            if method == "GET":
-                response = await self._get_scp81_config()
-            elif method == "PUT":
-                response = await self._update_scp81_config(body)
-
-        elif path == "/api/scp81/keys":
-            if method == "GET":
-                response = await self._get_scp81_keys()
-            elif method == "POST":
-                response = await self._add_scp81_key(body)
-
-        elif path.startswith("/api/scp81/keys/"):
-            key_id = path.split("/")[-1]
-            if method == "DELETE":
-                response = await self._delete_scp81_key(key_id)
-
-        elif path == "/api/scp81/trigger":
-            if method == "GET":
-                response = await self._get_trigger_params()
-            elif method == "PUT":
-                response = await self._update_trigger_params(body)
-
-        # =====================================================================
-        # Network Simulator API
-        # =====================================================================
+        return router
 
-        elif path == "/api/simulator/status":
-            if method == "GET":
-                response = await self._get_simulator_status()
+    async def _handle_api(
+        self,
+        request: HTTPRequest,
+        writer: asyncio.StreamWriter,
+        keep_alive: bool = False,
+    ) -> None:
+        """Handle API requests.
 
-        elif path == "/api/simulator/connect":
-            if method == "POST":
-                response, status = await self._connect_simulator(data)
+        Handlers receive ``(request, params, data)`` and return either the
+        response body or a ``(body, status)`` tuple, directly or as a coroutine.
+        """
+        match = self._router.match(request.method, request.path)
+        if match is None:
+            await self._send_json_response(writer, {"error": "Not found"}, 404, keep_alive)
+            return
+        if match.handler is None:
+            await self._send_json_response(
+                writer,
+                {"error": "Method not allowed"},
+                405,
+                keep_alive,
+                extra_headers={"Allow": ", ".join(sorted(match.allowed_methods))},
+            )
+            return
 
-        elif path == "/api/simulator/disconnect":
-            if method == "POST":
-                response, status = await self._disconnect_simulator()
+        try:
+            # Parse body
+            data = json.loads(request.body) if request.body else {}
+        except json.JSONDecodeError:
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
 
-        elif path == "/api/simulator/ues":
-            if method == "GET":
-                response, status = await self._get_simulator_ues()
+        result = match.handler(request, match.params, data)
+        if inspect.isawaitable(result):
+            result = await result
 
-        elif path == "/api/simulator/sessions":
-            if method == "GET":
-                response, status = await self._get_simulator_sessions()
+        response, status = result if isinstance(result, tuple) else (result, 200)
 
-        elif path == "/api/simulator/events":
-            if method == "GET":
-                response = self._simulator_events[-100:]  # Last 100 events
+        # Send response
+        await self._send_json_response(writer, response, status, keep_alive)
 
-        elif path == "/api/simulator/cell/start":
-            if method == "POST":
-                response, status = await self._start_simulator_cell(data)
+    # =========================================================================
+    # API Handlers
+    # =========================================================================
 
-        elif path == "/api/simulator/cell/stop":
-            if method == "POST":
-                response, status = await self._stop_simulator_cell()
+    async def _api_list_sessions(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        """List sessions, filtered (?iccid=...) or changed since a version (?since=N).
 
-        elif path == "/api/simulator/sms/send":
-            if method == "POST":
-                response, status = await self._send_simulator_sms(data)
+        With ``since`` the response is ``{version, sessions, deleted, reset}``:
+        only sessions changed after that version and the IDs of deleted
+        sessions (or every session with ``reset`` set, e.g. for since=0).
+        """
+        query = request.query_params
+        criteria = {
+            SESSION_QUERY_FILTERS[name]: value
+            for name, value in query.items()
+            if name in SESSION_QUERY_FILTERS
+        }
+        if "since" in query:
+            if criteria:
+                return {"error": "since cannot be combined with filters"}, 400
+            try:
+                since = int(query["since"])
+            except ValueError:
+                return {"error": "since must be an integer"}, 400
+            changes = await self.state.get_changes(since)
+            return {
+                "version": changes.version,
+                "sessions": [self.state.session_dict(s) for s in changes.sessions],
+                "deleted": changes.deleted,
+                "reset": changes.reset,
+            }
 
-        # =====================================================================
-        # TLS PSK Server API
-        # =====================================================================
+        if criteria:
+            sessions = await self.state.find_sessions(**criteria)
+        else:
+            sessions = await self.state.get_sessions()
+        return [self.state.session_dict(s) for s in sessions]
+
+    async def _api_create_session(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        # Extract psk_identity and client_ip from request
+        psk_identity = data.get("pskIdentity") or data.get("psk_identity")
+        client_ip = data.get("clientIp") or data.get("client_ip")
+        metadata = data.get("metadata", {})
+
+        # Also check metadata for these fields
+        if not psk_identity:
+            psk_identity = metadata.get("psk_identity") or metadata.get("pskIdentity")
+        if not client_ip:
+            client_ip = metadata.get("client_ip") or metadata.get("clientIp")
+
+        session = await self.state.create_session(
+            name=data.get("name", f"Session {datetime.now().strftime('%H:%M:%S')}"),
+            psk_identity=psk_identity,
+            client_ip=client_ip,
+            **metadata,
+        )
+        response = session.to_dict()
+        await self._broadcast("session.created", response)
+        return response, 201
+
+    async def _api_get_session(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        session = await self.state.get_session(params["session_id"])
+        if session:
+            return session.to_dict(), 200
+        return {"error": "Session not found"}, 404
+
+    async def _api_update_session(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        session = await self.state.update_session(params["session_id"], **data)
+        if session:
+            response = session.to_dict()
+            await self._broadcast("session.updated", response)
+            return response, 200
+        return {"error": "Session not found"}, 404
+
+    async def _api_delete_session(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        session_id = params["session_id"]
+        if await self.state.delete_session(session_id):
+            self.metrics.forget_session(session_id)
+            await self._broadcast("session.deleted", {"id": session_id})
+            return {"success": True}, 200
+        return {"error": "Session not found"}, 404
 
-        elif path == "/api/server/status":
-            if method == "GET":
-                response = await self._get_server_status()
+    async def _api_list_apdus(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        """List APDUs of a session.
 
-        elif path == "/api/server/sessions":
-            if method == "GET":
-                response, status = await self._get_server_sessions()
+        Without query parameters, returns every retained APDU as a list.
+        With ``after`` and/or ``limit``, returns one page of entries with a
+        sequence number greater than ``after``, plus the cursor to pass as
+        ``after`` on the next request.
+        """
+        history = await self.state.get_apdu_history(params["session_id"])
+        query = request.query_params
+        if "after" not in query and "limit" not in query:
+            return [a.to_dict() for a in history or ()]
 
-        elif path == "/api/server/config":
-            if method == "GET":
-                response = await self._get_server_config()
+        try:
+            after = int(query.get("after", 0))
+            limit = int(query.get("limit", self.config.apdu_page_size))
+        except ValueError:
+            return {"error": "after and limit must be integers"}, 400
+        if after < 0 or limit <= 0:
+            return {"error": "after must be >= 0 and limit > 0"}, 400
+        if history is None:
+            return {"error": "Session not found"}, 404
+
+        limit = min(limit, self.config.apdu_page_size)
+        items = history.after(after, limit)
+        cursor = items[-1].seq if items else max(after, history.first_seq - 1)
+        return {
+            "items": [a.to_dict() for a in items],
+            "cursor": cursor,
+            "hasMore": cursor < history.last_seq,
+            # Entries after the requested cursor that were evicted before this request
+            "missed": max(0, history.first_seq - after - 1),
+            "dropped": history.dropped,
+        }
 
-        else:
-            status = 404
-            response = {"error": "Not found"}
+    async def _api_add_apdu(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        session_id = params["session_id"]
+        apdu_hex = data.get("data", "")
+        is_manual = data.get("manual", False)  # Flag for manually sent APDUs
+        payload_format = data.get("payloadFormat", "auto")  # Payload format per ETSI TS 102.226
+
+        # Queue the command for execution via AdminServer if connected
+        handler = getattr(self._admin_server, '_handler', None) if self._admin_server else None
+        if handler and apdu_hex:
+            try:
+                # Convert hex string to bytes and queue
+                apdu_bytes = bytes.fromhex(apdu_hex.replace(" ", ""))
+                # Store manual flag in session for tracking
+                if is_manual:
+                    if not hasattr(handler, '_manual_apdus'):
+                        handler._manual_apdus = {}
+                    if session_id not in handler._manual_apdus:
+                        handler._manual_apdus[session_id] = set()
+                    handler._manual_apdus[session_id].add(apdu_hex.upper().replace(" ", ""))
+                handler.queue_commands(session_id, [apdu_bytes])
+                logger.debug("Queued %sAPDU command for session %s: %s (format: %s)",
+                            "manual " if is_manual else "", session_id, apdu_hex, payload_format)
+                response = {"queued": True, "apdu": apdu_hex, "manual": is_manual, "payloadFormat": payload_format}
+                return response, 202  # Accepted
+            except ValueError as e:
+                return {"error": f"Invalid APDU hex: {e}"}, 400
+
+        # No AdminServer (or handler not ready) - just log the APDU
+        apdu = await self.state.add_apdu(
+            session_id=session_id,
+            direction=data.get("direction", "command"),
+            data=apdu_hex,
+            sw=data.get("sw"),
+            response_data=data.get("responseData"),
+            manual=is_manual,
+            payload_format=payload_format,
+        )
+        if apdu:
+            response = apdu.to_dict()
+            await self._publish_apdu(self.state.sessions.get(session_id), response)
+            return response, 201
+        return {"error": "Session not found"}, 404
+
+    async def _api_clear_apdus(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        if await self.state.clear_apdus(params["session_id"]):
+            return {"success": True}, 200
+        return {"error": "Session not found"}, 404
+
+    async def _api_search_apdus(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        """Search APDU history: ?q=INSTALL&then=6985&within=1&session=<id>&limit=100."""
+        query = request.query_params
+        if not query.get("q"):
+            return {"error": "Missing search query (q)"}, 400
+        try:
+            within = int(query.get("within", 1))
+            limit = min(int(query.get("limit", 100)), 1000)
+        except ValueError:
+            return {"error": "within and limit must be integers"}, 400
+        try:
+            return await self.state.search_apdus(
+                query["q"],
+                then=query.get("then"),
+                within=within,
+                session_id=query.get("session"),
+                limit=limit,
+            )
+        except PersistenceError as e:
+            return {"error": str(e)}, 503
+
+    async def _api_search_sessions(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        """Search sessions: ?q=<terms>."""
+        query = request.query_params
+        if not query.get("q"):
+            return {"error": "Missing search query (q)"}, 400
+        try:
+            sessions = await self.state.search_sessions(query["q"])
+        except PersistenceError as e:
+            return {"error": str(e)}, 503
+        return [s.to_dict() for s in sessions]
+
+    async def _api_status(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        return {
+            "status": "running",
+            "sessions": len(self.state.sessions),
+            "clients": len(self._clients),
+            "simulator_available": NETSIM_AVAILABLE,
+            "simulator_connected": self._simulator is not None and self._simulator.is_connected,
+            "server_available": ADMIN_SERVER_AVAILABLE,
+            "server_connected": self.is_server_connected,
+            "protocol_available": PROTOCOL_AVAILABLE,
+            "scripts_available": SCRIPTS_API_AVAILABLE and self._scripts_api is not None,
+        }
 
-        # Send response
-        await self._send_json_response(writer, response, status)
+    async def _api_timeseries(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        """Get traffic time series: ?series=apdus,errors&range=600&points=120.
+
+        ``range`` is in seconds (up to 24 hours). Rates are per second and
+        latencies in milliseconds; point i is at ``start + i * step``.
+        """
+        query = request.query_params
+        series = [name for name in query.get("series", "").split(",") if name]
+        try:
+            duration = float(query.get("range", 600))
+            points = min(int(query.get("points", 120)), 1000)
+            return self.metrics.query(series or SERIES, duration=duration, points=points)
+        except (ValueError, OverflowError) as e:
+            return {"error": str(e)}, 400
+
+    async def _api_scripts(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Tuple[Any, int]:
+        if self._scripts_api is None:
+            return {"error": "Scripts API not available"}, 503
+        return self._scripts_api.handle_request(
+            request.method, request.path, request.query_params, request.body
+        )
+
+    async def _api_simulator_events(
+        self, request: HTTPRequest, params: Dict[str, str], data: Dict[str, Any]
+    ) -> Any:
+        return self._simulator_events[-100:]  # Last 100 events
 
     # Explicit MIME type mapping for ES modules and common web files
     MIME_TYPES = {
@@ -1395,66 +2063,130 @@ class DashboardServer:
     }
 
     async def _serve_static(
-        self, path: str, writer: asyncio.StreamWriter
+        self, request: HTTPRequest, writer: asyncio.StreamWriter, keep_alive: bool = False
     ) -> None:
-        """Serve static files."""
-        # Default to index.html
-        if path == "/" or path == "":
-            path = "/index.html"
+        """Serve static files from the asset cache.
+
+        Responses carry an ETag and Cache-Control; a matching
+        If-None-Match is answered with 304. Cached text assets are sent
+        gzip-compressed when the client accepts it, and files too large
+        to cache are sent from disk with sendfile.
+        """
+        if request.method not in ("GET", "HEAD"):
+            await self._send_json_response(
+                writer, {"error": "Method not allowed"}, 405, keep_alive,
+                extra_headers={"Allow": "GET, HEAD"},
+            )
+            return
 
-        # Security: prevent directory traversal
-        file_path = self.config.static_dir / path.lstrip("/")
         try:
-            file_path = file_path.resolve()
-            if not str(file_path).startswith(str(self.config.static_dir.resolve())):
-                await self._send_error(writer, 403, "Forbidden")
-                return
-        except Exception:
-            await self._send_error(writer, 400, "Bad request")
+            asset = self._assets.lookup(request.path)
+        except PermissionError:
+            await self._send_error(writer, 403, "Forbidden", keep_alive)
+            return
+        except (OSError, ValueError):
+            await self._send_error(writer, 400, "Bad request", keep_alive)
             return
 
-        if not file_path.exists() or not file_path.is_file():
-            await self._send_error(writer, 404, "Not found")
+        if asset is None:
+            await self._send_error(writer, 404, "Not found", keep_alive)
             return
 
-        # Determine content type - use explicit mapping first for ES module compatibility
-        suffix = file_path.suffix.lower()
-        content_type = self.MIME_TYPES.get(suffix)
-        if content_type is None:
-            content_type, _ = mimetypes.guess_type(str(file_path))
-        if content_type is None:
-            content_type = "application/octet-stream"
+        use_gzip = asset.gzip is not None and accepts_gzip(
+            request.headers.get("accept-encoding", "")
+        )
+        headers = [
+            f"ETag: {asset.gzip_etag if use_gzip else asset.etag}",
+            f"Cache-Control: {asset.cache_control}",
+        ]
+        if asset.gzip is not None:
+            headers.append("Vary: Accept-Encoding")
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and asset.matches(if_none_match):
+            writer.write(
+                (
+                    f"HTTP/1.1 304 {self.STATUS_TEXT[304]}\r\n"
+                    + "".join(h + "\r\n" for h in headers)
+                    + self._connection_header(keep_alive)
+                    + "\r\n"
+                ).encode()
+            )
+            await writer.drain()
+            return
 
-        # Read and send file
-        content = file_path.read_bytes()
+        if use_gzip:
+            body = asset.gzip
+            headers.append("Content-Encoding: gzip")
+        else:
+            body = asset.content
+        length = len(body) if body is not None else asset.size
+
+        head = (
+            "HTTP/1.1 200 OK\r\n"
+            f"Content-Type: {asset.content_type}\r\n"
+            f"Content-Length: {length}\r\n"
+            + "".join(h + "\r\n" for h in headers)
+            + self._connection_header(keep_alive)
+            + "\r\n"
+        ).encode()
+
+        if request.method == "HEAD":
+            writer.write(head)
+        elif body is not None:
+            writer.write(head + body)
+        else:
+            writer.write(head)
+            await writer.drain()
+            with open(asset.path, "rb") as f:
+                await asyncio.get_running_loop().sendfile(writer.transport, f, count=asset.size)
+        await writer.drain()
 
-        response = (
-            f"HTTP/1.1 200 OK\r\n"
-            f"Content-Type: {content_type}\r\n"
-            f"Content-Length: {len(content)}\r\n"
-            f"Connection: close\r\n"
-            f"\r\n"
-        ).encode() + content
+    STATUS_TEXT = {
+        200: "OK",
+        201: "Created",
+        202: "Accepted",
+        304: "Not Modified",
+        400: "Bad Request",
+        403: "Forbidden",
+        404: "Not Found",
+        405: "Method Not Allowed",
+        413: "Payload Too Large",
+        414: "URI Too Long",
+        431: "Request Header Fields Too Large",
+        500: "Internal Server Error",
+        501: "Not Implemented",
+        503: "Service Unavailable",
+    }
 
-        writer.write(response)
-        await writer.drain()
+    def _connection_header(self, keep_alive: bool) -> str:
+        """Build Connection header lines for a response."""
+        if keep_alive:
+            return (
+                f"Connection: keep-alive\r\n"
+                f"Keep-Alive: timeout={int(self.config.keepalive_timeout)}\r\n"
+            )
+        return "Connection: close\r\n"
 
     async def _send_json_response(
         self,
         writer: asyncio.StreamWriter,
         data: Any,
         status: int = 200,
+        keep_alive: bool = False,
+        extra_headers: Optional[Dict[str, str]] = None,
     ) -> None:
         """Send JSON response."""
         body = json.dumps(data).encode()
-        status_text = {200: "OK", 201: "Created", 400: "Bad Request", 404: "Not Found", 500: "Internal Server Error"}
+        extra = "".join(f"{k}: {v}\r\n" for k, v in (extra_headers or {}).items())
 
         response = (
-            f"HTTP/1.1 {status} {status_text.get(status, 'Unknown')}\r\n"
+            f"HTTP/1.1 {status} {self.STATUS_TEXT.get(status, 'Unknown')}\r\n"
             f"Content-Type: application/json\r\n"
             f"Content-Length: {len(body)}\r\n"
             f"Access-Control-Allow-Origin: *\r\n"
-            f"Connection: close\r\n"
+            f"{extra}"
+            f"{self._connection_header(keep_alive)}"
             f"\r\n"
         ).encode() + body
 
@@ -1462,10 +2194,14 @@ class DashboardServer:
         await writer.drain()
 
     async def _send_error(
-        self, writer: asyncio.StreamWriter, status: int, message: str
+        self,
+        writer: asyncio.StreamWriter,
+        status: int,
+        message: str,
+        keep_alive: bool = False,
     ) -> None:
         """Send error response."""
-        await self._send_json_response(writer, {"error": message}, status)
+        await self._send_json_response(writer, {"error": message}, status, keep_alive)
 
     async def _handle_websocket(
         self,
@@ -1473,26 +2209,31 @@ class DashboardServer:
         writer: asyncio.StreamWriter,
         headers: Dict[str, str],
     ) -> None:
-        """Handle WebSocket connection."""
-        import base64
-        import hashlib
-
-        # Compute accept key
-        key = headers.get("sec-websocket-key", "")
-        accept = base64.b64encode(
-            hashlib.sha1(
-                (key + "258EAFA5-E914-47DA-95CA-C5AB0DC85B11").encode()
-            ).digest()
-        ).decode()
-
-        # Send handshake response
+        """Handle WebSocket connection.
+
+        Performs the upgrade handshake (negotiating permessage-deflate when
+        enabled), then reads messages until the client closes. Replies
+        (pong, close) go through the client's send queue so they are never
+        interleaved with a broadcast frame.
+        """
+        key = headers.get("sec-websocket-key")
+        if not key:
+            await self._send_error(writer, 400, "Missing Sec-WebSocket-Key")
+            return
+
+        deflate = None
+        if self.config.ws_compression:
+            deflate = PerMessageDeflate.negotiate(headers.get("sec-websocket-extensions"))
+
         response = (
             "HTTP/1.1 101 Switching Protocols\r\n"
             "Upgrade: websocket\r\n"
             "Connection: Upgrade\r\n"
-            f"Sec-WebSocket-Accept: {accept}\r\n"
-            "\r\n"
+            f"Sec-WebSocket-Accept: {accept_key(key)}\r\n"
         )
+        if deflate is not None:
+            response += f"Sec-WebSocket-Extensions: {deflate.response_header()}\r\n"
+        response += "\r\n"
         try:
             writer.write(response.encode())
             await writer.drain()
@@ -1501,71 +2242,53 @@ class DashboardServer:
             return
 
         # Create client
-        client = WebSocketClient(writer)
+        client = WebSocketClient(
+            writer,
+            queue_size=self.config.ws_send_queue_size,
+            drop_when_full=self.config.ws_drop_when_full,
+            deflate=deflate,
+        )
+        client.start()
         self._clients[client.id] = client
-        logger.info("WebSocket client connected: %s", client.id)
+        logger.info(
+            "WebSocket client connected: %s%s", client.id, " (deflate)" if deflate else ""
+        )
 
+        ws_reader = WebSocketReader(
+            reader, deflate=deflate, max_size=self.config.ws_max_message_size
+        )
         try:
-            while True:
-                # Read frame header
-                header = await reader.read(2)
-                if len(header) < 2:
-                    break
-
-                fin = (header[0] >> 7) & 1
-                opcode = header[0] & 0x0F
-                masked = (header[1] >> 7) & 1
-                payload_len = header[1] & 0x7F
-
-                # Handle close frame
-                if opcode == 0x8:
-                    break
+            while not client.closed:
+                message = await ws_reader.receive()
 
-                # Read extended payload length
-                if payload_len == 126:
-                    ext_len = await reader.read(2)
-                    payload_len = int.from_bytes(ext_len, "big")
-                elif payload_len == 127:
-                    ext_len = await reader.read(8)
-                    payload_len = int.from_bytes(ext_len, "big")
-
-                # Read mask key
-                mask_key = await reader.read(4) if masked else None
-
-                # Read payload
-                payload = await reader.read(payload_len)
-
-                # Unmask if needed
-                if masked and mask_key:
-                    payload = bytes(
-                        payload[i] ^ mask_key[i % 4] for i in range(len(payload))
-                    )
-
-                # Handle text frame
-                if opcode == 0x1:
+                if message.opcode == OP_TEXT:
                     try:
-                        message = json.loads(payload.decode())
-                        await self._handle_ws_message(client, message)
+                        data = json.loads(message.data)
                     except json.JSONDecodeError:
-                        pass
+                        continue
+                    if isinstance(data, dict):
+                        await self._handle_ws_message(client, data)
 
-                # Handle ping
-                elif opcode == 0x9:
-                    # Send pong
-                    try:
-                        pong = bytes([0x8A, len(payload)]) + payload
-                        writer.write(pong)
-                        await writer.drain()
-                    except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError):
-                        # Client disconnected
-                        break
+                elif message.opcode == OP_PING:
+                    client.enqueue(encode_frame(OP_PONG, message.data))
 
+                elif message.opcode == OP_CLOSE:
+                    code = message.close_code
+                    await client.shutdown(CLOSE_NORMAL if code == 1005 else code)
+                    break
+
+        except WebSocketError as e:
+            logger.debug("WebSocket protocol error from %s: %s", client.id, e)
+            await client.shutdown(e.code, str(e))
+        except asyncio.IncompleteReadError:
+            logger.debug("WebSocket client %s closed the connection mid-frame", client.id)
         except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
             # Connection was closed by client - this is expected behavior
             logger.debug("WebSocket client disconnected: %s", e)
         except Exception as e:
             logger.debug("WebSocket error: %s", e)
         finally:
+            client.close()
             self._clients.pop(client.id, None)
             logger.info("WebSocket client disconnected: %s", client.id)
 
@@ -1587,15 +2310,54 @@ class DashboardServer:
         elif msg_type == "ping":
             await client.send({"type": "pong", "payload": {}})
 
+    async def _publish_apdu(self, session: Optional[Session], apdu_data: Dict[str, Any]) -> None:
+        """Publish an APDU event and the session's updated counters.
+
+        APDU events are batched and session counters debounced to their
+        latest state by the event coalescer. The APDU is also counted in
+        the traffic metrics.
+        """
+        self.metrics.record_apdu(
+            apdu_data.get("sessionId"), apdu_data.get("direction"), apdu_data.get("sw")
+        )
+        await self._events.add("apdu", apdu_data)
+        if session is not None:
+            await self._events.update(
+                "session.updated", session.id, lambda: self.state.session_dict(session)
+            )
+
     async def _broadcast(self, event_type: str, data: Any) -> None:
-        """Broadcast message to all connected clients."""
-        message = {"type": event_type, "payload": data}
+        """Broadcast message to all subscribed clients.
 
-        for client in list(self._clients.values()):
-            try:
-                await client.send(message)
-            except Exception:
-                pass
+        Coalesced events still pending are sent first, so clients see
+        events in the order they happened.
+        """
+        if self._events.pending:
+            await self._events.flush()
+        await self._send_event(event_type, data)
+
+    async def _send_event(self, event_type: str, data: Any) -> None:
+        """Send message to all subscribed clients.
+
+        The message is serialized once and framed once per compression
+        setting (compressed frames carry no context between messages, so
+        they are shared too), then queued on each client's send queue
+        without waiting for any client to drain.
+        """
+        recipients = [c for c in self._clients.values() if c.wants(event_type)]
+        if not recipients:
+            return
+
+        payload = json.dumps({"type": event_type, "payload": data}).encode()
+        frames: Dict[Optional[int], bytes] = {}
+        for client in recipients:
+            deflate = client.deflate
+            frame_key = deflate.key if deflate is not None else None
+            frame = frames.get(frame_key)
+            if frame is None:
+                frame = frames[frame_key] = encode_message(payload, deflate=deflate)
+            if not client.enqueue(frame) and client.closed:
+                self._clients.pop(client.id, None)
 
     # =========================================================================
     # Public API for external integration
@@ -1633,7 +2395,7 @@ class DashboardServer:
         )
 
         if apdu:
-            await self._broadcast("apdu", apdu.to_dict())
+            await self._publish_apdu(self.state.sessions.get(session_id), apdu.to_dict())
 
         return apdu
 
@@ -168,6 +168,16 @@ export function createAPIClient(config = {}) {
       return this.get('/sessions');
     },
 
+    /**
+     * Gets sessions changed since a state version.
+     * @param {number} since - Version from the previous call (0 for all)
+     * @returns {Promise<{version: number, sessions: Object[], deleted: string[], reset: boolean}>}
+     *   Changed sessions, deleted session IDs and the new version
+     */
+    getSessionChanges(since) {
+      return this.get(`/sessions?since=${since}`);
+    },
+
     /**
      * Gets a specific session.
      * @param {string} sessionId - Session ID
@@ -211,9 +221,12 @@ export function createAPIClient(config = {}) {
 
     /**
      * Gets APDUs for a session.
+     * Without params, returns all retained entries. With `after` (last
+     * `seq` seen) and/or `limit`, returns a page:
+     * `{items, cursor, hasMore, missed, dropped}`.
      * @param {string} sessionId - Session ID
-     * @param {Object} [params] - Query parameters
-     * @returns {Promise<Object[]>} APDU entries
+     * @param {Object} [params] - Query parameters (after, limit)
+     * @returns {Promise<Object[]|Object>} APDU entries or page
      */
     getApdus(sessionId, params = {}) {
       const query = new URLSearchParams(params).toString();
@@ -305,6 +318,18 @@ export function createAPIClient(config = {}) {
       return this.get('/status');
     },
 
+    /**
+     * Gets server-wide traffic time series.
+     * @param {string[]} series - Series names (e.g. 'apdus', 'errors', 'latency_avg')
+     * @param {number} [range=600] - Time range in seconds (up to 24 hours)
+     * @param {number} [points=120] - Maximum values per series
+     * @returns {Promise<{start: number, step: number, series: Object<string, Array<number|null>>}>}
+     *   Values per series; point i is at start + i * step (epoch seconds)
+     */
+    getTimeSeries(series, range = 600, points = 120) {
+      return this.get(`/metrics/timeseries?series=${series.join(',')}&range=${range}&points=${points}`);
+    },
+
     /**
      * Gets server configuration.
      * @returns {Promise<Object>} Configuration
@@ -14,6 +14,7 @@ import { createHttpLog } from './components/http-log.js';
 import { createSessionPanel } from './components/session-panel.js';
 import { createCommandBuilder } from './components/command-builder.js';
 import { createSimulatorPanel } from './components/simulator-panel.js';
+import { createThroughputPanel } from './components/throughput-panel.js';
 import { createCommLog } from './components/comm-log.js';
 import { createScriptManager } from './components/script-manager.js';
 import { debounce } from './utils/time.js';
@@ -495,6 +496,12 @@ class DashboardApp {
       this.components.simulatorPanel = createSimulatorPanel(simulatorContainer);
     }
 
+    // Throughput panel
+    const throughputContainer = document.getElementById('throughput-panel-container');
+    if (throughputContainer) {
+      this.components.throughputPanel = createThroughputPanel(throughputContainer);
+    }
+
     // Communication log
     const commLogContainer = document.getElementById('comm-log-content');
     const commLogEmpty = document.getElementById('comm-log-empty');
@@ -725,17 +732,25 @@ class DashboardApp {
    */
   setupWebSocket() {
     // APDU events
+    const toApdu = (payload) => ({
+      id: payload.id || Date.now().toString(),
+      seq: payload.seq,
+      timestamp: payload.timestamp || Date.now(),
+      direction: payload.direction,
+      data: payload.data,
+      sw: payload.sw,
+      responseData: payload.responseData,
+      sessionId: payload.sessionId,
+      http: payload.http || null,
+    });
+
     wsClient.onMessage('apdu', (payload) => {
-      state.addApdu({
-        id: payload.id || Date.now().toString(),
-        timestamp: payload.timestamp || Date.now(),
-        direction: payload.direction,
-        data: payload.data,
-        sw: payload.sw,
-        responseData: payload.responseData,
-        sessionId: payload.sessionId,
-        http: payload.http || null,
-      });
+      state.addApdu(toApdu(payload));
+    });
+
+    // Coalesced APDU events (sent by the server under load)
+    wsClient.onMessage('apdu.batch', (payload) => {
+      state.addApdus((payload.items || []).map(toApdu));
     });
 
     // Session events
@@ -766,6 +781,10 @@ class DashboardApp {
       state.removeSession(payload.id);
     });
 
+    wsClient.onMessage('session.deleted.batch', (payload) => {
+      state.removeSessions((payload.items || []).map((item) => item.id));
+    });
+
     // Simulator events
     wsClient.onMessage('simulator.connected', (payload) => {
       this.components.simulatorPanel?.handleSimulatorEvent('simulator.connected', payload);
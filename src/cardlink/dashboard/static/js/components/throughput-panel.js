@@ -0,0 +1,195 @@
+/**
+ * Throughput Panel Component for GP OTA Tester Dashboard
+ *
+ * Charts server-wide APDU rate, handshake rate, error status words and
+ * command/response latency from the dashboard's rolling time series.
+ */
+
+import { api } from '../api.js';
+
+/** Chart definitions: series shown together and their unit. */
+const CHARTS = [
+  { title: 'APDUs', unit: '/s', series: ['commands', 'responses'] },
+  { title: 'Handshakes', unit: '/s', series: ['handshakes', 'handshake_failures'] },
+  { title: 'Error SW', unit: '/s', series: ['errors'] },
+  { title: 'Latency', unit: 'ms', series: ['latency_avg', 'latency_max'] },
+];
+
+const SERIES_LABELS = {
+  commands: 'Commands',
+  responses: 'Responses',
+  handshakes: 'Completed',
+  handshake_failures: 'Failed',
+  errors: 'Errors',
+  latency_avg: 'Average',
+  latency_max: 'Max',
+};
+
+const RANGES = [
+  { label: '10 min', seconds: 600 },
+  { label: '1 hour', seconds: 3600 },
+  { label: '24 hours', seconds: 86400 },
+];
+
+const CHART_WIDTH = 600;
+const CHART_HEIGHT = 120;
+const POINTS = 150;
+const REFRESH_MS = 5000;
+
+/**
+ * Escapes HTML special characters.
+ * @param {string} str - String to escape
+ * @returns {string} Escaped string
+ */
+function escapeHtml(str) {
+  if (!str) return '';
+  const div = document.createElement('div');
+  div.textContent = str;
+  return div.innerHTML;
+}
+
+/**
+ * Formats a value for the chart legend.
+ * @param {number|null} value - Value
+ * @returns {string} Formatted value
+ */
+function formatValue(value) {
+  if (value === null || value === undefined) return '–';
+  if (value >= 100) return value.toFixed(0);
+  if (value >= 10) return value.toFixed(1);
+  return value.toFixed(2);
+}
+
+/**
+ * Builds SVG polyline points for a series (gaps for null values).
+ * @param {Array<number|null>} values - Series values
+ * @param {number} max - Value at the top of the chart
+ * @returns {string[]} Point lists, one per unbroken segment
+ */
+function toSegments(values, max) {
+  const segments = [];
+  let current = [];
+  const dx = values.length > 1 ? CHART_WIDTH / (values.length - 1) : 0;
+  values.forEach((value, i) => {
+    if (value === null) {
+      if (current.length) segments.push(current.join(' '));
+      current = [];
+      return;
+    }
+    const y = CHART_HEIGHT - (value / max) * CHART_HEIGHT;
+    current.push(`${(i * dx).toFixed(1)},${y.toFixed(1)}`);
+  });
+  if (current.length) segments.push(current.join(' '));
+  return segments;
+}
+
+/**
+ * Creates a throughput panel component.
+ * @param {HTMLElement} container - Panel container element
+ * @returns {Object} Throughput panel API
+ */
+export function createThroughputPanel(container) {
+  let range = RANGES[0].seconds;
+  let timer = null;
+  let loading = false;
+
+  /**
+   * Renders one chart.
+   * @param {Object} chart - Chart definition
+   * @param {Object} data - Time series response
+   * @returns {string} HTML
+   */
+  function renderChart(chart, data) {
+    const all = chart.series.flatMap((name) => data.series[name] || []);
+    const max = Math.max(1, ...all.filter((v) => v !== null));
+    const lines = chart.series.map((name, index) => {
+      const values = data.series[name] || [];
+      return toSegments(values, max)
+        .map((points) => `<polyline class="throughput__line throughput__line--${index}" points="${points}"/>`)
+        .join('');
+    }).join('');
+    const legend = chart.series.map((name, index) => {
+      const values = (data.series[name] || []).filter((v) => v !== null);
+      const latest = values.length ? values[values.length - 1] : null;
+      return `
+        <span class="throughput__legend-item throughput__legend-item--${index}">
+          ${SERIES_LABELS[name]}: ${formatValue(latest)} ${chart.unit}
+        </span>`;
+    }).join('');
+
+    return `
+      <div class="card throughput__chart">
+        <div class="card__header">
+          <h3 class="card__title">${chart.title}</h3>
+          <span class="throughput__max">max ${formatValue(max)} ${chart.unit}</span>
+        </div>
+        <div class="card__body">
+          <svg class="throughput__svg" viewBox="0 0 ${CHART_WIDTH} ${CHART_HEIGHT}" preserveAspectRatio="none">
+            ${lines}
+          </svg>
+          <div class="throughput__legend">${legend}</div>
+        </div>
+      </div>`;
+  }
+
+  /**
+   * Renders the panel.
+   * @param {Object|null} data - Time series response
+   * @param {string} [error] - Error message
+   */
+  function render(data, error) {
+    const buttons = RANGES.map((r) => `
+      <button type="button" class="btn btn--sm ${r.seconds === range ? 'btn--primary' : 'btn--secondary'}"
+              data-range="${r.seconds}">${r.label}</button>`).join('');
+    let body = '';
+    if (error) {
+      body = `<div class="throughput__error">${escapeHtml(error)}</div>`;
+    } else if (data) {
+      body = `<div class="throughput__grid">${CHARTS.map((c) => renderChart(c, data)).join('')}</div>`;
+    }
+    const step = data ? `${data.step} s per point` : '';
+    container.innerHTML = `
+      <div class="throughput__toolbar">
+        <div class="throughput__ranges">${buttons}</div>
+        <span class="throughput__step">${step}</span>
+      </div>
+      ${body}`;
+  }
+
+  /**
+   * Loads and renders the series, unless the panel is hidden.
+   * @param {boolean} [force] - Load even if hidden
+   */
+  async function refresh(force = false) {
+    if (loading || (!force && container.offsetParent === null)) return;
+    loading = true;
+    try {
+      const series = [...new Set(CHARTS.flatMap((c) => c.series))];
+      render(await api.getTimeSeries(series, range, POINTS));
+    } catch (error) {
+      render(null, error.message || 'Failed to load metrics');
+    } finally {
+      loading = false;
+    }
+  }
+
+  container.addEventListener('click', (event) => {
+    const button = event.target.closest('[data-range]');
+    if (!button) return;
+    range = Number(button.dataset.range);
+    refresh(true);
+  });
+
+  render(null);
+  refresh(true);
+  timer = setInterval(() => refresh(), REFRESH_MS);
+
+  return {
+    refresh,
+
+    destroy() {
+      clearInterval(timer);
+      container.innerHTML = '';
+    },
+  };
+}
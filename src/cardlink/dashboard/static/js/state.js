@@ -359,6 +359,21 @@ export function createStateManager() {
       }
     },
 
+    /**
+     * Removes several sessions with a single update.
+     * @param {string[]} sessionIds - Session IDs
+     */
+    removeSessions(sessionIds) {
+      const removed = new Set(sessionIds);
+      const sessions = state.sessions.filter(s => !removed.has(s.id));
+      this.set('sessions', sessions);
+
+      if (removed.has(state.activeSessionId)) {
+        this.set('activeSessionId', null);
+        this.clearApdus();
+      }
+    },
+
     /**
      * Gets filtered APDUs based on current filters.
      * @returns {Object[]} Filtered APDU entries
@@ -0,0 +1,428 @@
+"""WebSocket frame codec for the dashboard server (RFC 6455 / RFC 7692).
+
+This module provides frame encoding and decoding for the dashboard's
+WebSocket endpoint:
+
+- Exact reads of frame headers and payloads (``readexactly``)
+- Word-wide unmasking (whole payload XOR'd as one integer)
+- Fragmented messages with interleaved control frames
+- Close, ping and pong handling with protocol error close codes
+- permessage-deflate compression
+
+Outgoing messages are compressed without context takeover, so a
+compressed frame does not depend on earlier messages and one encoded
+frame can be shared by every client that negotiated the same parameters.
+
+Example:
+    >>> deflate = PerMessageDeflate.negotiate(headers.get("sec-websocket-extensions"))
+    >>> reader = WebSocketReader(stream_reader, deflate=deflate)
+    >>> message = await reader.receive()
+    >>> frame = encode_message(b'{"type": "pong"}', deflate=deflate)
+"""
+
+import asyncio
+import base64
+import hashlib
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Opcodes
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+# Close codes
+CLOSE_NORMAL = 1000
+CLOSE_GOING_AWAY = 1001
+CLOSE_PROTOCOL_ERROR = 1002
+CLOSE_INVALID_DATA = 1007
+CLOSE_MESSAGE_TOO_BIG = 1009
+
+# Trailer removed from / restored to deflate output (RFC 7692 section 7.2.1)
+_DEFLATE_TRAILER = b"\x00\x00\xff\xff"
+
+
+class WebSocketError(Exception):
+    """Protocol violation that terminates the connection.
+
+    Attributes:
+        code: Close code to send to the peer.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass
+class Message:
+    """Complete WebSocket message or control frame.
+
+    Attributes:
+        opcode: Message opcode (text, binary, close, ping or pong).
+        data: Payload, decompressed and reassembled.
+    """
+
+    opcode: int
+    data: bytes
+
+    @property
+    def close_code(self) -> int:
+        """Get close code of a close frame (1005 if none was sent)."""
+        if self.opcode != OP_CLOSE or len(self.data) < 2:
+            return 1005
+        return struct.unpack("!H", self.data[:2])[0]
+
+
+def accept_key(key: str) -> str:
+    """Compute Sec-WebSocket-Accept for a handshake key."""
+    return base64.b64encode(hashlib.sha1((key + WS_GUID).encode()).digest()).decode()
+
+
+def unmask(payload: bytes, mask: bytes) -> bytes:
+    """XOR payload with the 4-byte masking key.
+
+    The mask is repeated to the payload length and applied as a single
+    integer XOR instead of byte by byte.
+    """
+    length = len(payload)
+    if not length:
+        return payload
+    key = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, "little") ^ int.from_bytes(key, "little")).to_bytes(
+        length, "little"
+    )
+
+
+def encode_frame(
+    opcode: int,
+    payload: bytes = b"",
+    fin: bool = True,
+    rsv1: bool = False,
+    mask: Optional[bytes] = None,
+) -> bytes:
+    """Encode a single frame.
+
+    Args:
+        opcode: Frame opcode.
+        payload: Frame payload.
+        fin: Final fragment flag.
+        rsv1: Compressed flag (permessage-deflate).
+        mask: Optional 4-byte masking key (client frames).
+
+    Returns:
+        Encoded frame.
+    """
+    first = (0x80 if fin else 0) | (0x40 if rsv1 else 0) | opcode
+    mask_bit = 0x80 if mask else 0
+    length = len(payload)
+    if length <= 125:
+        header = struct.pack("!BB", first, mask_bit | length)
+    elif length <= 0xFFFF:
+        header = struct.pack("!BBH", first, mask_bit | 126, length)
+    else:
+        header = struct.pack("!BBQ", first, mask_bit | 127, length)
+    if mask:
+        return header + mask + unmask(payload, mask)
+    return header + payload
+
+
+def encode_close(code: int = CLOSE_NORMAL, reason: str = "") -> bytes:
+    """Encode a close frame."""
+    return encode_frame(OP_CLOSE, struct.pack("!H", code) + reason.encode()[:123])
+
+
+class PerMessageDeflate:
+    """Negotiated permessage-deflate parameters.
+
+    The server always compresses without context takeover (each message
+    is deflated independently), which keeps broadcast frames shareable.
+    Incoming messages are inflated with a persistent context unless the
+    client asked not to keep one.
+
+    Attributes:
+        server_max_window_bits: Window size used for outgoing messages.
+        client_no_context_takeover: Client resets its context per message.
+        level: zlib compression level.
+        threshold: Payloads shorter than this are sent uncompressed.
+    """
+
+    def __init__(
+        self,
+        server_max_window_bits: int = 15,
+        client_max_window_bits: Optional[int] = None,
+        client_no_context_takeover: bool = False,
+        level: int = 6,
+        threshold: int = 128,
+    ):
+        self.server_max_window_bits = server_max_window_bits
+        self.client_max_window_bits = client_max_window_bits
+        self.client_no_context_takeover = client_no_context_takeover
+        self.level = level
+        self.threshold = threshold
+        self._decompressor = zlib.decompressobj(-15)
+
+    @classmethod
+    def negotiate(cls, header: Optional[str], **kwargs) -> Optional["PerMessageDeflate"]:
+        """Accept the first acceptable permessage-deflate offer.
+
+        Args:
+            header: Sec-WebSocket-Extensions request header value.
+            **kwargs: Compression options (level, threshold).
+
+        Returns:
+            Negotiated parameters, or None if no offer was acceptable.
+        """
+        if not header:
+            return None
+
+        for offer in header.split(","):
+            parts = [p.strip() for p in offer.split(";")]
+            if parts[0].lower() != "permessage-deflate":
+                continue
+
+            params: Dict[str, Optional[str]] = {}
+            valid = True
+            for param in parts[1:]:
+                if not param:
+                    continue
+                name, _, value = param.partition("=")
+                name = name.strip().lower()
+                if name in params:
+                    valid = False
+                    break
+                params[name] = value.strip().strip('"') or None
+            if not valid:
+                continue
+
+            try:
+                server_bits = int(params.pop("server_max_window_bits", None) or 15)
+                client_bits_value = params.pop("client_max_window_bits", "")
+                client_bits = int(client_bits_value) if client_bits_value else None
+            except ValueError:
+                continue
+            # zlib cannot produce raw deflate streams with an 8-bit window
+            if not 9 <= server_bits <= 15:
+                continue
+            if client_bits is not None and not 8 <= client_bits <= 15:
+                continue
+
+            params.pop("server_no_context_takeover", None)
+            client_no_context = "client_no_context_takeover" in params
+            params.pop("client_no_context_takeover", None)
+            if params:
+                continue  # Unknown parameter
+
+            return cls(
+                server_max_window_bits=server_bits,
+                client_max_window_bits=client_bits,
+                client_no_context_takeover=client_no_context,
+                **kwargs,
+            )
+        return None
+
+    @property
+    def key(self) -> int:
+        """Get key identifying interchangeable outgoing frames."""
+        return self.server_max_window_bits
+
+    def response_header(self) -> str:
+        """Build Sec-WebSocket-Extensions response value."""
+        parts = ["permessage-deflate", "server_no_context_takeover"]
+        if self.server_max_window_bits < 15:
+            parts.append(f"server_max_window_bits={self.server_max_window_bits}")
+        if self.client_no_context_takeover:
+            parts.append("client_no_context_takeover")
+        if self.client_max_window_bits is not None and self.client_max_window_bits < 15:
+            parts.append(f"client_max_window_bits={self.client_max_window_bits}")
+        return "; ".join(parts)
+
+    def compress(self, data: bytes) -> bytes:
+        """Deflate one message payload."""
+        compressor = zlib.compressobj(self.level, zlib.DEFLATED, -self.server_max_window_bits)
+        compressed = compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if compressed.endswith(_DEFLATE_TRAILER):
+            compressed = compressed[: -len(_DEFLATE_TRAILER)]
+        return compressed
+
+    def decompress(self, data: bytes, max_size: int) -> bytes:
+        """Inflate one message payload.
+
+        Raises:
+            WebSocketError: If the payload is invalid or inflates beyond max_size.
+        """
+        if self.client_no_context_takeover:
+            self._decompressor = zlib.decompressobj(-15)
+        try:
+            result = self._decompressor.decompress(data + _DEFLATE_TRAILER, max_size + 1)
+        except zlib.error as e:
+            raise WebSocketError(CLOSE_INVALID_DATA, f"Invalid compressed data: {e}") from None
+        if len(result) > max_size or self._decompressor.unconsumed_tail:
+            raise WebSocketError(CLOSE_MESSAGE_TOO_BIG, "Message too big")
+        return result
+
+
+def encode_message(
+    data: bytes,
+    opcode: int = OP_TEXT,
+    deflate: Optional[PerMessageDeflate] = None,
+) -> bytes:
+    """Encode a data message as a single frame, compressed if negotiated.
+
+    Args:
+        data: Message payload.
+        opcode: OP_TEXT or OP_BINARY.
+        deflate: Negotiated compression, or None.
+
+    Returns:
+        Encoded frame.
+    """
+    if deflate is not None and len(data) >= deflate.threshold:
+        return encode_frame(opcode, deflate.compress(data), rsv1=True)
+    return encode_frame(opcode, data)
+
+
+class WebSocketReader:
+    """Reads complete messages from a client connection.
+
+    Data frames are reassembled across continuation frames; control
+    frames (close, ping, pong) are returned as soon as they arrive, even
+    in the middle of a fragmented message.
+
+    Example:
+        >>> reader = WebSocketReader(stream_reader)
+        >>> while True:
+        ...     message = await reader.receive()
+    """
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        deflate: Optional[PerMessageDeflate] = None,
+        max_size: int = 16 * 1024 * 1024,
+        require_mask: bool = True,
+    ):
+        """Initialize reader.
+
+        Args:
+            reader: Stream to read frames from.
+            deflate: Negotiated compression, or None.
+            max_size: Maximum message size in bytes (after decompression).
+            require_mask: Reject unmasked frames (required for client frames).
+        """
+        self._reader = reader
+        self.deflate = deflate
+        self.max_size = max_size
+        self.require_mask = require_mask
+        self._fragments: List[bytes] = []
+        self._fragment_size = 0
+        self._fragment_opcode: Optional[int] = None
+        self._fragment_compressed = False
+
+    async def _read_frame(self):
+        """Read one frame: (fin, rsv1, opcode, payload)."""
+        read = self._reader.readexactly
+        first, second = await read(2)
+
+        fin = bool(first & 0x80)
+        rsv1 = bool(first & 0x40)
+        if first & 0x30 or (rsv1 and self.deflate is None):
+            raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Reserved bits set")
+        opcode = first & 0x0F
+        masked = bool(second & 0x80)
+        length = second & 0x7F
+
+        if opcode >= 0x8:
+            if not fin or length > 125:
+                raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Invalid control frame")
+            if rsv1:
+                raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Compressed control frame")
+        elif opcode not in (OP_CONTINUATION, OP_TEXT, OP_BINARY):
+            raise WebSocketError(CLOSE_PROTOCOL_ERROR, f"Unknown opcode: {opcode:#x}")
+
+        if length == 126:
+            (length,) = struct.unpack("!H", await read(2))
+        elif length == 127:
+            (length,) = struct.unpack("!Q", await read(8))
+
+        if self.require_mask and not masked:
+            raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Client frame not masked")
+        if self._fragment_size + length > self.max_size:
+            raise WebSocketError(CLOSE_MESSAGE_TOO_BIG, "Message too big")
+
+        mask = await read(4) if masked else None
+        payload = await read(length) if length else b""
+        if mask:
+            payload = unmask(payload, mask)
+        return fin, rsv1, opcode, payload
+
+    async def receive(self) -> Message:
+        """Read the next complete message or control frame.
+
+        Returns:
+            Next Message.
+
+        Raises:
+            WebSocketError: On protocol violations.
+            asyncio.IncompleteReadError: If the connection closed mid-frame.
+        """
+        while True:
+            fin, rsv1, opcode, payload = await self._read_frame()
+
+            if opcode >= 0x8:
+                if opcode == OP_CLOSE:
+                    self._validate_close(payload)
+                return Message(opcode, payload)
+
+            if opcode == OP_CONTINUATION:
+                if self._fragment_opcode is None:
+                    raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Unexpected continuation frame")
+                if rsv1:
+                    raise WebSocketError(CLOSE_PROTOCOL_ERROR, "RSV1 on continuation frame")
+            else:
+                if self._fragment_opcode is not None:
+                    raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Expected continuation frame")
+                self._fragment_opcode = opcode
+                self._fragment_compressed = rsv1
+
+            self._fragments.append(payload)
+            self._fragment_size += len(payload)
+            if not fin:
+                continue
+
+            data = b"".join(self._fragments)
+            opcode = self._fragment_opcode
+            compressed = self._fragment_compressed
+            self._fragments = []
+            self._fragment_size = 0
+            self._fragment_opcode = None
+            self._fragment_compressed = False
+
+            if compressed:
+                data = self.deflate.decompress(data, self.max_size)
+            if opcode == OP_TEXT:
+                try:
+                    data.decode("utf-8")
+                except UnicodeDecodeError:
+                    raise WebSocketError(CLOSE_INVALID_DATA, "Invalid UTF-8 in text message")
+            return Message(opcode, data)
+
+    @staticmethod
+    def _validate_close(payload: bytes) -> None:
+        if len(payload) == 1:
+            raise WebSocketError(CLOSE_PROTOCOL_ERROR, "Invalid close frame")
+        if len(payload) >= 2:
+            (code,) = struct.unpack("!H", payload[:2])
+            if code < 1000 or code in (1004, 1005, 1006) or 1016 <= code < 3000:
+                raise WebSocketError(CLOSE_PROTOCOL_ERROR, f"Invalid close code: {code}")
+            try:
+                payload[2:].decode("utf-8")
+            except UnicodeDecodeError:
+                raise WebSocketError(CLOSE_INVALID_DATA, "Invalid close reason")
@@ -66,8 +66,10 @@ from cardlink.database.models import (
 )
 from cardlink.database.repositories import (
     BaseRepository,
+    BulkInsertResult,
     CardRepository,
     DeviceRepository,
+    KeysetPage,
     LogRepository,
     Page,
     SessionRepository,
@@ -89,6 +91,18 @@ from cardlink.database.export_import import (
     ExportFormat,
     ImportResult,
 )
+from cardlink.database.statistics import (
+    LogStats,
+    LogSummary,
+    SessionStats,
+    StatisticsService,
+)
+from cardlink.database.retention import (
+    Partition,
+    RetentionManager,
+    RetentionPolicy,
+    RetentionResult,
+)
 from cardlink.database.migrate import (
     run_migrations,
     downgrade,
@@ -133,6 +147,8 @@ __all__ = [
     "SettingKeys",
     # Repositories
     "BaseRepository",
+    "BulkInsertResult",
+    "KeysetPage",
     "Page",
     "DeviceRepository",
     "CardRepository",
@@ -152,6 +168,16 @@ __all__ = [
     "ExportFormat",
     "ConflictMode",
     "ImportResult",
+    # Statistics
+    "StatisticsService",
+    "LogSummary",
+    "LogStats",
+    "SessionStats",
+    # Retention
+    "RetentionManager",
+    "RetentionPolicy",
+    "RetentionResult",
+    "Partition",
     # Migrations
     "run_migrations",
     "downgrade",
@@ -0,0 +1,73 @@
+"""Add hourly and daily rollup tables.
+
+Revision ID: 003_rollups
+Revises: 002_scripts_templates
+Create Date: 2026-10-18 00:00:00.000000
+
+This migration adds pre-aggregated tables for historic reporting:
+- session_rollups: Session counts by status, card type and cipher suite
+- comm_log_rollups: Log counts by direction and status word
+- latency_rollups: Response latency histogram buckets
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "003_rollups"
+down_revision: Union[str, None] = "002_scripts_templates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create rollup tables."""
+
+    # =========================================================================
+    # Session rollups table
+    # =========================================================================
+    op.create_table(
+        "session_rollups",
+        sa.Column("period", sa.String(4), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("status", sa.String(16), primary_key=True),
+        sa.Column("card_type", sa.String(20), primary_key=True),
+        sa.Column("cipher_suite", sa.String(64), primary_key=True),
+        sa.Column("session_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("duration_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("duration_sum_ms", sa.Float(), nullable=False, default=0),
+    )
+
+    # =========================================================================
+    # Communication log rollups table
+    # =========================================================================
+    op.create_table(
+        "comm_log_rollups",
+        sa.Column("period", sa.String(4), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("direction", sa.String(10), primary_key=True),
+        sa.Column("status_word", sa.String(4), primary_key=True),
+        sa.Column("log_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("latency_count", sa.Integer(), nullable=False, default=0),
+        sa.Column("latency_sum_ms", sa.Float(), nullable=False, default=0),
+    )
+
+    # =========================================================================
+    # Latency histogram rollups table
+    # =========================================================================
+    op.create_table(
+        "latency_rollups",
+        sa.Column("period", sa.String(4), primary_key=True),
+        sa.Column("bucket_start", sa.DateTime(), primary_key=True),
+        sa.Column("bucket", sa.Integer(), primary_key=True),
+        sa.Column("log_count", sa.Integer(), nullable=False, default=0),
+    )
+
+
+def downgrade() -> None:
+    """Drop rollup tables."""
+    op.drop_table("latency_rollups")
+    op.drop_table("comm_log_rollups")
+    op.drop_table("session_rollups")
@@ -0,0 +1,142 @@
+"""Partition comm_logs by month on PostgreSQL.
+
+Revision ID: 004_partition_comm_logs
+Revises: 003_rollups
+Create Date: 2026-10-18 00:00:00.000000
+
+On PostgreSQL, comm_logs becomes a table partitioned by RANGE
+(timestamp). There is one partition per month of existing data plus the
+current and next month, and a DEFAULT partition catches rows outside
+every range. Old partitions are dropped by the retention manager
+(``gp-db retention apply``), which also creates partitions ahead of
+time and moves rows out of the DEFAULT partition into their month. The
+primary key becomes (id, timestamp), because PostgreSQL requires the
+partition key in unique constraints.
+
+Existing rows are copied into the partitioned table, which takes time
+proportional to the size of comm_logs.
+
+SQLite and MySQL are left unchanged; retention there deletes expired
+rows in small batches.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "004_partition_comm_logs"
+down_revision: Union[str, None] = "003_rollups"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    "idx_log_session": "session_id",
+    "idx_log_timestamp": "timestamp",
+    "idx_log_direction": "direction",
+    "idx_log_status_word": "status_word",
+}
+
+COLUMNS = (
+    "id, session_id, timestamp, latency_ms, direction, raw_data, "
+    "decoded_data, status_word, status_message"
+)
+
+
+def _rename_existing() -> None:
+    """Move the current comm_logs table, its indexes and key out of the way."""
+    op.execute("ALTER TABLE comm_logs RENAME TO comm_logs_old")
+    op.execute("ALTER TABLE comm_logs_old RENAME CONSTRAINT comm_logs_pkey TO comm_logs_old_pkey")
+    for name in INDEXES:
+        op.execute(f"ALTER INDEX IF EXISTS {name} RENAME TO {name}_old")
+    # Keep the id sequence when the old table is dropped
+    op.execute("ALTER SEQUENCE comm_logs_id_seq OWNED BY NONE")
+
+
+def _create_indexes() -> None:
+    """Create the comm_logs indexes on the new table."""
+    for name, column in INDEXES.items():
+        op.execute(f"CREATE INDEX {name} ON comm_logs ({column})")
+
+
+def upgrade() -> None:
+    """Convert comm_logs to a monthly range-partitioned table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _rename_existing()
+    op.execute(
+        """
+        CREATE TABLE comm_logs (
+            id INTEGER NOT NULL DEFAULT nextval('comm_logs_id_seq'),
+            session_id VARCHAR(36) NOT NULL
+                REFERENCES ota_sessions (id) ON DELETE CASCADE,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            latency_ms DOUBLE PRECISION,
+            direction VARCHAR(10) NOT NULL,
+            raw_data TEXT NOT NULL,
+            decoded_data TEXT,
+            status_word VARCHAR(4),
+            status_message VARCHAR(128),
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+        """
+    )
+    op.execute("ALTER SEQUENCE comm_logs_id_seq OWNED BY comm_logs.id")
+    _create_indexes()
+
+    # One partition per month from the oldest row to next month
+    op.execute(
+        """
+        DO $$
+        DECLARE
+            month_start TIMESTAMP;
+            last_month TIMESTAMP := date_trunc('month', now()) + INTERVAL '1 month';
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(timestamp), now()))
+                INTO month_start FROM comm_logs_old;
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF comm_logs FOR VALUES FROM (%L) TO (%L)',
+                    'comm_logs_p' || to_char(month_start, 'YYYYMM'),
+                    month_start,
+                    month_start + INTERVAL '1 month'
+                );
+                month_start := month_start + INTERVAL '1 month';
+            END LOOP;
+        END $$
+        """
+    )
+    op.execute("CREATE TABLE comm_logs_default PARTITION OF comm_logs DEFAULT")
+
+    op.execute(f"INSERT INTO comm_logs ({COLUMNS}) SELECT {COLUMNS} FROM comm_logs_old")
+    op.execute("DROP TABLE comm_logs_old")
+
+
+def downgrade() -> None:
+    """Convert comm_logs back to a plain table."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    _rename_existing()
+    op.execute(
+        """
+        CREATE TABLE comm_logs (
+            id INTEGER NOT NULL DEFAULT nextval('comm_logs_id_seq') PRIMARY KEY,
+            session_id VARCHAR(36) NOT NULL
+                REFERENCES ota_sessions (id) ON DELETE CASCADE,
+            timestamp TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            latency_ms DOUBLE PRECISION,
+            direction VARCHAR(10) NOT NULL,
+            raw_data TEXT NOT NULL,
+            decoded_data TEXT,
+            status_word VARCHAR(4),
+            status_message VARCHAR(128)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE comm_logs_id_seq OWNED BY comm_logs.id")
+    _create_indexes()
+
+    op.execute(f"INSERT INTO comm_logs ({COLUMNS}) SELECT {COLUMNS} FROM comm_logs_old")
+    op.execute("DROP TABLE comm_logs_old")
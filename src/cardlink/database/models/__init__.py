@@ -25,6 +25,12 @@ from cardlink.database.models.enums import (
     SessionStatus,
     TestStatus,
 )
+from cardlink.database.models.rollup import (
+    LATENCY_BUCKETS_MS,
+    CommLogRollup,
+    LatencyRollup,
+    SessionRollup,
+)
 from cardlink.database.models.script import Script
 from cardlink.database.models.session import OTASession
 from cardlink.database.models.setting import Setting, SettingKeys
@@ -53,4 +59,9 @@ __all__ = [
     "SettingKeys",
     "Script",
     "Template",
+    # Rollups
+    "SessionRollup",
+    "CommLogRollup",
+    "LatencyRollup",
+    "LATENCY_BUCKETS_MS",
 ]
@@ -0,0 +1,111 @@
+"""Rollup models for GP OTA Tester.
+
+This module defines pre-aggregated hourly and daily counts of OTA
+sessions and communication logs. Historic reports read these small
+tables instead of scanning ``ota_sessions`` and ``comm_logs``.
+
+Rows are keyed by ``period`` ("hour" or "day"), the bucket start time
+and the grouping dimensions. Missing dimension values (no card, no
+cipher suite, no status word) are stored as empty strings so they can
+be part of the primary key.
+
+Example:
+    >>> from cardlink.database.models import SessionRollup
+    >>> row = SessionRollup(
+    ...     period="hour",
+    ...     bucket_start=datetime(2024, 1, 1, 10),
+    ...     status="completed",
+    ...     card_type="UICC",
+    ...     cipher_suite="TLS_PSK_WITH_AES_128_CBC_SHA256",
+    ...     session_count=12,
+    ... )
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from cardlink.database.models.base import Base
+
+# Rollup periods
+PERIOD_HOUR = "hour"
+PERIOD_DAY = "day"
+PERIODS = (PERIOD_HOUR, PERIOD_DAY)
+
+# Upper bounds (inclusive, ms) of the latency histogram buckets. Bucket
+# index len(LATENCY_BUCKETS_MS) counts latencies above the last bound.
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class SessionRollup(Base):
+    """OTA session counts per period, status, card type and cipher suite.
+
+    Sessions are bucketed by ``created_at``.
+
+    Attributes:
+        period: Rollup period ("hour" or "day").
+        bucket_start: Start of the period.
+        status: Session status value.
+        card_type: Card type of the session's card ("" if none).
+        cipher_suite: TLS cipher suite ("" if none).
+        session_count: Number of sessions.
+        duration_count: Number of sessions with a duration.
+        duration_sum_ms: Sum of session durations.
+    """
+
+    __tablename__ = "session_rollups"
+
+    period: Mapped[str] = mapped_column(String(4), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    status: Mapped[str] = mapped_column(String(16), primary_key=True)
+    card_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    cipher_suite: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    session_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_sum_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+
+class CommLogRollup(Base):
+    """Communication log counts per period, direction and status word.
+
+    Attributes:
+        period: Rollup period ("hour" or "day").
+        bucket_start: Start of the period.
+        direction: Command or response.
+        status_word: Response status word ("" for commands).
+        log_count: Number of log entries.
+        latency_count: Number of entries with a latency.
+        latency_sum_ms: Sum of latencies.
+    """
+
+    __tablename__ = "comm_log_rollups"
+
+    period: Mapped[str] = mapped_column(String(4), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    direction: Mapped[str] = mapped_column(String(10), primary_key=True)
+    status_word: Mapped[str] = mapped_column(String(4), primary_key=True)
+
+    log_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    latency_sum_ms: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+
+
+class LatencyRollup(Base):
+    """Response latency histogram per period.
+
+    Attributes:
+        period: Rollup period ("hour" or "day").
+        bucket_start: Start of the period.
+        bucket: Histogram bucket index into LATENCY_BUCKETS_MS.
+        log_count: Number of responses in the bucket.
+    """
+
+    __tablename__ = "latency_rollups"
+
+    period: Mapped[str] = mapped_column(String(4), primary_key=True)
+    bucket_start: Mapped[datetime] = mapped_column(DateTime, primary_key=True)
+    bucket: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    log_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -235,6 +235,14 @@ class SettingKeys:
     DB_POOL_SIZE = "database.pool_size"
     DB_POOL_TIMEOUT = "database.pool_timeout"
     DB_ECHO = "database.echo"
+    DB_ROLLUP_WATERMARK = "database.rollup_watermark"
+
+    # Retention settings
+    RETENTION_COMM_LOGS_DAYS = "retention.comm_logs_days"
+    RETENTION_PARTITION = "retention.partition"
+    RETENTION_ARCHIVE = "retention.archive"
+    RETENTION_ARCHIVE_DIR = "retention.archive_dir"
+    RETENTION_PURGED_BEFORE = "retention.comm_logs_purged_before"
 
     # Test settings
     TEST_TIMEOUT = "test.timeout"
@@ -8,18 +8,27 @@ Example:
     ...     CardRepository,
     ...     SessionRepository,
     ...     LogRepository,
+    ...     RollupRepository,
     ...     TestRepository,
     ...     SettingRepository,
     ...     ScriptRepository,
     ...     TemplateRepository,
     ...     Page,
+    ...     KeysetPage,
+    ...     BulkInsertResult,
     ... )
 """
 
-from cardlink.database.repositories.base import BaseRepository, Page
+from cardlink.database.repositories.base import (
+    BaseRepository,
+    BulkInsertResult,
+    KeysetPage,
+    Page,
+)
 from cardlink.database.repositories.card_repository import CardRepository
 from cardlink.database.repositories.device_repository import DeviceRepository
 from cardlink.database.repositories.log_repository import LogRepository
+from cardlink.database.repositories.rollup_repository import RollupRepository
 from cardlink.database.repositories.script_repository import ScriptRepository
 from cardlink.database.repositories.session_repository import SessionRepository
 from cardlink.database.repositories.setting_repository import SettingRepository
@@ -29,12 +38,15 @@ from cardlink.database.repositories.test_repository import TestRepository
 __all__ = [
     # Base
     "BaseRepository",
+    "BulkInsertResult",
+    "KeysetPage",
     "Page",
     # Repositories
     "DeviceRepository",
     "CardRepository",
     "SessionRepository",
     "LogRepository",
+    "RollupRepository",
     "TestRepository",
     "SettingRepository",
     "ScriptRepository",
@@ -10,13 +10,18 @@ Example:
     ...         super().__init__(session, MyModel)
 """
 
+import base64
+import binascii
+import json
+import time
 from dataclasses import dataclass
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from datetime import date, datetime
+from typing import Any, Generic, Iterable, List, Mapping, Optional, Sequence, Type, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import and_, func, insert, or_, select, text
 from sqlalchemy.orm import Session
 
-from cardlink.database.exceptions import IntegrityError, NotFoundError
+from cardlink.database.exceptions import IntegrityError, NotFoundError, ValidationError
 
 T = TypeVar("T")
 
@@ -60,6 +65,46 @@ class Page:
         return self.page - 1 if self.has_prev else None
 
 
+@dataclass
+class KeysetPage:
+    """Keyset (cursor) pagination result container.
+
+    Attributes:
+        items: List of items for current page.
+        next_cursor: Opaque cursor for the next page, None on the last page.
+        total: Total number of matching items, if requested.
+        estimated: True if ``total`` is an estimate.
+    """
+
+    items: List[Any]
+    next_cursor: Optional[str]
+    total: Optional[int] = None
+    estimated: bool = False
+
+    @property
+    def has_next(self) -> bool:
+        """Check if there is a next page."""
+        return self.next_cursor is not None
+
+
+@dataclass
+class BulkInsertResult:
+    """Bulk insert result.
+
+    Attributes:
+        rows: Number of rows inserted.
+        seconds: Wall-clock time spent writing.
+    """
+
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Get insert throughput."""
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
 class BaseRepository(Generic[T]):
     """Base repository with common CRUD operations.
 
@@ -340,7 +385,10 @@ class BaseRepository(Generic[T]):
         order_by: Optional[str] = None,
         descending: bool = False,
     ) -> Page:
-        """Get paginated results.
+        """Get paginated results by page number.
+
+        Uses COUNT and OFFSET, so cost grows with table size and page
+        depth. Prefer :meth:`paginate_keyset` for large tables.
 
         Args:
             page: Page number (1-based).
@@ -382,10 +430,169 @@ class BaseRepository(Generic[T]):
             pages=pages,
         )
 
+    def paginate_keyset(
+        self,
+        cursor: Optional[str] = None,
+        per_page: int = 20,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        total: Optional[str] = None,
+        **filters: Any,
+    ) -> KeysetPage:
+        """Get a page of results after a cursor.
+
+        Rows are ordered by ``order_by`` and then the primary key, which
+        makes the sort key unique. Each page seeks directly past the last
+        key of the previous page, so deep pages cost the same as the
+        first one when the sort columns are indexed.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page (None for the first).
+            per_page: Items per page.
+            order_by: Non-nullable column name to order by (primary key
+                only if omitted).
+            descending: If True, order descending.
+            total: None to skip counting, ``"exact"`` for COUNT(*) or
+                ``"estimate"`` for :meth:`estimate_count` (exact when
+                filtering).
+            **filters: Attribute name-value pairs to filter by.
+
+        Returns:
+            KeysetPage with items and the next cursor.
+
+        Raises:
+            ValidationError: If the cursor, ordering or total mode is invalid.
+
+        Example:
+            >>> page = repo.paginate_keyset(order_by="timestamp", session_id=sid)
+            >>> while page.has_next:
+            ...     page = repo.paginate_keyset(page.next_cursor, order_by="timestamp",
+            ...                                 session_id=sid)
+        """
+        if per_page <= 0:
+            raise ValidationError("per_page", "must be positive")
+        if total not in (None, "exact", "estimate"):
+            raise ValidationError("total", "must be None, 'exact' or 'estimate'")
+
+        columns = self._keyset_columns(order_by)
+        conditions = [
+            getattr(self._model_class, key) == value
+            for key, value in filters.items()
+            if hasattr(self._model_class, key)
+        ]
+
+        stmt = select(self._model_class).where(*conditions)
+        if cursor is not None:
+            values = _decode_cursor(cursor, columns, order_by, descending)
+            stmt = stmt.where(_keyset_after(columns, values, descending))
+        stmt = stmt.order_by(*(c.desc() if descending else c for c in columns))
+        stmt = stmt.limit(per_page + 1)
+        items = list(self._session.execute(stmt).scalars().all())
+
+        next_cursor = None
+        if len(items) > per_page:
+            items = items[:per_page]
+            last = items[-1]
+            values = [getattr(last, c.key) for c in columns]
+            next_cursor = _encode_cursor(values, order_by, descending)
+
+        count = None
+        if total == "estimate" and not conditions:
+            count = self.estimate_count()
+        elif total is not None:
+            stmt = select(func.count()).select_from(self._model_class).where(*conditions)
+            count = self._session.execute(stmt).scalar() or 0
+
+        return KeysetPage(
+            items=items,
+            next_cursor=next_cursor,
+            total=count,
+            estimated=total == "estimate" and not conditions,
+        )
+
+    def estimate_count(self) -> int:
+        """Estimate the number of rows without scanning the table.
+
+        Uses planner statistics on PostgreSQL and MySQL and the largest
+        rowid on SQLite (exact unless rows have been deleted). Falls back
+        to :meth:`count` when no estimate is available.
+
+        Returns:
+            Approximate number of rows.
+        """
+        table = self._model_class.__table__.name
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            stmt = text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:t)")
+        elif dialect in ("mysql", "mariadb"):
+            stmt = text(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :t"
+            )
+        elif dialect == "sqlite":
+            stmt = text(f'SELECT max(rowid) FROM "{table}"')
+        else:
+            return self.count()
+
+        estimate = self._session.execute(stmt, {"t": table}).scalar()
+        if estimate is None or estimate < 0:
+            # Empty table, or never analyzed (PostgreSQL reports -1)
+            return 0 if dialect == "sqlite" else self.count()
+        return int(estimate)
+
+    def _keyset_columns(self, order_by: Optional[str]) -> List[Any]:
+        """Get the unique ordering columns: order_by, then the primary key."""
+        primary_key = list(self._model_class.__table__.primary_key.columns)
+        columns = [getattr(self._model_class, c.key) for c in primary_key]
+        if order_by is None:
+            return columns
+        column = self._model_class.__table__.columns.get(order_by)
+        if column is None:
+            raise ValidationError("order_by", f"unknown column {order_by!r}")
+        if column.nullable:
+            raise ValidationError("order_by", f"column {order_by!r} is nullable")
+        if column.primary_key:
+            return columns
+        return [getattr(self._model_class, order_by)] + columns
+
     # =========================================================================
     # Bulk Operations
     # =========================================================================
 
+    def bulk_insert(
+        self,
+        rows: Iterable[Mapping[str, Any]],
+        batch_size: int = 5000,
+    ) -> BulkInsertResult:
+        """Insert rows with Core executemany, bypassing the ORM.
+
+        No model instances are created and nothing is added to the
+        session's identity map, so generated primary keys are not
+        returned. Rows are sent in batches of ``batch_size`` so that
+        iterators of any length use bounded memory.
+
+        Args:
+            rows: Column name-value mappings (all with the same keys).
+            batch_size: Rows per executemany call.
+
+        Returns:
+            BulkInsertResult with row count and timing.
+        """
+        stmt = insert(self._model_class.__table__)
+        start = time.perf_counter()
+        total = 0
+        batch: List[Mapping[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                self._session.execute(stmt, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            self._session.execute(stmt, batch)
+            total += len(batch)
+        return BulkInsertResult(rows=total, seconds=time.perf_counter() - start)
+
     def delete_all(self) -> int:
         """Delete all entities.
 
@@ -417,3 +624,52 @@ class BaseRepository(Generic[T]):
                 stmt = stmt.where(getattr(self._model_class, key) == value)
         result = self._session.execute(stmt)
         return result.rowcount
+
+
+def _keyset_after(columns: Sequence[Any], values: Sequence[Any], descending: bool) -> Any:
+    """Build ``(c1, c2, ...) > (v1, v2, ...)`` as an expanded OR of ANDs.
+
+    Row value comparison is avoided because not every backend uses an
+    index for it.
+    """
+    clauses = []
+    for i, column in enumerate(columns):
+        equal = [columns[j] == values[j] for j in range(i)]
+        beyond = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*equal, beyond))
+    return or_(*clauses)
+
+
+def _encode_cursor(values: Sequence[Any], order_by: Optional[str], descending: bool) -> str:
+    """Encode the last sort key of a page as an opaque cursor."""
+    encoded = [v.isoformat() if isinstance(v, (date, datetime)) else v for v in values]
+    payload = json.dumps({"k": encoded, "o": order_by, "d": descending}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(
+    cursor: str,
+    columns: Sequence[Any],
+    order_by: Optional[str],
+    descending: bool,
+) -> List[Any]:
+    """Decode a cursor, checking it was issued for the same ordering."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["k"]
+        if payload["o"] != order_by or payload["d"] != descending:
+            raise ValidationError("cursor", "Cursor was issued for a different ordering")
+        if len(values) != len(columns):
+            raise ValueError("key length")
+        decoded = []
+        for column, value in zip(columns, values):
+            python_type = column.type.python_type
+            if value is not None and issubclass(python_type, date):
+                value = python_type.fromisoformat(value)
+            decoded.append(value)
+        return decoded
+    except ValidationError:
+        raise
+    except (binascii.Error, TypeError, KeyError, ValueError, UnicodeDecodeError) as e:
+        raise ValidationError("cursor", "Invalid pagination cursor") from e
@@ -8,16 +8,41 @@ Example:
     >>> with UnitOfWork(manager) as uow:
     ...     logs = uow.logs.find_by_session(session_id)
     ...     commands = uow.logs.find_commands(session_id)
+
+Bulk ingestion:
+    >>> with UnitOfWork(manager) as uow:
+    ...     result = uow.logs.log_batch([
+    ...         (session_id, "command", "80F28000024F00"),
+    ...         (session_id, "response", "9000", 12.5),
+    ...     ])
+    ...     uow.commit()
+    >>> print(f"{result.rows_per_second:.0f} rows/s")
 """
 
+import csv
+import io
+import logging
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.orm import Session
 
 from cardlink.database.models import CommLog, CommDirection
-from cardlink.database.repositories.base import BaseRepository
+from cardlink.database.repositories.base import BaseRepository, BulkInsertResult
+from cardlink.database.statistics import StatisticsService
+
+logger = logging.getLogger(__name__)
+
+# Positional layout of tuple rows accepted by LogRepository.log_batch
+# (trailing fields may be omitted)
+BATCH_COLUMNS = ("session_id", "direction", "raw_data", "latency_ms", "decoded_data", "timestamp")
+
+# Columns written by bulk ingestion, in COPY order
+_INSERT_COLUMNS = BATCH_COLUMNS + ("status_word", "status_message")
+
+LogBatch = Union[Iterable[Sequence[Any]], Mapping[str, Sequence[Any]]]
 
 
 class LogRepository(BaseRepository[CommLog]):
@@ -216,6 +241,88 @@ class LogRepository(BaseRepository[CommLog]):
         log = CommLog.create_response(session_id, raw_data, latency_ms, decoded_data)
         return self.create(log)
 
+    def log_batch(
+        self,
+        rows: LogBatch,
+        batch_size: int = 5000,
+    ) -> BulkInsertResult:
+        """Bulk insert log entries without creating ORM objects.
+
+        Rows are either tuples laid out as :data:`BATCH_COLUMNS`
+        (``session_id, direction, raw_data[, latency_ms, decoded_data,
+        timestamp]``) or a columnar batch mapping column names to
+        equal-length sequences. Raw data and status words are
+        normalized exactly as by :meth:`log_command` and
+        :meth:`log_response`; missing timestamps default to now (UTC).
+
+        PostgreSQL (psycopg2) uses ``COPY ... FROM STDIN``; other
+        backends use Core executemany. The rows are part of the current
+        transaction and become visible on commit.
+
+        Args:
+            rows: Tuple rows or a columnar batch.
+            batch_size: Rows per executemany call or COPY.
+
+        Returns:
+            BulkInsertResult with row count and rows/s.
+
+        Raises:
+            ValueError: If a row is malformed or columns differ in length.
+        """
+        records = _normalize_rows(_iter_rows(rows), datetime.utcnow())
+        if self._session.get_bind().dialect.name == "postgresql":
+            result = self._copy_rows(records, batch_size)
+        else:
+            result = self.bulk_insert(records, batch_size)
+        logger.debug(
+            "Bulk inserted %d log rows in %.3f s (%.0f rows/s)",
+            result.rows,
+            result.seconds,
+            result.rows_per_second,
+        )
+        return result
+
+    def _copy_rows(
+        self,
+        records: Iterator[Dict[str, Any]],
+        batch_size: int,
+    ) -> BulkInsertResult:
+        """Insert rows with PostgreSQL COPY over the session's connection."""
+        dbapi_connection = self._session.connection().connection.dbapi_connection
+        cursor = dbapi_connection.cursor()
+        if not hasattr(cursor, "copy_expert"):
+            # Not psycopg2: fall back to executemany
+            cursor.close()
+            return self.bulk_insert(records, batch_size)
+
+        table = CommLog.__table__.name
+        sql = (
+            f"COPY {table} ({', '.join(_INSERT_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+        )
+        start = time.perf_counter()
+        total = 0
+        try:
+            while True:
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                count = 0
+                for record in records:
+                    writer.writerow(
+                        "\\N" if record[c] is None else record[c] for c in _INSERT_COLUMNS
+                    )
+                    count += 1
+                    if count >= batch_size:
+                        break
+                if not count:
+                    break
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+                total += count
+        finally:
+            cursor.close()
+        return BulkInsertResult(rows=total, seconds=time.perf_counter() - start)
+
     def get_session_summary(self, session_id: str) -> dict:
         """Get summary statistics for a session.
 
@@ -223,30 +330,9 @@ class LogRepository(BaseRepository[CommLog]):
             session_id: Session UUID.
 
         Returns:
-            Dictionary with log statistics.
+            Dictionary with log statistics (see :class:`LogSummary`).
         """
-        logs = self.find_by_session(session_id)
-        commands = [l for l in logs if l.is_command]
-        responses = [l for l in logs if l.is_response]
-
-        # Calculate latency stats
-        latencies = [r.latency_ms for r in responses if r.latency_ms]
-        avg_latency = sum(latencies) / len(latencies) if latencies else 0
-
-        # Count success/errors
-        success_count = sum(1 for r in responses if r.is_success)
-        error_count = len(responses) - success_count
-
-        return {
-            "total_logs": len(logs),
-            "command_count": len(commands),
-            "response_count": len(responses),
-            "success_count": success_count,
-            "error_count": error_count,
-            "avg_latency_ms": round(avg_latency, 2),
-            "min_latency_ms": min(latencies) if latencies else 0,
-            "max_latency_ms": max(latencies) if latencies else 0,
-        }
+        return StatisticsService(self._session).log_summary(session_id).to_dict()
 
     def delete_for_session(self, session_id: str) -> int:
         """Delete all logs for a session.
@@ -266,18 +352,67 @@ class LogRepository(BaseRepository[CommLog]):
             hours: If specified, only count logs from last N hours.
 
         Returns:
-            Dictionary with statistics.
+            Dictionary with statistics (see :class:`LogStats`).
         """
-        base_query = select(func.count()).select_from(CommLog)
-
-        if hours:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            base_query = base_query.where(CommLog.timestamp >= cutoff)
-
-        total = self._session.execute(base_query).scalar() or 0
-
-        return {
-            "total": total,
-            "commands": self.count_by(direction=CommDirection.COMMAND.value),
-            "responses": self.count_by(direction=CommDirection.RESPONSE.value),
+        return StatisticsService(self._session).log_stats(hours).to_dict()
+
+
+def _iter_rows(rows: LogBatch) -> Iterator[Sequence[Any]]:
+    """Iterate a batch as tuples in :data:`BATCH_COLUMNS` order."""
+    if not isinstance(rows, Mapping):
+        return iter(rows)
+
+    unknown = set(rows) - set(BATCH_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown log batch columns: {sorted(unknown)}")
+    missing = {"session_id", "direction", "raw_data"} - set(rows)
+    if missing:
+        raise ValueError(f"Missing log batch columns: {sorted(missing)}")
+    lengths = {len(values) for values in rows.values()}
+    if len(lengths) > 1:
+        raise ValueError("Log batch columns differ in length")
+
+    length = lengths.pop()
+    columns = [rows.get(name, (None,) * length) for name in BATCH_COLUMNS]
+    return zip(*columns)
+
+
+def _normalize_rows(
+    rows: Iterable[Sequence[Any]],
+    now: datetime,
+) -> Iterator[Dict[str, Any]]:
+    """Build insert parameters, decoding status words for responses."""
+    command = CommDirection.COMMAND.value
+    response = CommDirection.RESPONSE.value
+    messages: Dict[str, str] = {}  # Status word -> message, per batch
+
+    for row in rows:
+        if not 3 <= len(row) <= len(BATCH_COLUMNS):
+            raise ValueError(f"Log row must have 3 to {len(BATCH_COLUMNS)} fields: {row!r}")
+        session_id, direction, raw_data, latency_ms, decoded_data, timestamp = (
+            tuple(row) + (None,) * (len(BATCH_COLUMNS) - len(row))
+        )
+        if isinstance(direction, CommDirection):
+            direction = direction.value
+        if direction not in (command, response):
+            raise ValueError(f"Invalid log direction: {direction!r}")
+
+        raw_data = raw_data.upper().replace(" ", "")
+        status_word = None
+        status_message = None
+        if direction == response and len(raw_data) >= 4:
+            status_word = raw_data[-4:]
+            status_message = messages.get(status_word)
+            if status_message is None:
+                status_message = messages[status_word] = CommLog.decode_status_word(status_word)
+
+        yield {
+            "session_id": session_id,
+            "direction": direction,
+            "raw_data": raw_data,
+            "latency_ms": latency_ms,
+            "decoded_data": decoded_data,
+            "timestamp": timestamp or now,
+            "status_word": status_word,
+            "status_message": status_message,
         }
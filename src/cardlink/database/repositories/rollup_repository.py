@@ -0,0 +1,606 @@
+"""Rollup repository for GP OTA Tester.
+
+This module maintains and queries the hourly and daily rollup tables
+(see :mod:`cardlink.database.models.rollup`).
+
+Rollups are rebuilt by a compactor rather than updated on every write,
+because a session's status, duration and cipher suite change after the
+session row is created. :meth:`RollupRepository.compact` recomputes the
+hourly buckets from a watermark (minus a lookback window for late
+updates) with GROUP BY queries over the raw tables, then recomputes the
+affected daily buckets from the hourly rollups. Run it periodically,
+e.g. with ``gp-db rollup`` from cron.
+
+Example:
+    >>> with UnitOfWork(manager) as uow:
+    ...     uow.rollups.compact()
+    ...     uow.commit()
+    ...     for point in uow.rollups.session_counts("day", start, end):
+    ...         print(point.bucket_start, point.status, point.sessions)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import DateTime, and_, case, cast, delete, func, insert, select, type_coerce
+from sqlalchemy.orm import Session
+
+from cardlink.database.exceptions import ValidationError
+from cardlink.database.models import (
+    LATENCY_BUCKETS_MS,
+    CardProfile,
+    CommDirection,
+    CommLog,
+    CommLogRollup,
+    LatencyRollup,
+    OTASession,
+    SessionRollup,
+    SettingKeys,
+)
+from cardlink.database.models.rollup import PERIOD_DAY, PERIOD_HOUR, PERIODS
+
+SESSION_DIMENSIONS = ("status", "card_type", "cipher_suite")
+
+
+@dataclass
+class SessionCount:
+    """Session count for one bucket and dimension combination.
+
+    Dimensions not requested in ``by`` are None.
+
+    Attributes:
+        bucket_start: Start of the period.
+        status: Session status value.
+        card_type: Card type ("" if none).
+        cipher_suite: TLS cipher suite ("" if none).
+        sessions: Number of sessions.
+        avg_duration_ms: Average duration of sessions with one.
+    """
+
+    bucket_start: datetime
+    status: Optional[str]
+    card_type: Optional[str]
+    cipher_suite: Optional[str]
+    sessions: int
+    avg_duration_ms: Optional[float]
+
+
+@dataclass
+class StatusWordCount:
+    """Response count for one bucket and status word.
+
+    Attributes:
+        bucket_start: Start of the period.
+        status_word: Response status word.
+        responses: Number of responses.
+        avg_latency_ms: Average latency of responses with one.
+    """
+
+    bucket_start: datetime
+    status_word: str
+    responses: int
+    avg_latency_ms: Optional[float]
+
+
+@dataclass
+class LatencyHistogram:
+    """Response latency histogram.
+
+    Attributes:
+        bounds_ms: Inclusive upper bound of each bucket except the last.
+        counts: Responses per bucket (one more entry than ``bounds_ms``).
+    """
+
+    bounds_ms: Tuple[int, ...]
+    counts: List[int]
+
+    @property
+    def total(self) -> int:
+        """Get the number of responses."""
+        return sum(self.counts)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Get the upper bound of the bucket containing a percentile.
+
+        Args:
+            q: Percentile between 0 and 100.
+
+        Returns:
+            Bucket upper bound in ms, ``inf`` for the overflow bucket,
+            or None if the histogram is empty.
+        """
+        rank = self.total * q / 100
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                if index == len(self.bounds_ms):
+                    return float("inf")
+                return float(self.bounds_ms[index])
+        return None
+
+
+@dataclass
+class CompactionResult:
+    """Rollup compaction result.
+
+    Attributes:
+        start: First hour recomputed (None if there was nothing to do).
+        end: End of the last hour recomputed.
+        rows: Rollup rows written (hourly and daily).
+    """
+
+    start: Optional[datetime]
+    end: Optional[datetime]
+    rows: int
+
+
+class RollupRepository:
+    """Repository for rollup maintenance and historic queries.
+
+    Query methods only read the rollup tables, so their cost depends on
+    the number of buckets, not on the number of sessions or log rows.
+
+    Example:
+        >>> repo = RollupRepository(session)
+        >>> repo.compact()
+        >>> repo.latency_histogram("day", start, end).percentile(95)
+        250.0
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize rollup repository.
+
+        Args:
+            session: SQLAlchemy session.
+        """
+        self._session = session
+
+    # =========================================================================
+    # Compaction
+    # =========================================================================
+
+    def compact(
+        self,
+        now: Optional[datetime] = None,
+        lookback: timedelta = timedelta(hours=24),
+    ) -> CompactionResult:
+        """Recompute rollups changed since the last compaction.
+
+        Hourly buckets from ``watermark - lookback`` up to and including
+        the current hour are rebuilt from the raw tables; on the first
+        run, everything from the oldest row is. Sessions or logs changed
+        or backfilled further back than ``lookback`` need
+        :meth:`rebuild`.
+
+        Args:
+            now: Current time (UTC, defaults to now).
+            lookback: How far before the watermark to recompute.
+
+        Returns:
+            CompactionResult with the recomputed range.
+        """
+        now = now or datetime.utcnow()
+        end = _truncate_hour(now) + timedelta(hours=1)
+
+        watermark = self._get_watermark()
+        if watermark is not None:
+            start = _truncate_hour(min(watermark, now) - lookback)
+        else:
+            start = self._oldest_raw_timestamp()
+
+        rows = 0
+        if start is not None:
+            rows = self.rebuild(start, end)
+        self._set_watermark(_truncate_hour(now))
+        return CompactionResult(start=start, end=end if start else None, rows=rows)
+
+    def rebuild(self, start: datetime, end: datetime) -> int:
+        """Rebuild hourly rollups in a range and the days containing it.
+
+        Log and latency rollups from before the retention purge time
+        (``retention.comm_logs_purged_before``) are kept as they are,
+        since the raw ``comm_logs`` rows behind them no longer exist.
+
+        Args:
+            start: Start of the range (rounded down to the hour).
+            end: End of the range (exclusive, rounded up to the hour).
+
+        Returns:
+            Rollup rows written.
+        """
+        start = _truncate_hour(start)
+        if _truncate_hour(end) < end:
+            end = _truncate_hour(end) + timedelta(hours=1)
+        day_start = _truncate_day(start)
+        day_end = _truncate_day(end - timedelta(microseconds=1)) + timedelta(days=1)
+
+        rows = self._rebuild_hours(start, end)
+        rows += self._rebuild_days(day_start, day_end)
+        return rows
+
+    def _rebuild_hours(self, start: datetime, end: datetime) -> int:
+        """Recompute hourly rollups from ``ota_sessions`` and ``comm_logs``."""
+        self._delete(PERIOD_HOUR, start, end, (SessionRollup,))
+
+        hour = self._bucket(OTASession.created_at, PERIOD_HOUR)
+        card_type = func.coalesce(CardProfile.card_type, "")
+        cipher_suite = func.coalesce(OTASession.tls_cipher_suite, "")
+        stmt = (
+            select(
+                hour,
+                OTASession.status,
+                card_type,
+                cipher_suite,
+                func.count(),
+                func.count(OTASession.duration_ms),
+                func.coalesce(func.sum(OTASession.duration_ms), 0),
+            )
+            .select_from(OTASession)
+            .outerjoin(CardProfile, CardProfile.iccid == OTASession.card_iccid)
+            .where(OTASession.created_at >= start, OTASession.created_at < end)
+            .group_by(hour, OTASession.status, card_type, cipher_suite)
+        )
+        sessions = [
+            {
+                "period": PERIOD_HOUR,
+                "bucket_start": bucket,
+                "status": status.value,
+                "card_type": card,
+                "cipher_suite": cipher,
+                "session_count": count,
+                "duration_count": duration_count,
+                "duration_sum_ms": duration_sum,
+            }
+            for bucket, status, card, cipher, count, duration_count, duration_sum
+            in self._session.execute(stmt)
+        ]
+
+        # Never rebuild log rollups from rows retention has purged
+        purged_before = self._get_purged_before()
+        if purged_before is not None:
+            start = max(start, _truncate_hour(purged_before))
+        if start >= end:
+            return self._insert(sessions, [], [])
+        self._delete(PERIOD_HOUR, start, end, (CommLogRollup, LatencyRollup))
+
+        hour = self._bucket(CommLog.timestamp, PERIOD_HOUR)
+        status_word = func.coalesce(CommLog.status_word, "")
+        in_range = and_(CommLog.timestamp >= start, CommLog.timestamp < end)
+        stmt = (
+            select(
+                hour,
+                CommLog.direction,
+                status_word,
+                func.count(),
+                func.count(CommLog.latency_ms),
+                func.coalesce(func.sum(CommLog.latency_ms), 0),
+            )
+            .where(in_range)
+            .group_by(hour, CommLog.direction, status_word)
+        )
+        logs = [
+            {
+                "period": PERIOD_HOUR,
+                "bucket_start": bucket,
+                "direction": direction,
+                "status_word": sw,
+                "log_count": count,
+                "latency_count": latency_count,
+                "latency_sum_ms": latency_sum,
+            }
+            for bucket, direction, sw, count, latency_count, latency_sum
+            in self._session.execute(stmt)
+        ]
+
+        bucket_index = case(
+            *(
+                (CommLog.latency_ms <= bound, index)
+                for index, bound in enumerate(LATENCY_BUCKETS_MS)
+            ),
+            else_=len(LATENCY_BUCKETS_MS),
+        )
+        stmt = (
+            select(hour, bucket_index, func.count())
+            .where(
+                in_range,
+                CommLog.direction == CommDirection.RESPONSE.value,
+                CommLog.latency_ms.isnot(None),
+            )
+            .group_by(hour, bucket_index)
+        )
+        latencies = [
+            {"period": PERIOD_HOUR, "bucket_start": bucket, "bucket": index, "log_count": count}
+            for bucket, index, count in self._session.execute(stmt)
+        ]
+
+        return self._insert(sessions, logs, latencies)
+
+    def _rebuild_days(self, start: datetime, end: datetime) -> int:
+        """Recompute daily rollups by summing hourly rollups."""
+        self._delete(PERIOD_DAY, start, end)
+
+        day = self._bucket(SessionRollup.bucket_start, PERIOD_DAY)
+        dims = [SessionRollup.status, SessionRollup.card_type, SessionRollup.cipher_suite]
+        stmt = (
+            select(
+                day,
+                *dims,
+                func.sum(SessionRollup.session_count),
+                func.sum(SessionRollup.duration_count),
+                func.sum(SessionRollup.duration_sum_ms),
+            )
+            .where(_in_period(SessionRollup, PERIOD_HOUR, start, end))
+            .group_by(day, *dims)
+        )
+        sessions = [
+            {
+                "period": PERIOD_DAY,
+                "bucket_start": bucket,
+                "status": status,
+                "card_type": card,
+                "cipher_suite": cipher,
+                "session_count": count,
+                "duration_count": duration_count,
+                "duration_sum_ms": duration_sum,
+            }
+            for bucket, status, card, cipher, count, duration_count, duration_sum
+            in self._session.execute(stmt)
+        ]
+
+        day = self._bucket(CommLogRollup.bucket_start, PERIOD_DAY)
+        dims = [CommLogRollup.direction, CommLogRollup.status_word]
+        stmt = (
+            select(
+                day,
+                *dims,
+                func.sum(CommLogRollup.log_count),
+                func.sum(CommLogRollup.latency_count),
+                func.sum(CommLogRollup.latency_sum_ms),
+            )
+            .where(_in_period(CommLogRollup, PERIOD_HOUR, start, end))
+            .group_by(day, *dims)
+        )
+        logs = [
+            {
+                "period": PERIOD_DAY,
+                "bucket_start": bucket,
+                "direction": direction,
+                "status_word": sw,
+                "log_count": count,
+                "latency_count": latency_count,
+                "latency_sum_ms": latency_sum,
+            }
+            for bucket, direction, sw, count, latency_count, latency_sum
+            in self._session.execute(stmt)
+        ]
+
+        day = self._bucket(LatencyRollup.bucket_start, PERIOD_DAY)
+        stmt = (
+            select(day, LatencyRollup.bucket, func.sum(LatencyRollup.log_count))
+            .where(_in_period(LatencyRollup, PERIOD_HOUR, start, end))
+            .group_by(day, LatencyRollup.bucket)
+        )
+        latencies = [
+            {"period": PERIOD_DAY, "bucket_start": bucket, "bucket": index, "log_count": count}
+            for bucket, index, count in self._session.execute(stmt)
+        ]
+
+        return self._insert(sessions, logs, latencies)
+
+    def _delete(
+        self,
+        period: str,
+        start: datetime,
+        end: datetime,
+        models: Sequence[Any] = (SessionRollup, CommLogRollup, LatencyRollup),
+    ) -> None:
+        """Delete rollup rows of a period in a range."""
+        for model in models:
+            self._session.execute(
+                delete(model).where(
+                    model.period == period,
+                    model.bucket_start >= start,
+                    model.bucket_start < end,
+                )
+            )
+
+    def _insert(self, *batches: Sequence[Dict[str, Any]]) -> int:
+        """Insert rollup rows (session, log and latency batches)."""
+        models = (SessionRollup, CommLogRollup, LatencyRollup)
+        for model, rows in zip(models, batches):
+            if rows:
+                self._session.execute(insert(model.__table__), list(rows))
+        return sum(len(rows) for rows in batches)
+
+    def _bucket(self, column: Any, period: str) -> Any:
+        """Truncate a datetime column to the start of its hour or day."""
+        dialect = self._session.get_bind().dialect.name
+        if dialect == "postgresql":
+            return func.date_trunc(period, column)
+        fmt = "%Y-%m-%d %H:00:00" if period == PERIOD_HOUR else "%Y-%m-%d 00:00:00"
+        if dialect in ("mysql", "mariadb"):
+            return cast(func.date_format(column, fmt), DateTime)
+        # SQLite: the text format SQLAlchemy stores DateTime values in
+        return type_coerce(func.strftime(fmt + ".000000", column), DateTime)
+
+    def _oldest_raw_timestamp(self) -> Optional[datetime]:
+        """Get the start of the hour of the oldest session or log."""
+        oldest = [
+            self._session.execute(select(func.min(OTASession.created_at))).scalar(),
+            self._session.execute(select(func.min(CommLog.timestamp))).scalar(),
+        ]
+        oldest = [value for value in oldest if value is not None]
+        return _truncate_hour(min(oldest)) if oldest else None
+
+    def _get_watermark(self) -> Optional[datetime]:
+        """Get the hour the last compaction ran in."""
+        from cardlink.database.repositories.setting_repository import SettingRepository
+
+        value = SettingRepository(self._session).get_value(SettingKeys.DB_ROLLUP_WATERMARK)
+        return datetime.fromisoformat(value) if value else None
+
+    def _get_purged_before(self) -> Optional[datetime]:
+        """Get the time before which retention purged ``comm_logs``."""
+        from cardlink.database.repositories.setting_repository import SettingRepository
+
+        value = SettingRepository(self._session).get_value(SettingKeys.RETENTION_PURGED_BEFORE)
+        return datetime.fromisoformat(value) if value else None
+
+    def _set_watermark(self, watermark: datetime) -> None:
+        """Record the hour compaction ran in."""
+        from cardlink.database.repositories.setting_repository import SettingRepository
+
+        SettingRepository(self._session).set_value(
+            SettingKeys.DB_ROLLUP_WATERMARK,
+            watermark.isoformat(),
+            category="database",
+            description="Hour of the last rollup compaction",
+        )
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def session_counts(
+        self,
+        period: str,
+        start: datetime,
+        end: datetime,
+        by: Sequence[str] = ("status",),
+    ) -> List[SessionCount]:
+        """Get session counts per bucket, grouped by dimensions.
+
+        Args:
+            period: "hour" or "day".
+            start: Start of the range (bucket starts >= start).
+            end: End of the range (bucket starts < end).
+            by: Dimensions to group by: any of "status", "card_type"
+                and "cipher_suite".
+
+        Returns:
+            Counts ordered by bucket start.
+
+        Raises:
+            ValidationError: If the period or a dimension is unknown.
+        """
+        _check_period(period)
+        unknown = set(by) - set(SESSION_DIMENSIONS)
+        if unknown:
+            raise ValidationError("by", f"unknown dimensions {sorted(unknown)}")
+
+        dims = [getattr(SessionRollup, name) for name in SESSION_DIMENSIONS if name in by]
+        stmt = (
+            select(
+                SessionRollup.bucket_start,
+                *dims,
+                func.sum(SessionRollup.session_count),
+                func.sum(SessionRollup.duration_count),
+                func.sum(SessionRollup.duration_sum_ms),
+            )
+            .where(_in_period(SessionRollup, period, start, end))
+            .group_by(SessionRollup.bucket_start, *dims)
+            .order_by(SessionRollup.bucket_start, *dims)
+        )
+
+        counts = []
+        for row in self._session.execute(stmt):
+            bucket, *values, sessions, duration_count, duration_sum = row
+            keys = dict(zip((d.key for d in dims), values))
+            counts.append(
+                SessionCount(
+                    bucket_start=bucket,
+                    status=keys.get("status"),
+                    card_type=keys.get("card_type"),
+                    cipher_suite=keys.get("cipher_suite"),
+                    sessions=sessions,
+                    avg_duration_ms=duration_sum / duration_count if duration_count else None,
+                )
+            )
+        return counts
+
+    def status_word_counts(
+        self,
+        period: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[StatusWordCount]:
+        """Get response counts per bucket and status word.
+
+        Args:
+            period: "hour" or "day".
+            start: Start of the range (bucket starts >= start).
+            end: End of the range (bucket starts < end).
+
+        Returns:
+            Counts ordered by bucket start and status word.
+        """
+        _check_period(period)
+        stmt = (
+            select(CommLogRollup)
+            .where(
+                _in_period(CommLogRollup, period, start, end),
+                CommLogRollup.direction == CommDirection.RESPONSE.value,
+            )
+            .order_by(CommLogRollup.bucket_start, CommLogRollup.status_word)
+        )
+        return [
+            StatusWordCount(
+                bucket_start=row.bucket_start,
+                status_word=row.status_word,
+                responses=row.log_count,
+                avg_latency_ms=(
+                    row.latency_sum_ms / row.latency_count if row.latency_count else None
+                ),
+            )
+            for row in self._session.execute(stmt).scalars()
+        ]
+
+    def latency_histogram(
+        self,
+        period: str,
+        start: datetime,
+        end: datetime,
+    ) -> LatencyHistogram:
+        """Get the response latency histogram over a range.
+
+        Args:
+            period: Rollup period to read ("hour" or "day").
+            start: Start of the range (bucket starts >= start).
+            end: End of the range (bucket starts < end).
+
+        Returns:
+            LatencyHistogram summed over the range.
+        """
+        _check_period(period)
+        stmt = (
+            select(LatencyRollup.bucket, func.sum(LatencyRollup.log_count))
+            .where(_in_period(LatencyRollup, period, start, end))
+            .group_by(LatencyRollup.bucket)
+        )
+        counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for index, count in self._session.execute(stmt):
+            counts[index] = count
+        return LatencyHistogram(bounds_ms=LATENCY_BUCKETS_MS, counts=counts)
+
+
+def _check_period(period: str) -> None:
+    """Validate a rollup period."""
+    if period not in PERIODS:
+        raise ValidationError("period", f"must be one of {PERIODS}")
+
+
+def _in_period(model: Any, period: str, start: datetime, end: datetime) -> Any:
+    """Filter rollup rows of a period in a range."""
+    return and_(model.period == period, model.bucket_start >= start, model.bucket_start < end)
+
+
+def _truncate_hour(value: datetime) -> datetime:
+    """Round a datetime down to the hour."""
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def _truncate_day(value: datetime) -> datetime:
+    """Round a datetime down to the day."""
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
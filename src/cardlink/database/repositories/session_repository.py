@@ -13,11 +13,12 @@ Example:
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from cardlink.database.models import OTASession, SessionStatus
 from cardlink.database.repositories.base import BaseRepository
+from cardlink.database.statistics import StatisticsService
 
 
 class SessionRepository(BaseRepository[OTASession]):
@@ -280,39 +281,6 @@ class SessionRepository(BaseRepository[OTASession]):
             hours: If specified, only count sessions from last N hours.
 
         Returns:
-            Dictionary with session statistics.
+            Dictionary with session statistics (see :class:`SessionStats`).
         """
-        # Base query
-        base_query = select(func.count()).select_from(OTASession)
-
-        if hours:
-            cutoff = datetime.utcnow() - timedelta(hours=hours)
-            base_query = base_query.where(OTASession.created_at >= cutoff)
-
-        # Count by status
-        stats = {
-            "total": self._session.execute(base_query).scalar() or 0,
-        }
-
-        for status in SessionStatus:
-            count_query = base_query.where(OTASession.status == status)
-            if hours:
-                cutoff = datetime.utcnow() - timedelta(hours=hours)
-                count_query = count_query.where(OTASession.created_at >= cutoff)
-            stats[status.value] = self._session.execute(
-                select(func.count())
-                .select_from(OTASession)
-                .where(OTASession.status == status)
-            ).scalar() or 0
-
-        # Average duration for completed sessions
-        avg_query = (
-            select(func.avg(OTASession.duration_ms))
-            .where(OTASession.status == SessionStatus.COMPLETED)
-        )
-        if hours:
-            avg_query = avg_query.where(OTASession.created_at >= cutoff)
-        avg_duration = self._session.execute(avg_query).scalar()
-        stats["avg_duration_ms"] = round(avg_duration) if avg_duration else 0
-
-        return stats
+        return StatisticsService(self._session).session_stats(hours).to_dict()
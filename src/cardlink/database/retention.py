@@ -0,0 +1,580 @@
+"""Communication log retention for GP OTA Tester.
+
+This module expires old ``comm_logs`` rows one time partition at a time.
+Each expired partition is optionally archived to gzip-compressed NDJSON
+(one JSON object per row) and then dropped:
+
+- PostgreSQL with native partitioning (migration 004): the partition
+  table is detached and dropped, which takes no row locks and frees the
+  space immediately. Partitions for upcoming months are created ahead
+  of time.
+- SQLite, MySQL and unpartitioned PostgreSQL: partitions are time
+  windows of the table, deleted in small batches, one transaction per
+  batch, so no single statement holds a long lock. On SQLite the file
+  can be compacted afterwards with ``vacuum=True``.
+
+The policy is stored in the settings table (``retention.*`` keys).
+
+Example:
+    >>> from cardlink.database.retention import RetentionManager, RetentionPolicy
+    >>> with UnitOfWork(manager) as uow:
+    ...     RetentionPolicy(comm_logs_days=90).save(uow.settings)
+    ...     uow.commit()
+    >>> result = RetentionManager(manager).apply()
+    >>> print(result.rows, result.archives)
+"""
+
+import gzip
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from sqlalchemy import delete, func, select, text
+
+from cardlink.database.exceptions import ValidationError
+from cardlink.database.manager import DatabaseManager
+from cardlink.database.models import CommLog, SettingKeys
+from cardlink.database.unit_of_work import UnitOfWork
+
+if TYPE_CHECKING:
+    from cardlink.database.repositories.setting_repository import SettingRepository
+
+logger = logging.getLogger(__name__)
+
+PARTITION_PERIODS = ("day", "month")
+
+_BOUND_PATTERN = re.compile(r"FROM \('([^']+)'\) TO \('([^']+)'\)")
+
+_COLUMNS = ", ".join(column.name for column in CommLog.__table__.columns)
+
+
+@dataclass
+class RetentionPolicy:
+    """Retention policy for communication logs.
+
+    Attributes:
+        comm_logs_days: Days to keep logs (0 keeps them forever).
+        partition: Partition size for non-native partitioning ("day" or
+            "month"); native PostgreSQL partitions are monthly.
+        archive: Archive partitions before dropping them.
+        archive_dir: Directory for NDJSON archives.
+    """
+
+    comm_logs_days: int = 0
+    partition: str = "month"
+    archive: bool = True
+    archive_dir: str = "data/archive"
+
+    def __post_init__(self) -> None:
+        if self.comm_logs_days < 0:
+            raise ValidationError("comm_logs_days", "must be >= 0")
+        if self.partition not in PARTITION_PERIODS:
+            raise ValidationError("partition", f"must be one of {PARTITION_PERIODS}")
+
+    @classmethod
+    def from_settings(cls, settings: "SettingRepository") -> "RetentionPolicy":
+        """Load the policy from settings, using defaults for missing keys.
+
+        Args:
+            settings: Setting repository.
+
+        Returns:
+            RetentionPolicy instance.
+        """
+        defaults = cls()
+        return cls(
+            comm_logs_days=settings.get_int(
+                SettingKeys.RETENTION_COMM_LOGS_DAYS, defaults.comm_logs_days
+            ),
+            partition=settings.get_string(SettingKeys.RETENTION_PARTITION, defaults.partition),
+            archive=settings.get_bool(SettingKeys.RETENTION_ARCHIVE, defaults.archive),
+            archive_dir=settings.get_string(
+                SettingKeys.RETENTION_ARCHIVE_DIR, defaults.archive_dir
+            ),
+        )
+
+    def save(self, settings: "SettingRepository") -> None:
+        """Store the policy in settings.
+
+        Args:
+            settings: Setting repository.
+        """
+        settings.set_many(
+            {
+                SettingKeys.RETENTION_COMM_LOGS_DAYS: self.comm_logs_days,
+                SettingKeys.RETENTION_PARTITION: self.partition,
+                SettingKeys.RETENTION_ARCHIVE: self.archive,
+                SettingKeys.RETENTION_ARCHIVE_DIR: self.archive_dir,
+            },
+            category="retention",
+        )
+
+    def cutoff(self, now: datetime) -> Optional[datetime]:
+        """Get the time before which logs expire (None if kept forever)."""
+        if not self.comm_logs_days:
+            return None
+        return now - timedelta(days=self.comm_logs_days)
+
+
+@dataclass
+class Partition:
+    """A time partition of ``comm_logs``.
+
+    Attributes:
+        name: Partition name (``comm_logs_pYYYYMM`` or ``comm_logs_pYYYYMMDD``).
+        start: Start of the partition range.
+        end: End of the partition range (exclusive).
+        rows: Number of rows (planner estimate for native partitions).
+        native: True for a native PostgreSQL partition table.
+        pending: True if the partition does not exist yet and its rows
+            are in the default partition (moved by ensure_partitions).
+    """
+
+    name: str
+    start: datetime
+    end: datetime
+    rows: int
+    native: bool = False
+    pending: bool = False
+
+
+@dataclass
+class RetentionResult:
+    """Result of applying the retention policy.
+
+    Attributes:
+        dropped: Partitions dropped (or that would be, on a dry run).
+        archives: Archive files written.
+        rows: Rows archived or deleted.
+        created: Native partitions created ahead of time.
+    """
+
+    dropped: List[Partition] = field(default_factory=list)
+    archives: List[Path] = field(default_factory=list)
+    rows: int = 0
+    created: List[str] = field(default_factory=list)
+
+
+class RetentionManager:
+    """Archives and drops expired ``comm_logs`` partitions.
+
+    Example:
+        >>> retention = RetentionManager(manager)
+        >>> for partition in retention.list_partitions():
+        ...     print(partition.name, partition.rows)
+        >>> retention.apply(dry_run=True).dropped
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        policy: Optional[RetentionPolicy] = None,
+        batch_size: int = 5000,
+    ) -> None:
+        """Initialize retention manager.
+
+        Args:
+            db_manager: Database manager.
+            policy: Retention policy (loaded from settings if None).
+            batch_size: Rows per delete batch and archive fetch.
+        """
+        self._db_manager = db_manager
+        self._batch_size = batch_size
+        if policy is None:
+            with UnitOfWork(db_manager) as uow:
+                policy = RetentionPolicy.from_settings(uow.settings)
+        self.policy = policy
+
+    @property
+    def _dialect(self) -> str:
+        return self._db_manager.engine.dialect.name
+
+    def is_partitioned(self) -> bool:
+        """Check if ``comm_logs`` is natively partitioned (PostgreSQL)."""
+        if self._dialect != "postgresql":
+            return False
+        with UnitOfWork(self._db_manager) as uow:
+            kind = uow.session.execute(
+                text("SELECT relkind FROM pg_class WHERE oid = to_regclass('comm_logs')")
+            ).scalar()
+        return kind == "p"
+
+    def list_partitions(self) -> List[Partition]:
+        """List partitions, oldest first.
+
+        Returns:
+            Native partitions (plus pending months whose rows are in the
+            default partition), or the time windows of the configured
+            partition size that contain rows.
+        """
+        if self.is_partitioned():
+            return self._native_partitions()
+        return self._logical_partitions()
+
+    def ensure_partitions(self, now: Optional[datetime] = None, ahead: int = 2) -> List[str]:
+        """Create native partitions for the current and next months.
+
+        Rows that landed in the default partition because their month
+        had no partition yet are moved into newly created partitions:
+        PostgreSQL refuses to create a partition whose range the default
+        partition already holds rows for, so the default partition is
+        detached while the partitions are created and filled. Everything
+        happens in one transaction.
+
+        Does nothing unless ``comm_logs`` is natively partitioned.
+
+        Args:
+            now: Current time (UTC, defaults to now).
+            ahead: Months after the current one to create.
+
+        Returns:
+            Names of the partitions created.
+        """
+        if not self.is_partitioned():
+            return []
+
+        created = []
+        with UnitOfWork(self._db_manager) as uow:
+            partitions, default = self._partition_tables(uow)
+            existing = {p.name for p in partitions}
+            pending = self._pending_partitions(uow, default) if default else []
+
+            starts = {p.start for p in pending}
+            start = _period_start(now or datetime.utcnow(), "month")
+            for _ in range(ahead + 1):
+                starts.add(start)
+                start = _next_period(start, "month")
+            missing = sorted(m for m in starts if _partition_name(m, "month") not in existing)
+            if not missing:
+                return []
+
+            if pending:
+                uow.session.execute(text(f"ALTER TABLE comm_logs DETACH PARTITION {default}"))
+            for start in missing:
+                end = _next_period(start, "month")
+                name = _partition_name(start, "month")
+                uow.session.execute(
+                    text(
+                        f"CREATE TABLE {name} PARTITION OF comm_logs "
+                        f"FOR VALUES FROM ('{start.isoformat(' ')}') "
+                        f"TO ('{end.isoformat(' ')}')"
+                    )
+                )
+                if pending:
+                    in_range = "timestamp >= :start AND timestamp < :end"
+                    params = {"start": start, "end": end}
+                    uow.session.execute(
+                        text(
+                            f"INSERT INTO comm_logs ({_COLUMNS}) "
+                            f"SELECT {_COLUMNS} FROM {default} WHERE {in_range}"
+                        ),
+                        params,
+                    )
+                    uow.session.execute(
+                        text(f"DELETE FROM {default} WHERE {in_range}"), params
+                    )
+                created.append(name)
+            if pending:
+                uow.session.execute(
+                    text(f"ALTER TABLE comm_logs ATTACH PARTITION {default} DEFAULT")
+                )
+            uow.commit()
+        for name in created:
+            logger.info("Created partition %s", name)
+        return created
+
+    def expired_partitions(self, now: Optional[datetime] = None) -> List[Partition]:
+        """Get partitions that end before the retention cutoff.
+
+        Args:
+            now: Current time (UTC, defaults to now).
+
+        Returns:
+            Expired partitions, oldest first.
+        """
+        cutoff = self.policy.cutoff(now or datetime.utcnow())
+        if cutoff is None:
+            return []
+        return [p for p in self.list_partitions() if p.end <= cutoff]
+
+    def apply(
+        self,
+        now: Optional[datetime] = None,
+        dry_run: bool = False,
+        vacuum: bool = False,
+    ) -> RetentionResult:
+        """Apply the retention policy.
+
+        Native partitions are created first (moving rows out of the
+        default partition, so they expire with their month). Rollups are
+        then brought up to date so historic reports keep the expired
+        data, and every expired partition is archived (if enabled) and
+        dropped.
+
+        Args:
+            now: Current time (UTC, defaults to now).
+            dry_run: Only report what would be dropped.
+            vacuum: Reclaim free space afterwards (SQLite only).
+
+        Returns:
+            RetentionResult describing the changes.
+        """
+        now = now or datetime.utcnow()
+        if dry_run:
+            result = RetentionResult(dropped=self.expired_partitions(now))
+            result.rows = sum(p.rows for p in result.dropped)
+            return result
+
+        created = self.ensure_partitions(now)
+        result = RetentionResult(dropped=self.expired_partitions(now), created=created)
+        if result.dropped:
+            with UnitOfWork(self._db_manager) as uow:
+                uow.rollups.compact(now=now)
+                uow.commit()
+
+        for partition in result.dropped:
+            archived = max_id = None
+            if self.policy.archive:
+                path, archived, max_id = self.archive_partition(partition)
+                result.archives.append(path)
+            rows = self.drop_partition(partition, max_id=max_id)
+            # The archive count is exact; native drops only know the estimate
+            if archived is not None:
+                rows = archived
+            result.rows += rows
+            logger.info("Dropped partition %s (%d rows)", partition.name, rows)
+
+        if vacuum and result.dropped and self._dialect == "sqlite":
+            with self._db_manager.engine.connect() as connection:
+                connection.execution_options(isolation_level="AUTOCOMMIT").exec_driver_sql(
+                    "VACUUM"
+                )
+        return result
+
+    def archive_partition(self, partition: Partition) -> "tuple[Path, int, Optional[int]]":
+        """Write a partition's rows to gzip-compressed NDJSON.
+
+        The file is written under a temporary name and published when
+        complete, so a partial archive is never mistaken for a full one.
+        Existing archives are never overwritten: if the window was
+        archived before (rows that arrived after an earlier drop), the
+        new file is ``<name>.1.ndjson.gz``, ``<name>.2.ndjson.gz`` and so on.
+
+        Args:
+            partition: Partition to archive.
+
+        Returns:
+            Archive path, number of rows and the largest archived id.
+        """
+        directory = Path(self.policy.archive_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        partial = directory / f"{partition.name}.ndjson.gz.partial"
+
+        table = CommLog.__table__
+        stmt = (
+            select(table)
+            .where(table.c.timestamp >= partition.start, table.c.timestamp < partition.end)
+            .order_by(table.c.id)
+        )
+        rows = 0
+        max_id = None
+        with UnitOfWork(self._db_manager) as uow:
+            result = uow.session.execute(stmt, execution_options={"yield_per": self._batch_size})
+            with gzip.open(partial, "wt", encoding="utf-8") as f:
+                for row in result.mappings():
+                    f.write(json.dumps(dict(row), default=_json_default, separators=(",", ":")))
+                    f.write("\n")
+                    rows += 1
+                    max_id = row["id"]
+        path = _publish_archive(partial, directory, partition.name)
+        logger.info("Archived %d rows of %s to %s", rows, partition.name, path)
+        return path, rows, max_id
+
+    def drop_partition(self, partition: Partition, max_id: Optional[int] = None) -> int:
+        """Drop a partition's rows.
+
+        Args:
+            partition: Partition to drop.
+            max_id: Only delete rows up to this id (logical partitions),
+                so rows added after archiving are kept.
+
+        Returns:
+            Number of rows dropped (estimate for native partitions).
+
+        Raises:
+            ValidationError: If the partition is still pending.
+        """
+        if partition.pending:
+            raise ValidationError(
+                "partition", f"{partition.name} is in the default partition; ensure it first"
+            )
+        if partition.native:
+            with UnitOfWork(self._db_manager) as uow:
+                uow.session.execute(
+                    text(f"ALTER TABLE comm_logs DETACH PARTITION {partition.name}")
+                )
+                uow.session.execute(text(f"DROP TABLE {partition.name}"))
+                _record_purged(uow, partition.end)
+                uow.commit()
+            return partition.rows
+
+        table = CommLog.__table__
+        conditions = [table.c.timestamp >= partition.start, table.c.timestamp < partition.end]
+        if max_id is not None:
+            conditions.append(table.c.id <= max_id)
+
+        deleted = 0
+        while True:
+            with UnitOfWork(self._db_manager) as uow:
+                ids = list(
+                    uow.session.execute(
+                        select(table.c.id).where(*conditions).limit(self._batch_size)
+                    ).scalars()
+                )
+                if not ids:
+                    break
+                uow.session.execute(delete(table).where(table.c.id.in_(ids)))
+                uow.commit()
+            deleted += len(ids)
+
+        with UnitOfWork(self._db_manager) as uow:
+            _record_purged(uow, partition.end)
+            uow.commit()
+        return deleted
+
+    def _native_partitions(self) -> List[Partition]:
+        """List native partitions and the months waiting in the default partition."""
+        with UnitOfWork(self._db_manager) as uow:
+            partitions, default = self._partition_tables(uow)
+            if default is not None:
+                partitions.extend(self._pending_partitions(uow, default))
+        return sorted(partitions, key=lambda p: p.start)
+
+    def _partition_tables(self, uow: UnitOfWork) -> "tuple[List[Partition], Optional[str]]":
+        """Get the range partitions and the name of the default partition."""
+        stmt = text(
+            "SELECT c.relname, pg_get_expr(c.relpartbound, c.oid), c.reltuples "
+            "FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'comm_logs'::regclass"
+        )
+        partitions = []
+        default = None
+        for name, bound, estimate in uow.session.execute(stmt):
+            match = _BOUND_PATTERN.search(bound or "")
+            if match is None:
+                default = name
+                continue
+            partitions.append(
+                Partition(
+                    name=name,
+                    start=datetime.fromisoformat(match.group(1)),
+                    end=datetime.fromisoformat(match.group(2)),
+                    rows=max(int(estimate), 0),
+                    native=True,
+                )
+            )
+        return partitions, default
+
+    def _pending_partitions(self, uow: UnitOfWork, default: str) -> List[Partition]:
+        """Get the monthly partitions needed for rows in the default partition."""
+        stmt = text(
+            f"SELECT date_trunc('month', timestamp), count(*) FROM {default} GROUP BY 1"
+        )
+        return [
+            Partition(
+                name=_partition_name(start, "month"),
+                start=start,
+                end=_next_period(start, "month"),
+                rows=rows,
+                native=True,
+                pending=True,
+            )
+            for start, rows in uow.session.execute(stmt)
+        ]
+
+    def _logical_partitions(self) -> List[Partition]:
+        """List time windows of the configured size that contain rows."""
+        period = self.policy.partition
+        timestamp = CommLog.__table__.c.timestamp
+        partitions = []
+        with UnitOfWork(self._db_manager) as uow:
+            oldest, newest = uow.session.execute(
+                select(func.min(timestamp), func.max(timestamp))
+            ).one()
+            if oldest is None:
+                return []
+
+            start = _period_start(oldest, period)
+            while start <= newest:
+                end = _next_period(start, period)
+                rows = uow.session.execute(
+                    select(func.count()).where(timestamp >= start, timestamp < end)
+                ).scalar()
+                if rows:
+                    partitions.append(Partition(_partition_name(start, period), start, end, rows))
+                start = end
+        return partitions
+
+
+def _period_start(value: datetime, period: str) -> datetime:
+    """Round a datetime down to the start of its day or month."""
+    value = value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(day=1) if period == "month" else value
+
+
+def _next_period(start: datetime, period: str) -> datetime:
+    """Get the start of the following day or month."""
+    if period == "day":
+        return start + timedelta(days=1)
+    if start.month == 12:
+        return start.replace(year=start.year + 1, month=1)
+    return start.replace(month=start.month + 1)
+
+
+def _partition_name(start: datetime, period: str) -> str:
+    """Get the partition name for a period start."""
+    return f"comm_logs_p{start:%Y%m}" if period == "month" else f"comm_logs_p{start:%Y%m%d}"
+
+
+def _publish_archive(partial: Path, directory: Path, name: str) -> Path:
+    """Move a finished archive to the first free archive name for ``name``."""
+    suffix = 0
+    while True:
+        path = directory / (f"{name}.{suffix}.ndjson.gz" if suffix else f"{name}.ndjson.gz")
+        try:
+            # Unlike a rename, a hard link fails instead of replacing a file
+            os.link(partial, path)
+        except FileExistsError:
+            suffix += 1
+            continue
+        os.unlink(partial)
+        return path
+
+
+def _record_purged(uow: UnitOfWork, end: datetime) -> None:
+    """Record that comm_logs before ``end`` were purged.
+
+    Rollup rebuilds do not recompute log rollups before this time, so
+    they survive the raw rows.
+    """
+    value = uow.settings.get_value(SettingKeys.RETENTION_PURGED_BEFORE)
+    if value and datetime.fromisoformat(value) >= end:
+        return
+    uow.settings.set_value(
+        SettingKeys.RETENTION_PURGED_BEFORE,
+        end.isoformat(),
+        category="retention",
+        description="comm_logs before this time were purged",
+    )
+
+
+def _json_default(value: Any) -> Any:
+    """Encode datetimes in archives as ISO 8601."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError(f"Cannot archive {type(value).__name__}")
@@ -0,0 +1,211 @@
+"""Aggregate statistics for GP OTA Tester.
+
+This module computes session and communication log statistics with
+single GROUP BY / conditional aggregate queries, so the database does
+the counting and only one row per group reaches Python.
+
+Example:
+    >>> from cardlink.database import UnitOfWork
+    >>> with UnitOfWork(manager) as uow:
+    ...     stats = uow.stats.session_stats(hours=24)
+    ...     print(stats.total, stats.by_status[SessionStatus.FAILED])
+    ...     summary = uow.stats.log_summary(session_id)
+    ...     print(summary.avg_latency_ms)
+"""
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional
+
+from sqlalchemy import and_, case, func, or_, select
+from sqlalchemy.orm import Session
+
+from cardlink.database.models import CommDirection, CommLog, OTASession, SessionStatus
+
+
+@dataclass
+class LogSummary:
+    """Communication log summary for one session.
+
+    Attributes:
+        total_logs: Number of log entries.
+        command_count: Number of commands.
+        response_count: Number of responses.
+        success_count: Responses with SW 9000 or 61XX.
+        error_count: Other responses.
+        avg_latency_ms: Average non-zero response latency.
+        min_latency_ms: Minimum non-zero response latency.
+        max_latency_ms: Maximum response latency.
+    """
+
+    total_logs: int = 0
+    command_count: int = 0
+    response_count: int = 0
+    success_count: int = 0
+    error_count: int = 0
+    avg_latency_ms: float = 0
+    min_latency_ms: float = 0
+    max_latency_ms: float = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class LogStats:
+    """Overall communication log counts.
+
+    Attributes:
+        total: Number of log entries.
+        commands: Number of commands.
+        responses: Number of responses.
+    """
+
+    total: int = 0
+    commands: int = 0
+    responses: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class SessionStats:
+    """OTA session counts by status.
+
+    Attributes:
+        total: Number of sessions.
+        by_status: Session count for every status (zero if none).
+        avg_duration_ms: Average duration of completed sessions.
+    """
+
+    total: int = 0
+    by_status: Dict[SessionStatus, int] = field(
+        default_factory=lambda: {status: 0 for status in SessionStatus}
+    )
+    avg_duration_ms: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary keyed by status value.
+
+        Returns:
+            ``{"total": ..., "pending": ..., ..., "avg_duration_ms": ...}``
+        """
+        data: Dict[str, Any] = {"total": self.total}
+        data.update({status.value: count for status, count in self.by_status.items()})
+        data["avg_duration_ms"] = self.avg_duration_ms
+        return data
+
+
+class StatisticsService:
+    """Aggregate queries over sessions and communication logs.
+
+    Example:
+        >>> service = StatisticsService(session)
+        >>> service.log_stats(hours=1).responses
+        42
+    """
+
+    def __init__(self, session: Session) -> None:
+        """Initialize statistics service.
+
+        Args:
+            session: SQLAlchemy session.
+        """
+        self._session = session
+
+    def log_summary(self, session_id: str) -> LogSummary:
+        """Get log counts and latency statistics for a session.
+
+        Args:
+            session_id: Session UUID.
+
+        Returns:
+            LogSummary for the session.
+        """
+        is_command = CommLog.direction == CommDirection.COMMAND.value
+        is_response = CommLog.direction == CommDirection.RESPONSE.value
+        is_success = and_(
+            is_response,
+            or_(CommLog.status_word == "9000", CommLog.status_word.like("61%")),
+        )
+        # Matches the previous in-Python rule: responses with a truthy latency
+        latency = case((and_(is_response, CommLog.latency_ms != 0), CommLog.latency_ms))
+
+        stmt = select(
+            func.count(),
+            func.sum(case((is_command, 1), else_=0)),
+            func.sum(case((is_response, 1), else_=0)),
+            func.sum(case((is_success, 1), else_=0)),
+            func.avg(latency),
+            func.min(latency),
+            func.max(latency),
+        ).where(CommLog.session_id == session_id)
+        total, commands, responses, successes, avg, low, high = (
+            self._session.execute(stmt).one()
+        )
+
+        responses = responses or 0
+        successes = successes or 0
+        return LogSummary(
+            total_logs=total,
+            command_count=commands or 0,
+            response_count=responses,
+            success_count=successes,
+            error_count=responses - successes,
+            avg_latency_ms=round(avg, 2) if avg else 0,
+            min_latency_ms=low or 0,
+            max_latency_ms=high or 0,
+        )
+
+    def log_stats(self, hours: Optional[int] = None) -> LogStats:
+        """Get log counts by direction.
+
+        Args:
+            hours: If specified, only count logs from last N hours.
+
+        Returns:
+            LogStats with total and per-direction counts.
+        """
+        stmt = select(CommLog.direction, func.count()).group_by(CommLog.direction)
+        if hours:
+            stmt = stmt.where(CommLog.timestamp >= _cutoff(hours))
+        counts = dict(self._session.execute(stmt).all())
+
+        return LogStats(
+            total=sum(counts.values()),
+            commands=counts.get(CommDirection.COMMAND.value, 0),
+            responses=counts.get(CommDirection.RESPONSE.value, 0),
+        )
+
+    def session_stats(self, hours: Optional[int] = None) -> SessionStats:
+        """Get session counts by status and average completed duration.
+
+        Args:
+            hours: If specified, only count sessions from last N hours.
+
+        Returns:
+            SessionStats for the period.
+        """
+        stmt = select(
+            OTASession.status,
+            func.count(),
+            func.avg(OTASession.duration_ms),
+        ).group_by(OTASession.status)
+        if hours:
+            stmt = stmt.where(OTASession.created_at >= _cutoff(hours))
+
+        stats = SessionStats()
+        for status, count, avg_duration in self._session.execute(stmt):
+            stats.by_status[status] = count
+            stats.total += count
+            if status == SessionStatus.COMPLETED and avg_duration:
+                stats.avg_duration_ms = round(avg_duration)
+        return stats
+
+
+def _cutoff(hours: int) -> datetime:
+    """Get the start of the last ``hours`` hours."""
+    return datetime.utcnow() - timedelta(hours=hours)
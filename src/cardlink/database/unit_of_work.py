@@ -25,11 +25,13 @@ if TYPE_CHECKING:
     from cardlink.database.repositories.card_repository import CardRepository
     from cardlink.database.repositories.device_repository import DeviceRepository
     from cardlink.database.repositories.log_repository import LogRepository
+    from cardlink.database.repositories.rollup_repository import RollupRepository
     from cardlink.database.repositories.script_repository import ScriptRepository
     from cardlink.database.repositories.session_repository import SessionRepository
     from cardlink.database.repositories.setting_repository import SettingRepository
     from cardlink.database.repositories.template_repository import TemplateRepository
     from cardlink.database.repositories.test_repository import TestRepository
+    from cardlink.database.statistics import StatisticsService
 
 
 logger = logging.getLogger(__name__)
@@ -284,3 +286,25 @@ class UnitOfWork:
         from cardlink.database.repositories.template_repository import TemplateRepository
 
         return self._get_repository(TemplateRepository)
+
+    @property
+    def rollups(self) -> "RollupRepository":
+        """Get hourly/daily rollup repository.
+
+        Returns:
+            RollupRepository instance.
+        """
+        from cardlink.database.repositories.rollup_repository import RollupRepository
+
+        return self._get_repository(RollupRepository)
+
+    @property
+    def stats(self) -> "StatisticsService":
+        """Get aggregate statistics service.
+
+        Returns:
+            StatisticsService instance.
+        """
+        from cardlink.database.statistics import StatisticsService
+
+        return self._get_repository(StatisticsService)
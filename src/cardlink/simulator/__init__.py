@@ -26,7 +26,7 @@ Example:
 from .behavior import BehaviorController
 from .client import MobileSimulator, SimulatorError
 from .config import BehaviorConfig, SimulatorConfig, UICCProfile
-from .http_client import HTTPAdminClient, HTTPAdminError, HTTPStatusError
+from .http_client import HTTPAdminClient, HTTPAdminError, HTTPResponseParser, HTTPStatusError
 from .models import (
     APDUExchange,
     BehaviorMode,
@@ -37,6 +37,22 @@ from .models import (
     TLSConnectionInfo,
     VirtualApplet,
 )
+from .network import (
+    NetworkConditions,
+    NetworkProfile,
+    get_network_profile,
+    list_network_profiles,
+    register_network_profile,
+)
+from .population import (
+    BinaryCardPopulation,
+    CardPopulation,
+    CardRecord,
+    CSVCardPopulation,
+    PopulationError,
+    open_population,
+    write_population,
+)
 from .psk_tls_client import (
     ConnectionError,
     HandshakeError,
@@ -44,7 +60,22 @@ from .psk_tls_client import (
     PSKTLSClientError,
     TimeoutError,
 )
-from .virtual_uicc import LoadFileEntry, ParsedAPDU, PSKKeyEntry, SW, VirtualUICC
+from .sinks import (
+    NDJSONResultSink,
+    ResultSink,
+    ResultSinkError,
+    SQLiteResultSink,
+    UnixSocketResultSink,
+    create_sink,
+)
+from .virtual_uicc import (
+    LoadFileEntry,
+    LoadFilePayload,
+    ParsedAPDU,
+    PSKKeyEntry,
+    SW,
+    VirtualUICC,
+)
 
 __all__ = [
     # Main classes
@@ -57,7 +88,27 @@ __all__ = [
     # Components
     "PSKTLSClient",
     "HTTPAdminClient",
+    "HTTPResponseParser",
     "BehaviorController",
+    # Network simulation
+    "NetworkProfile",
+    "NetworkConditions",
+    "get_network_profile",
+    "list_network_profiles",
+    "register_network_profile",
+    # Card populations
+    "CardPopulation",
+    "CardRecord",
+    "BinaryCardPopulation",
+    "CSVCardPopulation",
+    "open_population",
+    "write_population",
+    # Result sinks
+    "ResultSink",
+    "NDJSONResultSink",
+    "SQLiteResultSink",
+    "UnixSocketResultSink",
+    "create_sink",
     # Models
     "ConnectionState",
     "BehaviorMode",
@@ -70,6 +121,7 @@ __all__ = [
     "ParsedAPDU",
     "PSKKeyEntry",
     "LoadFileEntry",
+    "LoadFilePayload",
     "SW",
     # Exceptions
     "SimulatorError",
@@ -79,4 +131,6 @@ __all__ = [
     "TimeoutError",
     "HTTPAdminError",
     "HTTPStatusError",
+    "ResultSinkError",
+    "PopulationError",
 ]
@@ -1,7 +1,8 @@
 """Behavior controller for simulation modes.
 
 This module provides the BehaviorController that manages simulation
-behaviors including error injection, timeout simulation, and response delays.
+behaviors including error injection, timeout simulation, response delays,
+and bearer network conditions.
 """
 
 import asyncio
@@ -11,6 +12,7 @@ from typing import Optional
 
 from .config import BehaviorConfig
 from .models import BehaviorMode
+from .network import NetworkConditions, get_network_profile
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,8 @@ logger = logging.getLogger(__name__)
 class BehaviorController:
     """Controls simulator behavior modes.
 
-    Manages error injection, timeout simulation, and response delays
-    based on configuration.
+    Manages error injection, timeout simulation, response delays and
+    network profile delays based on configuration.
 
     Attributes:
         config: Behavior configuration.
@@ -39,6 +41,14 @@ class BehaviorController:
         self.config = config
         self._error_count = 0
         self._timeout_count = 0
+        self._stall_count = 0
+        self._network_delay_ms = 0.0
+
+        self._network: Optional[NetworkConditions] = None
+        if config.network_profile:
+            self._network = NetworkConditions(
+                get_network_profile(config.network_profile), seed=config.network_seed
+            )
 
     @property
     def mode(self) -> BehaviorMode:
@@ -55,6 +65,21 @@ class BehaviorController:
         """Get number of simulated timeouts."""
         return self._timeout_count
 
+    @property
+    def network(self) -> Optional[NetworkConditions]:
+        """Get network conditions sampler, if a profile is configured."""
+        return self._network
+
+    @property
+    def stall_count(self) -> int:
+        """Get number of exchanges delayed by a network stall."""
+        return self._stall_count
+
+    @property
+    def network_delay_ms(self) -> float:
+        """Get total simulated network delay in milliseconds."""
+        return self._network_delay_ms
+
     def should_inject_error(self) -> bool:
         """Determine if error should be injected.
 
@@ -183,8 +208,48 @@ class BehaviorController:
 
         return None
 
+    def get_network_delay(self, command_len: int, response_len: int) -> float:
+        """Sample bearer delay for an exchange.
+
+        Args:
+            command_len: C-APDU length in bytes.
+            response_len: R-APDU length in bytes.
+
+        Returns:
+            Delay in seconds, 0.0 if no network profile is configured.
+        """
+        if self._network is None:
+            return 0.0
+
+        delay = self._network.exchange_delay(command_len, response_len)
+        if self._network.stalled:
+            self._stall_count += 1
+            logger.debug(f"Network stall: {delay:.2f}s ({self._network.profile.name})")
+        self._network_delay_ms += delay * 1000
+        return delay
+
+    async def apply_network_delay(self, command_len: int, response_len: int) -> float:
+        """Apply bearer delay for an exchange.
+
+        Args:
+            command_len: C-APDU length in bytes.
+            response_len: R-APDU length in bytes.
+
+        Returns:
+            Applied delay in seconds.
+
+        Example:
+            >>> await controller.apply_network_delay(len(c_apdu), len(r_apdu))
+        """
+        delay = self.get_network_delay(command_len, response_len)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
     def reset_stats(self) -> None:
-        """Reset error and timeout counts."""
+        """Reset error, timeout and network counts."""
         self._error_count = 0
         self._timeout_count = 0
+        self._stall_count = 0
+        self._network_delay_ms = 0.0
         logger.debug("Behavior stats reset")
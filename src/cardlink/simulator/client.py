@@ -7,6 +7,7 @@ processing for simulating mobile device behavior.
 
 import asyncio
 import logging
+import ssl
 import time
 import uuid
 from datetime import datetime
@@ -30,6 +31,7 @@ from .psk_tls_client import (
     PSKTLSClientError,
     TimeoutError,
 )
+from .sinks import ResultSink
 from .virtual_uicc import ParsedAPDU, VirtualUICC
 
 logger = logging.getLogger(__name__)
@@ -63,13 +65,27 @@ class MobileSimulator:
         >>> await simulator.connect()
         >>> result = await simulator.run_session()
         >>> await simulator.disconnect()
+
+        Streaming results to a sink without keeping them in memory:
+
+        >>> sink = NDJSONResultSink("soak.ndjson")
+        >>> simulator = MobileSimulator(config, result_sink=sink, retain_exchanges=False)
     """
 
-    def __init__(self, config: SimulatorConfig):
+    def __init__(
+        self,
+        config: SimulatorConfig,
+        result_sink: Optional[ResultSink] = None,
+        retain_exchanges: bool = True,
+    ):
         """Initialize simulator with configuration.
 
         Args:
             config: Simulator configuration.
+            result_sink: Optional sink receiving every exchange and session
+                result as it completes. The sink is not closed by the simulator.
+            retain_exchanges: Keep exchanges in SessionResult.exchanges.
+                Disable for long runs that rely on the sink.
         """
         config.validate()
         self.config = config
@@ -84,11 +100,20 @@ class MobileSimulator:
         self._virtual_uicc: VirtualUICC = VirtualUICC(config.uicc_profile)
         self._behavior: BehaviorController = BehaviorController(config.behavior)
 
+        # SSL context shared by every connection of this card
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
         # Statistics
         self._stats = SimulatorStats()
 
+        # Result streaming
+        self._result_sink = result_sink
+        self._retain_exchanges = retain_exchanges
+
         # Current session tracking
         self._exchanges: List[APDUExchange] = []
+        self._exchange_count = 0
+        self._last_sw = ""
         self._connection_info: Optional[TLSConnectionInfo] = None
 
     @property
@@ -106,6 +131,11 @@ class MobileSimulator:
         """Get TLS connection information."""
         return self._connection_info
 
+    @property
+    def result_sink(self) -> Optional[ResultSink]:
+        """Get result sink receiving streamed results."""
+        return self._result_sink
+
     @property
     def statistics(self) -> SimulatorStats:
         """Get simulator statistics."""
@@ -121,6 +151,79 @@ class MobileSimulator:
         self._state = new_state
         logger.debug(f"State transition: {old_state.value} -> {new_state.value}")
 
+    def _record_exchange(self, exchange: APDUExchange) -> None:
+        """Track an exchange and stream it to the result sink.
+
+        Args:
+            exchange: Completed APDU exchange.
+        """
+        self._exchange_count += 1
+        self._last_sw = exchange.sw
+        if self._retain_exchanges:
+            self._exchanges.append(exchange)
+        if self._result_sink is not None:
+            self._result_sink.write_exchange(self._session_id or "", exchange)
+
+    def _session_result(
+        self,
+        success: bool,
+        session_start: float,
+        error: Optional[str] = None,
+    ) -> SessionResult:
+        """Build result for the current session and stream it to the sink.
+
+        Args:
+            success: Whether the session completed successfully.
+            session_start: Monotonic time the session started.
+            error: Error message if the session failed.
+
+        Returns:
+            SessionResult for the current session.
+        """
+        result = SessionResult(
+            success=success,
+            session_id=self._session_id or "",
+            duration_seconds=time.monotonic() - session_start,
+            apdu_count=self._exchange_count,
+            final_sw=self._last_sw if success else "",
+            exchanges=self._exchanges.copy(),
+            error=error,
+            tls_info=self._connection_info,
+        )
+        if self._result_sink is not None:
+            self._result_sink.write_session(result)
+        return result
+
+    def _create_tls_client(self) -> PSKTLSClient:
+        """Create a TLS client reusing this card's SSL context.
+
+        Returns:
+            New PSKTLSClient for the configured server.
+        """
+        return PSKTLSClient(
+            host=self.config.server_host,
+            port=self.config.server_port,
+            psk_identity=self.config.effective_psk_identity,
+            psk_key=self.config.psk_key,
+            timeout=self.config.connect_timeout,
+            enable_null_ciphers=self.config.enable_null_ciphers,
+            ssl_context=self._ssl_context,
+        )
+
+    async def _open_tls_connection(self) -> Optional[TLSConnectionInfo]:
+        """Connect a new TLS client and record the handshake type.
+
+        Returns:
+            TLS connection information.
+        """
+        self._tls_client = self._create_tls_client()
+        info = await self._tls_client.connect()
+        if self._ssl_context is None:
+            self._ssl_context = self._tls_client.ssl_context
+        if info is not None:
+            self._stats.record_handshake(bool(info.session_resumed))
+        return info
+
     async def connect(self) -> bool:
         """Establish PSK-TLS connection to server.
 
@@ -143,19 +246,9 @@ class MobileSimulator:
 
         for attempt in range(self.config.retry_count + 1):
             try:
-                # Create TLS client (use effective_psk_identity for ICCID support)
-                self._tls_client = PSKTLSClient(
-                    host=self.config.server_host,
-                    port=self.config.server_port,
-                    psk_identity=self.config.effective_psk_identity,
-                    psk_key=self.config.psk_key,
-                    timeout=self.config.connect_timeout,
-                    enable_null_ciphers=self.config.enable_null_ciphers,
-                )
-
-                # Connect
+                # Create TLS client (use effective_psk_identity for ICCID support) and connect
                 connection_start = time.monotonic()
-                self._connection_info = await self._tls_client.connect()
+                self._connection_info = await self._open_tls_connection()
                 connection_time_ms = (time.monotonic() - connection_start) * 1000
 
                 # Add ICCID and IMSI from UICC profile to connection info
@@ -240,6 +333,8 @@ class MobileSimulator:
 
         self._set_state(ConnectionState.EXCHANGING)
         self._exchanges = []
+        self._exchange_count = 0
+        self._last_sw = ""
         session_start = time.monotonic()
 
         # Check if persistent mode is enabled
@@ -286,19 +381,17 @@ class MobileSimulator:
                                 if self._tls_client:
                                     await self._tls_client.close()
 
-                                # Reconnect
-                                self._tls_client = PSKTLSClient(
-                                    host=self.config.server_host,
-                                    port=self.config.server_port,
-                                    psk_identity=self.config.effective_psk_identity,
-                                    psk_key=self.config.psk_key,
-                                    timeout=self.config.connect_timeout,
-                                    enable_null_ciphers=self.config.enable_null_ciphers,
-                                )
-                                self._connection_info = await self._tls_client.connect()
+                                # Reconnect (resumes the TLS session if the server allows)
+                                self._connection_info = await self._open_tls_connection()
                                 self._http_client = HTTPAdminClient(self._tls_client)
 
-                                logger.info("Reconnected successfully")
+                                resumed = bool(
+                                    self._connection_info and self._connection_info.session_resumed
+                                )
+                                logger.info(
+                                    f"Reconnected successfully"
+                                    f"{' (session resumed)' if resumed else ''}"
+                                )
 
                                 # Poll on new connection
                                 c_apdu = await self._http_client.poll_request()
@@ -349,7 +442,7 @@ class MobileSimulator:
                     ins=ins,
                     description=description,
                 )
-                self._exchanges.append(exchange)
+                self._record_exchange(exchange)
                 self._stats.total_apdus_received += 1
                 self._stats.record_apdu_time(exchange_time_ms)
 
@@ -360,29 +453,21 @@ class MobileSimulator:
                     f"APDU exchange: {description} -> SW={sw} ({exchange_time_ms:.1f}ms)"
                 )
 
+                # Bearer latency, transfer time and stalls of the network profile
+                await self._behavior.apply_network_delay(len(c_apdu), len(r_apdu))
+
                 # Send R-APDU and get next C-APDU
                 self._stats.total_apdus_sent += 1
                 c_apdu = await self._http_client.send_response(r_apdu)
 
             # Session complete
-            session_duration = time.monotonic() - session_start
+            result = self._session_result(True, session_start)
             self._stats.sessions_completed += 1
-            self._stats.record_session_duration(session_duration * 1000)
-
-            final_sw = self._exchanges[-1].sw if self._exchanges else ""
-            result = SessionResult(
-                success=True,
-                session_id=self._session_id or "",
-                duration_seconds=session_duration,
-                apdu_count=len(self._exchanges),
-                final_sw=final_sw,
-                exchanges=self._exchanges.copy(),
-                tls_info=self._connection_info,
-            )
+            self._stats.record_session_duration(result.duration_seconds * 1000)
 
             logger.info(
-                f"Session complete: {len(self._exchanges)} APDUs, "
-                f"{session_duration:.2f}s, final SW={final_sw}"
+                f"Session complete: {result.apdu_count} APDUs, "
+                f"{result.duration_seconds:.2f}s, final SW={result.final_sw}"
             )
 
             self._set_state(ConnectionState.CONNECTED)
@@ -390,16 +475,8 @@ class MobileSimulator:
 
         except HTTPStatusError as e:
             self._stats.sessions_failed += 1
-            session_duration = time.monotonic() - session_start
-
-            result = SessionResult(
-                success=False,
-                session_id=self._session_id or "",
-                duration_seconds=session_duration,
-                apdu_count=len(self._exchanges),
-                exchanges=self._exchanges.copy(),
-                error=f"HTTP {e.status_code}: {e.reason}",
-                tls_info=self._connection_info,
+            result = self._session_result(
+                False, session_start, error=f"HTTP {e.status_code}: {e.reason}"
             )
 
             logger.error(f"Session failed: HTTP {e.status_code}")
@@ -408,17 +485,7 @@ class MobileSimulator:
 
         except HTTPAdminError as e:
             self._stats.sessions_failed += 1
-            session_duration = time.monotonic() - session_start
-
-            result = SessionResult(
-                success=False,
-                session_id=self._session_id or "",
-                duration_seconds=session_duration,
-                apdu_count=len(self._exchanges),
-                exchanges=self._exchanges.copy(),
-                error=str(e),
-                tls_info=self._connection_info,
-            )
+            result = self._session_result(False, session_start, error=str(e))
 
             logger.error(f"Session failed: {e}")
             self._set_state(ConnectionState.ERROR)
@@ -432,32 +499,15 @@ class MobileSimulator:
             else:
                 self._set_state(ConnectionState.ERROR)
 
-            session_duration = time.monotonic() - session_start
-            result = SessionResult(
-                success=False,
-                session_id=self._session_id or "",
-                duration_seconds=session_duration,
-                apdu_count=len(self._exchanges),
-                exchanges=self._exchanges.copy(),
-                error=str(e),
-                tls_info=self._connection_info,
-            )
+            result = self._session_result(False, session_start, error=str(e))
 
             logger.error(f"Session failed: {e}")
             return result
 
         except Exception as e:
             self._stats.sessions_failed += 1
-            session_duration = time.monotonic() - session_start
-
-            result = SessionResult(
-                success=False,
-                session_id=self._session_id or "",
-                duration_seconds=session_duration,
-                apdu_count=len(self._exchanges),
-                exchanges=self._exchanges.copy(),
-                error=f"Unexpected error: {e}",
-                tls_info=self._connection_info,
+            result = self._session_result(
+                False, session_start, error=f"Unexpected error: {e}"
             )
 
             logger.error(f"Session failed: {e}")
@@ -492,6 +542,8 @@ class MobileSimulator:
         self._virtual_uicc.reset()
         self._behavior.reset_stats()
         self._exchanges = []
+        self._exchange_count = 0
+        self._last_sw = ""
         logger.debug("Simulator state reset")
 
     def get_statistics(self) -> SimulatorStats:
@@ -514,6 +566,8 @@ class MobileSimulator:
             avg_apdu_response_time_ms=self._stats.avg_apdu_response_time_ms,
             error_responses=self._stats.error_responses.copy(),
             timeout_count=self._stats.timeout_count,
+            full_handshakes=self._stats.full_handshakes,
+            resumed_handshakes=self._stats.resumed_handshakes,
         )
 
     async def run_complete_session(self) -> SessionResult:
@@ -530,11 +584,14 @@ class MobileSimulator:
         """
         try:
             if not await self.connect():
-                return SessionResult(
+                result = SessionResult(
                     success=False,
                     session_id=self._session_id or str(uuid.uuid4()),
                     error="Connection failed",
                 )
+                if self._result_sink is not None:
+                    self._result_sink.write_session(result)
+                return result
 
             result = await self.run_session()
             return result
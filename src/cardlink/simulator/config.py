@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from .models import BehaviorMode, ConnectionMode, VirtualApplet
+from .network import get_network_profile
 
 
 # =============================================================================
@@ -27,6 +28,7 @@ class UICCProfile:
         gp_version: GlobalPlatform card specification version.
         scp_version: Secure Channel Protocol version.
         applets: List of pre-installed virtual applets.
+        retain_load_data: Keep full LOAD content instead of only its hash and size.
 
     Example:
         >>> profile = UICCProfile(
@@ -42,6 +44,7 @@ class UICCProfile:
     gp_version: str = "2.2.1"
     scp_version: str = "03"
     applets: List[VirtualApplet] = field(default_factory=list)
+    retain_load_data: bool = False
 
 
 @dataclass
@@ -61,6 +64,9 @@ class BehaviorConfig:
         reconnect_after: Number of commands before reconnecting.
         poll_interval_ms: Poll interval for persistent mode in milliseconds.
         session_timeout_seconds: Max time without commands before ending session (persistent mode).
+        network_profile: Named bearer profile applied to each exchange (e.g. "3g",
+            "nb-iot"), or None to disable network simulation.
+        network_seed: Random seed for reproducible network delays.
 
     Example:
         >>> config = BehaviorConfig(mode=BehaviorMode.ERROR, error_rate=0.1)
@@ -78,6 +84,8 @@ class BehaviorConfig:
     reconnect_after: int = 3
     poll_interval_ms: int = 1000
     session_timeout_seconds: float = 0.0  # 0 = no timeout (wait forever)
+    network_profile: Optional[str] = None
+    network_seed: Optional[int] = None
 
     def validate(self) -> None:
         """Validate configuration values.
@@ -116,6 +124,9 @@ class BehaviorConfig:
                 f"session_timeout_seconds must be >= 0: {self.session_timeout_seconds}"
             )
 
+        if self.network_profile:
+            get_network_profile(self.network_profile)
+
 
 @dataclass
 class SimulatorConfig:
@@ -320,6 +331,13 @@ class SimulatorConfig:
             behavior_data["timeout_delay_min_ms"] = delay_range.get("min", 1000)
             behavior_data["timeout_delay_max_ms"] = delay_range.get("max", 5000)
 
+        network_data = behavior_data.pop("network", {})
+        if isinstance(network_data, str):
+            behavior_data["network_profile"] = network_data
+        elif network_data:
+            behavior_data["network_profile"] = network_data.get("profile")
+            behavior_data["network_seed"] = network_data.get("seed")
+
         behavior_config = BehaviorConfig(**behavior_data) if behavior_data else BehaviorConfig()
 
         # Build main config (filter out None values)
@@ -12,8 +12,9 @@ Implements headers per GlobalPlatform GPC_SPE_011 Amendment B:
 
 import logging
 import re
+from collections import deque
 from enum import Enum
-from typing import Dict, Optional, Tuple
+from typing import Deque, Dict, List, Optional, Tuple
 
 from .psk_tls_client import PSKTLSClient
 
@@ -65,6 +66,264 @@ class HTTPStatusError(HTTPAdminError):
         super().__init__(f"HTTP {status_code} {reason}")
 
 
+# =============================================================================
+# Incremental Response Parser
+# =============================================================================
+
+_STATUS_LINE_RE = re.compile(r"HTTP/\d\.\d\s+(\d+)\s*(.*)")
+
+
+def extract_apdus(body: bytes) -> List[bytes]:
+    """Extract all length-prefixed APDUs from a GP Admin body.
+
+    GP Admin format uses length-prefixed APDUs:
+    [length (2 bytes big-endian)] [APDU bytes] ...
+
+    Zero-length entries are skipped. A truncated last entry is returned
+    as-is (with a warning), matching the lenient single-APDU behavior.
+
+    Args:
+        body: Body with length-prefixed APDUs.
+
+    Returns:
+        List of APDU bytes (empty if body is empty).
+    """
+    size = len(body)
+    if size < 2:
+        # Body too short for length prefix, return as-is
+        return [bytes(body)] if body else []
+
+    apdus: List[bytes] = []
+    offset = 0
+    while offset + 2 <= size:
+        length = (body[offset] << 8) | body[offset + 1]
+        offset += 2
+        if length == 0:
+            continue
+        end = offset + length
+        if end > size:
+            logger.warning(f"Body length mismatch: expected {length}, got {size - offset}")
+            end = size
+        apdus.append(bytes(body[offset:end]))
+        offset = end
+    return apdus
+
+
+class HTTPResponseParser:
+    """Incremental single-pass HTTP/1.1 response parser.
+
+    Bytes are fed as they arrive and parsed exactly once: the header
+    terminator search resumes where the previous chunk ended, Content-Length
+    and chunked bodies are tracked with an explicit state machine, and the
+    receive buffer is reused across responses. Bytes received past the end
+    of a response are kept for the next one.
+
+    Example:
+        >>> parser = HTTPResponseParser()
+        >>> while not parser.feed(await tls_client.receive()):
+        ...     pass
+        >>> status, headers, body = parser.result()
+        >>> parser.reset()
+    """
+
+    # Parser states
+    HEADERS = 0
+    BODY = 1
+    CHUNK_SIZE = 2
+    CHUNK_DATA = 3
+    CHUNK_END = 4
+    TRAILERS = 5
+    UNTIL_CLOSE = 6
+    DONE = 7
+
+    def __init__(self, max_header_size: int = 65536):
+        """Initialize parser.
+
+        Args:
+            max_header_size: Maximum size of the status line and headers.
+        """
+        self.max_header_size = max_header_size
+        self._buffer = bytearray()
+        self._body = bytearray()
+        self.reset()
+
+    def reset(self) -> None:
+        """Prepare for the next response, keeping any unconsumed bytes."""
+        self._state = self.HEADERS
+        self._scan = 0
+        self._remaining = 0
+        self._body.clear()
+        self.status_code = 0
+        self.reason = ""
+        self.headers: Dict[str, str] = {}
+        self.truncated = False
+
+    @property
+    def complete(self) -> bool:
+        """Check if a complete response has been parsed."""
+        return self._state == self.DONE
+
+    @property
+    def headers_complete(self) -> bool:
+        """Check if the status line and headers have been parsed."""
+        return self._state != self.HEADERS
+
+    @property
+    def body(self) -> bytes:
+        """Get (decoded) body received so far."""
+        return bytes(self._body)
+
+    def result(self) -> Tuple[int, Dict[str, str], bytes]:
+        """Get parsed response as (status_code, headers, body)."""
+        return self.status_code, self.headers, self.body
+
+    def feed(self, data: bytes) -> bool:
+        """Feed received bytes.
+
+        Args:
+            data: Next bytes from the connection (may be empty).
+
+        Returns:
+            True once the response is complete.
+
+        Raises:
+            HTTPProtocolError: If the response is malformed.
+        """
+        if data:
+            self._buffer += data
+        self._parse()
+        return self._state == self.DONE
+
+    def feed_eof(self) -> None:
+        """Signal that the connection was closed.
+
+        Raises:
+            HTTPProtocolError: If headers were not complete.
+        """
+        if self._state == self.DONE:
+            return
+        if self._state == self.HEADERS:
+            raise HTTPProtocolError("Connection closed while reading headers")
+        if self._state != self.UNTIL_CLOSE:
+            self.truncated = True
+            logger.warning("Connection closed before end of response body")
+        self._state = self.DONE
+
+    def _parse(self) -> None:
+        """Advance the state machine over buffered bytes."""
+        buf = self._buffer
+        pos = 0
+
+        while self._state != self.DONE:
+            state = self._state
+
+            if state == self.HEADERS:
+                idx = buf.find(b"\r\n\r\n", max(pos, self._scan))
+                if idx == -1:
+                    if len(buf) - pos > self.max_header_size:
+                        raise HTTPProtocolError("HTTP response headers too large")
+                    self._scan = max(pos, len(buf) - 3)
+                    break
+                self._parse_headers(bytes(buf[pos:idx]))
+                pos = idx + 4
+
+            elif state == self.BODY:
+                take = min(self._remaining, len(buf) - pos)
+                if take:
+                    self._body += buf[pos:pos + take]
+                    pos += take
+                    self._remaining -= take
+                if self._remaining:
+                    break
+                self._state = self.DONE
+
+            elif state == self.CHUNK_SIZE:
+                idx = buf.find(b"\r\n", pos)
+                if idx == -1:
+                    break
+                size_field = bytes(buf[pos:idx]).split(b";", 1)[0].strip()
+                try:
+                    size = int(size_field, 16)
+                except ValueError:
+                    raise HTTPProtocolError(f"Invalid chunk size: {size_field!r}")
+                pos = idx + 2
+                if size == 0:
+                    self._state = self.TRAILERS
+                else:
+                    self._remaining = size
+                    self._state = self.CHUNK_DATA
+
+            elif state == self.CHUNK_DATA:
+                take = min(self._remaining, len(buf) - pos)
+                if take:
+                    self._body += buf[pos:pos + take]
+                    pos += take
+                    self._remaining -= take
+                if self._remaining:
+                    break
+                self._state = self.CHUNK_END
+
+            elif state == self.CHUNK_END:
+                if len(buf) - pos < 2:
+                    break
+                if buf[pos:pos + 2] != b"\r\n":
+                    raise HTTPProtocolError("Missing CRLF after chunk data")
+                pos += 2
+                self._state = self.CHUNK_SIZE
+
+            elif state == self.TRAILERS:
+                idx = buf.find(b"\r\n", pos)
+                if idx == -1:
+                    break
+                # Empty line ends the trailer section; trailer fields are ignored
+                if idx == pos:
+                    self._state = self.DONE
+                pos = idx + 2
+
+            else:  # UNTIL_CLOSE
+                if pos < len(buf):
+                    self._body += buf[pos:]
+                    pos = len(buf)
+                break
+
+        # Drop consumed bytes; keeps only a partial line or the next response
+        if pos:
+            del buf[:pos]
+            self._scan = max(0, self._scan - pos)
+
+    def _parse_headers(self, header_block: bytes) -> None:
+        """Parse status line and headers, then select the body mode."""
+        lines = header_block.decode("ascii", errors="replace").split("\r\n")
+
+        status_match = _STATUS_LINE_RE.match(lines[0])
+        if not status_match:
+            raise HTTPProtocolError(f"Invalid HTTP status line: {lines[0]}")
+        self.status_code = int(status_match.group(1))
+        self.reason = status_match.group(2)
+
+        headers = {}
+        for line in lines[1:]:
+            key, sep, value = line.partition(":")
+            if sep:
+                headers[key.strip().lower()] = value.strip()
+        self.headers = headers
+
+        if self.status_code in (204, 304) or 100 <= self.status_code < 200:
+            self._state = self.DONE
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            self._state = self.CHUNK_SIZE
+        elif "content-length" in headers:
+            try:
+                self._remaining = int(headers["content-length"])
+            except ValueError:
+                raise HTTPProtocolError(
+                    f"Invalid Content-Length: {headers['content-length']}"
+                )
+            self._state = self.BODY
+        else:
+            self._state = self.UNTIL_CLOSE
+
+
 class HTTPAdminClient:
     """HTTP Admin protocol client.
 
@@ -96,6 +355,9 @@ class HTTPAdminClient:
     # HTTP line ending
     CRLF = b"\r\n"
 
+    # Bytes requested per receive (one maximum-size TLS record)
+    RECEIVE_SIZE = 16384
+
     def __init__(
         self,
         tls_client: PSKTLSClient,
@@ -121,6 +383,13 @@ class HTTPAdminClient:
         self._is_resuming: bool = False
         self._next_uri: Optional[str] = None  # From server X-Admin-Next-URI
 
+        # Reusable incremental response parser
+        self._parser = HTTPResponseParser()
+
+        # Multi-APDU scripts: C-APDUs not yet handed out and R-APDUs not yet sent
+        self._pending_apdus: Deque[bytes] = deque()
+        self._pending_responses: List[bytes] = []
+
     def build_request(
         self,
         body: bytes = b"",
@@ -227,40 +496,17 @@ class HTTPAdminClient:
         Raises:
             HTTPProtocolError: If response format is invalid.
         """
-        # Find header/body separator
-        separator_idx = response.find(b"\r\n\r\n")
-        if separator_idx == -1:
+        parser = HTTPResponseParser()
+        parser.feed(response)
+        if not parser.headers_complete:
             raise HTTPProtocolError("Invalid HTTP response: no header/body separator")
+        parser.feed_eof()
 
-        header_part = response[:separator_idx].decode("ascii", errors="replace")
-        body = response[separator_idx + 4:]
-
-        # Parse status line
-        lines = header_part.split("\r\n")
-        if not lines:
-            raise HTTPProtocolError("Invalid HTTP response: empty headers")
-
-        status_match = re.match(r"HTTP/\d\.\d\s+(\d+)\s+(.*)", lines[0])
-        if not status_match:
-            raise HTTPProtocolError(f"Invalid HTTP status line: {lines[0]}")
-
-        status_code = int(status_match.group(1))
-        reason = status_match.group(2)
-
-        # Parse headers
-        headers = {}
-        for line in lines[1:]:
-            if ": " in line:
-                key, value = line.split(": ", 1)
-                headers[key.lower()] = value
+        status_code, headers, body = parser.result()
 
         # Extract GP Admin headers
         self._extract_gp_headers(headers)
 
-        # Handle chunked transfer encoding
-        if headers.get("transfer-encoding", "").lower() == "chunked":
-            body = self._decode_chunked(body)
-
         return status_code, headers, body
 
     def _extract_gp_headers(self, headers: Dict[str, str]) -> None:
@@ -287,124 +533,46 @@ class HTTPAdminClient:
                 f"Server protocol version mismatch: {protocol} != {GP_ADMIN_PROTOCOL}"
             )
 
-    def _decode_chunked(self, data: bytes) -> bytes:
-        """Decode chunked transfer encoding.
-
-        Args:
-            data: Chunked encoded data.
+    async def _read_response(self) -> Tuple[int, Dict[str, str], bytes]:
+        """Receive and parse a complete HTTP response in a single pass.
 
         Returns:
-            Decoded body bytes.
-        """
-        result = b""
-        remaining = data
-
-        while remaining:
-            # Find chunk size line
-            line_end = remaining.find(b"\r\n")
-            if line_end == -1:
-                break
-
-            # Parse chunk size (hex)
-            try:
-                chunk_size = int(remaining[:line_end].decode("ascii").split(";")[0], 16)
-            except ValueError:
-                break
-
-            if chunk_size == 0:
-                break
-
-            # Extract chunk data
-            chunk_start = line_end + 2
-            chunk_end = chunk_start + chunk_size
-            result += remaining[chunk_start:chunk_end]
-
-            # Move past chunk and CRLF
-            remaining = remaining[chunk_end + 2:]
-
-        return result
-
-    async def _receive_response(self) -> bytes:
-        """Receive complete HTTP response.
-
-        Returns:
-            Complete HTTP response bytes.
+            Tuple of (status_code, headers_dict, body_bytes).
 
         Raises:
             HTTPProtocolError: If response is invalid.
         """
-        # Read headers first
-        response = b""
-        while b"\r\n\r\n" not in response:
-            chunk = await self.tls_client.receive(4096)
-            if not chunk:
-                raise HTTPProtocolError("Connection closed while reading headers")
-            response += chunk
-
-        # Parse headers to get content length
-        separator_idx = response.find(b"\r\n\r\n")
-        header_part = response[:separator_idx].decode("ascii", errors="replace")
-        body_start = response[separator_idx + 4:]
-
-        # Find content-length or transfer-encoding
-        content_length = None
-        chunked = False
-        for line in header_part.split("\r\n"):
-            if line.lower().startswith("content-length:"):
-                content_length = int(line.split(":", 1)[1].strip())
-            elif line.lower().startswith("transfer-encoding:"):
-                chunked = "chunked" in line.lower()
-
-        # Read remaining body if needed
-        if content_length is not None:
-            bytes_needed = content_length - len(body_start)
-            while bytes_needed > 0:
-                chunk = await self.tls_client.receive(min(bytes_needed, 4096))
+        parser = self._parser
+        parser.reset()
+
+        # Bytes left over from a previous response are parsed first
+        if not parser.feed(b""):
+            while True:
+                chunk = await self.tls_client.receive(self.RECEIVE_SIZE)
                 if not chunk:
+                    parser.feed_eof()
                     break
-                response += chunk
-                bytes_needed -= len(chunk)
-        elif chunked:
-            # Read until final chunk (0\r\n\r\n)
-            while not response.endswith(b"0\r\n\r\n") and not response.endswith(b"\r\n0\r\n\r\n"):
-                chunk = await self.tls_client.receive(4096)
-                if not chunk:
+                if parser.feed(chunk):
                     break
-                response += chunk
-
-        return response
 
-    def _extract_first_apdu(self, body: bytes) -> bytes:
-        """Extract first C-APDU from length-prefixed body.
+        status_code, headers, body = parser.result()
+        self._extract_gp_headers(headers)
+        return status_code, headers, body
 
-        GP Admin format uses length-prefixed APDUs:
-        [length (2 bytes big-endian)] [APDU bytes] ...
+    def _take_apdus(self, body: bytes) -> bytes:
+        """Queue all C-APDUs of a response body and return the first.
 
         Args:
-            body: Response body with length-prefixed APDUs.
+            body: Response body with length-prefixed C-APDUs.
 
         Returns:
             First C-APDU bytes, or empty bytes if body is empty.
         """
-        if len(body) < 2:
-            # Body too short for length prefix, return as-is
-            return body
-
-        # Read length prefix (2 bytes, big-endian)
-        length = (body[0] << 8) | body[1]
-
-        if length == 0:
+        apdus = extract_apdus(body)
+        if not apdus:
             return b""
-
-        if len(body) < 2 + length:
-            # Not enough data, return what we have after prefix
-            logger.warning(
-                f"Body length mismatch: expected {length}, got {len(body) - 2}"
-            )
-            return body[2:]
-
-        # Extract APDU
-        return body[2:2 + length]
+        self._pending_apdus.extend(apdus[1:])
+        return apdus[0]
 
     async def initial_request(self) -> bytes:
         """Send initial empty request, receive first C-APDU.
@@ -424,16 +592,15 @@ class HTTPAdminClient:
         self._request_count += 1
 
         # Receive and parse response
-        response = await self._receive_response()
-        status_code, headers, body = self.parse_response(response)
+        status_code, headers, body = await self._read_response()
 
         logger.debug(f"Initial response: HTTP {status_code}, body={len(body)} bytes")
 
         # Check status
         if status_code == 200:
-            # Parse length-prefixed C-APDU
-            c_apdu = self._extract_first_apdu(body)
-            if c_apdu:
+            # Parse length-prefixed C-APDU(s)
+            c_apdu = self._take_apdus(body)
+            if c_apdu and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Received C-APDU: {c_apdu.hex().upper()}")
             return c_apdu
         elif status_code == 204:
@@ -457,6 +624,11 @@ class HTTPAdminClient:
     async def send_response(self, r_apdu: bytes) -> Optional[bytes]:
         """Send R-APDU and receive next C-APDU.
 
+        When the previous response carried several C-APDUs, the R-APDU is
+        buffered and the next queued C-APDU is returned without a round
+        trip; all buffered R-APDUs are sent together in one request once
+        the script has been processed.
+
         Args:
             r_apdu: R-APDU bytes to send to server.
 
@@ -472,10 +644,16 @@ class HTTPAdminClient:
             >>> if c_apdu is None:
             ...     print("Session complete")
         """
-        logger.debug(f"Sending R-APDU: {r_apdu.hex().upper()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending R-APDU: {r_apdu.hex().upper()}")
+
+        self._pending_responses.append(r_apdu)
+        if self._pending_apdus:
+            return self._pending_apdus.popleft()
 
         # Build length-prefixed R-APDU body
-        body = self._build_length_prefixed_apdu(r_apdu)
+        body = b"".join(self._build_length_prefixed_apdu(r) for r in self._pending_responses)
+        self._pending_responses.clear()
 
         # Build and send POST with R-APDU
         request = self.build_request(body)
@@ -483,16 +661,15 @@ class HTTPAdminClient:
         self._request_count += 1
 
         # Receive and parse response
-        response = await self._receive_response()
-        status_code, headers, body = self.parse_response(response)
+        status_code, headers, body = await self._read_response()
 
         logger.debug(f"Response: HTTP {status_code}, body={len(body)} bytes")
 
         # Check status
         if status_code == 200:
-            # Parse length-prefixed C-APDU
-            c_apdu = self._extract_first_apdu(body)
-            if c_apdu:
+            # Parse length-prefixed C-APDU(s)
+            c_apdu = self._take_apdus(body)
+            if c_apdu and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Received C-APDU: {c_apdu.hex().upper()}")
             return c_apdu
         elif status_code == 204:
@@ -526,16 +703,15 @@ class HTTPAdminClient:
         self._request_count += 1
 
         # Receive and parse response
-        response = await self._receive_response()
-        status_code, headers, body = self.parse_response(response)
+        status_code, headers, body = await self._read_response()
 
         logger.debug(f"Poll response: HTTP {status_code}, body={len(body)} bytes")
 
         # Check status
         if status_code == 200:
-            # Parse length-prefixed C-APDU
-            c_apdu = self._extract_first_apdu(body)
-            if c_apdu:
+            # Parse length-prefixed C-APDU(s)
+            c_apdu = self._take_apdus(body)
+            if c_apdu and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Received C-APDU: {c_apdu.hex().upper()}")
             return c_apdu
         elif status_code == 204:
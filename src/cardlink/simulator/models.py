@@ -86,6 +86,7 @@ class TLSConnectionInfo:
         server_address: Server IP address and port.
         iccid: ICCID of the virtual UICC (if available).
         imsi: IMSI of the virtual UICC (if available).
+        session_resumed: Whether the handshake resumed a cached TLS session.
 
     Example:
         >>> info = TLSConnectionInfo(
@@ -103,6 +104,7 @@ class TLSConnectionInfo:
     server_address: Optional[str] = None
     iccid: Optional[str] = None
     imsi: Optional[str] = None
+    session_resumed: bool = False
 
     @property
     def display_identity(self) -> str:
@@ -149,6 +151,22 @@ class APDUExchange:
         sw = self.sw.upper()
         return sw == "9000" or sw.startswith(("61", "62", "63"))
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert exchange to a JSON-serializable dictionary.
+
+        Returns:
+            Dictionary containing exchange fields.
+        """
+        return {
+            "timestamp": self.timestamp.isoformat(),
+            "ins": self.ins,
+            "description": self.description,
+            "command": self.command,
+            "response": self.response,
+            "sw": self.sw,
+            "duration_ms": self.duration_ms,
+        }
+
 
 @dataclass
 class SessionResult:
@@ -221,6 +239,8 @@ class SimulatorStats:
         avg_apdu_response_time_ms: Average APDU response time.
         error_responses: Error SW counts by code.
         timeout_count: Number of timeouts.
+        full_handshakes: TLS handshakes that negotiated a new session.
+        resumed_handshakes: TLS handshakes that resumed a cached session.
 
     Example:
         >>> stats = SimulatorStats()
@@ -249,10 +269,17 @@ class SimulatorStats:
     error_responses: Dict[str, int] = field(default_factory=dict)
     timeout_count: int = 0
 
-    # Internal tracking for averages
-    _connection_times: List[float] = field(default_factory=list, repr=False)
-    _session_durations: List[float] = field(default_factory=list, repr=False)
-    _apdu_times: List[float] = field(default_factory=list, repr=False)
+    # TLS handshake stats
+    full_handshakes: int = 0
+    resumed_handshakes: int = 0
+
+    # Running totals for averages (constant memory on long runs)
+    _connection_time_total: float = field(default=0.0, repr=False)
+    _connection_time_count: int = field(default=0, repr=False)
+    _session_duration_total: float = field(default=0.0, repr=False)
+    _session_duration_count: int = field(default=0, repr=False)
+    _apdu_time_total: float = field(default=0.0, repr=False)
+    _apdu_time_count: int = field(default=0, repr=False)
 
     def record_connection_time(self, time_ms: float) -> None:
         """Record a connection time for averaging.
@@ -260,8 +287,9 @@ class SimulatorStats:
         Args:
             time_ms: Connection time in milliseconds.
         """
-        self._connection_times.append(time_ms)
-        self.avg_connection_time_ms = sum(self._connection_times) / len(self._connection_times)
+        self._connection_time_total += time_ms
+        self._connection_time_count += 1
+        self.avg_connection_time_ms = self._connection_time_total / self._connection_time_count
 
     def record_session_duration(self, duration_ms: float) -> None:
         """Record a session duration for averaging.
@@ -269,8 +297,11 @@ class SimulatorStats:
         Args:
             duration_ms: Session duration in milliseconds.
         """
-        self._session_durations.append(duration_ms)
-        self.avg_session_duration_ms = sum(self._session_durations) / len(self._session_durations)
+        self._session_duration_total += duration_ms
+        self._session_duration_count += 1
+        self.avg_session_duration_ms = (
+            self._session_duration_total / self._session_duration_count
+        )
 
     def record_apdu_time(self, time_ms: float) -> None:
         """Record an APDU response time for averaging.
@@ -278,8 +309,62 @@ class SimulatorStats:
         Args:
             time_ms: APDU response time in milliseconds.
         """
-        self._apdu_times.append(time_ms)
-        self.avg_apdu_response_time_ms = sum(self._apdu_times) / len(self._apdu_times)
+        self._apdu_time_total += time_ms
+        self._apdu_time_count += 1
+        self.avg_apdu_response_time_ms = self._apdu_time_total / self._apdu_time_count
+
+    def record_handshake(self, resumed: bool) -> None:
+        """Record a completed TLS handshake.
+
+        Args:
+            resumed: Whether the handshake resumed a cached session.
+        """
+        if resumed:
+            self.resumed_handshakes += 1
+        else:
+            self.full_handshakes += 1
+
+    def merge(self, other: "SimulatorStats") -> None:
+        """Add another simulator's statistics to this one.
+
+        Used to aggregate statistics across the cards of a fleet run.
+
+        Args:
+            other: Statistics to add.
+        """
+        for name in (
+            "connections_attempted",
+            "connections_succeeded",
+            "connections_failed",
+            "sessions_completed",
+            "sessions_failed",
+            "total_apdus_sent",
+            "total_apdus_received",
+            "timeout_count",
+            "full_handshakes",
+            "resumed_handshakes",
+            "_connection_time_total",
+            "_connection_time_count",
+            "_session_duration_total",
+            "_session_duration_count",
+            "_apdu_time_total",
+            "_apdu_time_count",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+        for error_type, count in other.connection_errors.items():
+            self.connection_errors[error_type] = self.connection_errors.get(error_type, 0) + count
+        for sw, count in other.error_responses.items():
+            self.error_responses[sw] = self.error_responses.get(sw, 0) + count
+
+        if self._connection_time_count:
+            self.avg_connection_time_ms = self._connection_time_total / self._connection_time_count
+        if self._session_duration_count:
+            self.avg_session_duration_ms = (
+                self._session_duration_total / self._session_duration_count
+            )
+        if self._apdu_time_count:
+            self.avg_apdu_response_time_ms = self._apdu_time_total / self._apdu_time_count
 
     def record_error(self, error_type: str) -> None:
         """Record a connection error.
@@ -0,0 +1,253 @@
+"""Network condition profiles for bearer simulation.
+
+This module models the bearer between the UICC and the admin server
+(BIP over 2G/3G/LTE-M/NB-IoT). Each exchange is delayed by a heavy-tailed
+round-trip latency, a per-byte transfer delay derived from the bearer
+bandwidth, and occasional correlated stalls, so capacity tests hold
+sessions open as long as cards in the field would.
+
+Stalls follow a two-state (good/stalled) Markov chain: a card enters the
+stalled state with ``stall_probability`` and stays there with
+``stall_persistence``, which produces bursts of consecutive slow exchanges
+rather than independent outliers.
+"""
+
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """Statistical description of a bearer.
+
+    Attributes:
+        name: Profile name.
+        latency_median_ms: Median round-trip latency in milliseconds.
+        latency_sigma: Log-normal shape parameter (larger means heavier tail).
+        latency_max_ms: Upper bound applied to sampled latencies.
+        uplink_bps: Card-to-server bandwidth in bits per second (0 = unlimited).
+        downlink_bps: Server-to-card bandwidth in bits per second (0 = unlimited).
+        overhead_bytes: Per-exchange protocol overhead (HTTP headers, TLS records).
+        stall_probability: Probability of entering the stalled state per exchange.
+        stall_persistence: Probability of remaining stalled on the next exchange.
+        stall_min_ms: Minimum extra delay of a stalled exchange.
+        stall_max_ms: Maximum extra delay of a stalled exchange.
+
+    Example:
+        >>> profile = NetworkProfile(name="satellite", latency_median_ms=600.0)
+    """
+
+    name: str
+    latency_median_ms: float = 0.0
+    latency_sigma: float = 0.0
+    latency_max_ms: float = 30000.0
+    uplink_bps: int = 0
+    downlink_bps: int = 0
+    overhead_bytes: int = 0
+    stall_probability: float = 0.0
+    stall_persistence: float = 0.0
+    stall_min_ms: float = 0.0
+    stall_max_ms: float = 0.0
+
+    def validate(self) -> None:
+        """Validate profile values.
+
+        Raises:
+            ValueError: If profile is invalid.
+        """
+        if self.latency_median_ms < 0:
+            raise ValueError(f"latency_median_ms must be >= 0: {self.latency_median_ms}")
+        if self.latency_sigma < 0:
+            raise ValueError(f"latency_sigma must be >= 0: {self.latency_sigma}")
+        if self.uplink_bps < 0 or self.downlink_bps < 0:
+            raise ValueError("Bandwidth must be >= 0")
+        for name in ("stall_probability", "stall_persistence"):
+            value = getattr(self, name)
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"{name} must be between 0.0 and 1.0: {value}")
+        if self.stall_min_ms > self.stall_max_ms:
+            raise ValueError(
+                f"stall_min_ms ({self.stall_min_ms}) must be <= "
+                f"stall_max_ms ({self.stall_max_ms})"
+            )
+
+
+# Rough field figures for BIP sessions over common IoT/mobile bearers.
+NETWORK_PROFILES: Dict[str, NetworkProfile] = {
+    "2g": NetworkProfile(
+        name="2g",
+        latency_median_ms=650.0,
+        latency_sigma=0.55,
+        uplink_bps=20_000,
+        downlink_bps=40_000,
+        overhead_bytes=400,
+        stall_probability=0.03,
+        stall_persistence=0.6,
+        stall_min_ms=1000.0,
+        stall_max_ms=6000.0,
+    ),
+    "3g": NetworkProfile(
+        name="3g",
+        latency_median_ms=150.0,
+        latency_sigma=0.4,
+        uplink_bps=384_000,
+        downlink_bps=1_000_000,
+        overhead_bytes=400,
+        stall_probability=0.01,
+        stall_persistence=0.4,
+        stall_min_ms=300.0,
+        stall_max_ms=2000.0,
+    ),
+    "lte-m": NetworkProfile(
+        name="lte-m",
+        latency_median_ms=90.0,
+        latency_sigma=0.35,
+        uplink_bps=375_000,
+        downlink_bps=300_000,
+        overhead_bytes=400,
+        stall_probability=0.005,
+        stall_persistence=0.3,
+        stall_min_ms=200.0,
+        stall_max_ms=1500.0,
+    ),
+    "nb-iot": NetworkProfile(
+        name="nb-iot",
+        latency_median_ms=1600.0,
+        latency_sigma=0.6,
+        uplink_bps=60_000,
+        downlink_bps=25_000,
+        overhead_bytes=400,
+        stall_probability=0.02,
+        stall_persistence=0.5,
+        stall_min_ms=2000.0,
+        stall_max_ms=10000.0,
+    ),
+}
+
+
+def get_network_profile(name: str) -> NetworkProfile:
+    """Look up a named network profile.
+
+    Args:
+        name: Profile name (case-insensitive).
+
+    Returns:
+        Registered NetworkProfile.
+
+    Raises:
+        ValueError: If no profile with that name is registered.
+    """
+    profile = NETWORK_PROFILES.get(name.lower())
+    if profile is None:
+        raise ValueError(
+            f"Unknown network profile: {name} "
+            f"(available: {', '.join(sorted(NETWORK_PROFILES))})"
+        )
+    return profile
+
+
+def register_network_profile(profile: NetworkProfile) -> None:
+    """Register a custom network profile.
+
+    Args:
+        profile: Profile to register; replaces any profile of the same name.
+
+    Raises:
+        ValueError: If profile is invalid.
+    """
+    profile.validate()
+    NETWORK_PROFILES[profile.name.lower()] = profile
+
+
+def list_network_profiles() -> List[str]:
+    """Get names of registered network profiles."""
+    return sorted(NETWORK_PROFILES)
+
+
+class NetworkConditions:
+    """Per-card sampler for exchange delays of a network profile.
+
+    Holds the stall state of one card, so each simulated card
+    experiences its own correlated bursts.
+
+    Attributes:
+        profile: Network profile being simulated.
+
+    Example:
+        >>> conditions = NetworkConditions(get_network_profile("3g"), seed=42)
+        >>> delay = conditions.exchange_delay(command_len=13, response_len=2)
+    """
+
+    def __init__(self, profile: NetworkProfile, seed: Optional[int] = None):
+        """Initialize sampler.
+
+        Args:
+            profile: Network profile to simulate.
+            seed: Optional random seed for reproducible runs.
+        """
+        self.profile = profile
+        self._rng = random.Random(seed)
+        self._stalled = False
+        self._mu = math.log(profile.latency_median_ms) if profile.latency_median_ms > 0 else 0.0
+
+    @property
+    def stalled(self) -> bool:
+        """Check if the card is currently in a stall burst."""
+        return self._stalled
+
+    def sample_latency_ms(self) -> float:
+        """Sample a round-trip latency in milliseconds."""
+        profile = self.profile
+        if profile.latency_median_ms <= 0:
+            return 0.0
+        if profile.latency_sigma <= 0:
+            latency = profile.latency_median_ms
+        else:
+            latency = self._rng.lognormvariate(self._mu, profile.latency_sigma)
+        return min(latency, profile.latency_max_ms)
+
+    def transfer_delay_ms(self, uplink_bytes: int, downlink_bytes: int) -> float:
+        """Compute serialization delay for an exchange.
+
+        Args:
+            uplink_bytes: Bytes sent by the card (R-APDU).
+            downlink_bytes: Bytes received by the card (C-APDU).
+
+        Returns:
+            Transfer delay in milliseconds.
+        """
+        profile = self.profile
+        delay = 0.0
+        if profile.uplink_bps:
+            delay += (uplink_bytes + profile.overhead_bytes) * 8000.0 / profile.uplink_bps
+        if profile.downlink_bps:
+            delay += (downlink_bytes + profile.overhead_bytes) * 8000.0 / profile.downlink_bps
+        return delay
+
+    def sample_stall_ms(self) -> float:
+        """Advance the stall state and sample stall delay in milliseconds."""
+        profile = self.profile
+        threshold = profile.stall_persistence if self._stalled else profile.stall_probability
+        self._stalled = threshold > 0 and self._rng.random() < threshold
+        if not self._stalled:
+            return 0.0
+        return self._rng.uniform(profile.stall_min_ms, profile.stall_max_ms)
+
+    def exchange_delay(self, command_len: int, response_len: int) -> float:
+        """Sample total bearer delay for one APDU exchange.
+
+        Args:
+            command_len: C-APDU length in bytes.
+            response_len: R-APDU length in bytes.
+
+        Returns:
+            Delay in seconds.
+        """
+        delay_ms = (
+            self.sample_latency_ms()
+            + self.transfer_delay_ms(response_len, command_len)
+            + self.sample_stall_ms()
+        )
+        return delay_ms / 1000.0
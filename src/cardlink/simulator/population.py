@@ -0,0 +1,460 @@
+"""Card population files for simulated fleets.
+
+A population file lists the cards of a simulated fleet: ICCID, IMSI, PSK
+identity and key, and an optional network profile per card. Files are
+memory-mapped and decoded one record at a time, and a full
+SimulatorConfig is only built when a card becomes active, so the number
+of cards does not determine memory use.
+
+Two formats are supported:
+
+CSV:
+    Header row followed by one card per line. Required columns are
+    ``iccid`` and ``psk_key`` (hex); optional columns are ``imsi``,
+    ``psk_identity`` (defaults to the ICCID) and ``network_profile``.
+
+Binary (``.pop``):
+    Fixed-size records for O(1) random access. Layout (little-endian)::
+
+        header  (24 bytes)  magic "CLPP", version, flags, record size,
+                            record count, offset of profile name table
+        records (84 bytes)  iccid BCD[10], imsi BCD[8], key length,
+                            profile index (0 = none), key[32], identity[32]
+        names               NUL-separated network profile names
+
+    Use :func:`write_population` (or ``gp-simulator population-convert``)
+    to convert a CSV file.
+"""
+
+import csv
+import mmap
+import os
+import struct
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .config import SimulatorConfig
+
+POPULATION_MAGIC = b"CLPP"
+POPULATION_VERSION = 1
+
+_HEADER = struct.Struct("<4sBBHIQ4x")
+_RECORD = struct.Struct("<10s8sBB32s32s")
+
+
+class PopulationError(Exception):
+    """Error raised for invalid population files."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class CardRecord:
+    """Identity and credentials of one card in a population.
+
+    Attributes:
+        iccid: Integrated Circuit Card Identifier.
+        psk_key: PSK key bytes (16 or 32 bytes).
+        imsi: International Mobile Subscriber Identity.
+        psk_identity: PSK identity (empty to use the ICCID).
+        network_profile: Network profile name, or None for the base config's.
+
+    Example:
+        >>> card = CardRecord(iccid="8901234567890123456", psk_key=bytes(16))
+        >>> config = card.to_config(base_config)
+    """
+
+    iccid: str
+    psk_key: bytes
+    imsi: str = ""
+    psk_identity: str = ""
+    network_profile: Optional[str] = None
+
+    @property
+    def identity(self) -> str:
+        """Get effective PSK identity (ICCID if none is set)."""
+        return self.psk_identity or self.iccid
+
+    def to_config(self, base: SimulatorConfig) -> SimulatorConfig:
+        """Materialize a simulator configuration for this card.
+
+        Args:
+            base: Configuration providing server, UICC and behavior defaults.
+
+        Returns:
+            New SimulatorConfig with this card's identity and credentials.
+        """
+        uicc_profile = replace(
+            base.uicc_profile,
+            iccid=self.iccid,
+            imsi=self.imsi or base.uicc_profile.imsi,
+        )
+        behavior = base.behavior
+        if self.network_profile:
+            behavior = replace(behavior, network_profile=self.network_profile)
+        return replace(
+            base,
+            psk_identity=self.identity,
+            psk_key=self.psk_key,
+            use_iccid_as_identity=False,
+            uicc_profile=uicc_profile,
+            behavior=behavior,
+        )
+
+
+_BCD_DIGITS = frozenset("0123456789Ff")
+
+
+def _encode_bcd(digits: str, size: int) -> bytes:
+    if len(digits) > size * 2:
+        raise PopulationError(f"Value too long for {size}-byte BCD field: {digits}")
+    if not _BCD_DIGITS.issuperset(digits):
+        raise PopulationError(f"Invalid BCD digits: {digits}")
+    return bytes.fromhex(digits.ljust(size * 2, "F"))
+
+
+def _decode_bcd(data: bytes) -> str:
+    return data.hex().upper().rstrip("F")
+
+
+class CardPopulation(ABC):
+    """Base class for memory-mapped card populations.
+
+    Subclasses decode individual records on demand; iteration and
+    :meth:`configs` never hold more than one card at a time.
+
+    Example:
+        >>> with open_population("fleet.pop") as population:
+        ...     for config in population.configs(base_config):
+        ...         await MobileSimulator(config).run_complete_session()
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Memory-map population file.
+
+        Args:
+            path: Population file path.
+
+        Raises:
+            PopulationError: If the file is empty.
+        """
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise PopulationError(f"Empty population file: {self.path}") from None
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Get the number of cards."""
+
+    @abstractmethod
+    def record(self, index: int) -> CardRecord:
+        """Decode the card at ``index``.
+
+        Args:
+            index: Card index (negative values count from the end).
+
+        Returns:
+            CardRecord for the card.
+
+        Raises:
+            IndexError: If index is out of range.
+        """
+
+    def __getitem__(self, index: int) -> CardRecord:
+        return self.record(index)
+
+    def __iter__(self) -> Iterator[CardRecord]:
+        for index in range(len(self)):
+            yield self.record(index)
+
+    def configs(self, base: SimulatorConfig, start: int = 0) -> Iterator[SimulatorConfig]:
+        """Lazily materialize simulator configurations.
+
+        Args:
+            base: Configuration providing defaults for every card.
+            start: Index of the first card.
+
+        Yields:
+            SimulatorConfig for each card, built when requested.
+        """
+        for index in range(start, len(self)):
+            yield self.record(index).to_config(base)
+
+    def _check_index(self, index: int) -> int:
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"Card index out of range: {index}")
+        return index
+
+    def close(self) -> None:
+        """Unmap and close the population file."""
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "CardPopulation":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class BinaryCardPopulation(CardPopulation):
+    """Population stored as fixed-size binary records."""
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path)
+        try:
+            magic, version, _, record_size, count, names_offset = _HEADER.unpack_from(
+                self._mmap, 0
+            )
+        except struct.error:
+            self.close()
+            raise PopulationError(f"Truncated population header: {self.path}") from None
+
+        if magic != POPULATION_MAGIC or version != POPULATION_VERSION:
+            self.close()
+            raise PopulationError(f"Unsupported population file: {self.path}")
+        if record_size != _RECORD.size or names_offset < _HEADER.size + count * record_size:
+            self.close()
+            raise PopulationError(f"Corrupt population file: {self.path}")
+
+        self._count = count
+        names = bytes(self._mmap[names_offset:])
+        self._profiles: List[str] = [n.decode("utf-8") for n in names.split(b"\0") if n]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, index: int) -> CardRecord:
+        index = self._check_index(index)
+        iccid, imsi, key_len, profile_idx, key, identity = _RECORD.unpack_from(
+            self._mmap, _HEADER.size + index * _RECORD.size
+        )
+        return CardRecord(
+            iccid=_decode_bcd(iccid),
+            psk_key=key[:key_len],
+            imsi=_decode_bcd(imsi),
+            psk_identity=identity.rstrip(b"\0").decode("utf-8"),
+            network_profile=self._profiles[profile_idx - 1] if profile_idx else None,
+        )
+
+
+class CSVCardPopulation(CardPopulation):
+    """Population stored as CSV.
+
+    Every row is decoded once when the file is opened, so a bad card is
+    reported before any session starts rather than when it is reached.
+    Iteration streams lines straight from the mapping. Random access
+    builds a line offset index on first use (8 bytes per card).
+    """
+
+    REQUIRED_COLUMNS = ("iccid", "psk_key")
+
+    def __init__(self, path: Union[str, Path]):
+        super().__init__(path)
+        header_end = self._mmap.find(b"\n")
+        header_line = self._mmap[: header_end if header_end >= 0 else len(self._mmap)]
+        self._columns = [c.strip().lower() for c in self._parse_line(header_line)]
+        missing = [c for c in self.REQUIRED_COLUMNS if c not in self._columns]
+        if missing:
+            self.close()
+            raise PopulationError(f"Population CSV missing columns: {', '.join(missing)}")
+
+        self._data_start = header_end + 1 if header_end >= 0 else len(self._mmap)
+        self._offsets: Optional[array] = None
+        try:
+            self._validate()
+        except PopulationError:
+            self.close()
+            raise
+
+    def _validate(self) -> None:
+        """Decode every row, raising on the first invalid card.
+
+        Raises:
+            PopulationError: If a row is invalid (the message names the card number).
+        """
+        for number, line in enumerate(self._lines(self._data_start), start=1):
+            try:
+                record = self._row_to_record(line)
+                if not record.iccid.isdigit():
+                    raise PopulationError(f"Invalid iccid: {record.iccid!r}")
+                if record.imsi and not record.imsi.isdigit():
+                    raise PopulationError(f"Invalid imsi for card {record.iccid}")
+                if len(record.psk_key) not in (16, 32):
+                    raise PopulationError(
+                        f"psk_key must be 16 or 32 bytes for card {record.iccid}"
+                    )
+            except PopulationError as e:
+                raise PopulationError(f"{self.path}: card {number}: {e}") from None
+
+    @staticmethod
+    def _parse_line(line: bytes) -> List[str]:
+        return next(csv.reader([line.decode("utf-8").rstrip("\r\n")]), [])
+
+    def _lines(self, start: int) -> Iterator[bytes]:
+        """Yield non-empty data lines from ``start``."""
+        data = self._mmap
+        size = len(data)
+        pos = start
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                end = size
+            line = data[pos:end]
+            if line.strip():
+                yield line
+            pos = end + 1
+
+    def _build_offsets(self) -> array:
+        offsets = array("Q")
+        data = self._mmap
+        size = len(data)
+        pos = self._data_start
+        while pos < size:
+            end = data.find(b"\n", pos)
+            if end < 0:
+                end = size
+            if data[pos:end].strip():
+                offsets.append(pos)
+            pos = end + 1
+        return offsets
+
+    def _row_to_record(self, line: bytes) -> CardRecord:
+        row: Dict[str, str] = dict(zip(self._columns, self._parse_line(line)))
+        try:
+            psk_key = bytes.fromhex(row["psk_key"])
+        except (KeyError, ValueError):
+            raise PopulationError(f"Invalid psk_key for card {row.get('iccid')}") from None
+        return CardRecord(
+            iccid=row["iccid"].strip(),
+            psk_key=psk_key,
+            imsi=row.get("imsi", "").strip(),
+            psk_identity=row.get("psk_identity", "").strip(),
+            network_profile=row.get("network_profile", "").strip() or None,
+        )
+
+    def __len__(self) -> int:
+        if self._offsets is None:
+            self._offsets = self._build_offsets()
+        return len(self._offsets)
+
+    def record(self, index: int) -> CardRecord:
+        index = self._check_index(index)
+        start = self._offsets[index]
+        end = self._mmap.find(b"\n", start)
+        return self._row_to_record(self._mmap[start : end if end >= 0 else len(self._mmap)])
+
+    def __iter__(self) -> Iterator[CardRecord]:
+        for line in self._lines(self._data_start):
+            yield self._row_to_record(line)
+
+    def configs(self, base: SimulatorConfig, start: int = 0) -> Iterator[SimulatorConfig]:
+        if start:
+            yield from super().configs(base, start)
+            return
+        for record in self:
+            yield record.to_config(base)
+
+
+def open_population(path: Union[str, Path]) -> CardPopulation:
+    """Open a population file, detecting its format.
+
+    Args:
+        path: CSV or binary population file.
+
+    Returns:
+        CardPopulation for the file.
+
+    Raises:
+        PopulationError: If the file is invalid.
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(POPULATION_MAGIC))
+    if magic == POPULATION_MAGIC:
+        return BinaryCardPopulation(path)
+    return CSVCardPopulation(path)
+
+
+def write_population(path: Union[str, Path], records: Iterable[CardRecord]) -> int:
+    """Write cards to a binary population file.
+
+    Records are streamed to disk, so converting a large CSV population
+    only holds one card at a time. The file is written under a temporary
+    name and renamed on success, so a failed conversion leaves no
+    partial file behind.
+
+    Args:
+        path: Output file path.
+        records: Cards to write.
+
+    Returns:
+        Number of cards written.
+
+    Raises:
+        PopulationError: If a card cannot be encoded.
+
+    Example:
+        >>> with open_population("fleet.csv") as population:
+        ...     write_population("fleet.pop", population)
+    """
+    path = Path(path)
+    partial = path.with_name(path.name + ".partial")
+    try:
+        count = _write_records(partial, records)
+        os.replace(partial, path)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _write_records(path: Path, records: Iterable[CardRecord]) -> int:
+    """Write the binary population header, records and profile names."""
+    profiles: Dict[str, int] = {}
+    count = 0
+    with open(path, "wb") as f:
+        f.write(b"\0" * _HEADER.size)
+        for card in records:
+            if len(card.psk_key) not in (16, 32):
+                raise PopulationError(f"psk_key must be 16 or 32 bytes for card {card.iccid}")
+            identity = card.psk_identity.encode("utf-8")
+            if len(identity) > 32:
+                raise PopulationError(f"psk_identity longer than 32 bytes: {card.psk_identity}")
+
+            profile_idx = 0
+            if card.network_profile:
+                profile_idx = profiles.setdefault(card.network_profile, len(profiles) + 1)
+                if profile_idx > 255:
+                    raise PopulationError("Too many distinct network profiles (max 255)")
+
+            f.write(
+                _RECORD.pack(
+                    _encode_bcd(card.iccid, 10),
+                    _encode_bcd(card.imsi, 8),
+                    len(card.psk_key),
+                    profile_idx,
+                    card.psk_key,
+                    identity,
+                )
+            )
+            count += 1
+
+        names_offset = f.tell()
+        f.write(b"\0".join(name.encode("utf-8") for name in profiles))
+        f.seek(0)
+        f.write(
+            _HEADER.pack(
+                POPULATION_MAGIC, POPULATION_VERSION, 0, _RECORD.size, count, names_offset
+            )
+        )
+    return count
@@ -9,6 +9,7 @@ import logging
 import socket
 import ssl
 import time
+from collections import OrderedDict
 from typing import Optional, Tuple
 
 from .models import TLSConnectionInfo
@@ -40,6 +41,74 @@ class TimeoutError(PSKTLSClientError):
     pass
 
 
+# Session cache key: (host, port, psk_identity)
+SessionKey = Tuple[str, int, str]
+
+
+class TLSSessionCache:
+    """LRU cache of TLS sessions for client-side session resumption.
+
+    Sessions are keyed by (host, port, psk_identity). A session can only be
+    resumed with the SSL context that created it, so each entry remembers
+    its context and is not offered to connections using another one.
+
+    Example:
+        >>> cache = TLSSessionCache(max_entries=1000)
+        >>> client = PSKTLSClient(..., session_cache=cache)
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize cache.
+
+        Args:
+            max_entries: Maximum number of cached sessions.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[SessionKey, Tuple[ssl.SSLContext, ssl.SSLSession]]" = (
+            OrderedDict()
+        )
+
+    def get(self, key: SessionKey, context: ssl.SSLContext) -> Optional[ssl.SSLSession]:
+        """Get a resumable session for key created by context.
+
+        Args:
+            key: (host, port, psk_identity) tuple.
+            context: SSL context of the new connection.
+
+        Returns:
+            Cached session, or None if there is none for this context.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not context:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: SessionKey, context: ssl.SSLContext, session: ssl.SSLSession) -> None:
+        """Store the session of an established connection.
+
+        Args:
+            key: (host, port, psk_identity) tuple.
+            context: SSL context the session belongs to.
+            session: Session to cache.
+        """
+        self._entries[key] = (context, session)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: SessionKey) -> None:
+        """Remove the session for key, e.g. after a failed resumption."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all sessions."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class PSKTLSClient:
     """TLS-PSK client for connecting to admin server.
 
@@ -64,8 +133,16 @@ class PSKTLSClient:
         >>> await client.send(b"data")
         >>> response = await client.receive()
         >>> await client.close()
+
+    Reconnecting clients offer the last session for the same
+    (host, port, identity) from the session cache, so servers that
+    support resumption skip the full PSK handshake. Pass the
+    ``ssl_context`` of a previous client to reuse it for a new one.
     """
 
+    # Session cache shared by clients that are not given their own
+    default_session_cache = TLSSessionCache()
+
     # Supported PSK cipher suites per GlobalPlatform GPC_SPE_011 Table 3-2
     # Using OpenSSL cipher names (not IANA names)
     # Production ciphers (TLS 1.2 mandatory)
@@ -90,6 +167,9 @@ class PSKTLSClient:
         psk_key: bytes,
         timeout: float = 30.0,
         enable_null_ciphers: bool = False,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        session_cache: Optional[TLSSessionCache] = None,
+        enable_resumption: bool = True,
     ):
         """Initialize TLS client with connection parameters.
 
@@ -100,6 +180,11 @@ class PSKTLSClient:
             psk_key: PSK key bytes (16 or 32 bytes).
             timeout: Connection and read timeout in seconds.
             enable_null_ciphers: Enable NULL ciphers for testing (DANGEROUS - no encryption).
+            ssl_context: SSL context to reuse (must match identity, key and ciphers).
+                A new context is created on first connect if None.
+            session_cache: Session cache for resumption. Uses the shared
+                default cache if None.
+            enable_resumption: Offer cached sessions on connect.
 
         Note:
             Per GlobalPlatform GPC_SPE_011 Table 3-2, the following cipher suites are supported:
@@ -124,6 +209,13 @@ class PSKTLSClient:
         self._connected = False
         self._connection_info: Optional[TLSConnectionInfo] = None
 
+        # Session resumption
+        self._ssl_context = ssl_context
+        self._session_cache = (
+            session_cache if session_cache is not None else self.default_session_cache
+        )
+        self._enable_resumption = enable_resumption
+
         # Warn about NULL ciphers
         if enable_null_ciphers:
             logger.warning(
@@ -140,6 +232,16 @@ class PSKTLSClient:
         """Get connection information."""
         return self._connection_info
 
+    @property
+    def ssl_context(self) -> Optional[ssl.SSLContext]:
+        """Get SSL context used by this client (None before first connect)."""
+        return self._ssl_context
+
+    @property
+    def session_key(self) -> SessionKey:
+        """Get session cache key for this client."""
+        return (self.host, self.port, self.psk_identity)
+
     def _get_cipher_string(self) -> str:
         """Get OpenSSL cipher string for enabled ciphers.
 
@@ -154,6 +256,9 @@ class PSKTLSClient:
     def _create_ssl_context(self) -> ssl.SSLContext:
         """Create SSL context for PSK-TLS client mode.
 
+        The context carries the PSK client callback and cipher list, so it
+        can be reused for every connection of the same card.
+
         Returns:
             Configured SSL context.
 
@@ -168,18 +273,23 @@ class PSKTLSClient:
                 "Install with: pip install sslpsk3"
             ) from e
 
-        # Create context for TLS client
-        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        # Create context for TLS 1.2 client
+        context = sslpsk3.SSLPSKContext(ssl.PROTOCOL_TLSv1_2)
         context.check_hostname = False
         context.verify_mode = ssl.CERT_NONE
 
         # Set cipher suites
+        # Uses cipher suites per GlobalPlatform GPC_SPE_011 Table 3-2
         try:
-            context.set_ciphers(":".join(self.PSK_CIPHERS))
+            context.set_ciphers(self._get_cipher_string())
         except ssl.SSLError:
             # Fallback to PSK cipher filter
             context.set_ciphers("PSK")
 
+        identity = self._psk_identity_bytes.decode("utf-8")
+        psk_key = self.psk_key
+        context.set_psk_client_callback(lambda hint: (identity, psk_key))
+
         return context
 
     def _psk_callback(
@@ -214,13 +324,9 @@ class PSKTLSClient:
         start_time = time.monotonic()
         logger.info(f"Connecting to {self.host}:{self.port}...")
 
-        try:
-            import sslpsk3
-        except ImportError as e:
-            raise ImportError(
-                "sslpsk3 library is required for PSK-TLS support. "
-                "Install with: pip install sslpsk3"
-            ) from e
+        # Created once and reused for every reconnect (raises ImportError without sslpsk3)
+        if self._ssl_context is None:
+            self._ssl_context = self._create_ssl_context()
 
         try:
             # Create TCP socket
@@ -240,21 +346,20 @@ class PSKTLSClient:
             except socket.error as e:
                 raise ConnectionError(f"Failed to connect to {self.host}:{self.port}: {e}")
 
-            # Wrap socket with PSK-TLS
-            # Uses cipher suites per GlobalPlatform GPC_SPE_011 Table 3-2
+            # Wrap socket with PSK-TLS, offering a cached session if available
+            session: Optional[ssl.SSLSession] = None
             try:
-                cipher_string = self._get_cipher_string()
-                logger.debug(f"Using cipher suites: {cipher_string}")
+                if self._enable_resumption:
+                    session = self._session_cache.get(self.session_key, self._ssl_context)
 
-                # sslpsk3 client callback returns (psk, identity) - PSK first, then identity
-                self._ssl_socket = sslpsk3.wrap_socket(
+                self._ssl_socket = self._ssl_context.wrap_socket(
                     self._socket,
-                    psk=lambda hint: (self.psk_key, self._psk_identity_bytes),
                     server_side=False,
-                    ssl_version=ssl.PROTOCOL_TLSv1_2,
-                    ciphers=cipher_string,
+                    session=session,
                 )
             except ssl.SSLError as e:
+                if session is not None:
+                    self._session_cache.discard(self.session_key)
                 error_msg = str(e)
                 if "unknown_psk_identity" in error_msg.lower():
                     raise HandshakeError(f"Unknown PSK identity: {self.psk_identity}")
@@ -265,6 +370,12 @@ class PSKTLSClient:
             except Exception as e:
                 raise HandshakeError(f"Failed to wrap socket with PSK-TLS: {e}")
 
+            session_resumed = bool(self._ssl_socket.session_reused)
+            if self._enable_resumption and self._ssl_socket.session is not None:
+                self._session_cache.put(
+                    self.session_key, self._ssl_context, self._ssl_socket.session
+                )
+
             # Keep socket blocking for synchronous I/O
             # We'll use sync read/write wrapped in run_in_executor for async
             self._ssl_socket.setblocking(True)
@@ -286,13 +397,15 @@ class PSKTLSClient:
                 protocol_version=self._ssl_socket.version() or "TLSv1.2",
                 handshake_duration_ms=handshake_duration_ms,
                 server_address=f"{self.host}:{self.port}",
+                session_resumed=session_resumed,
             )
 
             self._connected = True
             logger.info(
                 f"Connected to {self.host}:{self.port} "
                 f"(cipher: {self._connection_info.cipher_suite}, "
-                f"handshake: {handshake_duration_ms:.1f}ms)"
+                f"handshake: {handshake_duration_ms:.1f}ms"
+                f"{', resumed' if session_resumed else ''})"
             )
 
             return self._connection_info
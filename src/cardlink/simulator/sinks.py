@@ -0,0 +1,495 @@
+"""Streaming result sinks for simulator runs.
+
+This module provides sinks that receive every APDU exchange and session
+result as soon as it completes. Records are buffered in a small bounded
+buffer and written in batches by a background thread, so long soak runs
+use constant memory, the simulator never waits for the destination, and
+results can be followed live while the run is still in progress.
+
+Supported destinations:
+    ndjson: Newline-delimited JSON file (``tail -f`` friendly).
+    sqlite: Local SQLite database in WAL mode (queryable during the run).
+    unix: NDJSON stream to a Unix domain socket listener.
+"""
+
+import json
+import logging
+import queue
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from .models import APDUExchange, SessionResult
+
+logger = logging.getLogger(__name__)
+
+
+class ResultSinkError(Exception):
+    """Error raised for invalid sink specifications."""
+
+    pass
+
+
+class ResultSink(ABC):
+    """Base class for streaming result sinks.
+
+    Records are appended to a bounded buffer which is handed to a
+    background writer thread when it reaches ``buffer_size`` records or
+    when ``flush_interval`` seconds have passed since the last flush; the
+    writer thread also flushes a stale buffer on its own when no new
+    records arrive. Writing to the destination therefore never blocks
+    the caller (the simulator's event loop). At most ``max_pending``
+    batches wait for the writer; further batches, and records that fail
+    to write, are counted as dropped instead of propagating errors.
+
+    Attributes:
+        buffer_size: Maximum number of records held before flushing.
+        flush_interval: Maximum age in seconds of buffered records.
+        max_pending: Maximum number of batches waiting for the writer.
+
+    Example:
+        >>> with NDJSONResultSink("results.ndjson") as sink:
+        ...     simulator = MobileSimulator(config, result_sink=sink)
+        ...     await simulator.run_complete_session()
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = 256,
+        flush_interval: float = 1.0,
+        max_pending: int = 16,
+    ):
+        """Initialize sink buffer.
+
+        Args:
+            buffer_size: Maximum number of records held before flushing.
+            flush_interval: Maximum age in seconds of buffered records.
+            max_pending: Maximum number of batches waiting for the writer.
+        """
+        self.buffer_size = max(1, buffer_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._buffer: List[Dict[str, Any]] = []
+        self._last_flush = time.monotonic()
+        self._queue: "queue.Queue[Optional[List[Dict[str, Any]]]]" = queue.Queue(
+            maxsize=self.max_pending
+        )
+        self._pending = 0  # Batches queued or being written
+        self._writer: Optional[threading.Thread] = None
+        self._records_written = 0
+        self._records_dropped = 0
+        self._closed = False
+
+    @property
+    def records_written(self) -> int:
+        """Get number of records successfully written."""
+        return self._records_written
+
+    @property
+    def records_dropped(self) -> int:
+        """Get number of records lost to write failures or a full queue."""
+        return self._records_dropped
+
+    @property
+    def closed(self) -> bool:
+        """Check if the sink has been closed."""
+        return self._closed
+
+    def write_exchange(self, session_id: str, exchange: APDUExchange) -> None:
+        """Queue an APDU exchange record.
+
+        Args:
+            session_id: Session the exchange belongs to.
+            exchange: Completed APDU exchange.
+        """
+        record = exchange.to_dict()
+        record["type"] = "exchange"
+        record["session_id"] = session_id
+        self._append(record)
+
+    def write_session(self, result: SessionResult) -> None:
+        """Queue a session result record.
+
+        The session record carries the summary only; individual exchanges
+        are streamed separately via :meth:`write_exchange`.
+
+        Args:
+            result: Completed session result.
+        """
+        record = result.get_summary()
+        record["type"] = "session"
+        self._append(record)
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        """Append record to buffer, handing it off when full or stale."""
+        with self._lock:
+            if self._closed:
+                self._records_dropped += 1
+                return
+
+            self._buffer.append(record)
+            self._start_writer()
+            if (
+                len(self._buffer) < self.buffer_size
+                and time.monotonic() - self._last_flush < self.flush_interval
+            ):
+                return
+        self._hand_off(block=False)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Write all buffered records and wait for the writer.
+
+        Blocks the caller; the simulator itself never calls it.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if every handed-off record has been processed.
+        """
+        self._hand_off(block=True)
+        return self.wait(timeout)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the writer has processed every handed-off batch.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if no batches are pending.
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self) -> None:
+        """Flush remaining records, stop the writer and release the destination."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._hand_off(block=True)
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+        self._close()
+
+    def _start_writer(self) -> None:
+        """Start the writer thread on first use (call with the lock held)."""
+        if self._writer is None:
+            self._writer = threading.Thread(
+                target=self._run_writer, name=f"{type(self).__name__}-writer", daemon=True
+            )
+            self._writer.start()
+
+    def _hand_off(self, block: bool) -> None:
+        """Queue the buffered records for the writer thread."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            records, self._buffer = self._buffer, []
+            self._pending += 1
+            self._start_writer()
+        try:
+            self._queue.put(records, block=block)
+        except queue.Full:
+            logger.warning(f"{type(self).__name__} dropped {len(records)} records: queue full")
+            self._finish_batch(written=0, dropped=len(records))
+
+    def _run_writer(self) -> None:
+        """Write queued batches; flush stale buffers when idle."""
+        while True:
+            try:
+                records = self._queue.get(timeout=max(self.flush_interval, 0.01))
+            except queue.Empty:
+                if self._buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                    self._hand_off(block=False)
+                continue
+            if records is None:
+                return
+            try:
+                self._write_records(records)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"{type(self).__name__} dropped {len(records)} records: {e}")
+                self._finish_batch(written=0, dropped=len(records))
+            else:
+                self._finish_batch(written=len(records), dropped=0)
+
+    def _finish_batch(self, written: int, dropped: int) -> None:
+        """Count a processed batch and wake up waiters."""
+        with self._idle:
+            self._records_written += written
+            self._records_dropped += dropped
+            self._pending -= 1
+            self._idle.notify_all()
+
+    @abstractmethod
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        """Write a batch of records to the destination (on the writer thread).
+
+        Args:
+            records: Records to write, in arrival order.
+        """
+
+    def _close(self) -> None:
+        """Release destination resources."""
+
+    def __enter__(self) -> "ResultSink":
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+
+def _encode_records(records: List[Dict[str, Any]]) -> bytes:
+    """Encode records as NDJSON bytes."""
+    return "".join(
+        json.dumps(record, separators=(",", ":"), default=str) + "\n" for record in records
+    ).encode("utf-8")
+
+
+class NDJSONResultSink(ResultSink):
+    """Result sink appending newline-delimited JSON to a file.
+
+    Example:
+        >>> sink = NDJSONResultSink("soak.ndjson")
+    """
+
+    def __init__(self, path: Union[str, Path], **kwargs: Any):
+        """Open NDJSON file for appending.
+
+        Args:
+            path: Output file path.
+            **kwargs: Buffer options passed to :class:`ResultSink`.
+        """
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab")
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        self._file.write(_encode_records(records))
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class SQLiteResultSink(ResultSink):
+    """Result sink storing records in a local SQLite database.
+
+    Exchanges and sessions are written to the ``exchanges`` and
+    ``sessions`` tables. The database uses WAL journaling so it can be
+    queried by other processes while the run is in progress.
+
+    Example:
+        >>> sink = SQLiteResultSink("soak.db")
+    """
+
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS exchanges ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " session_id TEXT NOT NULL,"
+        " timestamp TEXT,"
+        " ins INTEGER,"
+        " description TEXT,"
+        " command TEXT,"
+        " response TEXT,"
+        " sw TEXT,"
+        " duration_ms REAL)",
+        "CREATE INDEX IF NOT EXISTS idx_exchanges_session ON exchanges (session_id)",
+        "CREATE TABLE IF NOT EXISTS sessions ("
+        " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " session_id TEXT NOT NULL,"
+        " success INTEGER,"
+        " duration_seconds REAL,"
+        " apdu_count INTEGER,"
+        " final_sw TEXT,"
+        " error TEXT,"
+        " cipher_suite TEXT,"
+        " psk_identity TEXT,"
+        " iccid TEXT,"
+        " imsi TEXT)",
+    )
+
+    _EXCHANGE_COLUMNS = (
+        "session_id",
+        "timestamp",
+        "ins",
+        "description",
+        "command",
+        "response",
+        "sw",
+        "duration_ms",
+    )
+    _SESSION_COLUMNS = (
+        "session_id",
+        "success",
+        "duration_seconds",
+        "apdu_count",
+        "final_sw",
+        "error",
+        "cipher_suite",
+        "psk_identity",
+        "iccid",
+        "imsi",
+    )
+
+    def __init__(self, path: Union[str, Path], **kwargs: Any):
+        """Open SQLite database and create tables.
+
+        Args:
+            path: Database file path.
+            **kwargs: Buffer options passed to :class:`ResultSink`.
+        """
+        super().__init__(**kwargs)
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Written from the writer thread, closed after it has stopped
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+        self._insert_exchange = (
+            f"INSERT INTO exchanges ({', '.join(self._EXCHANGE_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(self._EXCHANGE_COLUMNS))})"
+        )
+        self._insert_session = (
+            f"INSERT INTO sessions ({', '.join(self._SESSION_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(self._SESSION_COLUMNS))})"
+        )
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        exchanges = [
+            tuple(r.get(c) for c in self._EXCHANGE_COLUMNS)
+            for r in records
+            if r["type"] == "exchange"
+        ]
+        sessions = [
+            tuple(r.get(c) for c in self._SESSION_COLUMNS)
+            for r in records
+            if r["type"] == "session"
+        ]
+        with self._conn:
+            if exchanges:
+                self._conn.executemany(self._insert_exchange, exchanges)
+            if sessions:
+                self._conn.executemany(self._insert_session, sessions)
+
+    def _close(self) -> None:
+        self._conn.close()
+
+
+class UnixSocketResultSink(ResultSink):
+    """Result sink streaming NDJSON to a Unix domain socket.
+
+    The socket is connected lazily and reconnected on the next flush
+    after a failure. Records that cannot be delivered are dropped, so a
+    missing or slow listener never stalls the simulator.
+
+    Example:
+        >>> sink = UnixSocketResultSink("/tmp/cardlink-results.sock")
+    """
+
+    def __init__(self, path: Union[str, Path], timeout: float = 1.0, **kwargs: Any):
+        """Initialize socket sink.
+
+        Args:
+            path: Path of the listening Unix socket.
+            timeout: Socket connect/send timeout in seconds.
+            **kwargs: Buffer options passed to :class:`ResultSink`.
+        """
+        super().__init__(**kwargs)
+        self.path = str(path)
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+
+    def _connect(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _write_records(self, records: List[Dict[str, Any]]) -> None:
+        if self._sock is None:
+            self._sock = self._connect()
+        try:
+            self._sock.sendall(_encode_records(records))
+        except OSError:
+            self._close()
+            raise
+
+    def _close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+
+_SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+
+def create_sink(spec: str, **kwargs: Any) -> ResultSink:
+    """Create a result sink from a destination specification.
+
+    The specification is either ``<kind>:<path>`` where kind is one of
+    ``ndjson``, ``sqlite`` or ``unix``, or a bare path whose extension
+    selects the sink (``.db``/``.sqlite``/``.sqlite3`` for SQLite,
+    ``.sock`` for a Unix socket, NDJSON otherwise).
+
+    Args:
+        spec: Destination specification.
+        **kwargs: Buffer options passed to the sink.
+
+    Returns:
+        Configured ResultSink instance.
+
+    Raises:
+        ResultSinkError: If the specification is empty or has an unknown kind.
+
+    Example:
+        >>> sink = create_sink("sqlite:results/soak.db")
+        >>> sink = create_sink("results.ndjson")
+    """
+    if not spec:
+        raise ResultSinkError("Empty result sink specification")
+
+    kind, sep, path = spec.partition(":")
+    if not sep or not kind.isalpha() or len(kind) == 1:
+        # Bare path (a single letter before ':' is a Windows drive)
+        path = spec
+        suffix = Path(spec).suffix.lower()
+        if suffix in _SQLITE_SUFFIXES:
+            kind = "sqlite"
+        elif suffix == ".sock":
+            kind = "unix"
+        else:
+            kind = "ndjson"
+
+    kind = kind.lower()
+    if not path:
+        raise ResultSinkError(f"Missing path in result sink specification: {spec}")
+    if kind == "ndjson":
+        return NDJSONResultSink(path, **kwargs)
+    if kind == "sqlite":
+        return SQLiteResultSink(path, **kwargs)
+    if kind == "unix":
+        return UnixSocketResultSink(path, **kwargs)
+    raise ResultSinkError(f"Unknown result sink type: {kind}")
@@ -10,10 +10,14 @@ Implements:
 - SCP '81' (PSK-TLS) key management
 """
 
+import functools
+import hashlib
 import logging
 import os
+import weakref
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Callable, Dict, List, Optional, Tuple, Any
+from typing import Callable, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Any
 
 from .config import UICCProfile
 from .models import VirtualApplet
@@ -87,6 +91,28 @@ class SW:
         return f"6C{correct_le:02X}"
 
 
+# Status word hex -> bytes, decoded once per distinct SW instead of per response
+_sw_bytes: Callable[[str], bytes] = functools.lru_cache(maxsize=None)(bytes.fromhex)
+
+
+# =============================================================================
+# Command Dispatch
+# =============================================================================
+
+# CLA classes used as the first component of the dispatch key
+CLA_CLASS_ISO = 0x00
+CLA_CLASS_PROPRIETARY = 0x80
+
+# Dispatch flags
+CMD_CACHEABLE = 0x01  # Response depends only on command bytes and card content
+CMD_MUTATING = 0x02  # Command changes card content; invalidates cached responses
+
+
+def _dispatch_key(cla: int, ins: int, p1: int) -> int:
+    """Pack (CLA class, INS, P1) into a single integer dispatch key."""
+    return ((cla & 0x80) << 16) | (ins << 8) | p1
+
+
 # =============================================================================
 # PSK Key Storage (GP SCP81)
 # =============================================================================
@@ -121,20 +147,96 @@ class PSKKeyEntry:
         return self.key_data[:3] if len(self.key_data) >= 3 else b"\x00\x00\x00"
 
 
+class LoadFilePayload:
+    """Immutable load file content shared by every card that loaded it.
+
+    Attributes:
+        digest: SHA-256 digest of the content (hex string).
+        data: Complete load file bytes.
+    """
+
+    __slots__ = ("digest", "data", "__weakref__")
+
+    def __init__(self, digest: str, data: bytes):
+        self.digest = digest
+        self.data = data
+
+
+# Retained load file payloads by digest. Entries live as long as at least one
+# card references them, so identical CAP files pushed to a fleet are stored once.
+_payload_pool: "weakref.WeakValueDictionary[str, LoadFilePayload]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _intern_payload(data: bytes, digest: str) -> LoadFilePayload:
+    """Return the shared payload for ``digest``, registering ``data`` if new."""
+    payload = _payload_pool.get(digest)
+    if payload is None:
+        payload = LoadFilePayload(digest, data)
+        _payload_pool[digest] = payload
+    return payload
+
+
 @dataclass
 class LoadFileEntry:
     """Executable Load File entry.
 
+    LOAD blocks are streamed through a running SHA-256 hash; only the block
+    count and total size are kept. When ``retain_data`` is set, blocks are
+    buffered until the last block and then replaced by a payload shared
+    with every other card that loaded identical content.
+
     Attributes:
         aid: Load file AID.
         lifecycle: Lifecycle state (0x01=Loaded, 0x07=Ready).
         modules: List of module AIDs contained.
-        data_blocks: Loaded data blocks.
+        retain_data: Keep the full load file content.
+        data_blocks: Buffered data blocks of an in-progress retained load.
+        block_count: Number of LOAD blocks received.
+        total_size: Total number of bytes received.
+        complete: Whether the last block has been received.
+        payload: Shared load file content (retained loads only).
     """
     aid: bytes
     lifecycle: int = 0x01
     modules: List[bytes] = field(default_factory=list)
+    retain_data: bool = False
     data_blocks: List[bytes] = field(default_factory=list)
+    block_count: int = 0
+    total_size: int = 0
+    complete: bool = False
+    payload: Optional[LoadFilePayload] = field(default=None, repr=False)
+    _hash: Any = field(default_factory=hashlib.sha256, repr=False, compare=False)
+
+    def add_block(self, block: bytes, is_last: bool = False) -> None:
+        """Consume a LOAD data block.
+
+        Args:
+            block: Block data.
+            is_last: Whether this is the last block of the load file.
+        """
+        self._hash.update(block)
+        self.block_count += 1
+        self.total_size += len(block)
+        if self.retain_data:
+            self.data_blocks.append(block)
+
+        if is_last:
+            self.complete = True
+            if self.retain_data:
+                self.payload = _intern_payload(b"".join(self.data_blocks), self.digest)
+                self.data_blocks = []
+
+    @property
+    def digest(self) -> str:
+        """Get SHA-256 digest (hex) of the data received so far."""
+        return self._hash.hexdigest()
+
+    @property
+    def data(self) -> Optional[bytes]:
+        """Get complete load file content, or None if not retained."""
+        return self.payload.data if self.payload else None
 
 
 # =============================================================================
@@ -142,6 +244,29 @@ class LoadFileEntry:
 # =============================================================================
 
 
+INS_NAMES: Dict[int, str] = {
+    0xA4: "SELECT",
+    0xB0: "READ BINARY",
+    0xB2: "READ RECORD",
+    0xC0: "GET RESPONSE",
+    0xCA: "GET DATA",
+    0xD6: "UPDATE BINARY",
+    0xDC: "UPDATE RECORD",
+    0xE2: "STORE DATA",
+    0xE4: "DELETE",
+    0xE6: "INSTALL",
+    0xE8: "LOAD",
+    0xF2: "GET STATUS",
+    0xF0: "SET STATUS",
+    0x50: "INITIALIZE UPDATE",
+    0x82: "EXTERNAL AUTHENTICATE",
+    0x84: "GET CHALLENGE",
+    0xD8: "PUT KEY",
+}
+
+RAM_INS: FrozenSet[int] = frozenset({0xE4, 0xE6, 0xE8, 0xF2, 0xF0, 0xD8, 0xE2})
+
+
 @dataclass
 class ParsedAPDU:
     """Parsed APDU command.
@@ -225,32 +350,26 @@ class ParsedAPDU:
     @property
     def ins_name(self) -> str:
         """Get human-readable INS name."""
-        names = {
-            0xA4: "SELECT",
-            0xB0: "READ BINARY",
-            0xB2: "READ RECORD",
-            0xC0: "GET RESPONSE",
-            0xCA: "GET DATA",
-            0xD6: "UPDATE BINARY",
-            0xDC: "UPDATE RECORD",
-            0xE2: "STORE DATA",
-            0xE4: "DELETE",
-            0xE6: "INSTALL",
-            0xE8: "LOAD",
-            0xF2: "GET STATUS",
-            0xF0: "SET STATUS",
-            0x50: "INITIALIZE UPDATE",
-            0x82: "EXTERNAL AUTHENTICATE",
-            0x84: "GET CHALLENGE",
-            0xD8: "PUT KEY",
-        }
-        return names.get(self.ins, f"INS_{self.ins:02X}")
+        return INS_NAMES.get(self.ins, f"INS_{self.ins:02X}")
 
     @property
     def is_ram_command(self) -> bool:
         """Check if this is a RAM (Remote Application Management) command."""
-        ram_ins = {0xE4, 0xE6, 0xE8, 0xF2, 0xF0, 0xD8, 0xE2}
-        return self.ins in ram_ins
+        return self.ins in RAM_INS
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_fci(aid: bytes) -> bytes:
+    """Encode the FCI template for an AID (memoized, shared by all cards)."""
+    # Simple FCI response
+    aid_tlv = bytes([0x84, len(aid)]) + aid
+    lifecycle_tlv = bytes([0x9F, 0x6E, 0x01, 0x01])  # Loaded state
+
+    a5_content = lifecycle_tlv
+    a5_tlv = bytes([0xA5, len(a5_content)]) + a5_content
+
+    fci_content = aid_tlv + a5_tlv
+    return bytes([0x6F, len(fci_content)]) + fci_content
 
 
 # =============================================================================
@@ -273,6 +392,35 @@ class VirtualUICC:
         >>> print(r_apdu.hex().upper())
     """
 
+    # Command table: (INS, handler name, dispatch flags, accepted P1 values).
+    # A P1 set of None accepts every P1; other P1 values are rejected with 6A86
+    # directly by the dispatch table.
+    COMMAND_TABLE: Tuple[Tuple[int, str, int, Optional[FrozenSet[int]]], ...] = (
+        # Standard commands
+        (0xA4, "_handle_select", 0, frozenset({0x00, 0x04})),
+        (0xC0, "_handle_get_response", 0, None),
+        (0xCA, "_handle_get_data", CMD_CACHEABLE, None),
+        (0xE2, "_handle_store_data", CMD_MUTATING, None),
+        (0xF2, "_handle_get_status", CMD_CACHEABLE, frozenset({0x40, 0x20, 0x10, 0x80})),
+        (0x50, "_handle_initialize_update", 0, None),
+        (0x82, "_handle_external_authenticate", 0, None),
+        (0x84, "_handle_get_challenge", 0, None),
+        # RAM commands (GP Amendment B)
+        (0xE4, "_handle_delete", CMD_MUTATING, None),
+        (0xE6, "_handle_install", CMD_MUTATING, None),
+        (0xE8, "_handle_load", CMD_MUTATING, None),
+        (0xD8, "_handle_put_key", CMD_MUTATING, None),
+        (0xF0, "_handle_set_status", CMD_MUTATING, None),
+    )
+
+    # Maximum number of distinct C-APDUs kept in the response cache (LRU)
+    RESPONSE_CACHE_SIZE = 64
+
+    # Compiled dispatch table, built on first use by each class
+    _compiled_dispatch: ClassVar[
+        Optional[Dict[int, Tuple[Callable[["VirtualUICC", ParsedAPDU], bytes], int]]]
+    ] = None
+
     def __init__(self, profile: UICCProfile):
         """Initialize with UICC profile.
 
@@ -302,24 +450,12 @@ class VirtualUICC:
         self._load_count: int = 0
         self._put_key_count: int = 0
 
-        # Command handlers (including RAM commands)
-        self._handlers: Dict[int, Callable[[ParsedAPDU], bytes]] = {
-            # Standard commands
-            0xA4: self._handle_select,
-            0xC0: self._handle_get_response,
-            0xCA: self._handle_get_data,
-            0xE2: self._handle_store_data,
-            0xF2: self._handle_get_status,
-            0x50: self._handle_initialize_update,
-            0x82: self._handle_external_authenticate,
-            0x84: self._handle_get_challenge,
-            # RAM commands (GP Amendment B)
-            0xE4: self._handle_delete,
-            0xE6: self._handle_install,
-            0xE8: self._handle_load,
-            0xD8: self._handle_put_key,
-            0xF0: self._handle_set_status,
-        }
+        # Compiled (CLA class, INS, P1) dispatch table, shared per class
+        self._dispatch = type(self)._get_dispatch_table()
+
+        # Cached responses for state-independent commands, keyed by raw C-APDU
+        self._response_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._response_cache_hits: int = 0
 
         # Pending response data (for GET RESPONSE)
         self._pending_response: bytes = b""
@@ -352,6 +488,8 @@ class VirtualUICC:
         self._install_count = 0
         self._load_count = 0
         self._put_key_count = 0
+        self._response_cache.clear()
+        self._response_cache_hits = 0
         logger.debug("UICC state reset (including PSK keys and load files)")
 
     @property
@@ -385,8 +523,47 @@ class VirtualUICC:
             "put_key_count": self._put_key_count,
             "psk_key_count": len(self._psk_keys),
             "load_file_count": len(self._load_files),
+            "response_cache_hits": self._response_cache_hits,
         }
 
+    @classmethod
+    def _get_dispatch_table(
+        cls,
+    ) -> Dict[int, Tuple[Callable[["VirtualUICC", ParsedAPDU], bytes], int]]:
+        """Get the compiled dispatch table for this class.
+
+        The table is built once per class from COMMAND_TABLE and maps every
+        (CLA class, INS, P1) combination to an unbound handler and its flags,
+        so subclasses overriding handlers get their own table.
+
+        Returns:
+            Dictionary of packed dispatch key -> (handler, flags).
+        """
+        table = cls.__dict__.get("_compiled_dispatch")
+        if table is not None:
+            return table
+
+        table = {}
+        for ins, name, flags, valid_p1 in cls.COMMAND_TABLE:
+            handler = getattr(cls, name)
+            for cla_class in (CLA_CLASS_ISO, CLA_CLASS_PROPRIETARY):
+                for p1 in range(256):
+                    if valid_p1 is None or p1 in valid_p1:
+                        table[_dispatch_key(cla_class, ins, p1)] = (handler, flags)
+                    else:
+                        table[_dispatch_key(cla_class, ins, p1)] = (cls._reject_p1p2, 0)
+
+        cls._compiled_dispatch = table
+        return table
+
+    def invalidate_response_cache(self) -> None:
+        """Drop all cached responses.
+
+        Called automatically by mutating commands. Call it explicitly after
+        changing the profile (e.g. its applet list) of a live card.
+        """
+        self._response_cache.clear()
+
     def process_apdu(self, apdu: bytes) -> bytes:
         """Process C-APDU and return R-APDU.
 
@@ -399,27 +576,47 @@ class VirtualUICC:
         Example:
             >>> r_apdu = uicc.process_apdu(bytes.fromhex("00A4040007A000000151000000"))
         """
+        if not isinstance(apdu, bytes):
+            apdu = bytes(apdu)
+
+        cached = self._response_cache.get(apdu)
+        if cached is not None:
+            self._response_cache.move_to_end(apdu)
+            self._response_cache_hits += 1
+            return cached
+
         try:
             parsed = ParsedAPDU.parse(apdu)
-            logger.debug(
-                f"Processing {parsed.ins_name} (CLA={parsed.cla:02X} INS={parsed.ins:02X} "
-                f"P1={parsed.p1:02X} P2={parsed.p2:02X})"
-            )
-
-            # Find handler
-            handler = self._handlers.get(parsed.ins)
-            if handler:
-                return handler(parsed)
-            else:
+
+            entry = self._dispatch.get(_dispatch_key(parsed.cla, parsed.ins, parsed.p1))
+            if entry is None:
                 logger.warning(f"Unsupported instruction: INS={parsed.ins:02X}")
-                return bytes.fromhex(SW.INS_NOT_SUPPORTED)
+                return _sw_bytes(SW.INS_NOT_SUPPORTED)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Processing {parsed.ins_name} (CLA={parsed.cla:02X} INS={parsed.ins:02X} "
+                    f"P1={parsed.p1:02X} P2={parsed.p2:02X})"
+                )
+
+            handler, flags = entry
+            if flags & CMD_MUTATING and self._response_cache:
+                self._response_cache.clear()
+
+            response = handler(self, parsed)
+
+            if flags & CMD_CACHEABLE:
+                self._response_cache[apdu] = response
+                if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
+            return response
 
         except ValueError as e:
             logger.error(f"APDU parse error: {e}")
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
         except Exception as e:
             logger.error(f"APDU processing error: {e}")
-            return bytes.fromhex(SW.UNKNOWN_ERROR)
+            return _sw_bytes(SW.UNKNOWN_ERROR)
 
     def _make_response(self, data: bytes, sw: str) -> bytes:
         """Build R-APDU response.
@@ -431,7 +628,7 @@ class VirtualUICC:
         Returns:
             Complete R-APDU bytes.
         """
-        return data + bytes.fromhex(sw)
+        return data + _sw_bytes(sw)
 
     def _handle_select(self, apdu: ParsedAPDU) -> bytes:
         """Handle SELECT command (INS=A4).
@@ -488,10 +685,10 @@ class VirtualUICC:
                     logger.info("Selected MF")
                     return self._make_response(b"", SW.SUCCESS)
 
-            return bytes.fromhex(SW.FILE_NOT_FOUND)
+            return _sw_bytes(SW.FILE_NOT_FOUND)
 
         else:
-            return bytes.fromhex(SW.INCORRECT_P1P2)
+            return _sw_bytes(SW.INCORRECT_P1P2)
 
     def _build_fci(self, aid: bytes) -> bytes:
         """Build FCI (File Control Information) response.
@@ -508,17 +705,11 @@ class VirtualUICC:
         #   - Life Cycle State (9F6E): 01 (Loaded)
         #   - Security Domain Management Data (73): ...
 
-        # Simple FCI response
-        aid_tlv = bytes([0x84, len(aid)]) + aid
-        lifecycle_tlv = bytes([0x9F, 0x6E, 0x01, 0x01])  # Loaded state
-
-        a5_content = lifecycle_tlv
-        a5_tlv = bytes([0xA5, len(a5_content)]) + a5_content
+        return _encode_fci(bytes(aid))
 
-        fci_content = aid_tlv + a5_tlv
-        fci = bytes([0x6F, len(fci_content)]) + fci_content
-
-        return fci
+    def _reject_p1p2(self, apdu: ParsedAPDU) -> bytes:
+        """Reject a command whose P1 is not accepted by its handler."""
+        return _sw_bytes(SW.INCORRECT_P1P2)
 
     def _handle_get_response(self, apdu: ParsedAPDU) -> bytes:
         """Handle GET RESPONSE command (INS=C0).
@@ -530,7 +721,7 @@ class VirtualUICC:
             R-APDU response.
         """
         if not self._pending_response:
-            return bytes.fromhex(SW.CONDITIONS_NOT_SATISFIED)
+            return _sw_bytes(SW.CONDITIONS_NOT_SATISFIED)
 
         le = apdu.le or 256
         data = self._pending_response[:le]
@@ -572,7 +763,7 @@ class VirtualUICC:
             return self._make_response(data, SW.SUCCESS)
         else:
             logger.debug(f"GET DATA for unknown tag: {tag:04X}")
-            return bytes.fromhex(SW.FILE_NOT_FOUND)
+            return _sw_bytes(SW.FILE_NOT_FOUND)
 
     def _handle_store_data(self, apdu: ParsedAPDU) -> bytes:
         """Handle STORE DATA command (INS=E2).
@@ -585,7 +776,7 @@ class VirtualUICC:
         """
         # Accept any STORE DATA (simulating successful storage)
         logger.debug(f"STORE DATA: {len(apdu.data)} bytes")
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_get_status(self, apdu: ParsedAPDU) -> bytes:
         """Handle GET STATUS command (INS=F2).
@@ -611,7 +802,7 @@ class VirtualUICC:
         elif apdu.p1 in (0x20, 0x10, 0x80):
             # Return registered applets
             if not self.profile.applets:
-                return bytes.fromhex(SW.FILE_NOT_FOUND)
+                return _sw_bytes(SW.FILE_NOT_FOUND)
 
             entries = b""
             for applet in self.profile.applets:
@@ -623,7 +814,7 @@ class VirtualUICC:
             return self._make_response(entries, SW.SUCCESS)
 
         else:
-            return bytes.fromhex(SW.INCORRECT_P1P2)
+            return _sw_bytes(SW.INCORRECT_P1P2)
 
     def _build_status_entry(
         self, aid: bytes, lifecycle: int = 0x07, privileges: int = 0x00
@@ -652,7 +843,7 @@ class VirtualUICC:
         """
         # Host challenge is in data
         if len(apdu.data) != 8:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         host_challenge = apdu.data
         logger.debug(f"INITIALIZE UPDATE with host challenge: {host_challenge.hex().upper()}")
@@ -683,7 +874,7 @@ class VirtualUICC:
         # Accept any authentication (simulated)
         logger.debug("EXTERNAL AUTHENTICATE (simulated success)")
         self._security_level = apdu.p1  # Security level from P1
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_get_challenge(self, apdu: ParsedAPDU) -> bytes:
         """Handle GET CHALLENGE command (INS=84).
@@ -719,17 +910,17 @@ class VirtualUICC:
 
         # Parse delete data - Tag 4F (AID to delete)
         if len(apdu.data) < 3:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         # Simple TLV parsing for AID
         tag = apdu.data[0]
         if tag != 0x4F:
             logger.warning(f"DELETE: Expected tag 4F, got {tag:02X}")
-            return bytes.fromhex(SW.WRONG_DATA)
+            return _sw_bytes(SW.WRONG_DATA)
 
         aid_len = apdu.data[1]
         if len(apdu.data) < 2 + aid_len:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         aid = apdu.data[2:2 + aid_len]
         aid_hex = aid.hex().upper()
@@ -740,18 +931,18 @@ class VirtualUICC:
         if aid_hex in self._load_files:
             del self._load_files[aid_hex]
             logger.debug(f"DELETE: Removed load file {aid_hex}")
-            return bytes.fromhex(SW.SUCCESS)
+            return _sw_bytes(SW.SUCCESS)
 
         # Check if it's an applet in profile
         for i, applet in enumerate(self.profile.applets):
             if applet.aid.upper() == aid_hex:
                 # Remove from profile (simulated)
                 logger.debug(f"DELETE: Removed applet {applet.name}")
-                return bytes.fromhex(SW.SUCCESS)
+                return _sw_bytes(SW.SUCCESS)
 
         # Not found but still return success (simulating card behavior)
         logger.debug(f"DELETE: AID {aid_hex} not found, returning success anyway")
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_install(self, apdu: ParsedAPDU) -> bytes:
         """Handle INSTALL command (INS=E6).
@@ -785,20 +976,20 @@ class VirtualUICC:
             return self._handle_install_for_personalization(apdu)
         else:
             logger.warning(f"INSTALL: Unsupported install type P1={install_type:02X}")
-            return bytes.fromhex(SW.INCORRECT_P1P2)
+            return _sw_bytes(SW.INCORRECT_P1P2)
 
     def _handle_install_for_load(self, apdu: ParsedAPDU) -> bytes:
         """Handle INSTALL [for load] command."""
         # Parse load file AID and security domain AID from data
         if len(apdu.data) < 2:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         offset = 0
         # Load file AID
         lf_aid_len = apdu.data[offset]
         offset += 1
         if offset + lf_aid_len > len(apdu.data):
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
         lf_aid = apdu.data[offset:offset + lf_aid_len]
         offset += lf_aid_len
 
@@ -806,15 +997,17 @@ class VirtualUICC:
         logger.info(f"INSTALL [for load]: Load file AID = {lf_aid_hex}")
 
         # Create new load file entry
-        self._current_load_file = LoadFileEntry(aid=lf_aid, lifecycle=0x01)
+        self._current_load_file = LoadFileEntry(
+            aid=lf_aid, lifecycle=0x01, retain_data=self.profile.retain_load_data
+        )
         self._load_files[lf_aid_hex] = self._current_load_file
 
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_install_for_install(self, apdu: ParsedAPDU) -> bytes:
         """Handle INSTALL [for install] command."""
         if len(apdu.data) < 6:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         offset = 0
         # Executable load file AID
@@ -839,17 +1032,17 @@ class VirtualUICC:
         logger.info(f"INSTALL [for install]: Application AID = {app_aid_hex}")
 
         # Simulated success - applet is now installed
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_install_for_make_selectable(self, apdu: ParsedAPDU) -> bytes:
         """Handle INSTALL [for make selectable] command."""
         logger.info("INSTALL [for make selectable]")
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_install_for_personalization(self, apdu: ParsedAPDU) -> bytes:
         """Handle INSTALL [for personalization] command."""
         logger.info("INSTALL [for personalization]")
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_load(self, apdu: ParsedAPDU) -> bytes:
         """Handle LOAD command (INS=E8).
@@ -869,22 +1062,24 @@ class VirtualUICC:
         is_last_block = (apdu.p1 & 0x80) != 0
         block_number = apdu.p1 & 0x7F
 
-        logger.debug(f"LOAD: Block {block_number}, last={is_last_block}, size={len(apdu.data)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"LOAD: Block {block_number}, last={is_last_block}, size={len(apdu.data)}")
 
         # Store block in current load file
         if self._current_load_file:
-            self._current_load_file.data_blocks.append(apdu.data)
+            load_file = self._current_load_file
+            load_file.add_block(apdu.data, is_last=is_last_block)
             if is_last_block:
-                self._current_load_file.lifecycle = 0x01  # Loaded
-                total_size = sum(len(b) for b in self._current_load_file.data_blocks)
+                load_file.lifecycle = 0x01  # Loaded
                 logger.info(
-                    f"LOAD: Complete - {len(self._current_load_file.data_blocks)} blocks, "
-                    f"{total_size} bytes total"
+                    f"LOAD: Complete - {load_file.block_count} blocks, "
+                    f"{load_file.total_size} bytes total (sha256={load_file.digest[:16]}...)"
                 )
+                self._current_load_file = None
         else:
             logger.warning("LOAD: No current load file (missing INSTALL [for load])")
 
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_put_key(self, apdu: ParsedAPDU) -> bytes:
         """Handle PUT KEY command (INS=D8).
@@ -909,7 +1104,7 @@ class VirtualUICC:
         logger.info(f"PUT KEY: version={key_version}, id={key_id}, multiple={multiple_keys}")
 
         if len(apdu.data) < 3:
-            return bytes.fromhex(SW.WRONG_LENGTH)
+            return _sw_bytes(SW.WRONG_LENGTH)
 
         # Parse key data - format: key_version | key_id | key_data_TLV...
         offset = 0
@@ -959,7 +1154,7 @@ class VirtualUICC:
                         logger.debug(f"PUT KEY: Storing key type {key_type:02X}")
 
         # Return KCV in response (optional)
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     def _handle_set_status(self, apdu: ParsedAPDU) -> bytes:
         """Handle SET STATUS command (INS=F0).
@@ -982,7 +1177,7 @@ class VirtualUICC:
         logger.info(f"SET STATUS: type={status_type:02X}, new_state={new_state:02X}")
 
         # Simulated success
-        return bytes.fromhex(SW.SUCCESS)
+        return _sw_bytes(SW.SUCCESS)
 
     # =========================================================================
     # PSK Key Management Methods
@@ -0,0 +1,63 @@
+"""Shared fixtures for database tests."""
+
+import pytest
+
+from cardlink.database import (
+    CardProfile,
+    DatabaseConfig,
+    DatabaseManager,
+    OTASession,
+    UnitOfWork,
+)
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """Create a database manager backed by a temporary SQLite file.
+
+    Every connection sees the same data, unlike ``sqlite:///:memory:``
+    with the SQLite NullPool.
+    """
+    manager = DatabaseManager(DatabaseConfig(url=f"sqlite:///{tmp_path / 'test.db'}"))
+    manager.initialize()
+    manager.create_tables()
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def session_id(file_db):
+    """Create a card and an OTA session, returning the session ID."""
+    with UnitOfWork(file_db) as uow:
+        card = CardProfile(iccid="89012345678901234567", psk_identity="card_001")
+        uow.cards.create(card)
+        session = OTASession(device_id=None, card_iccid=card.iccid)
+        uow.sessions.create(session)
+        uow.commit()
+        return session.id
+
+
+@pytest.fixture
+def add_session():
+    """Return a helper that adds a session with a given status and creation time.
+
+    Usage: ``add_session(uow, status, created_at, duration_ms=None,
+    cipher_suite=None, iccid=...)``; the session is flushed so its ID is set.
+    """
+
+    def _add_session(
+        uow,
+        status,
+        created_at,
+        duration_ms=None,
+        cipher_suite=None,
+        iccid="89012345678901234567",
+    ):
+        session = OTASession(card_iccid=iccid, status=status, tls_cipher_suite=cipher_suite)
+        session.created_at = created_at
+        session.duration_ms = duration_ms
+        uow.sessions.add(session)
+        uow.flush()
+        return session
+
+    return _add_session
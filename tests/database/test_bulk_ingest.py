@@ -0,0 +1,126 @@
+"""Tests for bulk communication log ingestion."""
+
+import time
+from datetime import datetime
+
+import pytest
+
+from cardlink.database import CommDirection, UnitOfWork
+
+
+class TestLogBatch:
+    """Test LogRepository.log_batch."""
+
+    def test_tuple_rows(self, file_db, session_id):
+        """Test tuple rows are normalized like log_command/log_response."""
+        ts = datetime(2024, 1, 1, 12, 0, 0)
+        with UnitOfWork(file_db) as uow:
+            result = uow.logs.log_batch([
+                (session_id, "command", "80 f2 80 00 02 4f 00", None, None, ts),
+                (session_id, CommDirection.RESPONSE, "6a82", 12.5),
+            ])
+            uow.commit()
+
+        assert result.rows == 2
+        assert result.rows_per_second > 0
+        with UnitOfWork(file_db) as uow:
+            command, response = uow.logs.find_by_session(session_id)
+            assert command.raw_data == "80F28000024F00"
+            assert command.timestamp == ts
+            assert command.status_word is None
+            assert response.is_response
+            assert response.latency_ms == 12.5
+            assert response.status_word == "6A82"
+            assert response.status_message == "File not found"
+
+    def test_columnar_batch(self, file_db, session_id):
+        """Test a columnar batch with optional columns omitted."""
+        with UnitOfWork(file_db) as uow:
+            result = uow.logs.log_batch(
+                {
+                    "session_id": [session_id] * 3,
+                    "direction": ["command", "response", "response"],
+                    "raw_data": ["00A40400", "9000", "6110"],
+                    "latency_ms": [None, 3.0, 4.0],
+                },
+                batch_size=2,
+            )
+            uow.commit()
+
+        assert result.rows == 3
+        with UnitOfWork(file_db) as uow:
+            summary = uow.logs.get_session_summary(session_id)
+            assert summary["command_count"] == 1
+            assert summary["success_count"] == 2
+            assert summary["max_latency_ms"] == 4.0
+
+    def test_generator_input(self, file_db, session_id):
+        """Test rows may come from an iterator."""
+        rows = ((session_id, "command", f"80CA00{i:02X}") for i in range(10))
+        with UnitOfWork(file_db) as uow:
+            assert uow.logs.log_batch(rows, batch_size=3).rows == 10
+            uow.commit()
+            assert uow.logs.count() == 10
+
+    def test_bypasses_orm(self, file_db, session_id):
+        """Test bulk rows never become ORM objects in the session."""
+        rows = [(session_id, "command", f"80CA00{i:02X}") for i in range(100)]
+        with UnitOfWork(file_db) as uow:
+            uow.logs.log_batch(rows, batch_size=30)
+            assert not uow.session.new
+            assert len(uow.session.identity_map) == 0
+            uow.commit()
+            assert uow.logs.count() == 100
+
+    def test_rollback(self, file_db, session_id):
+        """Test bulk rows are part of the unit of work transaction."""
+        with UnitOfWork(file_db) as uow:
+            uow.logs.log_batch([(session_id, "command", "00A40400")])
+
+        with UnitOfWork(file_db) as uow:
+            assert uow.logs.count() == 0
+
+    @pytest.mark.parametrize(
+        "rows",
+        [
+            [("s", "sideways", "00")],
+            [("s", "command")],
+            {"session_id": ["s"], "direction": ["command"]},
+            {"session_id": ["s"], "direction": ["command"], "raw_data": ["00", "00"]},
+            {"session_id": ["s"], "direction": ["command"], "raw_data": ["00"], "bogus": [1]},
+        ],
+    )
+    def test_invalid_rows(self, file_db, rows):
+        """Test malformed batches are rejected."""
+        with UnitOfWork(file_db) as uow:
+            with pytest.raises(ValueError):
+                uow.logs.log_batch(rows)
+
+
+@pytest.mark.slow
+class TestLogIngestPerformance:
+    """Benchmark bulk ingestion against the per-row ORM path."""
+
+    ROWS = 5000
+
+    def test_bulk_faster_than_orm(self, file_db, session_id):
+        """Test log_batch beats log_command/log_response by a wide margin."""
+        with UnitOfWork(file_db) as uow:
+            start = time.perf_counter()
+            for i in range(self.ROWS // 2):
+                uow.logs.log_command(session_id, "80F28000024F00")
+                uow.logs.log_response(session_id, "9000", latency_ms=float(i))
+            uow.commit()
+            orm_rate = self.ROWS / (time.perf_counter() - start)
+
+        rows = []
+        for i in range(self.ROWS // 2):
+            rows.append((session_id, "command", "80F28000024F00"))
+            rows.append((session_id, "response", "9000", float(i)))
+        with UnitOfWork(file_db) as uow:
+            start = time.perf_counter()
+            uow.logs.log_batch(rows)
+            uow.commit()
+            bulk_rate = self.ROWS / (time.perf_counter() - start)
+
+        assert bulk_rate > 5 * orm_rate
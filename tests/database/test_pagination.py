@@ -0,0 +1,150 @@
+"""Tests for keyset pagination."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from cardlink.cli.db import cli
+from cardlink.database import (
+    CardProfile,
+    OTASession,
+    SessionStatus,
+    UnitOfWork,
+    ValidationError,
+)
+
+
+@pytest.fixture
+def logs_db(file_db, session_id):
+    """Create 25 log entries, several sharing a timestamp."""
+    base = datetime(2024, 1, 1)
+    rows = [
+        (session_id, "command", f"80CA00{i:02X}", None, None, base + timedelta(seconds=i // 3))
+        for i in range(25)
+    ]
+    with UnitOfWork(file_db) as uow:
+        uow.logs.log_batch(rows)
+        uow.commit()
+    return file_db
+
+
+def collect(repo, **kwargs):
+    """Walk all pages, returning items and the number of pages."""
+    items, pages, cursor = [], 0, None
+    while True:
+        page = repo.paginate_keyset(cursor, **kwargs)
+        items.extend(page.items)
+        pages += 1
+        if not page.has_next:
+            return items, pages
+        cursor = page.next_cursor
+
+
+class TestKeysetPagination:
+    """Test BaseRepository.paginate_keyset."""
+
+    def test_walks_all_rows_once(self, logs_db):
+        """Test pages cover every row once across timestamp ties."""
+        with UnitOfWork(logs_db) as uow:
+            items, pages = collect(uow.logs, per_page=7, order_by="timestamp")
+            expected = sorted(uow.logs.get_all(), key=lambda log: (log.timestamp, log.id))
+            assert [log.id for log in items] == [log.id for log in expected]
+            assert pages == 4
+
+    def test_descending(self, logs_db):
+        """Test descending order."""
+        with UnitOfWork(logs_db) as uow:
+            items, _ = collect(uow.logs, per_page=10, order_by="timestamp", descending=True)
+            keys = [(log.timestamp, log.id) for log in items]
+            assert keys == sorted(keys, reverse=True)
+            assert len(keys) == 25
+
+    def test_exact_page_multiple(self, logs_db):
+        """Test no empty trailing page when rows divide evenly."""
+        with UnitOfWork(logs_db) as uow:
+            items, pages = collect(uow.logs, per_page=5)
+            assert len(items) == 25
+            assert pages == 5
+
+    def test_filters_and_total(self, logs_db, session_id):
+        """Test filters apply to items and the exact total."""
+        with UnitOfWork(logs_db) as uow:
+            page = uow.logs.paginate_keyset(per_page=10, total="exact", session_id=session_id)
+            assert page.total == 25
+            assert not page.estimated
+
+            page = uow.logs.paginate_keyset(per_page=10, total="exact", session_id="other")
+            assert page.items == []
+            assert page.total == 0
+            assert page.next_cursor is None
+
+    def test_total_skipped_or_estimated(self, logs_db):
+        """Test the total is optional and can be estimated."""
+        with UnitOfWork(logs_db) as uow:
+            assert uow.logs.paginate_keyset(per_page=10).total is None
+            page = uow.logs.paginate_keyset(per_page=10, total="estimate")
+            assert page.estimated
+            assert page.total == 25
+
+    def test_string_primary_key(self, file_db):
+        """Test sessions page by created_at with the UUID as tie-breaker."""
+        with UnitOfWork(file_db) as uow:
+            uow.cards.create(CardProfile(iccid="89012345678901234567"))
+            created = datetime(2024, 1, 1)
+            for i in range(6):
+                session = OTASession(card_iccid="89012345678901234567")
+                session.created_at = created
+                if i % 2:
+                    session.status = SessionStatus.FAILED
+                uow.sessions.add(session)
+            uow.commit()
+
+            items, pages = collect(
+                uow.sessions, per_page=2, order_by="created_at", descending=True
+            )
+            assert len({s.id for s in items}) == 6
+            assert pages == 3
+            failed, _ = collect(uow.sessions, per_page=2, status=SessionStatus.FAILED)
+            assert len(failed) == 3
+
+    def test_invalid_arguments(self, logs_db):
+        """Test bad cursors and orderings are rejected."""
+        with UnitOfWork(logs_db) as uow:
+            cursor = uow.logs.paginate_keyset(per_page=5, order_by="timestamp").next_cursor
+            with pytest.raises(ValidationError):
+                uow.logs.paginate_keyset(cursor, per_page=5, order_by="timestamp", descending=True)
+            with pytest.raises(ValidationError):
+                uow.logs.paginate_keyset("not-a-cursor", per_page=5)
+            with pytest.raises(ValidationError):
+                uow.logs.paginate_keyset(order_by="latency_ms")  # Nullable
+            with pytest.raises(ValidationError):
+                uow.logs.paginate_keyset(order_by="bogus")
+            with pytest.raises(ValidationError):
+                uow.logs.paginate_keyset(total="sometimes")
+
+
+class TestListCommands:
+    """Test the paginated listing CLI commands."""
+
+    def test_logs_pages(self, logs_db, tmp_path):
+        """Test gp-db logs prints a cursor that continues the listing."""
+        runner = CliRunner()
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        result = runner.invoke(cli, ["-d", url, "logs", "-n", "20", "--count", "exact"], obj={})
+        assert result.exit_code == 0, result.output
+        assert "Total: 25" in result.output
+        cursor = result.output.split("--cursor ")[1].split()[0]
+
+        result = runner.invoke(cli, ["-d", url, "logs", "-n", "20", "-c", cursor], obj={})
+        assert result.exit_code == 0, result.output
+        assert "80CA0018" in result.output
+        assert "80CA0000" not in result.output
+        assert "Next page" not in result.output
+
+    def test_sessions(self, file_db, session_id, tmp_path):
+        """Test gp-db sessions lists sessions."""
+        url = f"sqlite:///{tmp_path / 'test.db'}"
+        result = CliRunner().invoke(cli, ["-d", url, "sessions", "-s", "pending"], obj={})
+        assert result.exit_code == 0, result.output
+        assert session_id[:8] in result.output
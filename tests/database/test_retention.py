@@ -0,0 +1,288 @@
+"""Tests for communication log retention."""
+
+import gzip
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+from sqlalchemy import text
+
+from cardlink.cli.db import cli
+from cardlink.database import (
+    CardProfile,
+    CommLog,
+    DatabaseConfig,
+    DatabaseManager,
+    OTASession,
+    RetentionManager,
+    RetentionPolicy,
+    UnitOfWork,
+    ValidationError,
+)
+from cardlink.database.migrate import downgrade, run_migrations
+from cardlink.database.models import SettingKeys
+
+NOW = datetime(2024, 4, 15, 12)
+
+POSTGRES_URL = os.environ.get("CARDLINK_TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def log_db(file_db, session_id):
+    """Create logs in January, February and April 2024."""
+    with UnitOfWork(file_db) as uow:
+        uow.logs.log_batch([
+            (session_id, "command", "00A40400", None, None, datetime(2024, 1, 10)),
+            (session_id, "response", "9000", 5.0, None, datetime(2024, 1, 31, 23, 59)),
+            (session_id, "command", "00B00000", None, None, datetime(2024, 2, 1)),
+            (session_id, "response", "6A82", 7.5, None, datetime(2024, 4, 14)),
+        ])
+        uow.commit()
+    return file_db
+
+
+def count_logs(manager):
+    """Count all communication logs."""
+    with UnitOfWork(manager) as uow:
+        return uow.logs.count()
+
+
+class TestRetentionPolicy:
+    """Test RetentionPolicy."""
+
+    def test_defaults_keep_forever(self, file_db):
+        """Test missing settings keep logs forever."""
+        with UnitOfWork(file_db) as uow:
+            policy = RetentionPolicy.from_settings(uow.settings)
+        assert policy == RetentionPolicy()
+        assert policy.cutoff(NOW) is None
+
+    def test_save_and_load(self, file_db, tmp_path):
+        """Test policy round-trips through settings."""
+        policy = RetentionPolicy(comm_logs_days=30, partition="day", archive_dir=str(tmp_path))
+        with UnitOfWork(file_db) as uow:
+            policy.save(uow.settings)
+            uow.commit()
+        with UnitOfWork(file_db) as uow:
+            assert RetentionPolicy.from_settings(uow.settings) == policy
+            assert uow.settings.get_int(SettingKeys.RETENTION_COMM_LOGS_DAYS) == 30
+        assert policy.cutoff(NOW) == NOW - timedelta(days=30)
+
+    def test_invalid(self):
+        """Test invalid policies are rejected."""
+        with pytest.raises(ValidationError):
+            RetentionPolicy(comm_logs_days=-1)
+        with pytest.raises(ValidationError):
+            RetentionPolicy(partition="week")
+
+
+class TestRetentionManager:
+    """Test RetentionManager on SQLite."""
+
+    def test_list_partitions(self, log_db):
+        """Test monthly partitions skip months without rows."""
+        partitions = RetentionManager(log_db, RetentionPolicy()).list_partitions()
+        assert [(p.name, p.rows) for p in partitions] == [
+            ("comm_logs_p202401", 2),
+            ("comm_logs_p202402", 1),
+            ("comm_logs_p202404", 1),
+        ]
+        assert partitions[0].start == datetime(2024, 1, 1)
+        assert partitions[0].end == datetime(2024, 2, 1)
+        assert not partitions[0].native
+
+    def test_daily_partitions(self, log_db):
+        """Test daily partition names and ranges."""
+        policy = RetentionPolicy(partition="day")
+        names = [p.name for p in RetentionManager(log_db, policy).list_partitions()]
+        assert names[:2] == ["comm_logs_p20240110", "comm_logs_p20240131"]
+
+    def test_expired_partitions(self, log_db):
+        """Test only partitions ending before the cutoff expire."""
+        # Cutoff 2024-02-15: January expired, February still has live days
+        retention = RetentionManager(log_db, RetentionPolicy(comm_logs_days=60))
+        assert [p.name for p in retention.expired_partitions(NOW)] == ["comm_logs_p202401"]
+        assert RetentionManager(log_db, RetentionPolicy()).expired_partitions(NOW) == []
+
+    def test_apply_archives_and_deletes(self, log_db, tmp_path):
+        """Test expired partitions are archived to NDJSON then deleted."""
+        policy = RetentionPolicy(comm_logs_days=60, archive_dir=str(tmp_path / "archive"))
+        retention = RetentionManager(log_db, policy, batch_size=1)
+
+        result = retention.apply(now=NOW)
+
+        assert result.rows == 2
+        assert result.archives == [tmp_path / "archive" / "comm_logs_p202401.ndjson.gz"]
+        with gzip.open(result.archives[0], "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f]
+        assert [row["raw_data"] for row in rows] == ["00A40400", "9000"]
+        assert rows[1]["status_word"] == "9000"
+        assert rows[1]["timestamp"] == "2024-01-31T23:59:00"
+        assert not list((tmp_path / "archive").glob("*.partial"))
+
+        assert count_logs(log_db) == 2
+        with UnitOfWork(log_db) as uow:
+            # Rollups are compacted before the raw rows are dropped
+            hist = uow.rollups.latency_histogram(
+                "day", datetime(2024, 1, 1), datetime(2024, 2, 1)
+            )
+            assert hist.total == 1
+
+    def test_rebuild_keeps_purged_log_rollups(self, log_db, tmp_path):
+        """Test rebuilding rollups after retention keeps the purged history."""
+        policy = RetentionPolicy(comm_logs_days=60, archive_dir=str(tmp_path))
+        RetentionManager(log_db, policy).apply(now=NOW)
+
+        january = (datetime(2024, 1, 1), datetime(2024, 2, 1))
+        with UnitOfWork(log_db) as uow:
+            assert uow.settings.get_value(SettingKeys.RETENTION_PURGED_BEFORE) == (
+                "2024-02-01T00:00:00"
+            )
+            uow.rollups.rebuild(datetime(2024, 1, 1), NOW)
+            uow.commit()
+
+            for period in ("hour", "day"):
+                counts = uow.rollups.status_word_counts(period, *january)
+                assert [(c.status_word, c.responses) for c in counts] == [("9000", 1)]
+                assert uow.rollups.latency_histogram(period, *january).total == 1
+            # Ranges with raw rows are still recomputed
+            april = uow.rollups.status_word_counts("day", datetime(2024, 4, 1), NOW)
+            assert [(c.status_word, c.responses) for c in april] == [("6A82", 1)]
+
+    def test_apply_keeps_rows_added_after_archive(self, log_db, session_id, tmp_path):
+        """Test rows newer than the archive are not deleted."""
+        policy = RetentionPolicy(comm_logs_days=60, archive_dir=str(tmp_path))
+        retention = RetentionManager(log_db, policy)
+        partition = retention.expired_partitions(NOW)[0]
+        _, rows, max_id = retention.archive_partition(partition)
+        assert rows == 2
+
+        with UnitOfWork(log_db) as uow:
+            uow.logs.log_batch([(session_id, "command", "00", None, None, datetime(2024, 1, 5))])
+            uow.commit()
+
+        assert retention.drop_partition(partition, max_id=max_id) == 2
+        with UnitOfWork(log_db) as uow:
+            assert "00" in [log.raw_data for log in uow.logs.get_all()]
+
+    def test_rearchive_keeps_earlier_archive(self, log_db, session_id, tmp_path):
+        """Test late rows archived on a second run do not overwrite the first archive."""
+        policy = RetentionPolicy(comm_logs_days=60, archive_dir=str(tmp_path))
+        retention = RetentionManager(log_db, policy)
+        first = retention.apply(now=NOW)
+
+        with UnitOfWork(log_db) as uow:
+            uow.logs.log_batch([(session_id, "command", "00", None, None, datetime(2024, 1, 5))])
+            uow.commit()
+        second = retention.apply(now=NOW)
+
+        assert first.archives == [tmp_path / "comm_logs_p202401.ndjson.gz"]
+        assert second.archives == [tmp_path / "comm_logs_p202401.1.ndjson.gz"]
+        archived = []
+        for path in first.archives + second.archives:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                archived.append([json.loads(line)["raw_data"] for line in f])
+        assert archived == [["00A40400", "9000"], ["00"]]
+        assert not list(tmp_path.glob("*.partial"))
+
+    def test_apply_without_archive(self, log_db, tmp_path):
+        """Test partitions are dropped without archiving when disabled."""
+        policy = RetentionPolicy(comm_logs_days=1, archive=False, archive_dir=str(tmp_path))
+        result = RetentionManager(log_db, policy).apply(now=NOW, vacuum=True)
+        assert result.archives == []
+        assert result.rows == 3
+        assert count_logs(log_db) == 1
+
+    def test_dry_run(self, log_db, tmp_path):
+        """Test dry run changes nothing."""
+        archive_dir = tmp_path / "archive"
+        policy = RetentionPolicy(comm_logs_days=1, archive_dir=str(archive_dir))
+        result = RetentionManager(log_db, policy).apply(now=NOW, dry_run=True)
+        assert len(result.dropped) == 2
+        assert result.rows == 3
+        assert count_logs(log_db) == 4
+        assert not archive_dir.exists()
+
+    def test_ensure_partitions_noop_on_sqlite(self, log_db):
+        """Test native partitions are only managed on PostgreSQL."""
+        retention = RetentionManager(log_db, RetentionPolicy())
+        assert not retention.is_partitioned()
+        assert retention.ensure_partitions(NOW) == []
+
+
+def test_retention_cli(log_db, tmp_path):
+    """Test gp-db retention set/show/apply."""
+    url = str(log_db.engine.url)
+    runner = CliRunner()
+    archive_dir = str(tmp_path / "archive")
+
+    result = runner.invoke(
+        cli, ["-d", url, "retention", "set", "--days", "1", "--archive-dir", archive_dir], obj={}
+    )
+    assert result.exit_code == 0, result.output
+
+    result = runner.invoke(cli, ["-d", url, "retention", "show"], obj={})
+    assert result.exit_code == 0, result.output
+    assert "comm_logs_p202401" in result.output
+    assert "1 days" in result.output
+
+    result = runner.invoke(cli, ["-d", url, "retention", "apply", "--confirm"], obj={})
+    assert result.exit_code == 0, result.output
+    assert "Dropped" in result.output
+    with UnitOfWork(log_db) as uow:
+        assert uow.session.query(CommLog).count() == 0
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(not POSTGRES_URL, reason="CARDLINK_TEST_POSTGRES_URL not set")
+class TestNativePartitions:
+    """Test native partitions on PostgreSQL (migration 004)."""
+
+    @pytest.fixture
+    def pg_db(self):
+        """Migrate a scratch PostgreSQL database and downgrade it afterwards."""
+        run_migrations("head", POSTGRES_URL)
+        manager = DatabaseManager(DatabaseConfig(url=POSTGRES_URL))
+        manager.initialize()
+        yield manager
+        manager.close()
+        downgrade("base", POSTGRES_URL)
+
+    def test_default_partition_rows_move_and_expire(self, pg_db, tmp_path):
+        """Test rows in the default partition get their month and expire with it."""
+        with UnitOfWork(pg_db) as uow:
+            uow.cards.create(CardProfile(iccid="89012345678901234567"))
+            session = OTASession(card_iccid="89012345678901234567")
+            uow.sessions.create(session)
+            # No partition covers January 2001, so these land in comm_logs_default
+            uow.logs.log_batch([
+                (session.id, "command", "00A40400", None, None, datetime(2001, 1, 10)),
+                (session.id, "response", "9000", 5.0, None, datetime(2001, 1, 10, 0, 1)),
+            ])
+            uow.commit()
+
+        policy = RetentionPolicy(comm_logs_days=30, archive_dir=str(tmp_path))
+        retention = RetentionManager(pg_db, policy)
+        assert retention.is_partitioned()
+        pending = [p for p in retention.list_partitions() if p.pending]
+        assert [(p.name, p.rows) for p in pending] == [("comm_logs_p200101", 2)]
+        assert [p.name for p in retention.expired_partitions()] == ["comm_logs_p200101"]
+
+        result = retention.apply()
+
+        assert "comm_logs_p200101" in result.created
+        assert [p.name for p in result.dropped] == ["comm_logs_p200101"]
+        assert result.rows == 2
+        with gzip.open(result.archives[0], "rt", encoding="utf-8") as f:
+            assert len(f.readlines()) == 2
+        with UnitOfWork(pg_db) as uow:
+            assert uow.logs.count() == 0
+            default_rows = uow.session.execute(
+                text("SELECT count(*) FROM comm_logs_default")
+            ).scalar()
+            assert default_rows == 0
+        assert not [p for p in retention.list_partitions() if p.pending]
+        # New months can still be created once the default partition is empty
+        assert retention.ensure_partitions(datetime.utcnow(), ahead=3)
@@ -0,0 +1,144 @@
+"""Tests for hourly and daily rollups."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from click.testing import CliRunner
+
+from cardlink.cli.db import cli
+from cardlink.database import (
+    CardProfile,
+    SessionStatus,
+    UnitOfWork,
+    ValidationError,
+)
+
+DAY = datetime(2024, 3, 1)
+
+
+@pytest.fixture
+def history_db(file_db, add_session):
+    """Create sessions and logs spread over two days."""
+    with UnitOfWork(file_db) as uow:
+        uow.cards.create(CardProfile(iccid="89012345678901234567", card_type="UICC"))
+        uow.cards.create(CardProfile(iccid="89012345678901234568", card_type="eUICC"))
+        psk = "TLS_PSK_WITH_AES_128_CBC_SHA256"
+        s1 = add_session(uow, SessionStatus.COMPLETED, DAY + timedelta(hours=1, minutes=5),
+                         duration_ms=100, cipher_suite=psk)
+        add_session(uow, SessionStatus.COMPLETED, DAY + timedelta(hours=1, minutes=50),
+                    duration_ms=300, cipher_suite=psk)
+        add_session(uow, SessionStatus.FAILED, DAY + timedelta(hours=2),
+                    iccid="89012345678901234568")
+        add_session(uow, SessionStatus.COMPLETED, DAY + timedelta(days=1, hours=3),
+                    duration_ms=200, cipher_suite=psk)
+
+        t = DAY + timedelta(hours=1, minutes=6)
+        uow.logs.log_batch([
+            (s1.id, "command", "00A40400", None, None, t),
+            (s1.id, "response", "9000", 3.0, None, t),
+            (s1.id, "command", "00B00000", None, None, t),
+            (s1.id, "response", "6A82", 40.0, None, t),
+            (s1.id, "response", "9000", 9000.0, None, t + timedelta(days=1)),
+        ])
+        uow.commit()
+    return file_db
+
+
+class TestRollupRepository:
+    """Test RollupRepository."""
+
+    def test_compact_hourly_and_daily(self, history_db):
+        """Test the first compaction rolls up all history."""
+        with UnitOfWork(history_db) as uow:
+            result = uow.rollups.compact(now=DAY + timedelta(days=2))
+            uow.commit()
+            assert result.start == DAY + timedelta(hours=1)
+            assert result.rows > 0
+
+            hourly = uow.rollups.session_counts("hour", DAY, DAY + timedelta(days=1))
+            assert [(p.bucket_start.hour, p.status, p.sessions) for p in hourly] == [
+                (1, "completed", 2),
+                (2, "failed", 1),
+            ]
+            assert hourly[0].avg_duration_ms == 200
+
+            daily = uow.rollups.session_counts(
+                "day", DAY, DAY + timedelta(days=2), by=("card_type", "cipher_suite")
+            )
+            assert [(p.bucket_start, p.card_type, p.cipher_suite, p.sessions) for p in daily] == [
+                (DAY, "UICC", "TLS_PSK_WITH_AES_128_CBC_SHA256", 2),
+                (DAY, "eUICC", "", 1),
+                (DAY + timedelta(days=1), "UICC", "TLS_PSK_WITH_AES_128_CBC_SHA256", 1),
+            ]
+            assert daily[0].status is None
+
+    def test_status_words_and_latency(self, history_db):
+        """Test status word counts and the latency histogram."""
+        with UnitOfWork(history_db) as uow:
+            uow.rollups.compact(now=DAY + timedelta(days=2))
+
+            words = uow.rollups.status_word_counts("day", DAY, DAY + timedelta(days=1))
+            assert [(w.status_word, w.responses, w.avg_latency_ms) for w in words] == [
+                ("6A82", 1, 40.0),
+                ("9000", 1, 3.0),
+            ]
+
+            histogram = uow.rollups.latency_histogram("day", DAY, DAY + timedelta(days=2))
+            assert histogram.total == 3
+            assert histogram.counts[0] == 1  # <= 5 ms
+            assert histogram.counts[3] == 1  # <= 50 ms
+            assert histogram.counts[-1] == 1  # > 5000 ms
+            assert histogram.percentile(50) == 50.0
+            assert histogram.percentile(100) == float("inf")
+
+    def test_incremental_compaction(self, history_db, add_session):
+        """Test later runs only recompute from the watermark."""
+        now = DAY + timedelta(days=1, hours=3, minutes=30)
+        with UnitOfWork(history_db) as uow:
+            uow.rollups.compact(now=now)
+            uow.commit()
+
+            # Session completing within the lookback window
+            session = uow.sessions.find_failed()[0]
+            session.status = SessionStatus.COMPLETED
+            add_session(uow, SessionStatus.ACTIVE, now + timedelta(minutes=10))
+            uow.commit()
+
+            result = uow.rollups.compact(now=now + timedelta(hours=1), lookback=timedelta(hours=27))
+            uow.commit()
+            assert result.start == DAY
+
+            daily = uow.rollups.session_counts("day", DAY, DAY + timedelta(days=2))
+            assert [(p.bucket_start.day, p.status, p.sessions) for p in daily] == [
+                (1, "completed", 3),
+                (2, "active", 1),
+                (2, "completed", 1),
+            ]
+
+    def test_empty_database(self, file_db):
+        """Test compaction with no raw rows."""
+        with UnitOfWork(file_db) as uow:
+            result = uow.rollups.compact()
+            assert result.start is None
+            assert result.rows == 0
+            assert uow.rollups.latency_histogram("hour", DAY, DAY).percentile(99) is None
+
+    def test_invalid_queries(self, file_db):
+        """Test unknown periods and dimensions are rejected."""
+        with UnitOfWork(file_db) as uow:
+            with pytest.raises(ValidationError):
+                uow.rollups.session_counts("week", DAY, DAY)
+            with pytest.raises(ValidationError):
+                uow.rollups.session_counts("day", DAY, DAY, by=("device",))
+
+
+def test_rollup_command(history_db, tmp_path):
+    """Test gp-db rollup compacts and commits."""
+    url = f"sqlite:///{tmp_path / 'test.db'}"
+    result = CliRunner().invoke(cli, ["-d", url, "rollup"], obj={})
+    assert result.exit_code == 0, result.output
+    assert "rollup rows" in result.output
+
+    with UnitOfWork(history_db) as uow:
+        daily = uow.rollups.session_counts("day", DAY, DAY + timedelta(days=2))
+        assert sum(p.sessions for p in daily) == 4
@@ -0,0 +1,92 @@
+"""Tests for aggregate statistics."""
+
+from datetime import datetime, timedelta
+
+from cardlink.database import (
+    CardProfile,
+    LogStats,
+    SessionStatus,
+    UnitOfWork,
+)
+
+
+class TestStatisticsService:
+    """Test StatisticsService."""
+
+    def test_log_summary(self, file_db, session_id):
+        """Test session log summary from one aggregate query."""
+        with UnitOfWork(file_db) as uow:
+            uow.logs.log_batch([
+                (session_id, "command", "00A40400"),
+                (session_id, "response", "9000", 10.0),
+                (session_id, "command", "00C00000"),
+                (session_id, "response", "6110", 0.0),  # Zero latency ignored
+                (session_id, "command", "00B00000"),
+                (session_id, "response", "6A82", 5.0),
+                (session_id, "response", "6985"),
+            ])
+            uow.commit()
+
+            summary = uow.stats.log_summary(session_id)
+            assert summary.total_logs == 7
+            assert summary.command_count == 3
+            assert summary.response_count == 4
+            assert summary.success_count == 2
+            assert summary.error_count == 2
+            assert summary.avg_latency_ms == 7.5
+            assert summary.min_latency_ms == 5.0
+            assert summary.max_latency_ms == 10.0
+            assert uow.logs.get_session_summary(session_id) == summary.to_dict()
+
+    def test_empty_log_summary(self, file_db):
+        """Test summary of a session without logs."""
+        with UnitOfWork(file_db) as uow:
+            summary = uow.stats.log_summary("missing")
+            assert summary.total_logs == 0
+            assert summary.avg_latency_ms == 0
+            assert summary.max_latency_ms == 0
+
+    def test_log_stats_respects_hours(self, file_db, session_id):
+        """Test direction counts use the time window."""
+        old = datetime.utcnow() - timedelta(hours=5)
+        with UnitOfWork(file_db) as uow:
+            uow.logs.log_batch([
+                (session_id, "command", "00A40400", None, None, old),
+                (session_id, "response", "9000", None, None, old),
+                (session_id, "command", "00A40400"),
+            ])
+            uow.commit()
+
+            assert uow.stats.log_stats() == LogStats(total=3, commands=2, responses=1)
+            assert uow.stats.log_stats(hours=1) == LogStats(total=1, commands=1, responses=0)
+            assert uow.logs.get_stats(hours=1) == {"total": 1, "commands": 1, "responses": 0}
+
+    def test_session_stats_respects_hours(self, file_db, add_session):
+        """Test status counts use the time window."""
+        now = datetime.utcnow()
+        old = now - timedelta(days=2)
+        with UnitOfWork(file_db) as uow:
+            uow.cards.create(CardProfile(iccid="89012345678901234567"))
+            add_session(uow, SessionStatus.COMPLETED, now, duration_ms=100)
+            add_session(uow, SessionStatus.COMPLETED, now, duration_ms=301)
+            add_session(uow, SessionStatus.COMPLETED, old, duration_ms=10000)
+            add_session(uow, SessionStatus.FAILED, old)
+            add_session(uow, SessionStatus.FAILED, now)
+            uow.commit()
+
+            stats = uow.stats.session_stats(hours=24)
+            assert stats.total == 3
+            assert stats.by_status[SessionStatus.COMPLETED] == 2
+            assert stats.by_status[SessionStatus.FAILED] == 1
+            assert stats.by_status[SessionStatus.PENDING] == 0
+            assert stats.avg_duration_ms == 200
+
+            assert uow.sessions.get_stats() == {
+                "total": 5,
+                "pending": 0,
+                "active": 0,
+                "completed": 3,
+                "failed": 2,
+                "timeout": 0,
+                "avg_duration_ms": 3467,
+            }
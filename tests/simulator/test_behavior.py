@@ -1,7 +1,14 @@
 """Tests for BehaviorController component."""
 
 import pytest
-from cardlink.simulator import BehaviorController, BehaviorConfig, BehaviorMode
+from cardlink.simulator import (
+    BehaviorController,
+    BehaviorConfig,
+    BehaviorMode,
+    NetworkConditions,
+    NetworkProfile,
+    get_network_profile,
+)
 
 
 class TestBehaviorController:
@@ -163,3 +170,89 @@ class TestBehaviorController:
                 timeout_delay_max_ms=500,
             )
             config.validate()
+
+
+class TestNetworkProfiles:
+    """Test network profile delay sampling."""
+
+    def test_builtin_profiles(self):
+        """Test built-in profiles are valid and ordered by latency."""
+        for name in ("2g", "3g", "lte-m", "nb-iot"):
+            get_network_profile(name).validate()
+
+        assert (
+            get_network_profile("lte-m").latency_median_ms
+            < get_network_profile("3g").latency_median_ms
+            < get_network_profile("2g").latency_median_ms
+        )
+
+    def test_latency_is_heavy_tailed(self):
+        """Test sampled latency has median near profile and a long tail."""
+        profile = NetworkProfile(name="test", latency_median_ms=100.0, latency_sigma=0.5)
+        conditions = NetworkConditions(profile, seed=1)
+
+        samples = sorted(conditions.sample_latency_ms() for _ in range(2000))
+        median = samples[len(samples) // 2]
+        p99 = samples[int(len(samples) * 0.99)]
+
+        assert 90 <= median <= 110
+        assert p99 > 2.5 * median
+
+    def test_transfer_delay(self):
+        """Test per-byte delay follows bandwidth."""
+        profile = NetworkProfile(name="test", uplink_bps=8000, downlink_bps=16000)
+        conditions = NetworkConditions(profile)
+
+        # 100 bytes up at 1 kB/s + 200 bytes down at 2 kB/s
+        assert conditions.transfer_delay_ms(100, 200) == pytest.approx(200.0)
+
+    def test_stalls_are_correlated(self):
+        """Test stalls arrive in bursts."""
+        profile = NetworkProfile(
+            name="test",
+            stall_probability=0.05,
+            stall_persistence=0.9,
+            stall_min_ms=100.0,
+            stall_max_ms=100.0,
+        )
+        conditions = NetworkConditions(profile, seed=3)
+
+        stalls = [conditions.sample_stall_ms() > 0 for _ in range(5000)]
+        onsets = sum(1 for a, b in zip(stalls, stalls[1:]) if b and not a)
+
+        # Mean burst length should be close to 1 / (1 - persistence) = 10
+        assert onsets > 0
+        assert sum(stalls) / onsets > 5
+
+    def test_seed_reproducible(self):
+        """Test identical seeds produce identical delays."""
+        profile = get_network_profile("2g")
+        a = NetworkConditions(profile, seed=42)
+        b = NetworkConditions(profile, seed=42)
+
+        assert [a.exchange_delay(20, 2) for _ in range(50)] == [
+            b.exchange_delay(20, 2) for _ in range(50)
+        ]
+
+    def test_controller_without_profile(self, behavior_config_normal):
+        """Test no network delay when no profile is configured."""
+        controller = BehaviorController(behavior_config_normal)
+
+        assert controller.network is None
+        assert controller.get_network_delay(20, 2) == 0.0
+
+    def test_controller_network_delay(self):
+        """Test controller tracks network delay and stalls."""
+        controller = BehaviorController(
+            BehaviorConfig(network_profile="nb-iot", network_seed=5)
+        )
+
+        delays = [controller.get_network_delay(20, 2) for _ in range(200)]
+
+        assert all(d > 0 for d in delays)
+        assert controller.network_delay_ms == pytest.approx(sum(delays) * 1000)
+        assert controller.stall_count > 0
+
+        controller.reset_stats()
+        assert controller.stall_count == 0
+        assert controller.network_delay_ms == 0.0
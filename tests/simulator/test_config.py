@@ -177,6 +177,17 @@ class TestSimulatorConfig:
         assert config.behavior.timeout_delay_min_ms == 1000
         assert config.behavior.timeout_delay_max_ms == 5000
 
+    def test_from_dict_network_profile(self):
+        """Test loading network profile from dictionary."""
+        config = SimulatorConfig.from_dict(
+            {"behavior": {"network": {"profile": "nb-iot", "seed": 7}}}
+        )
+        assert config.behavior.network_profile == "nb-iot"
+        assert config.behavior.network_seed == 7
+
+        config = SimulatorConfig.from_dict({"behavior": {"network": "3g"}})
+        assert config.behavior.network_profile == "3g"
+
 
 class TestBehaviorConfig:
     """Test BehaviorConfig."""
@@ -201,6 +212,13 @@ class TestBehaviorConfig:
         assert config.error_rate == 0.5
         assert config.error_codes == ["6A82"]
 
+    def test_unknown_network_profile(self):
+        """Test validation rejects unknown network profiles."""
+        BehaviorConfig(network_profile="LTE-M").validate()
+
+        with pytest.raises(ValueError):
+            BehaviorConfig(network_profile="5g-mmwave").validate()
+
 
 class TestUICCProfile:
     """Test UICCProfile."""
@@ -8,8 +8,11 @@ from unittest.mock import Mock, AsyncMock
 
 from cardlink.simulator.http_client import (
     HTTPAdminClient,
+    HTTPProtocolError,
+    HTTPResponseParser,
     ScriptStatus,
     GP_ADMIN_PROTOCOL,
+    extract_apdus,
 )
 
 
@@ -223,3 +226,128 @@ class TestHTTPAdminClientResponseParsing:
         headers_str = request[:header_end].decode("ascii")
 
         assert "X-Admin-Script-Status: security-error" in headers_str
+
+
+class TestHTTPResponseParser:
+    """Tests for the incremental HTTP response parser."""
+
+    RESPONSE = (
+        b"HTTP/1.1 200 OK\r\n"
+        b"Content-Length: 4\r\n"
+        b"\r\n"
+        b"\x00\x02\x90\x00"
+    )
+
+    def test_byte_by_byte(self):
+        """Test response split into single bytes."""
+        parser = HTTPResponseParser()
+        done = [parser.feed(self.RESPONSE[i:i + 1]) for i in range(len(self.RESPONSE))]
+
+        assert done[-1] and not any(done[:-1])
+        assert parser.result() == (200, {"content-length": "4"}, b"\x00\x02\x90\x00")
+
+    def test_chunked_split_across_feeds(self):
+        """Test chunked body with chunk boundaries split across feeds."""
+        response = (
+            b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n"
+            b"3\r\nabc\r\n"
+            b"A;ext=1\r\n0123456789\r\n"
+            b"0\r\nX-Trailer: 1\r\n\r\n"
+        )
+        parser = HTTPResponseParser()
+        for i in range(0, len(response), 7):
+            parser.feed(response[i:i + 7])
+
+        assert parser.complete
+        assert parser.body == b"abc0123456789"
+
+    def test_pipelined_responses(self):
+        """Test bytes past the end of a response are kept for the next one."""
+        parser = HTTPResponseParser()
+        second = b"HTTP/1.1 204 No Content\r\n\r\n"
+
+        assert parser.feed(self.RESPONSE + second)
+        assert parser.status_code == 200
+
+        parser.reset()
+        assert parser.feed(b"")
+        assert parser.status_code == 204
+        assert parser.body == b""
+
+    def test_read_until_close(self):
+        """Test body without length is read until connection close."""
+        parser = HTTPResponseParser()
+        assert not parser.feed(b"HTTP/1.1 200 OK\r\n\r\nabc")
+        parser.feed(b"def")
+        parser.feed_eof()
+
+        assert parser.complete
+        assert parser.body == b"abcdef"
+
+    def test_eof_in_headers(self):
+        """Test connection close before end of headers raises."""
+        parser = HTTPResponseParser()
+        parser.feed(b"HTTP/1.1 200 OK\r\n")
+
+        with pytest.raises(HTTPProtocolError):
+            parser.feed_eof()
+
+    def test_invalid_chunk_size(self):
+        """Test malformed chunk size raises."""
+        parser = HTTPResponseParser()
+
+        with pytest.raises(HTTPProtocolError):
+            parser.feed(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\nzz\r\n")
+
+    def test_extract_apdus(self):
+        """Test extraction of all length-prefixed APDUs."""
+        body = b"\x00\x02\x90\x00\x00\x00\x00\x03\x01\x02\x03"
+        assert extract_apdus(body) == [b"\x90\x00", b"\x01\x02\x03"]
+        assert extract_apdus(b"") == []
+
+
+class ScriptedTLSClient(MockTLSClient):
+    """TLS client mock replaying canned server responses."""
+
+    def __init__(self, responses):
+        super().__init__()
+        self._data = b"".join(responses)
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def receive(self, max_bytes=4096):
+        chunk, self._data = self._data[:5], self._data[5:]
+        return chunk
+
+
+class TestHTTPAdminClientScripts:
+    """Tests for multi-APDU response bodies."""
+
+    @staticmethod
+    def _response(body, status="200 OK"):
+        return (
+            f"HTTP/1.1 {status}\r\nContent-Length: {len(body)}\r\n\r\n".encode("ascii")
+            + body
+        )
+
+    @pytest.mark.asyncio
+    async def test_script_processed_in_one_round_trip(self):
+        """Test all C-APDUs of a body are returned and R-APDUs sent together."""
+        select = bytes.fromhex("00A4040000")
+        get_status = bytes.fromhex("80F28000024F00")
+        body = b"\x00\x05" + select + b"\x00\x07" + get_status
+        tls_client = ScriptedTLSClient([
+            self._response(body),
+            self._response(b"", status="204 No Content"),
+        ])
+        client = HTTPAdminClient(tls_client)
+
+        assert await client.initial_request() == select
+        assert await client.send_response(b"\x90\x00") == get_status
+        assert len(tls_client.sent) == 1
+
+        assert await client.send_response(b"\x6A\x82") is None
+        assert len(tls_client.sent) == 2
+        assert tls_client.sent[1].endswith(b"\x00\x02\x90\x00\x00\x02\x6A\x82")
@@ -232,6 +232,38 @@ class TestSimulatorIntegration:
             assert stats.total_apdus_sent == 2
             assert stats.avg_connection_time_ms > 0
 
+    @pytest.mark.asyncio
+    async def test_handshake_statistics(self, default_config):
+        """Test full and resumed TLS handshakes are counted separately."""
+        simulator = MobileSimulator(default_config)
+
+        with patch("cardlink.simulator.client.PSKTLSClient") as mock_tls_cls, \
+             patch("cardlink.simulator.client.HTTPAdminClient"):
+
+            context = Mock()
+            infos = [
+                Mock(session_resumed=False),
+                Mock(session_resumed=True),
+            ]
+            clients = []
+            for info in infos:
+                mock_tls = AsyncMock()
+                mock_tls.connect = AsyncMock(return_value=info)
+                mock_tls.ssl_context = context
+                clients.append(mock_tls)
+            mock_tls_cls.side_effect = clients
+
+            await simulator.connect()
+            await simulator.disconnect()
+            await simulator.connect()
+
+            stats = simulator.get_statistics()
+            assert stats.full_handshakes == 1
+            assert stats.resumed_handshakes == 1
+
+            # Second client reuses the SSL context of the first
+            assert mock_tls_cls.call_args_list[1].kwargs["ssl_context"] is context
+
     @pytest.mark.asyncio
     async def test_context_manager(self, default_config):
         """Test simulator as async context manager."""
@@ -0,0 +1,190 @@
+"""Tests for card population files."""
+
+import pytest
+
+from cardlink.simulator import (
+    BinaryCardPopulation,
+    CardPopulation,
+    CardRecord,
+    CSVCardPopulation,
+    PopulationError,
+    SimulatorConfig,
+    SimulatorStats,
+    open_population,
+    write_population,
+)
+
+CSV_CONTENT = """iccid,imsi,psk_identity,psk_key,network_profile
+8901234567890123456,310150123456789,,000102030405060708090A0B0C0D0E0F,3g
+8901234567890123457,310150123456790,card_b,{key32},
+
+8901234567890123458,,,0F0E0D0C0B0A09080706050403020100,nb-iot
+""".format(key32="11" * 32)
+
+
+@pytest.fixture
+def csv_population(tmp_path):
+    path = tmp_path / "fleet.csv"
+    path.write_text(CSV_CONTENT)
+    return path
+
+
+class TestCSVCardPopulation:
+    """Tests for CSV populations."""
+
+    def test_iterate(self, csv_population):
+        with open_population(csv_population) as cards:
+            assert isinstance(cards, CSVCardPopulation)
+            records = list(cards)
+
+        assert [r.iccid for r in records] == [
+            "8901234567890123456",
+            "8901234567890123457",
+            "8901234567890123458",
+        ]
+        assert records[0].identity == "8901234567890123456"
+        assert records[0].network_profile == "3g"
+        assert records[1].identity == "card_b"
+        assert records[1].psk_key == bytes.fromhex("11" * 32)
+        assert records[1].network_profile is None
+
+    def test_random_access(self, csv_population):
+        with open_population(csv_population) as cards:
+            assert len(cards) == 3
+            assert cards[2].psk_key == bytes(range(16))[::-1]
+            assert cards[-1].iccid == cards[2].iccid
+            with pytest.raises(IndexError):
+                cards[3]
+
+    def test_missing_columns(self, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text("iccid,imsi\n8901234567890123456,310150123456789\n")
+
+        with pytest.raises(PopulationError):
+            open_population(path)
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            "8901234567890123459,,,not-hex,",
+            "8901234567890123459,,,0001,",
+            "89012345678901234AB,,,000102030405060708090A0B0C0D0E0F,",
+        ],
+    )
+    def test_invalid_card_rejected_on_open(self, tmp_path, row):
+        path = tmp_path / "bad.csv"
+        path.write_text(CSV_CONTENT + row + "\n")
+
+        with pytest.raises(PopulationError, match="card 4"):
+            open_population(path)
+
+    def test_base_class_is_abstract(self, csv_population):
+        with pytest.raises(TypeError):
+            CardPopulation(csv_population)
+
+
+class TestBinaryCardPopulation:
+    """Tests for binary populations."""
+
+    def test_round_trip(self, csv_population, tmp_path):
+        output = tmp_path / "fleet.pop"
+        with open_population(csv_population) as cards:
+            expected = list(cards)
+            assert write_population(output, cards) == 3
+
+        with open_population(output) as cards:
+            assert isinstance(cards, BinaryCardPopulation)
+            assert len(cards) == 3
+            assert list(cards) == expected
+            assert cards[1] == expected[1]
+
+    def test_rejects_invalid_key(self, tmp_path):
+        with pytest.raises(PopulationError):
+            write_population(
+                tmp_path / "bad.pop",
+                [CardRecord(iccid="8901234567890123456", psk_key=b"\x00" * 8)],
+            )
+
+    def test_failed_write_leaves_no_file(self, tmp_path):
+        output = tmp_path / "fleet.pop"
+        records = [
+            CardRecord(iccid="8901234567890123456", psk_key=bytes(16)),
+            CardRecord(iccid="8901234567890123457", psk_key=b"\x00" * 8),
+        ]
+        with pytest.raises(PopulationError):
+            write_population(output, records)
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.parametrize("iccid", ["89012345678901234A", "8901 23"])
+    def test_rejects_non_digit_bcd(self, tmp_path, iccid):
+        with pytest.raises(PopulationError, match="BCD"):
+            write_population(tmp_path / "bad.pop", [CardRecord(iccid=iccid, psk_key=bytes(16))])
+
+    def test_large_population_lazy(self, tmp_path):
+        output = tmp_path / "large.pop"
+        records = (
+            CardRecord(iccid=f"89{i:017d}", psk_key=i.to_bytes(16, "big"))
+            for i in range(50000)
+        )
+        assert write_population(output, records) == 50000
+
+        with open_population(output) as cards:
+            card = cards[41234]
+            assert card.iccid == f"89{41234:017d}"
+            assert card.psk_key == (41234).to_bytes(16, "big")
+
+
+class TestCardConfig:
+    """Tests for materializing card configurations."""
+
+    def test_to_config(self):
+        base = SimulatorConfig(psk_identity="base", use_iccid_as_identity=True)
+        card = CardRecord(
+            iccid="8901234567890123459",
+            psk_key=b"\x01" * 16,
+            imsi="310150000000001",
+            network_profile="lte-m",
+        )
+
+        config = card.to_config(base)
+        config.validate()
+
+        assert config.psk_identity == "8901234567890123459"
+        assert config.psk_key == b"\x01" * 16
+        assert config.uicc_profile.iccid == "8901234567890123459"
+        assert config.uicc_profile.imsi == "310150000000001"
+        assert config.behavior.network_profile == "lte-m"
+        assert not config.use_iccid_as_identity
+        # Base configuration is not modified
+        assert base.psk_identity == "base"
+        assert base.behavior.network_profile is None
+
+    def test_configs_lazy(self, csv_population):
+        base = SimulatorConfig()
+        with open_population(csv_population) as cards:
+            configs = cards.configs(base, start=1)
+            first = next(configs)
+
+        assert first.psk_identity == "card_b"
+
+
+class TestStatsMerge:
+    """Tests for aggregating fleet statistics."""
+
+    def test_merge(self):
+        a = SimulatorStats()
+        a.sessions_completed = 1
+        a.record_apdu_time(10.0)
+        a.record_error_sw("6A82")
+
+        b = SimulatorStats()
+        b.sessions_completed = 2
+        b.record_apdu_time(20.0)
+        b.record_apdu_time(30.0)
+        b.record_error_sw("6A82")
+
+        a.merge(b)
+
+        assert a.sessions_completed == 3
+        assert a.avg_apdu_response_time_ms == pytest.approx(20.0)
+        assert a.error_responses == {"6A82": 2}
@@ -0,0 +1,79 @@
+"""Tests for PSK-TLS client session resumption support."""
+
+import ssl
+
+from cardlink.simulator import PSKTLSClient
+from cardlink.simulator.psk_tls_client import TLSSessionCache
+
+
+class TestTLSSessionCache:
+    """Test TLS session cache."""
+
+    KEY = ("127.0.0.1", 8443, "test_card")
+
+    def test_get_returns_session_for_same_context(self):
+        """Test cached session is offered to the context that created it."""
+        cache = TLSSessionCache()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        session = object()
+
+        cache.put(self.KEY, context, session)
+
+        assert cache.get(self.KEY, context) is session
+
+    def test_get_ignores_other_context(self):
+        """Test sessions are never offered to a different context."""
+        cache = TLSSessionCache()
+        cache.put(self.KEY, ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT), object())
+
+        assert cache.get(self.KEY, ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)) is None
+
+    def test_lru_eviction(self):
+        """Test least recently used sessions are evicted first."""
+        cache = TLSSessionCache(max_entries=2)
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        keys = [("127.0.0.1", 8443, f"card_{i}") for i in range(3)]
+
+        cache.put(keys[0], context, object())
+        cache.put(keys[1], context, object())
+        cache.get(keys[0], context)
+        cache.put(keys[2], context, object())
+
+        assert len(cache) == 2
+        assert cache.get(keys[1], context) is None
+        assert cache.get(keys[0], context) is not None
+
+    def test_discard(self):
+        """Test discarding a session."""
+        cache = TLSSessionCache()
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        cache.put(self.KEY, context, object())
+
+        cache.discard(self.KEY)
+
+        assert cache.get(self.KEY, context) is None
+
+
+class TestPSKTLSClientResumption:
+    """Test PSKTLSClient resumption configuration."""
+
+    def test_session_key(self):
+        """Test session key is (host, port, identity)."""
+        client = PSKTLSClient("10.0.0.1", 8443, "card_001", b"\x00" * 16)
+        assert client.session_key == ("10.0.0.1", 8443, "card_001")
+
+    def test_default_cache_shared(self):
+        """Test clients share the default cache unless given one."""
+        own_cache = TLSSessionCache()
+        a = PSKTLSClient("10.0.0.1", 8443, "card_001", b"\x00" * 16)
+        b = PSKTLSClient("10.0.0.1", 8443, "card_002", b"\x00" * 16)
+        c = PSKTLSClient("10.0.0.1", 8443, "card_003", b"\x00" * 16, session_cache=own_cache)
+
+        assert a._session_cache is b._session_cache is PSKTLSClient.default_session_cache
+        assert c._session_cache is own_cache
+
+    def test_ssl_context_reused(self):
+        """Test a provided SSL context is kept for connect."""
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+        client = PSKTLSClient("10.0.0.1", 8443, "card_001", b"\x00" * 16, ssl_context=context)
+        assert client.ssl_context is context
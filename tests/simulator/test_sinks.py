@@ -0,0 +1,263 @@
+"""Tests for streaming simulator result sinks."""
+
+import json
+import socket
+import sqlite3
+import threading
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from cardlink.simulator import (
+    APDUExchange,
+    MobileSimulator,
+    NDJSONResultSink,
+    ResultSink,
+    ResultSinkError,
+    SessionResult,
+    SQLiteResultSink,
+    UnixSocketResultSink,
+    create_sink,
+)
+
+
+def make_exchange(sw: str = "9000") -> APDUExchange:
+    return APDUExchange(
+        command="00A4040007A0000001510000",
+        response=sw,
+        sw=sw,
+        duration_ms=0.5,
+        ins=0xA4,
+        description="SELECT",
+    )
+
+
+def make_result(session_id: str = "s1") -> SessionResult:
+    return SessionResult(success=True, session_id=session_id, apdu_count=2, final_sw="9000")
+
+
+class TestNDJSONResultSink:
+    """Tests for the NDJSON file sink."""
+
+    def test_writes_exchanges_and_sessions(self, tmp_path):
+        path = tmp_path / "results.ndjson"
+        with NDJSONResultSink(path) as sink:
+            sink.write_exchange("s1", make_exchange())
+            sink.write_exchange("s1", make_exchange("6A82"))
+            sink.write_session(make_result())
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["type"] for r in records] == ["exchange", "exchange", "session"]
+        assert records[0]["session_id"] == "s1"
+        assert records[1]["sw"] == "6A82"
+        assert records[2]["apdu_count"] == 2
+        assert sink.records_written == 3
+
+    def test_buffer_flushes_when_full(self, tmp_path):
+        path = tmp_path / "results.ndjson"
+        sink = NDJSONResultSink(path, buffer_size=2, flush_interval=3600)
+
+        sink.write_exchange("s1", make_exchange())
+        assert sink.wait(timeout=5)
+        assert path.read_text() == ""
+
+        sink.write_exchange("s1", make_exchange())
+        assert sink.wait(timeout=5)
+        assert len(path.read_text().splitlines()) == 2
+
+        sink.close()
+        assert sink.closed
+
+    def test_idle_buffer_flushed_by_timer(self, tmp_path):
+        path = tmp_path / "results.ndjson"
+        sink = NDJSONResultSink(path, buffer_size=100, flush_interval=0.05)
+
+        sink.write_session(make_result())
+        deadline = time.monotonic() + 5
+        while not path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert len(path.read_text().splitlines()) == 1
+        sink.close()
+
+    def test_write_after_close_is_dropped(self, tmp_path):
+        sink = NDJSONResultSink(tmp_path / "results.ndjson")
+        sink.close()
+
+        sink.write_session(make_result())
+
+        assert sink.records_dropped == 1
+
+
+class TestSQLiteResultSink:
+    """Tests for the SQLite sink."""
+
+    def test_writes_tables(self, tmp_path):
+        path = tmp_path / "results.db"
+        with SQLiteResultSink(path, buffer_size=1) as sink:
+            sink.write_exchange("s1", make_exchange())
+            sink.write_exchange("s1", make_exchange("6A82"))
+            sink.write_session(make_result())
+            assert sink.wait(timeout=5)
+
+            # Readable by another connection while the run is in progress
+            conn = sqlite3.connect(str(path))
+            count = conn.execute("SELECT COUNT(*) FROM exchanges").fetchone()[0]
+            conn.close()
+            assert count == 2
+
+        conn = sqlite3.connect(str(path))
+        sws = [row[0] for row in conn.execute("SELECT sw FROM exchanges ORDER BY id")]
+        session = conn.execute("SELECT session_id, success, apdu_count FROM sessions").fetchone()
+        conn.close()
+
+        assert sws == ["9000", "6A82"]
+        assert session == ("s1", 1, 2)
+
+
+class TestUnixSocketResultSink:
+    """Tests for the Unix socket sink."""
+
+    def test_streams_ndjson(self, tmp_path):
+        path = str(tmp_path / "results.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        try:
+            sink = UnixSocketResultSink(path, buffer_size=1)
+            sink.write_session(make_result("abc"))
+
+            conn, _ = server.accept()
+            conn.settimeout(1.0)
+            data = conn.recv(65536)
+            sink.close()
+            conn.close()
+        finally:
+            server.close()
+
+        record = json.loads(data.decode().splitlines()[0])
+        assert record["type"] == "session"
+        assert record["session_id"] == "abc"
+
+    def test_missing_listener_drops_records(self, tmp_path):
+        sink = UnixSocketResultSink(str(tmp_path / "missing.sock"), buffer_size=1)
+
+        sink.write_session(make_result())
+        sink.close()
+
+        assert sink.records_written == 0
+        assert sink.records_dropped == 1
+
+
+class BlockingSink(ResultSink):
+    """Sink whose destination blocks until released."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.batches = []
+
+    def _write_records(self, records):
+        self.writing.set()
+        self.release.wait(timeout=5)
+        self.batches.append(records)
+
+
+class TestSlowDestination:
+    """Tests that a slow destination never blocks the writer's callers."""
+
+    def test_writes_do_not_block(self):
+        sink = BlockingSink(buffer_size=1, flush_interval=3600, max_pending=2)
+
+        start = time.monotonic()
+        sink.write_session(make_result())
+        assert sink.writing.wait(timeout=5)
+        for _ in range(9):
+            sink.write_session(make_result())
+        assert time.monotonic() - start < 1.0
+
+        # One batch is being written, two wait in the queue, the rest are dropped
+        assert sink.records_dropped == 7
+        sink.release.set()
+        sink.close()
+        assert sink.records_written == 3
+        assert len(sink.batches) == 3
+
+
+class TestCreateSink:
+    """Tests for sink specification parsing."""
+
+    def test_explicit_kinds(self, tmp_path):
+        ndjson = create_sink(f"ndjson:{tmp_path / 'a.out'}")
+        sqlite = create_sink(f"sqlite:{tmp_path / 'b.out'}")
+        unix = create_sink(f"unix:{tmp_path / 'c.out'}")
+        try:
+            assert isinstance(ndjson, NDJSONResultSink)
+            assert isinstance(sqlite, SQLiteResultSink)
+            assert isinstance(unix, UnixSocketResultSink)
+        finally:
+            for sink in (ndjson, sqlite, unix):
+                sink.close()
+
+    def test_kind_from_extension(self, tmp_path):
+        sqlite = create_sink(str(tmp_path / "results.sqlite"))
+        ndjson = create_sink(str(tmp_path / "results.jsonl"))
+        try:
+            assert isinstance(sqlite, SQLiteResultSink)
+            assert isinstance(ndjson, NDJSONResultSink)
+        finally:
+            sqlite.close()
+            ndjson.close()
+
+    def test_invalid_spec(self):
+        with pytest.raises(ResultSinkError):
+            create_sink("")
+        with pytest.raises(ResultSinkError):
+            create_sink("kafka:topic")
+
+
+class TestSimulatorStreaming:
+    """Tests for MobileSimulator streaming to a sink."""
+
+    @pytest.mark.asyncio
+    async def test_session_streamed_without_retaining(self, default_config, tmp_path):
+        path = tmp_path / "results.ndjson"
+        sink = NDJSONResultSink(path)
+        simulator = MobileSimulator(default_config, result_sink=sink, retain_exchanges=False)
+
+        with patch("cardlink.simulator.client.PSKTLSClient") as mock_tls_cls, \
+             patch("cardlink.simulator.client.HTTPAdminClient") as mock_http_cls:
+            mock_tls = AsyncMock()
+            mock_tls.connect = AsyncMock(return_value=Mock(
+                cipher_suite="TLS_PSK_WITH_AES_128_CBC_SHA256",
+                psk_identity="test_card",
+                iccid=None,
+                imsi=None,
+                session_resumed=False,
+            ))
+            mock_tls_cls.return_value = mock_tls
+
+            mock_http = Mock()
+            mock_http.initial_request = AsyncMock(
+                return_value=bytes.fromhex("00A4040007A000000151000000")
+            )
+            mock_http.send_response = AsyncMock(
+                side_effect=[bytes.fromhex("80CA9F7F00"), None]
+            )
+            mock_http_cls.return_value = mock_http
+
+            result = await simulator.run_complete_session()
+
+        sink.close()
+
+        assert result.success
+        assert result.apdu_count == 2
+        assert result.exchanges == []
+        assert result.final_sw
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [r["type"] for r in records] == ["exchange", "exchange", "session"]
+        assert all(r["session_id"] == result.session_id for r in records)
+        assert records[-1]["final_sw"] == result.final_sw
@@ -158,3 +158,166 @@ class TestVirtualUICC:
 
             # Both should work
             assert len(r_apdu) >= 2
+
+
+class TestDispatchAndCache:
+    """Test compiled dispatch table and response cache."""
+
+    def test_dispatch_table_shared_per_class(self, uicc_profile):
+        """Test dispatch table is compiled once and shared by instances."""
+        a = VirtualUICC(uicc_profile)
+        b = VirtualUICC(uicc_profile)
+        assert a._dispatch is b._dispatch
+
+    def test_invalid_p1_rejected_by_table(self, uicc_profile):
+        """Test P1 values outside the handler's accepted set return 6A86."""
+        uicc = VirtualUICC(uicc_profile)
+
+        r_apdu = uicc.process_apdu(bytes([0x80, 0xF2, 0x01, 0x00, 0x02, 0x4F, 0x00]))
+        assert r_apdu == bytes([0x6A, 0x86])
+
+        r_apdu = uicc.process_apdu(bytes([0x00, 0xA4, 0x08, 0x00, 0x02, 0x3F, 0x00]))
+        assert r_apdu == bytes([0x6A, 0x86])
+
+    def test_cacheable_response_reused(self, uicc_profile):
+        """Test repeated GET STATUS is served from the response cache."""
+        uicc = VirtualUICC(uicc_profile)
+        c_apdu = bytes([0x80, 0xF2, 0x80, 0x00, 0x02, 0x4F, 0x00])
+
+        first = uicc.process_apdu(c_apdu)
+        second = uicc.process_apdu(c_apdu)
+
+        assert first == second
+        assert uicc.protocol_stats["response_cache_hits"] == 1
+
+    def test_mutating_command_invalidates_cache(self, uicc_profile):
+        """Test RAM commands drop cached responses."""
+        uicc = VirtualUICC(uicc_profile)
+        c_apdu = bytes([0x80, 0xF2, 0x80, 0x00, 0x02, 0x4F, 0x00])
+        uicc.process_apdu(c_apdu)
+
+        # DELETE is a mutating command
+        uicc.process_apdu(bytes.fromhex("80E40000094F07A0000001510001"))
+        uicc.process_apdu(c_apdu)
+
+        assert uicc.protocol_stats["response_cache_hits"] == 0
+
+    def test_state_dependent_commands_not_cached(self, uicc_profile):
+        """Test GET CHALLENGE returns fresh data each time."""
+        uicc = VirtualUICC(uicc_profile)
+        c_apdu = bytes([0x80, 0x84, 0x00, 0x00, 0x08])
+
+        assert uicc.process_apdu(c_apdu) != uicc.process_apdu(c_apdu)
+        assert uicc.protocol_stats["response_cache_hits"] == 0
+
+    def test_reset_clears_cache(self, uicc_profile):
+        """Test reset drops cached responses."""
+        uicc = VirtualUICC(uicc_profile)
+        c_apdu = bytes([0x80, 0xCA, 0x00, 0x66, 0x00])
+        uicc.process_apdu(c_apdu)
+
+        uicc.reset()
+        uicc.process_apdu(c_apdu)
+
+        assert uicc.protocol_stats["response_cache_hits"] == 0
+
+    def test_cache_evicts_least_recently_used(self, uicc_profile):
+        """Test a full cache keeps caching new APDUs, evicting the oldest."""
+        uicc = VirtualUICC(uicc_profile)
+        uicc.RESPONSE_CACHE_SIZE = 2
+        a, b, c = (bytes([0x80, 0xCA, 0x00, tag, 0x00]) for tag in (0x66, 0x67, 0x68))
+
+        uicc.process_apdu(a)
+        uicc.process_apdu(b)
+        uicc.process_apdu(a)  # hit, a becomes most recently used
+        uicc.process_apdu(c)  # evicts b
+        uicc.process_apdu(c)  # hit
+        uicc.process_apdu(a)  # hit
+        assert uicc.protocol_stats["response_cache_hits"] == 3
+
+        uicc.process_apdu(b)  # miss
+        assert uicc.protocol_stats["response_cache_hits"] == 3
+
+    def test_dispatch_table_is_class_attribute(self, uicc_profile):
+        """Test the compiled table is stored on the class."""
+        uicc = VirtualUICC(uicc_profile)
+        assert VirtualUICC.__dict__["_compiled_dispatch"] is uicc._dispatch
+
+    def test_bytearray_input(self, uicc_profile):
+        """Test mutable buffers are accepted as C-APDU."""
+        uicc = VirtualUICC(uicc_profile)
+        c_apdu = bytearray([0x80, 0xCA, 0x00, 0x66, 0x00])
+
+        assert uicc.process_apdu(c_apdu) == uicc.process_apdu(c_apdu)
+
+
+@pytest.mark.slow
+class TestVirtualUICCPerformance:
+    """Micro-benchmark for per-APDU processing cost."""
+
+    ITERATIONS = 20000
+
+    def test_per_apdu_cost(self, uicc_profile):
+        """Test a typical RAM session mix stays well below server-side cost."""
+        import time
+
+        uicc = VirtualUICC(uicc_profile)
+        isd = bytes.fromhex(uicc_profile.aid_isd)
+        session = [
+            bytes([0x00, 0xA4, 0x04, 0x00, len(isd)]) + isd,
+            bytes([0x80, 0xF2, 0x80, 0x00, 0x02, 0x4F, 0x00]),
+            bytes([0x80, 0xCA, 0x00, 0x66, 0x00]),
+            bytes.fromhex("80E60200100CA00000015100010203040506000000"),
+            bytes.fromhex("80E88000" + "10" + "00" * 16),
+            bytes([0x80, 0xF2, 0x40, 0x00, 0x02, 0x4F, 0x00]),
+        ]
+
+        start = time.perf_counter()
+        for i in range(self.ITERATIONS):
+            uicc.process_apdu(session[i % len(session)])
+        elapsed = time.perf_counter() - start
+
+        per_apdu_us = elapsed / self.ITERATIONS * 1e6
+        assert per_apdu_us < 200
+
+
+class TestStreamingLoad:
+    """Test LOAD handling with hashing and optional retention."""
+
+    LOAD_FILE_AID = "A0000001510002"
+
+    def _load(self, uicc, blocks):
+        aid = bytes.fromhex(self.LOAD_FILE_AID)
+        install = bytes([len(aid)]) + aid + bytes([0x00, 0x00, 0x00, 0x00])
+        uicc.process_apdu(bytes([0x80, 0xE6, 0x02, 0x00, len(install)]) + install)
+        for i, block in enumerate(blocks):
+            p1 = i | (0x80 if i == len(blocks) - 1 else 0x00)
+            r_apdu = uicc.process_apdu(bytes([0x80, 0xE8, p1, i, len(block)]) + block)
+            assert r_apdu == bytes([0x90, 0x00])
+        return uicc.load_files[self.LOAD_FILE_AID]
+
+    def test_hash_only_by_default(self, uicc_profile):
+        """Test only digest, size and block count are kept by default."""
+        import hashlib
+
+        blocks = [bytes([i]) * 200 for i in range(3)]
+        entry = self._load(VirtualUICC(uicc_profile), blocks)
+
+        assert entry.complete
+        assert entry.block_count == 3
+        assert entry.total_size == 600
+        assert entry.digest == hashlib.sha256(b"".join(blocks)).hexdigest()
+        assert entry.data_blocks == []
+        assert entry.data is None
+
+    def test_retained_payload_shared_across_cards(self, uicc_profile):
+        """Test identical retained load files share one payload object."""
+        uicc_profile.retain_load_data = True
+        blocks = [b"\xCA\xFE" * 100, b"\xBE\xEF" * 50]
+
+        first = self._load(VirtualUICC(uicc_profile), blocks)
+        second = self._load(VirtualUICC(uicc_profile), blocks)
+
+        assert first.data == b"".join(blocks)
+        assert first.payload is second.payload
+        assert first.data_blocks == []
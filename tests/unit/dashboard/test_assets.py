@@ -0,0 +1,147 @@
+"""Tests for static asset caching."""
+
+import asyncio
+import gzip
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+
+from cardlink.dashboard.assets import StaticAssetCache, accepts_gzip
+from cardlink.dashboard.server import DashboardConfig, DashboardServer
+
+from .test_http import read_response
+
+APP_JS = b"export function main() { return 'hello'; }\n" * 40
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    root = tmp_path / "static"
+    (root / "js").mkdir(parents=True)
+    (root / "index.html").write_bytes(b"<html></html>")
+    (root / "js" / "app.js").write_bytes(APP_JS)
+    (root / "js" / "vendor.3f9a1c2e.js").write_bytes(b"vendor")
+    (root / "large.bin").write_bytes(os.urandom(4096))
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    return root
+
+
+class TestStaticAssetCache:
+    """Tests for StaticAssetCache."""
+
+    def test_preload_and_variants(self, static_dir):
+        cache = StaticAssetCache(static_dir, max_file_size=2048)
+        assert cache.preload() == 4
+
+        app = cache.lookup("/js/app.js")
+        assert app.content == APP_JS
+        assert gzip.decompress(app.gzip) == APP_JS
+        assert app.cache_control == "no-cache"
+        assert cache.lookup("/js/vendor.3f9a1c2e.js").cache_control.endswith("immutable")
+        assert cache.lookup("/").content == b"<html></html>"
+
+        large = cache.lookup("/large.bin")
+        assert large.content is None and large.etag.startswith("W/")
+
+    def test_reload_on_change(self, static_dir):
+        cache = StaticAssetCache(static_dir)
+        etag = cache.lookup("/index.html").etag
+
+        path = static_dir / "index.html"
+        path.write_bytes(b"<html>v2</html>")
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000))
+
+        asset = cache.lookup("/index.html")
+        assert asset.content == b"<html>v2</html>"
+        assert asset.etag != etag
+
+    def test_traversal_and_missing(self, static_dir):
+        cache = StaticAssetCache(static_dir)
+        with pytest.raises(PermissionError):
+            cache.lookup("/../secret.txt")
+        assert cache.lookup("/missing.js") is None
+
+    def test_matches(self, static_dir):
+        asset = StaticAssetCache(static_dir).lookup("/js/app.js")
+        assert asset.matches(asset.etag)
+        assert asset.matches(f'"other", W/{asset.gzip_etag}')
+        assert asset.matches("*")
+        assert not asset.matches('"other"')
+
+    def test_accepts_gzip(self):
+        assert accepts_gzip("gzip, deflate, br")
+        assert accepts_gzip("br;q=1.0, gzip;q=0.8")
+        assert not accepts_gzip("gzip;q=0")
+        assert not accepts_gzip("identity")
+        assert not accepts_gzip("")
+
+
+@asynccontextmanager
+async def serve(static_dir):
+    dashboard = DashboardServer(
+        DashboardConfig(static_dir=static_dir, static_cache_max_file_size=2048)
+    )
+    server = await asyncio.start_server(dashboard._handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        yield reader, writer
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+class TestStaticServing:
+    """Tests for static file responses."""
+
+    @pytest.mark.asyncio
+    async def test_gzip_and_conditional_get(self, static_dir):
+        async with serve(static_dir) as (reader, writer):
+            writer.write(b"GET /js/app.js HTTP/1.1\r\nAccept-Encoding: gzip\r\n\r\n")
+            status, headers, body = await read_response(reader)
+            assert status == 200
+            assert headers["content-encoding"] == "gzip"
+            assert headers["vary"] == "Accept-Encoding"
+            assert headers["content-type"] == "text/javascript"
+            assert gzip.decompress(body) == APP_JS
+
+            etag = headers["etag"]
+            writer.write(
+                f"GET /js/app.js HTTP/1.1\r\nAccept-Encoding: gzip\r\n"
+                f"If-None-Match: {etag}\r\n\r\n".encode()
+            )
+            status, headers, body = await read_response(reader)
+            assert status == 304
+            assert headers["etag"] == etag
+            assert body == b""
+
+            writer.write(b"GET /js/app.js HTTP/1.1\r\n\r\n")
+            status, headers, body = await read_response(reader)
+            assert "content-encoding" not in headers
+            assert body == APP_JS
+
+    @pytest.mark.asyncio
+    async def test_large_file_from_disk(self, static_dir):
+        async with serve(static_dir) as (reader, writer):
+            writer.write(b"GET /large.bin HTTP/1.1\r\n\r\n")
+            status, _, body = await read_response(reader)
+            assert status == 200
+            assert body == (static_dir / "large.bin").read_bytes()
+
+            writer.write(b"HEAD /large.bin HTTP/1.1\r\n\r\n")
+            status_line = await reader.readuntil(b"\r\n\r\n")
+            assert b"Content-Length: 4096" in status_line
+
+    @pytest.mark.asyncio
+    async def test_errors(self, static_dir):
+        async with serve(static_dir) as (reader, writer):
+            writer.write(b"GET /missing.js HTTP/1.1\r\n\r\n")
+            status, _, _ = await read_response(reader)
+            assert status == 404
+
+            writer.write(b"POST /index.html HTTP/1.1\r\nContent-Length: 0\r\n\r\n")
+            status, headers, _ = await read_response(reader)
+            assert status == 405
+            assert headers["allow"] == "GET, HEAD"
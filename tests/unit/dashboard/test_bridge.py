@@ -0,0 +1,133 @@
+"""Tests for the admin server event bridge."""
+
+import asyncio
+import threading
+
+import pytest
+
+from cardlink.dashboard.bridge import EventBridge
+from cardlink.dashboard.server import DashboardConfig, DashboardServer
+
+
+class FakeEmitter:
+    """Minimal event emitter delivering events in the caller's thread."""
+
+    def __init__(self):
+        self.callbacks = {}
+
+    def subscribe(self, event_type, callback):
+        self.callbacks.setdefault(event_type, []).append(callback)
+
+    def emit_sync(self, event_type, data):
+        for callback in self.callbacks.get(event_type, []):
+            callback(data)
+
+
+async def wait_for(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+class TestEventBridge:
+    """Tests for EventBridge."""
+
+    @pytest.mark.asyncio
+    async def test_batches_events_from_threads(self):
+        received = []
+
+        async def handler(batch):
+            received.append(batch)
+
+        bridge = EventBridge(handler, max_batch=100)
+        bridge.start()
+
+        def produce(worker):
+            for i in range(500):
+                bridge.post("apdu", (worker, i))
+
+        threads = [threading.Thread(target=produce, args=(w,)) for w in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        await bridge.stop()
+
+        events = [event for batch in received for _, event in batch]
+        assert len(events) == 2000
+        assert all(len(batch) <= 100 for batch in received)
+        # Fewer handler calls than events, and per-thread order is preserved
+        assert bridge.batches < 2000
+        for worker in range(4):
+            assert [i for w, i in events if w == worker] == list(range(500))
+
+    @pytest.mark.asyncio
+    async def test_drops_when_full(self):
+        async def handler(batch):
+            pass
+
+        bridge = EventBridge(handler, max_pending=3)
+        bridge.start()
+        results = [bridge.post("apdu", i) for i in range(5)]
+        await bridge.stop()
+
+        assert results == [True, True, True, False, False]
+        assert bridge.events_dropped == 2
+
+    def test_post_before_start(self):
+        async def handler(batch):
+            pass
+
+        assert not EventBridge(handler).post("apdu", {})
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_stop_bridge(self):
+        received = []
+
+        async def handler(batch):
+            received.extend(batch)
+            raise RuntimeError("boom")
+
+        bridge = EventBridge(handler)
+        bridge.start()
+        bridge.post("a", 1)
+        await wait_for(lambda: received)
+        bridge.post("b", 2)
+        await bridge.stop()
+
+        assert received == [("a", 1), ("b", 2)]
+
+
+class TestAdminServerEvents:
+    """Tests for applying admin server events to dashboard state."""
+
+    @pytest.mark.asyncio
+    async def test_events_from_admin_thread(self):
+        dashboard = DashboardServer(DashboardConfig(admin_event_batch_size=50))
+        emitter = FakeEmitter()
+        dashboard._admin_server = type("Admin", (), {"_event_emitter": emitter})()
+        dashboard._loop = asyncio.get_running_loop()
+        dashboard._admin_events.start(dashboard._loop)
+        dashboard._subscribe_to_admin_events()
+
+        def admin_thread():
+            emitter.emit_sync(
+                "handshake_completed",
+                {"psk_identity": "card_1", "client_address": "10.0.0.5:4000"},
+            )
+            for _ in range(200):
+                emitter.emit_sync("apdu_sent", {"psk_identity": "card_1", "apdu": b"\x80\xf2"})
+                emitter.emit_sync("apdu_received", {"psk_identity": "card_1", "apdu": b"\x90\x00"})
+
+        thread = threading.Thread(target=admin_thread)
+        thread.start()
+        thread.join()
+        await dashboard._admin_events.stop()
+
+        session = await dashboard.state.get_session_by_psk_identity("card_1")
+        assert session.client_ip == "10.0.0.5"
+        apdus = await dashboard.state.get_apdus(session.id)
+        assert len(apdus) == 400
+        assert [a.direction for a in apdus[:2]] == ["command", "response"]
+        assert dashboard._admin_events.batches < 401
@@ -0,0 +1,128 @@
+"""Tests for WebSocket fan-out broadcasting."""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from cardlink.dashboard.server import DashboardConfig, DashboardServer, WebSocketClient
+
+
+class FakeWriter:
+    """Stream writer recording frames; drain blocks while ``stalled`` is set."""
+
+    def __init__(self, stalled: bool = False):
+        self.data = bytearray()
+        self.writes = []
+        self.transport = Mock()
+        self._ready = asyncio.Event()
+        if not stalled:
+            self._ready.set()
+
+    def write(self, data: bytes) -> None:
+        self.writes.append(data)
+        self.data.extend(data)
+
+    async def drain(self) -> None:
+        await self._ready.wait()
+
+    def close(self) -> None:
+        pass
+
+
+def decode_frames(data: bytes):
+    """Decode unmasked text frames into JSON messages."""
+    messages = []
+    pos = 0
+    while pos < len(data):
+        length = data[pos + 1] & 0x7F
+        pos += 2
+        if length == 126:
+            length = int.from_bytes(data[pos : pos + 2], "big")
+            pos += 2
+        elif length == 127:
+            length = int.from_bytes(data[pos : pos + 8], "big")
+            pos += 8
+        messages.append(json.loads(data[pos : pos + length]))
+        pos += length
+    return messages
+
+
+def add_client(server, writer, **kwargs):
+    client = WebSocketClient(writer, **kwargs)
+    client.start()
+    server._clients[client.id] = client
+    return client
+
+
+class TestBroadcast:
+    """Tests for DashboardServer._broadcast."""
+
+    @pytest.mark.asyncio
+    async def test_encodes_once_for_all_clients(self):
+        server = DashboardServer()
+        writers = [FakeWriter() for _ in range(3)]
+        clients = [add_client(server, w) for w in writers]
+
+        await server._broadcast("apdu", {"data": "00A4"})
+        await asyncio.sleep(0)
+
+        frames = [w.writes[0] for w in writers]
+        assert all(f is frames[0] for f in frames)
+        assert decode_frames(writers[0].data) == [{"type": "apdu", "payload": {"data": "00A4"}}]
+
+        for client in clients:
+            client.close()
+
+    @pytest.mark.asyncio
+    async def test_subscription_filtering(self):
+        server = DashboardServer()
+        all_writer, session_writer, apdu_writer = FakeWriter(), FakeWriter(), FakeWriter()
+        add_client(server, all_writer)
+        add_client(server, session_writer).subscriptions.add("session")
+        add_client(server, apdu_writer).subscriptions.add("apdu")
+
+        await server._broadcast("session.created", {"id": "s1"})
+        await server._broadcast("apdu", {"data": "00A4"})
+        await asyncio.sleep(0)
+
+        assert [m["type"] for m in decode_frames(all_writer.data)] == ["session.created", "apdu"]
+        assert [m["type"] for m in decode_frames(session_writer.data)] == ["session.created"]
+        assert [m["type"] for m in decode_frames(apdu_writer.data)] == ["apdu"]
+
+        for client in list(server._clients.values()):
+            client.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_disconnected(self):
+        server = DashboardServer(DashboardConfig(ws_send_queue_size=2))
+        fast_writer, slow_writer = FakeWriter(), FakeWriter(stalled=True)
+        fast = add_client(server, fast_writer, queue_size=2)
+        slow = add_client(server, slow_writer, queue_size=2)
+
+        for i in range(10):
+            await server._broadcast("apdu", {"seq": i})
+            await asyncio.sleep(0)
+
+        assert slow.closed
+        assert slow.id not in server._clients
+        slow_writer.transport.abort.assert_called_once()
+        assert [m["payload"]["seq"] for m in decode_frames(fast_writer.data)] == list(range(10))
+
+        fast.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_drops_frames(self):
+        writer = FakeWriter(stalled=True)
+        client = WebSocketClient(writer, queue_size=2, drop_when_full=True)
+        client.start()
+
+        for i in range(10):
+            client.enqueue(b"frame")
+            await asyncio.sleep(0)
+
+        assert not client.closed
+        assert client.frames_dropped > 0
+
+        client.close()
@@ -0,0 +1,93 @@
+"""Tests for table-driven APDU classification."""
+
+import pytest
+
+from cardlink.dashboard.classify import (
+    INTERINDUSTRY_TABLE,
+    PROPRIETARY_TABLE,
+    classify_apdu,
+)
+from cardlink.dashboard.server import DashboardState
+
+
+def classify(hex_apdu, direction="command"):
+    return classify_apdu(bytes.fromhex(hex_apdu), direction)
+
+
+class TestClassifyAPDU:
+    """Tests for classify_apdu."""
+
+    @pytest.mark.parametrize(
+        "apdu, name, apdu_type",
+        [
+            ("80E60C0010", "INSTALL", "ram"),
+            ("84E8000010", "LOAD", "ram"),
+            ("80F24000024F00", "GET STATUS", "ram"),
+            ("00A4040008A000000151000000", "SELECT", "standard"),
+            ("00B0000010", "READ BINARY", "standard"),
+            ("00D6000002AABB", "UPDATE BINARY", "rfm"),
+            ("A0DC0104021234", "UPDATE RECORD", "rfm"),
+            ("00E000001A", "CREATE FILE", "rfm"),
+            ("00E4000002", "DELETE FILE", "rfm"),
+            ("80D6000002AABB", "UPDATE BINARY", "standard"),
+            ("8077000000", "INS_77", "unknown"),
+        ],
+    )
+    def test_compact_commands(self, apdu, name, apdu_type):
+        info = classify(apdu)
+        assert (info.ins_name, info.apdu_type, info.remote_apdu_format) == (
+            name,
+            apdu_type,
+            "compact",
+        )
+        assert info.ins == int(apdu[2:4], 16)
+
+    def test_expanded_command_script(self):
+        # AA <len> 22 <len> C-APDU ...
+        c_apdu = bytes.fromhex("80E60C0004AABBCCDD")
+        script = bytes([0xAA, len(c_apdu) + 2, 0x22, len(c_apdu)]) + c_apdu
+        info = classify_apdu(script, "command")
+        assert (info.ins_name, info.apdu_type, info.remote_apdu_format) == (
+            "INSTALL",
+            "ram",
+            "expanded",
+        )
+
+        # Indefinite length template with a leading non-C-APDU TLV
+        script = bytes.fromhex("AE80" "8101FF" "220500B0000010" "0000")
+        info = classify_apdu(script, "command")
+        assert (info.ins_name, info.remote_apdu_format) == ("READ BINARY", "expanded")
+
+        # Long form length
+        script = bytes([0xAA, 0x81, len(c_apdu) + 2, 0x22, len(c_apdu)]) + c_apdu
+        assert classify_apdu(script, "command").ins_name == "INSTALL"
+
+    def test_malformed_expanded_script(self):
+        info = classify("AA0281FF")
+        assert info.ins is None and info.remote_apdu_format == "expanded"
+
+    def test_responses_and_short_data(self):
+        assert classify("9000", "response").ins is None
+        assert classify("AB07230590000000", "response").remote_apdu_format == "expanded"
+        assert classify("00A4", "command").ins is None
+        assert classify_apdu(b"", "response").remote_apdu_format is None
+
+    def test_tables_cover_every_instruction(self):
+        assert len(INTERINDUSTRY_TABLE) == len(PROPRIETARY_TABLE) == 256
+        assert all(entry.ins == ins for ins, entry in enumerate(PROPRIETARY_TABLE))
+
+
+class TestIngestionClassification:
+    """Tests for classification in DashboardState.add_apdu."""
+
+    @pytest.mark.asyncio
+    async def test_counts_by_type(self):
+        state = DashboardState()
+        session = await state.create_session("card")
+        await state.add_apdu(session.id, "command", "80E60C0010")
+        raw = bytes.fromhex("00D6000002AABB")
+        await state.add_apdu(session.id, "command", raw.hex().upper(), raw=raw)
+        entry = await state.add_apdu(session.id, "command", "not hex")
+
+        assert entry.ins is None
+        assert (session.ram_command_count, session.rfm_command_count) == (1, 1)
@@ -0,0 +1,99 @@
+"""Tests for WebSocket event coalescing."""
+
+import asyncio
+
+import pytest
+
+from cardlink.dashboard.coalescer import EventCoalescer
+from cardlink.dashboard.server import DashboardConfig, DashboardServer
+
+
+class Recorder:
+    def __init__(self):
+        self.messages = []
+
+    async def __call__(self, event_type, data):
+        self.messages.append((event_type, data))
+
+
+class TestEventCoalescer:
+    """Tests for EventCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_sends_immediately_when_not_started(self):
+        sent = Recorder()
+        coalescer = EventCoalescer(sent)
+
+        await coalescer.add("apdu", {"n": 1})
+        await coalescer.update("session.updated", "s1", lambda: {"count": 1})
+
+        assert sent.messages == [("apdu", {"n": 1}), ("session.updated", {"count": 1})]
+
+    @pytest.mark.asyncio
+    async def test_batches_and_debounces(self):
+        sent = Recorder()
+        coalescer = EventCoalescer(sent, interval=0.02)
+        coalescer.start()
+        counter = {"count": 0}
+
+        for i in range(5):
+            await coalescer.add("apdu", {"n": i})
+            counter["count"] += 1
+            await coalescer.update("session.updated", "s1", lambda: dict(counter))
+        await asyncio.sleep(0.05)
+
+        assert sent.messages == [
+            ("apdu.batch", {"items": [{"n": i} for i in range(5)]}),
+            ("session.updated", {"count": 5}),
+        ]
+        await coalescer.stop()
+
+    @pytest.mark.asyncio
+    async def test_flushes_when_batch_full(self):
+        sent = Recorder()
+        coalescer = EventCoalescer(sent, interval=10.0, max_batch=3)
+        coalescer.start()
+
+        for i in range(3):
+            await coalescer.add("apdu", i)
+        await asyncio.sleep(0.01)
+
+        assert sent.messages == [("apdu.batch", {"items": [0, 1, 2]})]
+        await coalescer.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending(self):
+        sent = Recorder()
+        coalescer = EventCoalescer(sent, interval=10.0)
+        coalescer.start()
+
+        await coalescer.add("apdu", 1)
+        await coalescer.stop()
+
+        assert sent.messages == [("apdu", 1)]
+
+
+class TestDashboardCoalescing:
+    """Tests for coalesced APDU events in the dashboard."""
+
+    @pytest.mark.asyncio
+    async def test_emit_apdu_coalesced_and_ordered(self):
+        dashboard = DashboardServer(DashboardConfig(ws_flush_interval=10.0))
+        sent = Recorder()
+        dashboard._send_event = sent
+        dashboard._events._send = sent
+        dashboard._events.start()
+        session = await dashboard.state.create_session("s")
+
+        for i in range(3):
+            await dashboard.emit_apdu(session.id, "command", f"00B0000{i}")
+        assert sent.messages == []
+
+        # An immediate event first flushes pending coalesced events
+        await dashboard._broadcast("session.deleted", {"id": session.id})
+        await dashboard._events.stop()
+
+        types = [t for t, _ in sent.messages]
+        assert types == ["apdu.batch", "session.updated", "session.deleted"]
+        assert [a["seq"] for a in sent.messages[0][1]["items"]] == [1, 2, 3]
+        assert sent.messages[1][1]["apduCount"] == 3
@@ -0,0 +1,130 @@
+"""Tests for dashboard session expiry."""
+
+import asyncio
+
+import pytest
+
+from cardlink.dashboard.expiry import ExpiryScheduler
+from cardlink.dashboard.server import DashboardConfig, DashboardServer, DashboardState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestExpiryScheduler:
+    """Tests for ExpiryScheduler."""
+
+    def test_expires_idle_keys(self):
+        clock = FakeClock()
+        expiry = ExpiryScheduler(10, clock=clock)
+        expiry.touch("a")
+        clock.now += 4
+        expiry.touch("b")
+
+        assert expiry.time_until_next() == 6
+        clock.now += 6
+        assert expiry.pop_expired() == ["a"]
+        assert expiry.time_until_next() == 4
+        clock.now += 4
+        assert expiry.pop_expired() == ["b"]
+        assert expiry.time_until_next() is None
+        assert len(expiry) == 0
+
+    def test_activity_reschedules_lazily(self):
+        clock = FakeClock()
+        expiry = ExpiryScheduler(10, clock=clock)
+        expiry.touch("a")
+        for _ in range(100):
+            clock.now += 1
+            expiry.touch("a")
+
+        # One heap entry per key regardless of activity
+        assert len(expiry._heap) == 1
+        assert expiry.deadline("a") == clock.now + 10
+
+        clock.now += 9
+        assert expiry.pop_expired() == []
+        assert expiry.time_until_next() == 1
+        clock.now += 1
+        assert expiry.pop_expired() == ["a"]
+
+    def test_remove(self):
+        clock = FakeClock()
+        expiry = ExpiryScheduler(10, clock=clock)
+        expiry.touch("a")
+        expiry.remove("a")
+        clock.now += 10
+
+        assert "a" not in expiry
+        assert expiry.pop_expired() == []
+        assert expiry._heap == []
+
+    def test_invalid_timeout(self):
+        with pytest.raises(ValueError):
+            ExpiryScheduler(0)
+
+
+class TestSessionExpiry:
+    """Tests for expiring dashboard sessions."""
+
+    @pytest.mark.asyncio
+    async def test_expire_sessions(self):
+        state = DashboardState(session_timeout=10)
+        clock = FakeClock()
+        state.expiry._clock = clock
+
+        idle = await state.create_session("idle")
+        busy = await state.create_session("busy")
+        clock.now += 8
+        await state.add_apdu(busy.id, "command", "80F20000")
+        clock.now += 2
+
+        assert [s.id for s in await state.expire_sessions()] == [idle.id]
+        assert await state.get_session(idle.id) is None
+        assert await state.get_session(busy.id) is busy
+
+        await state.delete_session(busy.id)
+        clock.now += 10
+        assert await state.expire_sessions() == []
+
+    @pytest.mark.asyncio
+    async def test_expiry_disabled(self):
+        state = DashboardState()
+        await state.create_session("a")
+        assert state.expiry is None
+        assert await state.expire_sessions() == []
+
+    @pytest.mark.asyncio
+    async def test_timeout_checker_broadcasts_batch(self):
+        dashboard = DashboardServer(DashboardConfig(session_timeout_seconds=0.05))
+        sent = []
+
+        async def broadcast(event_type, data):
+            sent.append((event_type, data))
+
+        dashboard._broadcast = broadcast
+        clock = FakeClock()
+        dashboard.state.expiry._clock = clock
+        sessions = [await dashboard.state.create_session(f"s{i}") for i in range(3)]
+        clock.now += 1
+        task = asyncio.create_task(dashboard._run_session_timeout_checker())
+        try:
+            for _ in range(100):
+                if sent:
+                    break
+                await asyncio.sleep(0.01)
+        finally:
+            task.cancel()
+
+        assert sent == [
+            (
+                "session.deleted.batch",
+                {"items": [{"id": s.id, "reason": "timeout"} for s in sessions]},
+            )
+        ]
+        assert dashboard.state.sessions == {}
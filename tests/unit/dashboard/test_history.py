@@ -0,0 +1,54 @@
+"""Tests for the bounded APDU history."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from cardlink.dashboard.history import APDUHistory
+
+
+def fill(history, count):
+    for _ in range(count):
+        history.append(SimpleNamespace(seq=0))
+
+
+class TestAPDUHistory:
+    """Tests for APDUHistory."""
+
+    def test_assigns_sequence_numbers(self):
+        history = APDUHistory(capacity=10)
+        fill(history, 3)
+
+        assert [e.seq for e in history] == [1, 2, 3]
+        assert (history.first_seq, history.last_seq, history.dropped) == (1, 3, 0)
+
+    def test_evicts_oldest(self):
+        history = APDUHistory(capacity=4)
+        fill(history, 10)
+
+        assert len(history) == 4
+        assert [e.seq for e in history] == [7, 8, 9, 10]
+        assert history.dropped == 6
+        assert [e.seq for e in history.tail(3)] == [8, 9, 10]
+
+    def test_after_pagination(self):
+        history = APDUHistory(capacity=5)
+        fill(history, 8)  # Retains 4..8, wrapped around the buffer
+
+        assert [e.seq for e in history.after(0, 2)] == [4, 5]
+        assert [e.seq for e in history.after(5, 10)] == [6, 7, 8]
+        assert history.after(8, 10) == []
+        assert history.after(100, 10) == []
+
+    def test_clear_keeps_sequence(self):
+        history = APDUHistory(capacity=5)
+        fill(history, 3)
+        history.clear()
+        fill(history, 1)
+
+        assert [e.seq for e in history] == [4]
+        assert [e.seq for e in history.after(0, 10)] == [4]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            APDUHistory(capacity=0)
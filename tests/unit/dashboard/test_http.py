@@ -0,0 +1,225 @@
+"""Tests for dashboard HTTP connection handling."""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+import pytest
+
+from cardlink.dashboard.server import DashboardConfig, DashboardServer
+
+
+async def read_response(reader):
+    status_line = await reader.readline()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        key, _, value = line.decode().partition(":")
+        headers[key.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    return int(status_line.split()[1]), headers, body
+
+
+@asynccontextmanager
+async def connect():
+    """Serve a dashboard on an ephemeral port and open a client connection."""
+    dashboard = DashboardServer(DashboardConfig(max_body_size=1024, keepalive_timeout=5.0))
+    server = await asyncio.start_server(dashboard._handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        yield reader, writer
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+class TestHTTPConnection:
+    """Tests for keep-alive, pipelining and request limits."""
+
+    @pytest.mark.asyncio
+    async def test_keep_alive(self):
+        async with connect() as (reader, writer):
+            for _ in range(3):
+                writer.write(b"GET /api/status HTTP/1.1\r\nHost: x\r\n\r\n")
+                status, headers, body = await read_response(reader)
+                assert status == 200
+                assert headers["connection"] == "keep-alive"
+                assert json.loads(body)["status"] == "running"
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests(self):
+        async with connect() as (reader, writer):
+            body = json.dumps({"name": "pipelined"}).encode()
+            writer.write(
+                b"POST /api/sessions HTTP/1.1\r\nContent-Length: "
+                + str(len(body)).encode()
+                + b"\r\n\r\n"
+                + body
+                + b"GET /api/sessions HTTP/1.1\r\nConnection: close\r\n\r\n"
+            )
+
+            status, _, created = await read_response(reader)
+            assert status == 201
+            status, headers, sessions = await read_response(reader)
+            assert status == 200
+            assert headers["connection"] == "close"
+            assert [s["id"] for s in json.loads(sessions)] == [json.loads(created)["id"]]
+            assert await reader.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_http10_closes(self):
+        async with connect() as (reader, writer):
+            writer.write(b"GET /api/status HTTP/1.0\r\n\r\n")
+            status, headers, _ = await read_response(reader)
+
+            assert status == 200
+            assert headers["connection"] == "close"
+            assert await reader.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_body_too_large(self):
+        async with connect() as (reader, writer):
+            writer.write(b"POST /api/sessions HTTP/1.1\r\nContent-Length: 4096\r\n\r\n")
+            status, _, _ = await read_response(reader)
+
+            assert status == 413
+            assert await reader.read() == b""
+
+    @pytest.mark.asyncio
+    async def test_not_found_and_method_not_allowed(self):
+        async with connect() as (reader, writer):
+            writer.write(b"GET /api/nope HTTP/1.1\r\n\r\n")
+            status, _, _ = await read_response(reader)
+            assert status == 404
+
+            writer.write(b"DELETE /api/status HTTP/1.1\r\n\r\n")
+            status, headers, _ = await read_response(reader)
+            assert status == 405
+            assert headers["allow"] == "GET"
+
+    @pytest.mark.asyncio
+    async def test_session_filters(self):
+        async with connect() as (reader, writer):
+            for identity in ("card_1", "card_2"):
+                body = json.dumps({"name": identity, "pskIdentity": identity}).encode()
+                writer.write(
+                    b"POST /api/sessions HTTP/1.1\r\nContent-Length: "
+                    + str(len(body)).encode()
+                    + b"\r\n\r\n"
+                    + body
+                )
+                await read_response(reader)
+
+            writer.write(b"GET /api/sessions?pskIdentity=card_2 HTTP/1.1\r\n\r\n")
+            status, _, body = await read_response(reader)
+
+            assert status == 200
+            assert [s["pskIdentity"] for s in json.loads(body)] == ["card_2"]
+
+    @pytest.mark.asyncio
+    async def test_session_delta_sync(self):
+        dashboard = DashboardServer(DashboardConfig())
+        first = await dashboard.state.create_session("first")
+        second = await dashboard.state.create_session("second")
+
+        server = await asyncio.start_server(dashboard._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            writer.write(b"GET /api/sessions?since=0 HTTP/1.1\r\n\r\n")
+            _, _, body = await read_response(reader)
+            sync = json.loads(body)
+            assert sync["reset"] and len(sync["sessions"]) == 2
+
+            await dashboard.state.update_session(second.id, status="active")
+            await dashboard.state.delete_session(first.id)
+            writer.write(f"GET /api/sessions?since={sync['version']} HTTP/1.1\r\n\r\n".encode())
+            _, _, body = await read_response(reader)
+            delta = json.loads(body)
+            assert [s["status"] for s in delta["sessions"]] == ["active"]
+            assert delta["deleted"] == [first.id]
+            assert not delta["reset"] and delta["version"] > sync["version"]
+
+            writer.write(b"GET /api/sessions?since=x HTTP/1.1\r\n\r\n")
+            status, _, _ = await read_response(reader)
+            assert status == 400
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
+
+    @pytest.mark.asyncio
+    async def test_timeseries(self):
+        async with connect() as (reader, writer):
+            body = json.dumps({"name": "metrics"}).encode()
+            writer.write(
+                b"POST /api/sessions HTTP/1.1\r\nContent-Length: "
+                + str(len(body)).encode()
+                + b"\r\n\r\n"
+                + body
+            )
+            _, _, body = await read_response(reader)
+            session_id = json.loads(body)["id"]
+            apdus = [
+                {"direction": "command", "data": "80F20000"},
+                {"direction": "response", "data": "", "sw": "6985"},
+            ]
+            for apdu in apdus:
+                body = json.dumps(apdu).encode()
+                writer.write(
+                    f"POST /api/sessions/{session_id}/apdus HTTP/1.1\r\n".encode()
+                    + b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await read_response(reader)
+
+            path = "/api/metrics/timeseries?series=apdus,errors&range=60"
+            writer.write(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+            status, _, body = await read_response(reader)
+            result = json.loads(body)
+            assert status == 200
+            assert sum(result["series"]["apdus"]) * result["step"] == 2
+            assert sum(result["series"]["errors"]) * result["step"] == 1
+
+            writer.write(b"GET /api/metrics/timeseries?series=nope HTTP/1.1\r\n\r\n")
+            status, _, _ = await read_response(reader)
+            assert status == 400
+
+    @pytest.mark.asyncio
+    async def test_apdu_pagination(self):
+        dashboard = DashboardServer(DashboardConfig(apdu_history_size=5, apdu_page_size=3))
+        session = await dashboard.state.create_session("paged")
+        for i in range(7):
+            await dashboard.state.add_apdu(session.id, "command", f"00A40400{i:02X}")
+
+        server = await asyncio.start_server(dashboard._handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        try:
+            path = f"/api/sessions/{session.id}/apdus"
+            writer.write(f"GET {path}?after=0&limit=10 HTTP/1.1\r\n\r\n".encode())
+            _, _, body = await read_response(reader)
+            page = json.loads(body)
+            assert [a["seq"] for a in page["items"]] == [3, 4, 5]
+            assert page["hasMore"] and page["missed"] == 2 and page["dropped"] == 2
+
+            writer.write(f"GET {path}?after={page['cursor']} HTTP/1.1\r\n\r\n".encode())
+            _, _, body = await read_response(reader)
+            page = json.loads(body)
+            assert [a["seq"] for a in page["items"]] == [6, 7]
+            assert not page["hasMore"] and page["missed"] == 0
+
+            writer.write(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+            _, _, body = await read_response(reader)
+            assert len(json.loads(body)) == 5
+
+            writer.write(f"GET {path}?after=x HTTP/1.1\r\n\r\n".encode())
+            status, _, _ = await read_response(reader)
+            assert status == 400
+        finally:
+            writer.close()
+            server.close()
+            await server.wait_closed()
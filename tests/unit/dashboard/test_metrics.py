@@ -0,0 +1,104 @@
+"""Tests for the rolling time-series aggregator."""
+
+import pytest
+
+from cardlink.dashboard.metrics import Resolution, TimeSeriesAggregator, is_error_sw
+
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_aggregator(clock):
+    return TimeSeriesAggregator([Resolution(1, 10), Resolution(10, 6)], clock=clock)
+
+
+class TestTimeSeriesAggregator:
+    """Tests for TimeSeriesAggregator."""
+
+    def test_rates_per_second(self):
+        clock = FakeClock()
+        metrics = make_aggregator(clock)
+        for _ in range(4):
+            metrics.record("handshakes")
+        clock.now += 1
+        metrics.record("handshakes")
+
+        result = metrics.query(["handshakes"], duration=3, points=3)
+        assert result["step"] == 1
+        assert result["start"] == int(clock.now) - 2
+        assert result["series"]["handshakes"] == [0.0, 4.0, 1.0]
+
+    def test_downsampling(self):
+        clock = FakeClock()
+        metrics = make_aggregator(clock)
+        for _ in range(10):
+            metrics.record("apdus")
+            clock.now += 1
+        clock.now -= 1
+
+        result = metrics.query(["apdus"], duration=10, points=5)
+        assert result["step"] == 2
+        assert result["series"]["apdus"] == [1.0] * 5
+
+    def test_coarser_resolution_for_long_ranges(self):
+        clock = FakeClock(1_000_000.0)
+        metrics = make_aggregator(clock)
+        metrics.record("apdus")
+        clock.now += 30
+
+        # 1 s ring no longer holds the event; the 10 s ring covers 60 s
+        assert sum(metrics.query(["apdus"], duration=10)["series"]["apdus"]) == 0
+        result = metrics.query(["apdus"], duration=60, points=6)
+        assert result["step"] == 10
+        assert result["series"]["apdus"][2] == pytest.approx(0.1)
+
+    def test_old_buckets_expire(self):
+        clock = FakeClock()
+        metrics = make_aggregator(clock)
+        metrics.record("apdus")
+        clock.now += 10  # Same slot in the 1 s ring, one lap later
+        metrics.record("apdus")
+
+        assert metrics.query(["apdus"], duration=10)["series"]["apdus"] == [0.0] * 9 + [1.0]
+
+    def test_latency_and_errors(self):
+        clock = FakeClock()
+        metrics = make_aggregator(clock)
+        metrics.record_apdu("s1", "command")
+        metrics.record_apdu("s2", "command")
+        clock.now += 0.2
+        metrics.record_apdu("s1", "response", sw="9000")
+        clock.now += 0.2
+        metrics.record_apdu("s2", "response", sw="6985")
+        metrics.record_apdu("s3", "response", sw="6A82")  # No command: no latency
+
+        series = metrics.query(
+            ["apdus", "errors", "latency_avg", "latency_max"], duration=1, points=1
+        )["series"]
+        assert series["apdus"] == [5.0]
+        assert series["errors"] == [2.0]
+        assert series["latency_avg"][0] == pytest.approx(300)
+        assert series["latency_max"][0] == pytest.approx(400)
+
+        clock.now += 1
+        assert metrics.query(["latency_avg"], duration=1)["series"]["latency_avg"] == [None]
+
+    def test_invalid_query(self):
+        metrics = make_aggregator(FakeClock())
+        with pytest.raises(ValueError):
+            metrics.query(["bogus"])
+        with pytest.raises(ValueError):
+            metrics.query(["apdus"], points=0)
+
+    def test_is_error_sw(self):
+        assert not is_error_sw("9000")
+        assert not is_error_sw("6110")
+        assert not is_error_sw("9F20")
+        assert is_error_sw("6985")
+        assert is_error_sw("6a82")
+        assert not is_error_sw(None)
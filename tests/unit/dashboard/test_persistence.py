@@ -0,0 +1,151 @@
+"""Tests for dashboard SQLite persistence and search."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from cardlink.dashboard.persistence import DashboardStore, PersistenceError, fts_query
+from cardlink.dashboard.server import DashboardState
+
+
+@asynccontextmanager
+async def persisted_state(path, history_size=100):
+    """Dashboard state backed by a store at ``path``."""
+    store = DashboardStore(path)
+    store.open()
+    state = DashboardState(apdu_history_size=history_size)
+    await state.attach_store(store)
+    try:
+        yield state
+    finally:
+        await store.close()
+
+
+async def install_exchange(state, session_id, sw):
+    await state.add_apdu(session_id, "command", "80E60C0010A000000151000000")
+    await state.add_apdu(session_id, "response", "", sw=sw)
+
+
+class TestFTSQuery:
+    """Tests for search text conversion."""
+
+    def test_quotes_terms(self):
+        assert fts_query('INSTALL 80E6* a"b') == '"INSTALL" "80E6"* "a""b"'
+
+    def test_empty(self):
+        assert fts_query("  * ") == ""
+
+
+class TestDashboardStore:
+    """Tests for persisting and restoring dashboard state."""
+
+    @pytest.mark.asyncio
+    async def test_restore_sessions_and_apdus(self, tmp_path):
+        path = tmp_path / "dashboard.db"
+        async with persisted_state(path) as state:
+            session = await state.create_session("card", psk_identity="card_1", iccid="8901")
+            for i in range(5):
+                await state.add_apdu(session.id, "command", f"80F2000{i}")
+
+        async with persisted_state(path, history_size=3) as state:
+            restored = await state.get_session(session.id)
+            assert restored.psk_identity == "card_1"
+            assert restored.apdu_count == 5
+            assert restored.created_at == session.created_at
+            assert state.version == restored.version
+            assert (await state.get_session_by_psk_identity("card_1")).id == session.id
+
+            apdus = await state.get_apdus(session.id)
+            assert [a.data for a in apdus] == ["80F20002", "80F20003", "80F20004"]
+            assert [a.seq for a in apdus] == [3, 4, 5]
+
+            # New APDUs continue the restored sequence
+            entry = await state.add_apdu(session.id, "command", "80F20005")
+            assert entry.seq == 6
+
+    @pytest.mark.asyncio
+    async def test_restore_keeps_dropped_count(self, tmp_path):
+        path = tmp_path / "dashboard.db"
+        async with persisted_state(path, history_size=3) as state:
+            session = await state.create_session("card")
+            for i in range(5):
+                await state.add_apdu(session.id, "command", f"80F2000{i}")
+            assert (await state.get_session(session.id)).apdus_dropped == 2
+
+        async with persisted_state(path, history_size=3) as state:
+            assert (await state.get_session(session.id)).apdus_dropped == 2
+            await state.add_apdu(session.id, "command", "80F20005")
+            assert (await state.get_session(session.id)).apdus_dropped == 3
+
+    @pytest.mark.asyncio
+    async def test_delete_session(self, tmp_path):
+        path = tmp_path / "dashboard.db"
+        async with persisted_state(path) as state:
+            keep = await state.create_session("keep")
+            drop = await state.create_session("drop")
+            await state.add_apdu(drop.id, "command", "80F20000")
+            await state.delete_session(drop.id)
+
+        async with persisted_state(path) as state:
+            assert [s.id for s in await state.get_sessions()] == [keep.id]
+            assert await state.search_apdus("80F20000") == []
+
+    @pytest.mark.asyncio
+    async def test_open_failure(self, tmp_path):
+        (tmp_path / "dir.db").mkdir()
+        with pytest.raises(PersistenceError):
+            DashboardStore(tmp_path / "dir.db").open()
+
+
+class TestSearch:
+    """Tests for APDU and session search."""
+
+    @pytest.mark.asyncio
+    async def test_search_apdus(self, tmp_path):
+        async with persisted_state(tmp_path / "dashboard.db") as state:
+            session = await state.create_session("card")
+            await install_exchange(state, session.id, "9000")
+            await state.add_apdu(session.id, "command", "80F24000024F00")
+
+            results = await state.search_apdus("INSTALL")
+            assert len(results) == 1
+            assert results[0]["direction"] == "command"
+            assert results[0]["sessionId"] == session.id
+
+            assert len(await state.search_apdus("80F2*")) == 1
+            assert len(await state.search_apdus("command", limit=1)) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_followed_by(self, tmp_path):
+        async with persisted_state(tmp_path / "dashboard.db") as state:
+            first = await state.create_session("first")
+            second = await state.create_session("second")
+            await install_exchange(state, first.id, "9000")
+            await install_exchange(state, second.id, "6985")
+            await install_exchange(state, first.id, "6985")
+
+            results = await state.search_apdus("INSTALL", then="6985")
+            assert [(r["sessionId"], r["followedBy"]["sw"]) for r in results] == [
+                (first.id, "6985"),
+                (second.id, "6985"),
+            ]
+            assert results[0]["followedBy"]["seq"] == results[0]["seq"] + 1
+
+            results = await state.search_apdus("INSTALL", then="6985", session_id=second.id)
+            assert [r["sessionId"] for r in results] == [second.id]
+
+    @pytest.mark.asyncio
+    async def test_search_sessions(self, tmp_path):
+        async with persisted_state(tmp_path / "dashboard.db") as state:
+            await state.create_session("lab", iccid="89014103211118510720")
+            target = await state.create_session("field", imei="356938035643809", site="berlin")
+
+            assert [s.id for s in await state.search_sessions("berlin")] == [target.id]
+            assert [s.id for s in await state.search_sessions("356938*")] == [target.id]
+            await state.update_session(target.id, name="renamed")
+            assert [s.id for s in await state.search_sessions("renamed")] == [target.id]
+
+    @pytest.mark.asyncio
+    async def test_search_without_store(self):
+        with pytest.raises(PersistenceError):
+            await DashboardState().search_apdus("INSTALL")
@@ -0,0 +1,72 @@
+"""Tests for dashboard request routing."""
+
+from cardlink.dashboard.router import ANY_METHOD, Router
+
+
+def handler_a(*args):
+    return "a"
+
+
+def handler_b(*args):
+    return "b"
+
+
+class TestRouter:
+    """Tests for Router."""
+
+    def test_static_route(self):
+        router = Router()
+        router.add("GET", "/api/status", handler_a)
+
+        match = router.match("GET", "/api/status")
+        assert match.handler is handler_a
+        assert match.params == {}
+
+        # Trailing slash is ignored
+        assert router.match("GET", "/api/status/").handler is handler_a
+
+    def test_unknown_path(self):
+        router = Router()
+        router.add("GET", "/api/status", handler_a)
+
+        assert router.match("GET", "/api/other") is None
+
+    def test_method_not_allowed(self):
+        router = Router()
+        router.add("GET", "/api/sessions", handler_a)
+        router.add("POST", "/api/sessions", handler_b)
+
+        match = router.match("DELETE", "/api/sessions")
+        assert match.handler is None
+        assert match.allowed_methods == {"GET", "POST"}
+
+    def test_parameter_extraction(self):
+        router = Router()
+        router.add("GET", "/api/sessions/{session_id}", handler_a)
+        router.add("GET", "/api/sessions/{session_id}/apdus", handler_b)
+
+        match = router.match("GET", "/api/sessions/abc%20def")
+        assert match.handler is handler_a
+        assert match.params == {"session_id": "abc def"}
+
+        match = router.match("GET", "/api/sessions/abc/apdus")
+        assert match.handler is handler_b
+        assert match.params == {"session_id": "abc"}
+
+        assert router.match("GET", "/api/sessions/abc/other") is None
+
+    def test_static_preferred_over_dynamic(self):
+        router = Router()
+        router.add("GET", "/api/scp81/keys/{key_id}", handler_a)
+        router.add("GET", "/api/scp81/keys/default", handler_b)
+
+        assert router.match("GET", "/api/scp81/keys/default").handler is handler_b
+        assert router.match("GET", "/api/scp81/keys/other").handler is handler_a
+
+    def test_path_parameter_and_wildcard_method(self):
+        router = Router()
+        router.add(ANY_METHOD, "/api/scripts/{rest:path}", handler_a)
+
+        match = router.match("PUT", "/api/scripts/select-isd/execute")
+        assert match.handler is handler_a
+        assert match.params == {"rest": "select-isd/execute"}
@@ -0,0 +1,101 @@
+"""Tests for DashboardState session storage."""
+
+import pytest
+
+from cardlink.dashboard.server import DashboardState
+
+
+class TestSessionIndexes:
+    """Tests for indexed session lookups."""
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_psk_identity(self):
+        state = DashboardState()
+        first = await state.create_session("a", psk_identity="card_1")
+        await state.create_session("b", psk_identity="card_2")
+        await state.create_session("c", psk_identity="card_1")
+
+        assert await state.get_session_by_psk_identity("card_1") is first
+        assert await state.get_session_by_psk_identity("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_find_sessions(self):
+        state = DashboardState()
+        a = await state.create_session("a", iccid="8901", imei="3550", client_ip="10.0.0.1")
+        b = await state.create_session("b", iccid="8902", imei="3550", client_ip="10.0.0.1")
+        await state.update_session(b.id, status="active")
+
+        assert await state.find_sessions(imei="3550") == [a, b]
+        assert await state.find_sessions(imei="3550", iccid="8902") == [b]
+        assert await state.find_sessions(client_ip="10.0.0.1", status="active") == [b]
+        assert await state.find_sessions(status="idle") == [a]
+        assert await state.find_sessions(iccid="8903") == []
+
+        with pytest.raises(ValueError):
+            await state.find_sessions(colour="red")
+
+    @pytest.mark.asyncio
+    async def test_indexes_follow_updates_and_deletes(self):
+        state = DashboardState()
+        session = await state.create_session("a", psk_identity="old", eid="89049")
+
+        await state.update_session(session.id, psk_identity="new")
+        assert await state.get_session_by_psk_identity("old") is None
+        assert await state.get_session_by_psk_identity("new") is session
+
+        await state.delete_session(session.id)
+        assert await state.get_session_by_psk_identity("new") is None
+        assert await state.find_sessions(eid="89049") == []
+        assert all(not index for index in state._indexes.values())
+
+
+class TestSessionVersions:
+    """Tests for session versions and delta sync."""
+
+    @pytest.mark.asyncio
+    async def test_changes_since_version(self):
+        state = DashboardState()
+        a = await state.create_session("a")
+        b = await state.create_session("b")
+        c = await state.create_session("c")
+        since = state.version
+
+        await state.update_session(a.id, status="active")
+        await state.add_apdu(c.id, "command", "80F20000")
+        await state.delete_session(b.id)
+
+        changes = await state.get_changes(since)
+        assert [s.id for s in changes.sessions] == [a.id, c.id]
+        assert changes.deleted == [b.id]
+        assert not changes.reset
+        assert changes.version == state.version == c.version + 1
+
+        changes = await state.get_changes(changes.version)
+        assert changes.sessions == [] and changes.deleted == []
+
+    @pytest.mark.asyncio
+    async def test_reset(self):
+        state = DashboardState()
+        state.MAX_TOMBSTONES = 2
+        keep = await state.create_session("keep")
+        since = state.version
+        for name in ("x", "y", "z"):
+            session = await state.create_session(name)
+            await state.delete_session(session.id)
+
+        for version in (0, since, state.version + 1):
+            changes = await state.get_changes(version)
+            assert changes.reset
+            assert changes.sessions == [keep] and changes.deleted == []
+
+    @pytest.mark.asyncio
+    async def test_session_dict_cache(self):
+        state = DashboardState()
+        session = await state.create_session("a")
+
+        data = state.session_dict(session)
+        assert state.session_dict(session) is data
+        assert data["version"] == session.version
+
+        await state.update_session(session.id, name="b")
+        assert state.session_dict(session)["name"] == "b"
@@ -0,0 +1,280 @@
+"""Tests for the dashboard WebSocket codec and endpoint."""
+
+import asyncio
+import json
+import os
+import struct
+import zlib
+from contextlib import asynccontextmanager
+
+import pytest
+
+from cardlink.dashboard.server import DashboardConfig, DashboardServer
+from cardlink.dashboard.websocket import (
+    CLOSE_MESSAGE_TOO_BIG,
+    CLOSE_PROTOCOL_ERROR,
+    OP_BINARY,
+    OP_CLOSE,
+    OP_CONTINUATION,
+    OP_PING,
+    OP_PONG,
+    OP_TEXT,
+    PerMessageDeflate,
+    WebSocketError,
+    WebSocketReader,
+    encode_frame,
+    encode_message,
+    unmask,
+)
+
+MASK = b"\x37\xfa\x21\x3d"
+
+
+def feed(*frames: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    for frame in frames:
+        reader.feed_data(frame)
+    reader.feed_eof()
+    return reader
+
+
+def parse_frame(data: bytes):
+    """Decode one unmasked server frame: (fin, rsv1, opcode, payload, rest)."""
+    first, second = data[0], data[1]
+    length = second & 0x7F
+    pos = 2
+    if length == 126:
+        length = struct.unpack("!H", data[2:4])[0]
+        pos = 4
+    elif length == 127:
+        length = struct.unpack("!Q", data[2:10])[0]
+        pos = 10
+    return (
+        bool(first & 0x80),
+        bool(first & 0x40),
+        first & 0x0F,
+        data[pos : pos + length],
+        data[pos + length :],
+    )
+
+
+def inflate(payload: bytes) -> bytes:
+    return zlib.decompressobj(-15).decompress(payload + b"\x00\x00\xff\xff")
+
+
+class TestFrameCodec:
+    """Tests for frame encoding and masking."""
+
+    def test_unmask_matches_bytewise(self):
+        for length in (0, 1, 3, 4, 5, 125, 4097):
+            payload = os.urandom(length)
+            expected = bytes(b ^ MASK[i % 4] for i, b in enumerate(payload))
+            assert unmask(payload, MASK) == expected
+
+    @pytest.mark.parametrize("length", [0, 125, 126, 65535, 65536])
+    def test_length_encodings(self, length):
+        payload = b"x" * length
+        fin, rsv1, opcode, decoded, rest = parse_frame(encode_frame(OP_BINARY, payload))
+        assert (fin, rsv1, opcode, decoded, rest) == (True, False, OP_BINARY, payload, b"")
+
+    def test_encode_message_compresses_large_payloads(self):
+        deflate = PerMessageDeflate()
+        payload = json.dumps({"data": "00A4040007A0000000041010" * 50}).encode()
+
+        _, rsv1, _, compressed, _ = parse_frame(encode_message(payload, deflate=deflate))
+        assert rsv1
+        assert len(compressed) < len(payload) // 4
+        assert inflate(compressed) == payload
+
+        _, rsv1, _, plain, _ = parse_frame(encode_message(b"{}", deflate=deflate))
+        assert not rsv1 and plain == b"{}"
+
+
+class TestWebSocketReader:
+    """Tests for reading client messages."""
+
+    @pytest.mark.asyncio
+    async def test_fragmented_message_with_interleaved_ping(self):
+        reader = WebSocketReader(
+            feed(
+                encode_frame(OP_TEXT, b"hel", fin=False, mask=MASK),
+                encode_frame(OP_PING, b"p", mask=MASK),
+                encode_frame(OP_CONTINUATION, b"lo", mask=MASK),
+            )
+        )
+
+        ping = await reader.receive()
+        message = await reader.receive()
+
+        assert (ping.opcode, ping.data) == (OP_PING, b"p")
+        assert (message.opcode, message.data) == (OP_TEXT, b"hello")
+
+    @pytest.mark.asyncio
+    async def test_compressed_message(self):
+        deflate = PerMessageDeflate()
+        payload = b'{"type": "subscribe"}' * 20
+        compressed = deflate.compress(payload)
+        reader = WebSocketReader(
+            feed(
+                encode_frame(OP_TEXT, compressed[:10], fin=False, rsv1=True, mask=MASK),
+                encode_frame(OP_CONTINUATION, compressed[10:], mask=MASK),
+            ),
+            deflate=deflate,
+        )
+
+        message = await reader.receive()
+        assert message.data == payload
+
+    @pytest.mark.asyncio
+    async def test_close_code(self):
+        reader = WebSocketReader(feed(encode_frame(OP_CLOSE, struct.pack("!H", 1001), mask=MASK)))
+        message = await reader.receive()
+        assert message.opcode == OP_CLOSE
+        assert message.close_code == 1001
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "frame, code",
+        [
+            (encode_frame(OP_TEXT, b"unmasked"), CLOSE_PROTOCOL_ERROR),
+            (encode_frame(OP_CONTINUATION, b"x", mask=MASK), CLOSE_PROTOCOL_ERROR),
+            (encode_frame(OP_PING, b"x", fin=False, mask=MASK), CLOSE_PROTOCOL_ERROR),
+            (encode_frame(OP_TEXT, b"x", rsv1=True, mask=MASK), CLOSE_PROTOCOL_ERROR),
+            (encode_frame(0x3, b"x", mask=MASK), CLOSE_PROTOCOL_ERROR),
+            (encode_frame(OP_TEXT, b"x" * 2048, mask=MASK), CLOSE_MESSAGE_TOO_BIG),
+        ],
+    )
+    async def test_protocol_errors(self, frame, code):
+        reader = WebSocketReader(feed(frame), max_size=1024)
+        with pytest.raises(WebSocketError) as exc_info:
+            await reader.receive()
+        assert exc_info.value.code == code
+
+    @pytest.mark.asyncio
+    async def test_short_read_raises(self):
+        reader = WebSocketReader(feed(encode_frame(OP_TEXT, b"hello", mask=MASK)[:-2]))
+        with pytest.raises(asyncio.IncompleteReadError):
+            await reader.receive()
+
+
+class TestNegotiation:
+    """Tests for permessage-deflate negotiation."""
+
+    def test_no_offer(self):
+        assert PerMessageDeflate.negotiate(None) is None
+        assert PerMessageDeflate.negotiate("x-webkit-deflate-frame") is None
+
+    def test_browser_offer(self):
+        deflate = PerMessageDeflate.negotiate("permessage-deflate; client_max_window_bits")
+        assert deflate is not None
+        assert deflate.response_header() == "permessage-deflate; server_no_context_takeover"
+
+    def test_window_bits(self):
+        deflate = PerMessageDeflate.negotiate(
+            "permessage-deflate; server_max_window_bits=10; client_no_context_takeover"
+        )
+        assert deflate.server_max_window_bits == 10
+        assert deflate.response_header() == (
+            "permessage-deflate; server_no_context_takeover; server_max_window_bits=10; "
+            "client_no_context_takeover"
+        )
+
+    def test_falls_back_to_acceptable_offer(self):
+        deflate = PerMessageDeflate.negotiate(
+            "permessage-deflate; server_max_window_bits=8, "
+            "permessage-deflate; unknown_param, permessage-deflate"
+        )
+        assert deflate is not None
+        assert deflate.server_max_window_bits == 15
+
+
+@asynccontextmanager
+async def websocket(extensions: str = ""):
+    """Open an upgraded WebSocket connection to a dashboard on an ephemeral port."""
+    dashboard = DashboardServer(DashboardConfig(ws_max_message_size=4096))
+    server = await asyncio.start_server(dashboard._handle_connection, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = (
+        "GET /ws HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        "Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n"
+    )
+    if extensions:
+        request += f"Sec-WebSocket-Extensions: {extensions}\r\n"
+    writer.write((request + "\r\n").encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    try:
+        yield dashboard, head.decode(), reader, writer
+    finally:
+        writer.close()
+        server.close()
+        await server.wait_closed()
+
+
+async def read_frame(reader):
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    return bool(first & 0x40), first & 0x0F, await reader.readexactly(length)
+
+
+class TestWebSocketEndpoint:
+    """End-to-end tests for the /ws endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_handshake_and_ping(self):
+        async with websocket() as (_, head, reader, writer):
+            assert "101 Switching Protocols" in head
+            assert "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=" in head
+            assert "Sec-WebSocket-Extensions" not in head
+
+            writer.write(encode_frame(OP_PING, b"hb", mask=MASK))
+            assert await read_frame(reader) == (False, OP_PONG, b"hb")
+
+            writer.write(encode_frame(OP_TEXT, b'{"type": "pi', fin=False, mask=MASK))
+            writer.write(encode_frame(OP_CONTINUATION, b'ng"}', mask=MASK))
+            _, opcode, data = await read_frame(reader)
+            assert opcode == OP_TEXT
+            assert json.loads(data)["type"] == "pong"
+
+    @pytest.mark.asyncio
+    async def test_close_is_echoed(self):
+        async with websocket() as (dashboard, _, reader, writer):
+            writer.write(encode_frame(OP_CLOSE, struct.pack("!H", 1001), mask=MASK))
+            _, opcode, data = await read_frame(reader)
+            assert opcode == OP_CLOSE
+            assert struct.unpack("!H", data[:2])[0] == 1001
+            assert await reader.read() == b""
+            assert not dashboard._clients
+
+    @pytest.mark.asyncio
+    async def test_protocol_error_closes_with_code(self):
+        async with websocket() as (_, _, reader, writer):
+            writer.write(encode_frame(OP_TEXT, b"unmasked"))
+            _, opcode, data = await read_frame(reader)
+            assert opcode == OP_CLOSE
+            assert struct.unpack("!H", data[:2])[0] == CLOSE_PROTOCOL_ERROR
+
+    @pytest.mark.asyncio
+    async def test_compressed_broadcast(self):
+        async with websocket("permessage-deflate; client_max_window_bits") as (
+            dashboard,
+            head,
+            reader,
+            writer,
+        ):
+            assert "permessage-deflate; server_no_context_takeover" in head
+
+            # Wait until the server has registered the client
+            writer.write(encode_frame(OP_PING, b"", mask=MASK))
+            await read_frame(reader)
+
+            payload = {"data": "80E2900000" + "00" * 200, "sw": "9000"}
+            await dashboard._broadcast("apdu", payload)
+            rsv1, opcode, data = await read_frame(reader)
+
+            assert rsv1 and opcode == OP_TEXT
+            assert json.loads(inflate(data)) == {"type": "apdu", "payload": payload}